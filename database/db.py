@@ -1,14 +1,72 @@
-from sqlalchemy import create_engine               # SQLAlchemy 엔진 생성 도구
+from sqlalchemy import create_engine, event        # SQLAlchemy 엔진 생성 도구 / 세션 이벤트
 from sqlalchemy.ext.declarative import declarative_base  # 모델의 Base 클래스
 from sqlalchemy.orm import sessionmaker            # 세션 팩토리 함수
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker  # 비동기 엔진/세션
 
 from config.settings import settings               # ✅ 환경변수 설정 파일 불러오기
+from database.query_stats import install_query_stats  # ✅ 요청별 SQL 계측
+from database.pool_metrics import InstrumentedQueuePool, InstrumentedAsyncQueuePool  # ✅ 풀 대기시간 계측
+
+
+def _pool_options(url: str, poolclass) -> dict:
+    """설정값 기반 커넥션 풀 옵션 (SQLite 테스트 DB는 드라이버 기본 풀 사용)"""
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
 
 # ✅ 환경변수에서 DB 연결 URL을 불러와 엔진 생성
-engine = create_engine(settings.DATABASE_URL)
+engine = create_engine(
+    settings.DATABASE_URL,
+    **_pool_options(settings.DATABASE_URL, InstrumentedQueuePool),
+)
 
 # ✅ 세션 팩토리: DB 연결에 사용할 세션 생성기 정의
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# ✅ 읽기 전용 복제본 엔진 (대시보드/통계 조회용)
+#    - DB_REPLICA_* 미설정 시 primary 엔진을 그대로 사용 (별도 풀 생성 X)
+if settings.REPLICA_DATABASE_URL:
+    read_engine = create_engine(
+        settings.REPLICA_DATABASE_URL,
+        **_pool_options(settings.REPLICA_DATABASE_URL, InstrumentedQueuePool),
+    )
+else:
+    read_engine = engine
+
+# ✅ 읽기 전용 세션 팩토리
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+
+@event.listens_for(ReadSessionLocal, "before_flush")
+def _reject_writes(session, flush_context, instances):
+    # 복제본 세션에서 쓰기를 시도하면 즉시 실패 (primary 로 가야 할 쓰기가 복제본에 묻히는 것 방지)
+    raise RuntimeError("읽기 전용 세션(get_read_db)에서는 쓰기 작업을 할 수 없습니다")
+
+
+# ✅ 비동기 엔진 (aiomysql, 테스트 시 aiosqlite로 대체 가능)
+#    - async def 라우터/AI 핸들러에서 이벤트 루프를 막지 않도록 사용
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    **_pool_options(settings.ASYNC_DATABASE_URL, InstrumentedAsyncQueuePool),
+)
+
+# ✅ 비동기 세션 팩토리
+#    - expire_on_commit=False: commit 이후 속성 접근 시 암묵적 lazy 로딩(동기 I/O) 방지
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# ✅ 요청별 SQL 수/DB 시간/행 수 계측 (middlewares/query_stats.py 에서 헤더로 노출)
+install_query_stats(engine)
+if read_engine is not engine:
+    install_query_stats(read_engine)
+install_query_stats(async_engine.sync_engine)
+
 # ✅ 모델 정의 시 상속할 Base 클래스 (Declarative 방식 사용)
 Base = declarative_base()
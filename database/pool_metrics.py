@@ -0,0 +1,93 @@
+"""
+database/pool_metrics.py
+
+- 커넥션 풀 상태(사용 중/유휴/overflow)와 커넥션 획득 대기 시간을 수집합니다.
+- QueuePool의 커넥션 획득(_do_get)을 감싸 대기 시간을 측정하는 풀 클래스를 제공하며,
+  /health/db 엔드포인트에서 snapshot()으로 조회합니다.
+"""
+
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class PoolWaitStats:
+    """커넥션 획득 대기 시간 누적 통계 (워커 프로세스 단위)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0        # 풀에서 커넥션을 꺼낸 횟수
+        self.total_wait_ms = 0.0  # 누적 대기 시간
+        self.max_wait_ms = 0.0    # 최대 대기 시간
+        self.timeouts = 0         # pool_timeout 초과로 실패한 횟수
+
+    def record(self, wait_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.checkouts += 1
+            self.total_wait_ms += wait_ms
+            if wait_ms > self.max_wait_ms:
+                self.max_wait_ms = wait_ms
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            avg = self.total_wait_ms / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "avg_wait_ms": round(avg, 2),
+                "max_wait_ms": round(self.max_wait_ms, 2),
+                "timeouts": self.timeouts,
+            }
+
+
+class _WaitTimingMixin:
+    """커넥션 획득 구간의 대기 시간을 pool.wait_stats에 기록"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.record(0, timed_out=True)
+            raise
+        self.wait_stats.record((time.perf_counter() - start) * 1000)
+        return conn
+
+    def recreate(self):
+        # dispose/재생성 시에도 누적 통계 유지
+        new_pool = super().recreate()
+        new_pool.wait_stats = self.wait_stats
+        return new_pool
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    """동기 엔진용 계측 풀"""
+
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    """비동기 엔진용 계측 풀"""
+
+
+def snapshot(pool: Pool) -> dict:
+    """풀 현재 상태 + 대기 시간 통계"""
+    data = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        data.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+        })
+    wait_stats = getattr(pool, "wait_stats", None)
+    if wait_stats is not None:
+        data["wait"] = wait_stats.as_dict()
+    return data
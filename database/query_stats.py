@@ -0,0 +1,85 @@
+"""
+database/query_stats.py
+
+- 요청 단위 DB 계측(실행 SQL 수, 누적 DB 시간, 조회 행 수)을 수집합니다.
+- 엔진의 before/after_cursor_execute 이벤트에 훅을 걸고, 현재 요청의 집계 객체는
+  ContextVar로 전달합니다. (스레드풀에서 실행되는 동기 라우터에도 컨텍스트가 복사됨)
+- 집계 시작/응답 헤더 기록은 middlewares/query_stats.py 에서 담당합니다.
+"""
+
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryStats:
+    """요청 하나 동안 발생한 DB 사용량 집계"""
+
+    __slots__ = ("statements", "db_time_ms", "rows")
+
+    def __init__(self):
+        self.statements = 0      # 실행된 SQL 문 수
+        self.db_time_ms = 0.0    # DB 왕복 누적 시간 (ms)
+        self.rows = 0            # 조회(SELECT)로 가져온 행 수 (스트리밍 조회 제외)
+
+    def as_dict(self) -> dict:
+        return {
+            "statements": self.statements,
+            "db_time_ms": round(self.db_time_ms, 1),
+            "rows": self.rows,
+        }
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats() -> QueryStats:
+    """현재 컨텍스트(요청)에 새 집계 객체를 연결하고 반환"""
+    stats = QueryStats()
+    _current_stats.set(stats)
+    return stats
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """현재 요청의 집계 객체 (요청 밖이면 None)"""
+    return _current_stats.get()
+
+
+_UNKNOWN_ROWCOUNT = 2 ** 63  # SSCursor 등이 행 수 대신 돌려주는 값(2**64-1) 이상은 무시
+
+
+def _is_streamed(context) -> bool:
+    return context is not None and bool(context.execution_options.get("stream_results"))
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    starts = conn.info.get("query_start")
+    if starts:
+        stats.db_time_ms += (time.perf_counter() - starts.pop()) * 1000
+    stats.statements += 1
+    # PyMySQL 기본(버퍼드) 커서는 SELECT 결과 행 수를 rowcount로 제공
+    # - DML(description 없음)의 rowcount 는 영향받은 행 수이므로 제외
+    # - 서버사이드 커서(stream_results, 내보내기 스트리밍)는 실행 시점에 행 수를 모름 (-1 / 2**64-1) → 제외
+    if cursor.description is None or _is_streamed(context):
+        return
+    rowcount = cursor.rowcount
+    if rowcount is not None and 0 <= rowcount < _UNKNOWN_ROWCOUNT:
+        stats.rows += rowcount
+
+
+def install_query_stats(engine: Engine) -> None:
+    """엔진에 계측 이벤트 리스너 등록 (비동기 엔진은 .sync_engine 전달)"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,42 @@
+from typing import AsyncIterator, Iterator
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.db import SessionLocal, ReadSessionLocal, AsyncSessionLocal
+
+
+# ==========================================================
+# [공통] DB 세션 의존성
+# - 모든 라우터가 공유하는 단일 진입점 (라우터별 get_db 복붙 제거)
+# - 엔진 레벨 계측(database/query_stats.py)이 이 세션의 모든 SQL을 집계
+# - try/finally 구조로 항상 close 보장 → connection leak 방지
+# ==========================================================
+def get_db() -> Iterator[Session]:
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# ==========================================================
+# [공통] 읽기 전용 DB 세션 의존성
+# - 대시보드/통계처럼 무거운 조회 전용 라우터에서 사용
+# - DB_REPLICA_* 설정 시 복제본, 미설정 시 primary 로 연결
+# - 복제 지연이 있으므로 "방금 쓴 데이터를 바로 읽어야 하는" 경로에는 get_db 사용
+# ==========================================================
+def get_read_db() -> Iterator[Session]:
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# ==========================================================
+# [공통] 비동기 DB 세션 의존성
+# - async def 라우터에서 사용 (DB I/O 대기 중에도 이벤트 루프가 다른 요청 처리)
+# - async with 블록으로 요청 종료 시 항상 세션 close 보장
+# ==========================================================
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,7 +1,12 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pymilvus import connections
 from models import *
+from database.db import engine, read_engine, async_engine
+from database import pool_metrics
+from sqlalchemy import text
+import time
 import logging
 
 # HTTP 라이브러리 디버그 로그 비활성화
@@ -10,6 +15,7 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 
 # ✅ 미들웨어 임포트
 from middlewares.timing import TimingMiddleware
+from middlewares.query_stats import QueryStatsMiddleware
 from middlewares.error_handler import add_error_handlers
 
 # ✅ 라우터 임포트
@@ -25,7 +31,8 @@ from routers import (
     front_proxy, pdf_reports, problem_generation,
 
     counseling,   # ✅ 상담 관리 라우터 추가
-    grades_dashboard  # ✅ 성적 대시보드 라우터 추가
+    grades_dashboard,  # ✅ 성적 대시보드 라우터 추가
+    dashboards  # ✅ 여러 반 대시보드 일괄 조회 라우터 추가
 )
 
 # ✅ gemini-langchain-chatbot-service 라우터 임포트
@@ -34,7 +41,8 @@ from routers import gemini, milvus
 app = FastAPI(
     title="Teacher Assistant API",
     description="초등학교 교사 행정지원 AI 챗봇 백엔드 API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # ✅ orjson 으로 응답 직렬화 (표준 json 대비 빠름)
 )
 
 # ✅ CORS 설정 (프론트엔드 연동 대비)
@@ -54,6 +62,9 @@ app.add_middleware(
 # ✅ 요청 지연 측정 미들웨어 (응답 헤더 X-Latency-Ms 추가)
 app.add_middleware(TimingMiddleware)
 
+# ✅ 요청별 DB 계측 미들웨어 (X-DB-Queries / X-DB-Time-Ms / X-DB-Rows, N+1 의심 경고 로그)
+app.add_middleware(QueryStatsMiddleware)
+
 # ✅ 전역 에러 핸들러 등록 (일관된 JSON 에러 포맷)
 add_error_handlers(app)
 
@@ -64,6 +75,7 @@ app.include_router(classes.router,            prefix="/v1")
 app.include_router(events.router,             prefix="/v1")
 app.include_router(grades.router,             prefix="/v1")
 app.include_router(grades_dashboard.router,   prefix="/v1")   # ✅ 성적 대시보드 라우터
+app.include_router(dashboards.router,         prefix="/v1")   # ✅ 대시보드 일괄 조회 라우터
 app.include_router(llm.router,                prefix="/v1")   # ✅ 새 Gemini 라우터
 app.include_router(meetings.router,           prefix="/v1")
 app.include_router(notices.router,            prefix="/v1")
@@ -92,6 +104,29 @@ app.include_router(gemini.router, prefix="/v1/gemini", tags=["Gemini AI 채팅"]
 def health_check():
     return {"status": "ok", "message": "API is running"}
 
+# ✅ DB 커넥션 풀 헬스체크 (사용 중/유휴/overflow 커넥션 수, 획득 대기 시간)
+#    - 값은 이 요청을 처리한 워커 프로세스 기준
+@app.get("/health/db")
+def health_db():
+    start = time.perf_counter()
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        db_status, error = "ok", None
+    except Exception as e:
+        db_status, error = "error", str(e)
+    ping_ms = round((time.perf_counter() - start) * 1000, 1)
+
+    return {
+        "status": db_status,
+        "error": error,
+        "ping_ms": ping_ms,
+        "pool": pool_metrics.snapshot(engine.pool),
+        "async_pool": pool_metrics.snapshot(async_engine.pool),
+        # 복제본 미설정 시 primary 와 같은 풀이므로 null
+        "replica_pool": pool_metrics.snapshot(read_engine.pool) if read_engine is not engine else None,
+    }
+
 @app.on_event("startup")
 def _connect_milvus():
     try:
@@ -99,6 +134,11 @@ def _connect_milvus():
     except:
         pass  # Milvus 연결 실패해도 서버 시작
 
+@app.on_event("shutdown")
+async def _dispose_async_engine():
+    # 비동기 엔진 커넥션 풀 정리
+    await async_engine.dispose()
+
 # ✅ 루트 엔드포인트
 @app.get("/")
 def root():
@@ -0,0 +1,38 @@
+import logging
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from config.settings import settings
+from database.query_stats import start_query_stats
+
+logger = logging.getLogger("db.query_stats")
+
+
+class QueryStatsMiddleware(BaseHTTPMiddleware):
+    """
+    요청별 DB 사용량을 응답 헤더/로그로 노출
+    - X-DB-Queries: 실행 SQL 수 / X-DB-Time-Ms: 누적 DB 시간 / X-DB-Rows: 조회 행 수 (버퍼드 SELECT 만, 스트리밍 내보내기 제외)
+    - 한 요청의 SQL 수가 DB_N_PLUS_ONE_THRESHOLD 초과 시 N+1 의심 경고 로그
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        stats = start_query_stats()
+        response = await call_next(request)
+
+        response.headers["X-DB-Queries"] = str(stats.statements)
+        response.headers["X-DB-Time-Ms"] = str(int(stats.db_time_ms))
+        response.headers["X-DB-Rows"] = str(stats.rows)
+
+        if stats.statements > settings.DB_N_PLUS_ONE_THRESHOLD:
+            logger.warning(
+                "N+1 의심: %s %s statements=%d db_time_ms=%.1f rows=%d",
+                request.method, request.url.path,
+                stats.statements, stats.db_time_ms, stats.rows,
+            )
+        elif stats.statements:
+            logger.debug(
+                "%s %s statements=%d db_time_ms=%.1f rows=%d",
+                request.method, request.url.path,
+                stats.statements, stats.db_time_ms, stats.rows,
+            )
+        return response
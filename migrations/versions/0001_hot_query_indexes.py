@@ -0,0 +1,42 @@
+"""hot query indexes
+
+- 대시보드/상담/성적 조회에서 필터링에 쓰이는 컬럼에 (복합) 인덱스 추가
+  * attendance(student_id, date), attendance(date)
+  * grades(student_id, term)
+  * meetings(student_id, date)
+  * test_scores(test_id, student_id), test_scores(student_id)
+  * students(class_id)
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# (인덱스명, 테이블, 컬럼) — models/*.py 의 __table_args__ 와 동일하게 유지
+INDEXES = [
+    ("ix_attendance_student_id_date", "attendance", ["student_id", "date"]),
+    ("ix_attendance_date", "attendance", ["date"]),
+    ("ix_grades_student_id_term", "grades", ["student_id", "term"]),
+    ("ix_meetings_student_id_date", "meetings", ["student_id", "date"]),
+    ("ix_test_scores_test_id_student_id", "test_scores", ["test_id", "student_id"]),
+    ("ix_test_scores_student_id", "test_scores", ["student_id"]),
+    ("ix_students_class_id", "students", ["class_id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
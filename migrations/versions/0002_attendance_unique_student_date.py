@@ -0,0 +1,41 @@
+"""attendance unique (student_id, date)
+
+- 한 학생은 하루에 출결 기록 1건만 가질 수 있도록 유니크 제약 추가
+- 유니크 인덱스가 (student_id, date) 조회를 그대로 커버하므로 0001의 일반 복합 인덱스는 제거
+- 기존 데이터에 중복이 있으면 자동 삭제하지 않고 중단 (정리 후 재실행)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    duplicates = bind.execute(sa.text(
+        "SELECT COUNT(*) FROM ("
+        "  SELECT student_id, date FROM attendance"
+        "  GROUP BY student_id, date HAVING COUNT(*) > 1"
+        ") d"
+    )).scalar()
+    if duplicates:
+        raise RuntimeError(
+            f"attendance 테이블에 (student_id, date) 중복 {duplicates}건이 있습니다. "
+            "중복 기록을 정리한 뒤 다시 실행하세요."
+        )
+
+    op.create_unique_constraint("uq_attendance_student_id_date", "attendance", ["student_id", "date"])
+    op.drop_index("ix_attendance_student_id_date", table_name="attendance")
+
+
+def downgrade() -> None:
+    op.create_index("ix_attendance_student_id_date", "attendance", ["student_id", "date"])
+    op.drop_constraint("uq_attendance_student_id_date", "attendance", type_="unique")
@@ -0,0 +1,37 @@
+"""period date indexes
+
+- services/periods.py 의 [start, end) 범위 조회가 인덱스를 타도록 날짜 컬럼 인덱스 추가
+  * events(start_date)  — /events/monthly, AI 월간 일정
+  * meetings(date)      — /meetings/monthly/{year}/{month}, 학교 리포트
+  * notices(date)       — 학급/학교 리포트
+- attendance(date) 는 0001 에서 이미 생성됨
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+# (인덱스명, 테이블, 컬럼) — models/*.py 와 동일하게 유지
+INDEXES = [
+    ("ix_events_start_date", "events", ["start_date"]),
+    ("ix_meetings_date", "meetings", ["date"]),
+    ("ix_notices_date", "notices", ["date"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,79 @@
+"""grade rollup tables
+
+- grade_subject_stats: 반 × 학기 × 과목 성적 통계 (개수/합계/최저/최고/점수 구간)
+- student_grade_averages: 학생 × 학기 성적 합계 (개인 평균 계산용)
+- 테이블 생성 후 원본 grades 로부터 즉시 백필
+  (이후에는 성적 CRUD 시 증분 갱신, 필요 시 python -m scripts.rebuild_grade_rollups)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+BUCKET_COLUMNS = ["bucket_0_59", "bucket_60_69", "bucket_70_79", "bucket_80_89", "bucket_90_100"]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "grade_subject_stats",
+        sa.Column("class_id", sa.Integer(), primary_key=True),
+        sa.Column("term", sa.Integer(), primary_key=True),
+        sa.Column("subject_id", sa.Integer(), primary_key=True),
+        sa.Column("grade_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("score_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("score_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("score_min", sa.Float()),
+        sa.Column("score_max", sa.Float()),
+        *[sa.Column(name, sa.Integer(), nullable=False, server_default="0") for name in BUCKET_COLUMNS],
+    )
+    op.create_table(
+        "student_grade_averages",
+        sa.Column("student_id", sa.Integer(), primary_key=True),
+        sa.Column("term", sa.Integer(), primary_key=True),
+        sa.Column("class_id", sa.Integer()),
+        sa.Column("grade_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("score_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("score_sum", sa.Float(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "ix_student_grade_averages_class_id_term", "student_grade_averages", ["class_id", "term"]
+    )
+
+    # ✅ 기존 성적 백필 (services/grade_rollup.rebuild 와 같은 집계)
+    op.execute(
+        "INSERT INTO grade_subject_stats "
+        "(class_id, term, subject_id, grade_count, score_count, score_sum, score_min, score_max, "
+        + ", ".join(BUCKET_COLUMNS) + ") "
+        "SELECT s.class_id, g.term, g.subject_id, COUNT(*), COUNT(g.average_score), "
+        "COALESCE(SUM(g.average_score), 0), MIN(g.average_score), MAX(g.average_score), "
+        "SUM(CASE WHEN g.average_score < 60 THEN 1 ELSE 0 END), "
+        "SUM(CASE WHEN g.average_score >= 60 AND g.average_score < 70 THEN 1 ELSE 0 END), "
+        "SUM(CASE WHEN g.average_score >= 70 AND g.average_score < 80 THEN 1 ELSE 0 END), "
+        "SUM(CASE WHEN g.average_score >= 80 AND g.average_score < 90 THEN 1 ELSE 0 END), "
+        "SUM(CASE WHEN g.average_score >= 90 THEN 1 ELSE 0 END) "
+        "FROM grades g JOIN students s ON s.id = g.student_id "
+        "GROUP BY s.class_id, g.term, g.subject_id"
+    )
+    op.execute(
+        "INSERT INTO student_grade_averages "
+        "(student_id, term, class_id, grade_count, score_count, score_sum) "
+        "SELECT g.student_id, g.term, MAX(s.class_id), COUNT(*), COUNT(g.average_score), "
+        "COALESCE(SUM(g.average_score), 0) "
+        "FROM grades g LEFT JOIN students s ON s.id = g.student_id "
+        "GROUP BY g.student_id, g.term"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_student_grade_averages_class_id_term", table_name="student_grade_averages")
+    op.drop_table("student_grade_averages")
+    op.drop_table("grade_subject_stats")
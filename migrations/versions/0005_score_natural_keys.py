@@ -0,0 +1,61 @@
+"""grades / test_scores natural unique keys
+
+- 일괄 저장(POST /grades/bulk, /test_scores/bulk)의 INSERT ... ON DUPLICATE KEY UPDATE 기준 키
+  * grades: (student_id, term, subject_id) — 학생 × 학기 × 과목당 성적 1건
+  * test_scores: (test_id, student_id) — 시험 × 학생당 점수 1건
+- 유니크 인덱스가 0001의 일반 복합 인덱스(grades(student_id, term), test_scores(test_id, student_id))를
+  선두 컬럼으로 그대로 커버하므로 기존 인덱스는 제거
+- 기존 데이터에 중복이 있으면 자동 삭제하지 않고 중단 (정리 후 재실행)
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+# (유니크 제약명, 대체되는 인덱스명, 테이블, 컬럼)
+KEYS = [
+    ("uq_grades_student_id_term_subject_id", "ix_grades_student_id_term",
+     "grades", ["student_id", "term", "subject_id"]),
+    ("uq_test_scores_test_id_student_id", "ix_test_scores_test_id_student_id",
+     "test_scores", ["test_id", "student_id"]),
+]
+REPLACED_INDEX_COLUMNS = {
+    "ix_grades_student_id_term": ["student_id", "term"],
+    "ix_test_scores_test_id_student_id": ["test_id", "student_id"],
+}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for _, _, table, columns in KEYS:
+        cols = ", ".join(columns)
+        duplicates = bind.execute(sa.text(
+            f"SELECT COUNT(*) FROM ("
+            f"  SELECT {cols} FROM {table}"
+            f"  GROUP BY {cols} HAVING COUNT(*) > 1"
+            f") d"
+        )).scalar()
+        if duplicates:
+            raise RuntimeError(
+                f"{table} 테이블에 ({cols}) 중복 {duplicates}건이 있습니다. "
+                "중복 기록을 정리한 뒤 다시 실행하세요."
+            )
+
+    for name, replaced, table, columns in KEYS:
+        op.create_unique_constraint(name, table, columns)
+        op.drop_index(replaced, table_name=table)
+
+
+def downgrade() -> None:
+    for name, replaced, table, _ in reversed(KEYS):
+        op.create_index(replaced, table, REPLACED_INDEX_COLUMNS[replaced])
+        op.drop_constraint(name, table, type_="unique")
@@ -0,0 +1,24 @@
+"""tests(class_id, test_date) index
+
+- 반 단위 시험 시계열 조회(GET /grades/trends)가 반의 시험을 날짜순으로 인덱스 범위 스캔
+  * WHERE tests.class_id = ? ORDER BY tests.test_date
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_tests_class_id_test_date", "tests", ["class_id", "test_date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tests_class_id_test_date", table_name="tests")
@@ -0,0 +1,36 @@
+"""grading policies
+
+- grading_policies: 과목 × 학기 범위별 성적 등급 기준 (등급 1행, 하한 점수)
+  * subject_id / term NULL = 전 과목 / 전 학기 기본값
+- 행이 없으면 settings.GRADE_LETTER_CUTOFFS 를 사용하므로 백필 없음
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "grading_policies",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("subject_id", sa.Integer()),
+        sa.Column("term", sa.Integer()),
+        sa.Column("letter", sa.String(10), nullable=False),
+        sa.Column("min_score", sa.Float(), nullable=False),
+        sa.UniqueConstraint("subject_id", "term", "letter", name="uq_grading_policies_subject_id_term_letter"),
+    )
+    op.create_index("ix_grading_policies_id", "grading_policies", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_grading_policies_id", table_name="grading_policies")
+    op.drop_table("grading_policies")
@@ -0,0 +1,42 @@
+"""attendance daily rollup
+
+- attendance_daily_rollup: 반 × 날짜 × 상태 출결 건수 (students 에 없는 학생의 출결은 class_id 0)
+- 테이블 생성 후 원본 attendance 로부터 즉시 백필
+  (이후에는 출결 쓰기 시 증분 갱신, 필요 시 python -m scripts.rebuild_attendance_rollup)
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "attendance_daily_rollup",
+        sa.Column("class_id", sa.Integer(), primary_key=True),
+        sa.Column("date", sa.Date(), primary_key=True),
+        sa.Column("status", sa.String(20), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index("ix_attendance_daily_rollup_date", "attendance_daily_rollup", ["date"])
+
+    # ✅ 기존 출결 백필 (services/attendance_rollup.rebuild 와 같은 집계)
+    op.execute(
+        "INSERT INTO attendance_daily_rollup (class_id, date, status, count) "
+        "SELECT COALESCE(s.class_id, 0), a.date, a.status, COUNT(*) "
+        "FROM attendance a LEFT JOIN students s ON s.id = a.student_id "
+        "GROUP BY COALESCE(s.class_id, 0), a.date, a.status"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_attendance_daily_rollup_date", table_name="attendance_daily_rollup")
+    op.drop_table("attendance_daily_rollup")
@@ -11,3 +11,6 @@ from .meetings import Meeting
 from .reports import Report
 from .school_report import SchoolReport
 from .notices import Notice
+from .grade_stats import GradeSubjectStat, StudentGradeAverage
+from .grading_policies import GradingPolicy
+from .attendance_stats import AttendanceDailyRollup
@@ -1,12 +1,16 @@
-from sqlalchemy import Column, Integer, String, Date
+from sqlalchemy import Column, Integer, String, Date, UniqueConstraint
 from database.db import Base
 
 class Attendance(Base):
     __tablename__ = "attendance"  # 출결 기록 테이블
+    __table_args__ = (
+        # 학생당 하루 1건 (학생+기간 조회 인덱스 겸용, migrations 0002)
+        UniqueConstraint("student_id", "date", name="uq_attendance_student_id_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)         # 출결 고유 ID (Primary Key)
     student_id = Column(Integer, nullable=False)               # 학생 ID (students 테이블과 연동)
-    date = Column(Date, nullable=False)                        # 날짜
+    date = Column(Date, nullable=False, index=True)            # 날짜
     status = Column(String(20), nullable=False)                # 출결 상태 (예: 출석, 결석, 지각)
     reason = Column(String(200))                               # 사유 (결석/조퇴 등 상세 이유)
     special_note = Column(String(200))                         # 특이사항 (예: 감염병 의심, 면담 필요 등)
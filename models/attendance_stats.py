@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, Date, Index
+from database.db import Base
+
+# ✅ 출결 일별 집계(rollup) 테이블
+# - attendance 원본에서 파생된 값이므로 직접 수정하지 않음
+#   * 출결 쓰기(CRUD, AI 일괄 출석처리) 시 services/attendance_rollup.py 가 같은 트랜잭션에서 증분 갱신
+#   * 백필/정합성 복구: python -m scripts.rebuild_attendance_rollup
+# - class_id 는 학생의 현재 반 (students 에 없는 학생의 출결은 0)
+#   PUT /students/{id} 반 이동은 이전/새 반 범위를 재구축, students 를 직접 바꾼 경우는 재구축 스크립트 실행
+
+
+class AttendanceDailyRollup(Base):
+    """반 × 날짜 × 상태 출결 건수"""
+    __tablename__ = "attendance_daily_rollup"
+    __table_args__ = (
+        # 학교 전체 기간 조회 (주간/학기 요약)
+        Index("ix_attendance_daily_rollup_date", "date"),
+    )
+
+    class_id = Column(Integer, primary_key=True)                # 반 ID (0 = students 에 없는 학생)
+    date = Column(Date, primary_key=True)                       # 날짜
+    status = Column(String(20), primary_key=True)               # 출결 상태 (예: 출석, 결석, 지각)
+    count = Column(Integer, nullable=False, default=0)          # 출결 건수
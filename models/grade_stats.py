@@ -0,0 +1,43 @@
+from sqlalchemy import Column, Integer, Float, Index
+from database.db import Base
+
+# ✅ 성적 집계(rollup) 테이블
+# - grades 원본에서 파생된 값이므로 직접 수정하지 않음
+#   * 성적 CRUD 시 services/grade_rollup.py 가 같은 트랜잭션에서 증분 갱신
+#   * 백필/정합성 복구: python -m scripts.rebuild_grade_rollups
+# - 학생의 반 이동(PUT /students/{id})은 이전/새 반 범위를 같은 트랜잭션에서 재구축
+#   (일괄 반 편성처럼 students 를 직접 바꾼 경우는 재구축 스크립트 실행)
+
+
+class GradeSubjectStat(Base):
+    """반 × 학기 × 과목 성적 통계 (점수 NULL 성적은 score_count/합계/구간에서 제외)"""
+    __tablename__ = "grade_subject_stats"
+
+    class_id = Column(Integer, primary_key=True)                # 반 ID
+    term = Column(Integer, primary_key=True)                    # 학기
+    subject_id = Column(Integer, primary_key=True)              # 과목 ID
+    grade_count = Column(Integer, nullable=False, default=0)    # 성적 행 수 (점수 NULL 포함)
+    score_count = Column(Integer, nullable=False, default=0)    # 점수가 있는 성적 수
+    score_sum = Column(Float, nullable=False, default=0)        # 점수 합계
+    score_min = Column(Float)                                   # 최저 점수
+    score_max = Column(Float)                                   # 최고 점수
+    bucket_0_59 = Column(Integer, nullable=False, default=0)    # 점수 구간별 성적 수
+    bucket_60_69 = Column(Integer, nullable=False, default=0)
+    bucket_70_79 = Column(Integer, nullable=False, default=0)
+    bucket_80_89 = Column(Integer, nullable=False, default=0)
+    bucket_90_100 = Column(Integer, nullable=False, default=0)
+
+
+class StudentGradeAverage(Base):
+    """학생 × 학기 성적 합계 (개인 평균 = score_sum / score_count 또는 / grade_count)"""
+    __tablename__ = "student_grade_averages"
+    __table_args__ = (
+        Index("ix_student_grade_averages_class_id_term", "class_id", "term"),
+    )
+
+    student_id = Column(Integer, primary_key=True)              # 학생 ID
+    term = Column(Integer, primary_key=True)                    # 학기
+    class_id = Column(Integer)                                  # 집계 시점의 반 ID
+    grade_count = Column(Integer, nullable=False, default=0)    # 성적 행 수 (점수 NULL 포함)
+    score_count = Column(Integer, nullable=False, default=0)    # 점수가 있는 성적 수
+    score_sum = Column(Float, nullable=False, default=0)        # 점수 합계
@@ -1,8 +1,12 @@
-from sqlalchemy import Column, Integer, Float, String
+from sqlalchemy import Column, Integer, Float, String, UniqueConstraint
 from database.db import Base
 
 class Grade(Base):
     __tablename__ = "grades"  # 성적 요약 테이블
+    __table_args__ = (
+        # 학생 × 학기 × 과목당 1건 (일괄 저장 upsert 키, 학생+학기 조회 인덱스 겸용, migrations 0005)
+        UniqueConstraint("student_id", "term", "subject_id", name="uq_grades_student_id_term_subject_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)     # 성적 고유 ID (Primary Key)
     student_id = Column(Integer, nullable=False)           # 학생 ID
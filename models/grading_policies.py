@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, Float, String, UniqueConstraint
+from database.db import Base
+
+# ✅ 성적 등급 기준(정책) 테이블
+# - 범위(subject_id, term) × 등급 1행: 점수가 min_score 이상이면 해당 등급
+# - NULL 은 "전체"를 의미 (subject_id NULL = 전 과목 기본, term NULL = 전 학기 공통)
+# - 적용 우선순위: (과목, 학기) > (과목, 전 학기) > (전 과목, 학기) > (전 과목, 전 학기) > settings.GRADE_LETTER_CUTOFFS
+# - 범위 단위로 통째로 교체 (PUT /grades/policies), 등급 계산은 services/grading_policy.py
+
+
+class GradingPolicy(Base):
+    __tablename__ = "grading_policies"
+    __table_args__ = (
+        UniqueConstraint("subject_id", "term", "letter", name="uq_grading_policies_subject_id_term_letter"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)     # 등급 기준 고유 ID
+    subject_id = Column(Integer)                           # 과목 ID (NULL = 전 과목 기본)
+    term = Column(Integer)                                 # 학기 (NULL = 전 학기 공통)
+    letter = Column(String(10), nullable=False)            # 성적 등급 (예: A, B, C)
+    min_score = Column(Float, nullable=False)              # 등급 하한 점수 (이상)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Date, Time
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, Time, Index
 from sqlalchemy.orm import relationship
 from database.db import Base
 
@@ -9,6 +9,10 @@ from models.teachers import Teacher as TeacherModel
 # ✅ 상담 및 면담 기록 테이블 정의
 class Meeting(Base):
     __tablename__ = "meetings"  # 테이블명: meetings
+    __table_args__ = (
+        Index("ix_meetings_student_id_date", "student_id", "date"),
+        Index("ix_meetings_date", "date"),  # 월별 상담 조회 (기간 범위)
+    )
 
     id = Column(Integer, primary_key=True, index=True)         # 상담 고유 ID (PK)
     title = Column(String(100), nullable=False)                # 상담 제목
@@ -8,5 +8,5 @@ class Notice(Base):
     title = Column(String(100), nullable=False)                             # 공지 제목
     content = Column(String(500), nullable=False)                           # 공지 내용
     target_class_id = Column(Integer, ForeignKey("classes.id"), nullable=False)  # 대상 학급 ID
-    date = Column(Date, nullable=False)                                     # 작성일자
+    date = Column(Date, nullable=False, index=True)                         # 작성일자 (기간 조회 인덱스)
     is_important = Column(Boolean, default=False, nullable=False)           # 중요 여부
\ No newline at end of file
@@ -1,8 +1,12 @@
-from sqlalchemy import Column, Integer, String, Date
+from sqlalchemy import Column, Integer, String, Date, Index
 from database.db import Base
 
 class Test(Base):
     __tablename__ = "tests"  # 시험 정보 테이블
+    __table_args__ = (
+        # 반 단위 시험 날짜순 조회 (성적 추이, migrations 0006)
+        Index("ix_tests_class_id_test_date", "class_id", "test_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)        # 시험 고유 ID
     subject_id = Column(Integer, nullable=False)             # 과목 ID
@@ -1,18 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from database.db import SessionLocal
+from sqlalchemy.ext.asyncio import AsyncSession
+from dependencies.db import get_async_db
 from pydantic import BaseModel
 from services.ai_service import process_ai_query
 
 router = APIRouter(prefix="/ai", tags=["AI 챗봇"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 class ChatRequest(BaseModel):
     message: str
 
@@ -21,7 +14,7 @@ class ChatResponse(BaseModel):
 
 @router.post("/chat", response_model=ChatResponse)
 
-async def chat_with_ai(request: ChatRequest, db: Session = Depends(get_db)):
+async def chat_with_ai(request: ChatRequest, db: AsyncSession = Depends(get_async_db)):
     try:
         # AI 서비스 호출
         response = await process_ai_query(request.message, db)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, HTTPException, Depends
 from typing import List
-from sqlalchemy.orm import Session
-from database.db import SessionLocal
+from sqlalchemy.ext.asyncio import AsyncSession
+from dependencies.db import get_async_db
 from services.ai_client import ai_client, AIClientError
 # ✅ 신규 핸들러들 추가
 from services.ai_handlers import (
@@ -21,22 +21,14 @@ from schemas.ai_schemas import (
 router = APIRouter(prefix="/ai", tags=["AI 챗봇"])
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ===============================================================
 # 회의록 질의 (Meeting Handler)
 # ===============================================================
 @router.post("/meetings/query", response_model=AIResponse)
-async def query_meetings(message: str, db: Session = Depends(get_db)):
+async def query_meetings(message: str, db: AsyncSession = Depends(get_async_db)):
     """회의록 요약/액션 아이템 질의"""
     try:
-        result = meeting_handler.handle_meeting_query(message, db)
+        result = await meeting_handler.handle_meeting_query(message, db)
         return AIResponse(status="success", data=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -46,10 +38,10 @@ async def query_meetings(message: str, db: Session = Depends(get_db)):
 # 일정 질의 (Event Handler)
 # ===============================================================
 @router.post("/events/query", response_model=AIResponse)
-async def query_events(message: str, db: Session = Depends(get_db)):
+async def query_events(message: str, db: AsyncSession = Depends(get_async_db)):
     """주간/월간 일정 질의"""
     try:
-        result = event_handler.handle_event_query(message, db)
+        result = await event_handler.handle_event_query(message, db)
         return AIResponse(status="success", data=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -59,10 +51,10 @@ async def query_events(message: str, db: Session = Depends(get_db)):
 # 출결 질의 (Attendance Handler)
 # ===============================================================
 @router.post("/attendance/query", response_model=AIResponse)
-async def query_attendance(message: str, db: Session = Depends(get_db)):
+async def query_attendance(message: str, db: AsyncSession = Depends(get_async_db)):
     """출결 요약/학생/반 질의"""
     try:
-        result = attendance_handler.handle_attendance_query(message, db)
+        result = await attendance_handler.handle_attendance_query(message, db)
         return AIResponse(status="success", data=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -72,10 +64,10 @@ async def query_attendance(message: str, db: Session = Depends(get_db)):
 # 공지 질의 (Notice Handler)
 # ===============================================================
 @router.post("/notices/query", response_model=AIResponse)
-async def query_notices(message: str, db: Session = Depends(get_db)):
+async def query_notices(message: str, db: AsyncSession = Depends(get_async_db)):
     """공지사항 질의 (중요/최근/주간 등)"""
     try:
-        result = notice_handler.handle_notice_query(message, db)
+        result = await notice_handler.handle_notice_query(message, db)
         return AIResponse(status="success", data=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -85,10 +77,10 @@ async def query_notices(message: str, db: Session = Depends(get_db)):
 # 통합 리포트 질의 (Report Handler)
 # ===============================================================
 @router.post("/reports/query", response_model=AIResponse)
-async def query_reports(message: str, db: Session = Depends(get_db)):
+async def query_reports(message: str, db: AsyncSession = Depends(get_async_db)):
     """통합 리포트 생성 (학급/학생/학교 단위)"""
     try:
-        result = report_handler.handle_report_query(message, db)
+        result = await report_handler.handle_report_query(message, db)
         return AIResponse(status="success", data=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
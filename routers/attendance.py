@@ -1,29 +1,24 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from datetime import datetime
-from collections import Counter
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date, datetime, timedelta
+from typing import List, Optional
 
-from database.db import SessionLocal
+from dependencies.db import get_db, get_async_db
 from models.attendance import Attendance as AttendanceModel
-from models.students import Student as StudentModel   # ✅ 학급(class_id) 참조용
-from schemas.attendance import Attendance as AttendanceSchema
+from models.students import Student as StudentModel
+from schemas.attendance import Attendance as AttendanceSchema, RollCallRequest
+from schemas.common import CursorPagination
+from services.pagination import keyset_paginate
+from services.export_stream import ExportFormat, stream_export
+from services import (
+    attendance_aggregation, attendance_calendar, attendance_roll_call, attendance_rollup, periods,
+)
+from services.attendance_rollup import AttendanceValues
 
 router = APIRouter(prefix="/attendance", tags=["attendance"])
 
-# ==========================================================
-# [공통] DB 세션 관리
-# - 모든 요청에서 DB 연결을 생성하고 종료하는 역할
-# - try/finally 구조로 항상 close 보장 → connection leak 방지
-# ==========================================================
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # ==========================================================
 # [공통] 상태 매핑 (DB 값 → 응답 값)
 # - DB에는 한글 상태값('출석', '결석', '지각', '조회')이 저장됨
@@ -46,6 +41,8 @@ def get_db():
 def create_attendance(attendance: AttendanceSchema, db: Session = Depends(get_db)):
     db_attendance = AttendanceModel(**attendance.model_dump())
     db.add(db_attendance)
+    db.flush()
+    attendance_rollup.apply_change(db, None, AttendanceValues.of(db_attendance))  # ✅ 일별 집계 증분 갱신
     db.commit()
     db.refresh(db_attendance)
     return {
@@ -61,24 +58,33 @@ def create_attendance(attendance: AttendanceSchema, db: Session = Depends(get_db
     }
 
 # ✅ [READ] 전체 출결 조회
-# - 모든 학생의 출결 기록을 전부 가져옴
+# - 모든 학생의 출결 기록을 id 순 커서(keyset) 페이지로 가져옴
 # - 관리자/교사가 학급 전체 출석부를 확인할 때 사용
+# - 다음 페이지: ?cursor={next_cursor}, 필드 선택: ?fields=id,date,status
 # - 결과: 리스트 형태로 반환, 프론트에서는 테이블로 표시 가능
+LIST_FIELDS = {
+    "id": AttendanceModel.id,
+    "student_id": AttendanceModel.student_id,
+    "date": AttendanceModel.date,
+    "status": AttendanceModel.status,
+    "reason": AttendanceModel.reason,
+}
+
 @router.get("/")
-def read_attendance_list(db: Session = Depends(get_db)):
-    records = db.query(AttendanceModel).all()
+def read_attendance_list(
+    page: CursorPagination = Depends(),
+    format: Optional[ExportFormat] = Query(None, description="전체 덤프 스트리밍: ndjson | csv"),
+    db: Session = Depends(get_db)
+):
+    # ✅ format 지정 시 페이지네이션 없이 전체 행을 서버사이드 커서로 스트리밍
+    if format:
+        return stream_export(LIST_FIELDS, format, "attendance", fields=page.fields)
+
+    result = keyset_paginate(db, LIST_FIELDS, page)
     return {
         "success": True,
-        "data": [
-            {
-                "id": r.id,
-                "student_id": r.student_id,
-                "date": str(r.date),
-                "status": r.status,
-                "reason": r.reason
-            }
-            for r in records
-        ]
+        "data": result["items"],
+        "next_cursor": result["next_cursor"]
     }
 
 # ==========================================================
@@ -95,16 +101,15 @@ def get_daily_attendance_summary(
     db: Session = Depends(get_db),
 ):
     target_date = datetime.strptime(date, "%Y-%m-%d").date()
-    records = db.query(AttendanceModel).filter(AttendanceModel.date == target_date).all()
-
-    total = len(records)
-    status_counter = Counter([r.status for r in records])  # 상태별 인원 수 카운트
+    # 상태별 인원 수 (GROUP BY status)
+    status_counter = attendance_aggregation.count_by_status(db, AttendanceModel.date == target_date)
 
+    total = sum(status_counter.values())
     present = status_counter.get("출석", 0)
     absent = status_counter.get("결석", 0)
     late = status_counter.get("지각", 0)
     checkin = status_counter.get("조회", 0)
-    rate = round((present / total) * 100, 1) if total else 0  # 출석률 계산
+    rate = attendance_aggregation.attendance_rate(present, total)  # 출석률 계산
 
     return {
         "success": True,
@@ -122,7 +127,8 @@ def get_daily_attendance_summary(
 # ✅ [WEEKLY SUMMARY] 특정 주간 출결 평균 + 결석 사유 분석
 # - 지정된 기간 동안의 일별 출석률을 계산하여 주간 평균을 냄
 # - 동시에 결석 사유 데이터를 수집 → 가장 많이 발생한 사유 분석
-# - 결과: 주간 평균 출석률, 최다 결석 사유, 비율
+# - 결과: 주간 평균 출석률, 최다 결석 사유, 비율 (+ 일별 출석률)
+# - 일별 출석률은 일별 집계 테이블(반 × 날짜 × 상태)에서, 결석 사유는 원본 GROUP BY reason 으로 계산
 @router.get("/weekly-summary")
 def get_weekly_attendance_summary(
     start_date: str = Query(..., description="시작일 (예: 2025-07-22)"),
@@ -131,36 +137,38 @@ def get_weekly_attendance_summary(
 ):
     start = datetime.strptime(start_date, "%Y-%m-%d").date()
     end = datetime.strptime(end_date, "%Y-%m-%d").date()
-    records = db.query(AttendanceModel).filter(AttendanceModel.date.between(start, end)).all()
+    in_range = attendance_aggregation.date_range(start, end)
 
-    # 날짜별 출석률 계산
-    grouped = {}
-    for r in records:
-        grouped.setdefault(r.date, []).append(r)
-
-    total_days = len(grouped)
-    total_rate = 0
-    for day_records in grouped.values():
-        day_total = len(day_records)
-        day_present = sum(1 for r in day_records if r.status == "출석")
-        total_rate += (day_present / day_total * 100) if day_total else 0
+    # 날짜별 출석률 계산 (일별 집계 테이블)
+    days = attendance_rollup.daily_counts(db, periods.Period(start, end + timedelta(days=1)))
+    total_days = len(days)
+    total_rate = sum((day_present / day_total * 100) for _, day_total, day_present in days)
 
     avg_rate = round(total_rate / total_days, 1) if total_days else 0
 
-    # 결석 사유 분석
-    reasons = [r.reason for r in records if r.status == "결석" and r.reason]
-    reason_counter = Counter(reasons)
-    top_reason = reason_counter.most_common(1)[0] if reason_counter else ("None", 0)
+    # 결석 사유 분석 (GROUP BY reason, 건수 내림차순)
+    reasons = attendance_aggregation.absence_reasons(db, *in_range)
+    total_absent = sum(count for _, count in reasons)
+    top_reason = reasons[0] if reasons else ("None", 0)
 
     return {
         "success": True,
         "data": {
             "period": f"{start_date} ~ {end_date}",
-            "total_records": len(records),
+            "total_records": sum(day_total for _, day_total, _ in days),
             "average_attendance_rate": f"{avg_rate}%",
             "top_absent_reason": top_reason[0],
-            "top_absent_rate": f"{round((top_reason[1] / len(reasons)) * 100, 1)}%" if reasons else "0%",
-            "total_absent": len(reasons)
+            "top_absent_rate": f"{round((top_reason[1] / total_absent) * 100, 1)}%" if total_absent else "0%",
+            "total_absent": total_absent,
+            "daily": [
+                {
+                    "date": str(day),
+                    "total": day_total,
+                    "present": day_present,
+                    "attendance_rate": f"{attendance_aggregation.attendance_rate(day_present, day_total)}%"
+                }
+                for day, day_total, day_present in days
+            ]
         }
     }
 
@@ -174,21 +182,19 @@ def get_monthly_attendance_summary(
     month: str = Query(..., description="YYYY-MM 형식 (예: 2025-07)"),
     db: Session = Depends(get_db),
 ):
-    year, mon = map(int, month.split("-"))
-    records = (
-        db.query(AttendanceModel)
-        .join(StudentModel, AttendanceModel.student_id == StudentModel.id)
-        .filter(StudentModel.class_id == class_id)
-        .filter(func.year(AttendanceModel.date) == year)
-        .filter(func.month(AttendanceModel.date) == mon)
-        .all()
-    )
-
-    total = len(records)
-    present = sum(1 for r in records if r.status == "출석")
-    absent = sum(1 for r in records if r.status == "결석")
-    late = sum(1 for r in records if r.status == "지각")
-    rate = round((present / total) * 100, 1) if total else 0
+    try:
+        period = periods.parse_month(month)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # ✅ 일별 집계 테이블의 (반, 기간) 행만 합산 — 반 인원/출결 행 수와 무관
+    counts = attendance_rollup.count_by_status(db, period, class_id)
+
+    total = sum(counts.values())
+    present = counts.get("출석", 0)
+    absent = counts.get("결석", 0)
+    late = counts.get("지각", 0)
+    rate = attendance_aggregation.attendance_rate(present, total)
 
     return {
         "success": True,
@@ -203,6 +209,39 @@ def get_monthly_attendance_summary(
         }
     }
 
+# ✅ [SEMESTER SUMMARY] 학기 출결 통계 (학교 전체 또는 반)
+# - 학년도 year 의 term 학기(1학기 3/1~8/31, 2학기 9/1~2월 말) 상태별 건수와 출석률
+# - 일별 집계 테이블에서 계산하므로 학기 길이 × 반 수 × 상태 수 만큼의 행만 읽음
+@router.get("/semester-summary")
+def get_semester_attendance_summary(
+    year: int = Query(..., description="학년도 (예: 2025)"),
+    term: int = Query(..., ge=1, le=2, description="학기 (1 또는 2)"),
+    class_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+):
+    period = periods.semester(year, term)
+    counts = attendance_rollup.count_by_status(db, period, class_id)
+
+    total = sum(counts.values())
+    present = counts.get("출석", 0)
+    rate = attendance_aggregation.attendance_rate(present, total)
+
+    return {
+        "success": True,
+        "data": {
+            "year": year,
+            "term": term,
+            "class_id": class_id,
+            "period": f"{period.start} ~ {period.last_day}",
+            "total": total,
+            "present": present,
+            "absent": counts.get("결석", 0),
+            "late": counts.get("지각", 0),
+            "early": counts.get("조퇴", 0),
+            "attendance_rate": f"{rate}%"
+        }
+    }
+
 # ==========================================================
 # [3단계] 혼합 라우터 - 일부 정적, 일부 동적
 # ==========================================================
@@ -213,15 +252,15 @@ def get_monthly_attendance_summary(
 # - 결과: 총 출결 수, 출석/결석/지각 횟수, 출석률 %
 @router.get("/student/{student_id}/summary")
 def get_student_attendance_summary(student_id: int, db: Session = Depends(get_db)):
-    records = db.query(AttendanceModel).filter(AttendanceModel.student_id == student_id).all()
-    if not records:
+    counts = attendance_aggregation.count_by_status(db, AttendanceModel.student_id == student_id)
+    if not counts:
         return {"success": False, "error": {"code": 404, "message": "Attendance records not found for student"}}
 
-    total = len(records)
-    present = sum(1 for r in records if r.status == "출석")
-    absent = sum(1 for r in records if r.status == "결석")
-    late = sum(1 for r in records if r.status == "지각")
-    rate = round((present / total) * 100, 1) if total else 0
+    total = sum(counts.values())
+    present = counts.get("출석", 0)
+    absent = counts.get("결석", 0)
+    late = counts.get("지각", 0)
+    rate = attendance_aggregation.attendance_rate(present, total)
 
     return {
         "success": True,
@@ -241,20 +280,15 @@ def get_student_attendance_summary(student_id: int, db: Session = Depends(get_db
 # - 결과: 반별 총 출석/결석/지각 횟수와 출석률 %
 @router.get("/class/{class_id}/summary")
 def get_class_attendance_summary(class_id: int, db: Session = Depends(get_db)):
-    records = (
-        db.query(AttendanceModel)
-        .join(StudentModel, AttendanceModel.student_id == StudentModel.id)
-        .filter(StudentModel.class_id == class_id)
-        .all()
-    )
-    if not records:
+    counts = attendance_aggregation.count_by_status(db, class_id=class_id)
+    if not counts:
         return {"success": False, "error": {"code": 404, "message": "Attendance records not found for class"}}
 
-    total = len(records)
-    present = sum(1 for r in records if r.status == "출석")
-    absent = sum(1 for r in records if r.status == "결석")
-    late = sum(1 for r in records if r.status == "지각")
-    rate = round((present / total) * 100, 1) if total else 0
+    total = sum(counts.values())
+    present = counts.get("출석", 0)
+    absent = counts.get("결석", 0)
+    late = counts.get("지각", 0)
+    rate = attendance_aggregation.attendance_rate(present, total)
 
     return {
         "success": True,
@@ -268,6 +302,101 @@ def get_class_attendance_summary(class_id: int, db: Session = Depends(get_db)):
         }
     }
 
+# ✅ [ROLL CALL] 반 × 날짜 출석부 일괄 저장
+# - body: 학생 ID → 상태/사유, 목록에 없는 반 학생은 출석으로 저장
+# - 바뀐 학생만 (student_id, date) 기준 INSERT ... ON DUPLICATE KEY UPDATE 한 문장 + 일별 집계 증분 반영을 한 트랜잭션으로
+# - 같은 요청 재전송/동시 중복 제출에도 결과 동일 (반 학생 행 잠금으로 직렬화)
+# - 결과: 적용된 diff (신규 / 변경 전후 / 변경 없음 건수)
+@router.put("/roll-call/{class_id}/{date}")
+def put_roll_call(
+    class_id: int,
+    date: str,
+    payload: RollCallRequest,
+    db: Session = Depends(get_db),
+):
+    try:
+        target_date = datetime.strptime(date, "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="날짜는 YYYY-MM-DD 형식이어야 합니다.")
+
+    entries = {student_id: (e.status, e.reason) for student_id, e in payload.students.items()}
+    try:
+        diff = attendance_roll_call.roll_call(db, class_id, target_date, entries)
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    if diff is None:
+        db.rollback()
+        return {"success": False, "error": {"code": 404, "message": "Students not found for class"}}
+    db.commit()
+
+    return {
+        "success": True,
+        "data": {"class_id": class_id, "date": str(target_date), **diff},
+        "message": f"출석부 저장 (신규 {len(diff['created'])}건, 변경 {len(diff['updated'])}건)"
+    }
+
+# ✅ [CALENDAR] 반 학년도 출결 달력 + 주의 학생
+# - 학생마다 학년도 하루 1글자 상태 코드 문자열 (legend 참고, 0 = 기록 없음)
+# - 연속 결석 / 요일 반복 패턴(예: 월요일 지각) / 잦은 결석을 반 전체 한 번에 계산
+# - 달력은 프로세스 캐시 사용 (출결 변경 시 다음 조회에서 DB 로 재구축)
+@router.get("/calendar/class/{class_id}")
+def get_class_attendance_calendar(
+    class_id: int,
+    date: Optional[str] = Query(None, description="기준 날짜 (예: 2025-07-26, 기본: 오늘)"),
+    db: Session = Depends(get_db),
+):
+    target_date = datetime.strptime(date, "%Y-%m-%d").date() if date else datetime.now().date()
+    calendar = attendance_calendar.get_calendar(db, class_id, periods.school_year_of(target_date))
+    if not len(calendar.student_ids):
+        return {"success": False, "error": {"code": 404, "message": "Students not found for class"}}
+
+    stats = attendance_calendar.detect(calendar, target_date)
+    return {
+        "success": True,
+        "data": {
+            "class_id": class_id,
+            "year": calendar.year,
+            "date": str(target_date),
+            "start": str(calendar.period.start),
+            "legend": attendance_calendar.LEGEND,
+            "students": attendance_calendar.student_summaries(calendar, target_date, stats),
+            "need_attention": attendance_calendar.need_attention(calendar, target_date, stats),
+        }
+    }
+
+# ✅ [CALENDAR] 학생 학년도 출결 달력
+# - 학생이 속한 반의 달력(캐시)에서 해당 학생 행만 반환
+@router.get("/calendar/student/{student_id}")
+def get_student_attendance_calendar(
+    student_id: int,
+    date: Optional[str] = Query(None, description="기준 날짜 (예: 2025-07-26, 기본: 오늘)"),
+    db: Session = Depends(get_db),
+):
+    target_date = datetime.strptime(date, "%Y-%m-%d").date() if date else datetime.now().date()
+    class_id = db.scalar(select(StudentModel.class_id).where(StudentModel.id == student_id))
+    if class_id is None:
+        return {"success": False, "error": {"code": 404, "message": "Student not found"}}
+
+    calendar = attendance_calendar.get_calendar(db, class_id, periods.school_year_of(target_date))
+    stats = attendance_calendar.detect(calendar, target_date)
+    summary = next(s for s in attendance_calendar.student_summaries(calendar, target_date, stats)
+                   if s["student_id"] == student_id)
+    alerts = [a for a in attendance_calendar.need_attention(calendar, target_date, stats)
+              if a["student_id"] == student_id]
+    return {
+        "success": True,
+        "data": {
+            **summary,
+            "class_id": class_id,
+            "year": calendar.year,
+            "date": str(target_date),
+            "start": str(calendar.period.start),
+            "legend": attendance_calendar.LEGEND,
+            "need_attention": alerts,
+        }
+    }
+
 # ==========================================================
 # [4단계] 완전 동적 라우터 - 맨 마지막에 배치
 # ==========================================================
@@ -300,9 +429,12 @@ def update_attendance(attendance_id: int, updated: AttendanceSchema, db: Session
     if attendance is None:
         return {"success": False, "error": {"code": 404, "message": "Attendance record not found"}}
 
+    before = AttendanceValues.of(attendance)
     for key, value in updated.model_dump().items():
         setattr(attendance, key, value)
 
+    db.flush()
+    attendance_rollup.apply_change(db, before, AttendanceValues.of(attendance))  # ✅ 일별 집계 증분 갱신
     db.commit()
     db.refresh(attendance)
     return {
@@ -326,7 +458,10 @@ def delete_attendance(attendance_id: int, db: Session = Depends(get_db)):
     if attendance is None:
         return {"success": False, "error": {"code": 404, "message": "Attendance record not found"}}
 
+    before = AttendanceValues.of(attendance)
     db.delete(attendance)
+    db.flush()
+    attendance_rollup.apply_change(db, before, None)  # ✅ 일별 집계 증분 갱신
     db.commit()
     return {
         "success": True,
@@ -337,42 +472,36 @@ def delete_attendance(attendance_id: int, db: Session = Depends(get_db)):
     }
 
 
+# ✅ [STATS] 학생별 출결 통계
+# - students ⟕ attendance 조건부 집계(COUNT(CASE ...)) 한 쿼리로 학생별 상태 건수 계산
+# - class_id / 기간(start_date~end_date, 양끝 포함) 필터, 학생 id 커서 페이지네이션 (limit 미지정 시 전체)
 @router.get("/stats/students")
-async def get_student_attendance_stats(db: Session = Depends(get_db)):
-    """학생별 출석 통계 조회 (전체 기간)"""
+async def get_student_attendance_stats(
+    class_id: Optional[int] = None,
+    start_date: Optional[date] = Query(None, description="시작일 (포함)"),
+    end_date: Optional[date] = Query(None, description="종료일 (포함)"),
+    cursor: Optional[int] = Query(None, ge=0, description="직전 응답의 next_cursor (학생 ID)"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="페이지당 학생 수 (미지정 시 전체)"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """학생별 출석 통계 조회 (기본: 전체 학생, 전체 기간)"""
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date 가 end_date 보다 늦습니다.")
     try:
-        # 모든 학생 조회
-        students = db.query(StudentModel).all()
-        
-        # 학생별 출석 통계 계산
-        stats_data = []
-        for student in students:
-            # 각 상태별 카운트
-            attendance_counts = db.query(
-                AttendanceModel.status,
-                func.count(AttendanceModel.id).label('count')
-            ).filter(
-                AttendanceModel.student_id == student.id
-            ).group_by(AttendanceModel.status).all()
-            
-            # 상태별 카운트를 딕셔너리로 변환
-            status_counts = {status: count for status, count in attendance_counts}
-            
-            stats_data.append({
-                "student_id": student.id,
-                "student_name": student.student_name,
-                "class_id": student.class_id,
-                "absent_count": status_counts.get("결석", 0),
-                "late_count": status_counts.get("지각", 0),
-                "early_count": status_counts.get("조퇴", 0),
-                "present_count": status_counts.get("출석", 0)
-            })
-        
+        stmt = attendance_aggregation.student_stats_stmt(
+            class_id, start_date, end_date, cursor, None if limit is None else limit + 1
+        )
+        rows = (await db.execute(stmt)).mappings().all()
+
+        has_more = limit is not None and len(rows) > limit
+        stats_data = [dict(row) for row in (rows[:limit] if has_more else rows)]
+
         return {
             "success": True,
-            "data": stats_data
+            "data": stats_data,
+            "next_cursor": stats_data[-1]["student_id"] if has_more else None
         }
-        
+
     except Exception as e:
         return {
             "success": False,
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from database.db import SessionLocal
+from dependencies.db import get_db, get_read_db
 from models.classes import Class as ClassModel
 from models.students import Student as StudentModel
 from models.teachers import Teacher as TeacherModel
@@ -12,17 +12,6 @@ from schemas.classes import Class, ClassCreate
 
 router = APIRouter(prefix="/classes", tags=["classes"])
 
-# ==========================================================
-# [공통] DB 세션 관리
-# - 모든 요청에서 DB 연결을 생성하고 종료
-# ==========================================================
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # ==========================================================
 # [1단계] CRUD 기본 라우터
 # ==========================================================
@@ -98,7 +87,7 @@ def get_class_teachers(class_id: int, db: Session = Depends(get_db)):
 # ✅ [SUMMARY] 학급별 요약 (학생 수, 평균 성적, 출결 통계)
 # - 한 반의 전반적인 상태를 요약해서 제공
 @router.get("/{class_id}/summary")
-def get_class_summary(class_id: int, db: Session = Depends(get_db)):
+def get_class_summary(class_id: int, db: Session = Depends(get_read_db)):
     # 학생 수
     student_count = db.query(StudentModel).filter(StudentModel.class_id == class_id).count()
 
@@ -127,7 +116,7 @@ def get_class_summary(class_id: int, db: Session = Depends(get_db)):
 # ✅ [SUMMARY] 전체 학급 요약
 # - 전 학급 단위의 학생 수, 평균 성적 현황
 @router.get("/summary")
-def classes_summary(db: Session = Depends(get_db)):
+def classes_summary(db: Session = Depends(get_read_db)):
     class_stats = db.query(
         ClassModel.id,
         func.count(StudentModel.id).label("student_count"),
@@ -2,29 +2,18 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from database.db import SessionLocal
+from dependencies.db import get_db, get_read_db
 from models.students import Student as StudentModel
 from models.meetings import Meeting as MeetingModel
 from schemas.meetings import Meeting, MeetingCreate
 
 router = APIRouter(prefix="/counseling", tags=["counseling"])
 
-# ==========================================================
-# [공통] DB 세션 관리
-# ==========================================================
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ==========================================================
 # [1단계] 학생별 상담 요약
 # ==========================================================
 @router.get("/students")
-def get_students_with_summary(db: Session = Depends(get_db)):
+def get_students_with_summary(db: Session = Depends(get_read_db)):
     students = db.query(StudentModel).all()
     result = []
 
@@ -60,7 +49,7 @@ def get_students_with_summary(db: Session = Depends(get_db)):
 # [2단계] 상담 현황 통계
 # ==========================================================
 @router.get("/stats")
-def get_counseling_stats(db: Session = Depends(get_db)):
+def get_counseling_stats(db: Session = Depends(get_read_db)):
     total_students = db.query(func.count(StudentModel.id)).scalar()
     students_with_counseling = db.query(MeetingModel.student_id).distinct().count()
     no_counseling = total_students - students_with_counseling
@@ -0,0 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from config.settings import settings
+from dependencies.db import get_read_db
+from models.classes import Class as ClassModel
+from schemas.dashboards import DashboardBatchRequest
+from services import attendance_calendar, attendance_dashboard, grade_analytics, periods
+from services.reference_cache import get_reference_data
+
+router = APIRouter(prefix="/dashboards", tags=["대시보드"])
+
+# ✅ 반별 계산(pandas 집계 등 CPU 작업)용 스레드 풀 — 요청마다 생성하지 않고 프로세스에서 공유
+_executor = ThreadPoolExecutor(
+    max_workers=max(settings.DASHBOARD_BATCH_WORKERS, 1),
+    thread_name_prefix="dashboard-batch",
+)
+
+
+# ==========================================================
+# [DASHBOARD] 여러 반 성적/출결 대시보드 일괄 조회
+# - 반 수와 관계없이 쿼리 수 고정:
+#   (학년 지정 시 반 목록 1) + 성적 1 + 출결 1
+#   (+ 참조 데이터 / 출결 달력 캐시 미스 시 각 1회 로드)
+# - 조회한 행을 반별로 나눈 뒤 대시보드 계산은 스레드 풀에서 병렬 수행
+# - 각 반의 grades / attendance 는 단건 API(/grades/dashboard, /attendance/dashboard)의 data 와 같은 형태
+# ==========================================================
+@router.post("/batch")
+def get_dashboards_batch(
+    payload: DashboardBatchRequest,
+    db: Session = Depends(get_read_db),
+):
+    try:
+        term_no = periods.parse_term(payload.term)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if payload.grade is not None:
+        class_ids = list(
+            db.scalars(
+                select(ClassModel.id)
+                .where(ClassModel.grade == payload.grade)
+                .order_by(ClassModel.class_num, ClassModel.id)
+            )
+        )
+    else:
+        class_ids = list(dict.fromkeys(payload.class_ids))  # 중복 제거 (순서 유지)
+
+    if not class_ids:
+        return {"success": False, "error": {"code": 404, "message": "데이터 없음"}}
+    if len(class_ids) > settings.DASHBOARD_BATCH_MAX_CLASSES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.DASHBOARD_BATCH_MAX_CLASSES}개 반까지 조회할 수 있습니다.",
+        )
+
+    # ✅ 모든 반의 원본 행을 한 번에 조회
+    refs = get_reference_data(db)
+    frame = grade_analytics.load_scores(db, term_no, class_ids)
+    frames = dict(tuple(frame.groupby("class_id", sort=False)))
+    attendance_rows = attendance_dashboard.load_rows(db, class_ids, payload.date)
+    calendars = attendance_calendar.get_calendars(db, class_ids, periods.school_year_of(payload.date))
+
+    def build(class_id: int) -> dict:
+        class_frame = frames.get(class_id)
+        grades = None
+        if class_frame is not None:
+            grades = {
+                "class_id": class_id,
+                "term": payload.term,
+                **grade_analytics.class_dashboard(class_frame, threshold=payload.threshold),
+            }
+        return {
+            "class_id": class_id,
+            "class_name": refs.class_name(class_id),
+            "grades": grades,  # 반에 학생이 없으면 None
+            "attendance": attendance_dashboard.build_dashboard(
+                class_id, payload.date, attendance_rows.get(class_id, []), calendars[class_id]
+            ),
+        }
+
+    if settings.DASHBOARD_BATCH_WORKERS > 1 and len(class_ids) > 1:
+        dashboards = list(_executor.map(build, class_ids))
+    else:
+        dashboards = [build(class_id) for class_id in class_ids]
+
+    return {
+        "success": True,
+        "data": {
+            "term": payload.term,
+            "date": str(payload.date),
+            "classes": dashboards,
+        },
+        "message": f"{len(dashboards)}개 반 대시보드 조회 성공"
+    }
@@ -1,24 +1,14 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from database.db import SessionLocal
+from dependencies.db import get_db
 from models.events import Event as EventModel
 from schemas.events import Event as EventSchema
+from schemas.common import CursorPagination
+from services.pagination import keyset_paginate
+from services import periods
 
 router = APIRouter(prefix="/events", tags=["events"])
 
-# ==========================================================
-# [공통] DB 세션 관리
-# - 모든 요청에서 DB 연결을 열고 닫는 역할
-# - connection leak 방지를 위해 try/finally 사용
-# ==========================================================
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # ==========================================================
 # [1단계] CRUD 기본 라우터
 # ==========================================================
@@ -48,26 +38,26 @@ def create_event(event: EventSchema, db: Session = Depends(get_db)):
     }
 
 # ✅ [READ] 전체 학사일정 조회
-# - 등록된 모든 학사일정 데이터를 조회
+# - 등록된 학사일정 데이터를 id 순 커서 페이지로 조회 (fields= 로 필드 선택)
 # - 예: 연간 학사 일정표 출력
+LIST_FIELDS = {
+    "id": EventModel.id,
+    "event_name": EventModel.event_name,
+    "event_type": EventModel.event_type,
+    "start_date": EventModel.start_date,
+    "end_date": EventModel.end_date,
+    "start_time": EventModel.start_time,
+    "end_time": EventModel.end_time,
+    "description": EventModel.description,
+}
+
 @router.get("/")
-def read_events(db: Session = Depends(get_db)):
-    records = db.query(EventModel).all()
+def read_events(page: CursorPagination = Depends(), db: Session = Depends(get_db)):
+    result = keyset_paginate(db, LIST_FIELDS, page)
     return {
         "success": True,
-        "data": [
-            {
-                "id": r.id, 
-                "event_name": r.event_name, 
-                "event_type": r.event_type, 
-                "start_date": str(r.start_date), 
-                "end_date": str(r.end_date) if r.end_date else None,
-                "start_time": str(r.start_time) if r.start_time else None,
-                "end_time": str(r.end_time) if r.end_time else None,
-                "description": r.description
-            }
-            for r in records
-        ]
+        "data": result["items"],
+        "next_cursor": result["next_cursor"]
     }
 
 # ==========================================================
@@ -79,10 +69,14 @@ def read_events(db: Session = Depends(get_db)):
 # - 학급별/학교별 월간 캘린더 조회에 활용
 @router.get("/monthly")
 def get_monthly_events(year: int, month: int, db: Session = Depends(get_db)):
+    try:
+        period = periods.month(year, month)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     events = (
         db.query(EventModel)
-        .filter(func.year(EventModel.start_date) == year)
-        .filter(func.month(EventModel.start_date) == month)
+        .filter(period.filter(EventModel.start_date))
         .all()
     )
     return {
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from database.db import SessionLocal
+from dependencies.db import get_db
 # (DB 저장 여부에 따라 models/schemas 연동 가능)
 # from models.exams import Exam as ExamModel
 # from schemas.exams import ExamCreate
@@ -10,14 +10,6 @@ from services.ai_handlers import exam_handler
 
 router = APIRouter(prefix="/exams", tags=["시험지 생성 및 관리"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ✅ [GENERATE] 시험지 자동 생성 (AI 연동)
 @router.post("/generate")
 def generate_exam(payload: dict, db: Session = Depends(get_db)):
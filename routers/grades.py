@@ -1,10 +1,24 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import and_, func, select
 
-from database.db import SessionLocal
+from config.settings import settings
+from dependencies.db import get_db, get_read_db
 from models.grades import Grade as GradeModel
-from schemas.grades import Grade as GradeSchema
+from schemas.grades import (
+    Grade as GradeSchema, GradeBulkItem, GradeBulkRequest, GradingPolicyUpdate, RecomputeLettersRequest,
+)
+from schemas.common import CursorPagination
+from services.pagination import keyset_paginate
+from services.export_stream import ExportFormat, stream_export
+from services.serializers import fast_response
+from services import (
+    bulk_upsert, grade_letters, grade_rankings, grade_rollup, grade_trends, grading_policy, score_buckets,
+)
+from services.reference_cache import get_reference_data
+from services.grade_rollup import GradeValues
+from models.grade_stats import GradeSubjectStat
 
 # 추가 모델 import
 from models.students import Student as StudentModel
@@ -13,184 +27,280 @@ from models.classes import Class as ClassModel
 
 router = APIRouter(prefix="/grades", tags=["grades"])
 
-# ==========================================================
-# [공통] DB 세션 관리
-# ==========================================================
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # ==========================================================
 # [1단계] 정적 분석/요약 라우터
 # ==========================================================
 
 # ✅ [PIVOT] 반(class_id) 기준 학생별 성적 피벗
 # - 한 반 학생들의 과목별 점수와 개인 평균 제공
+# - students ⟕ classes ⟕ grades ⟕ subjects 를 한 번의 쿼리로 조회 후 Python 에서 학생별로 묶음
+# - term 지정 시 해당 학기 성적만 (조건을 JOIN 에 걸어 성적 없는 학생도 목록에 유지)
 @router.get("/pivot")
-def get_class_grades(class_id: int, db: Session = Depends(get_db)):
-    students = db.query(StudentModel).filter(StudentModel.class_id == class_id).all()
-    if not students:
+def get_class_grades(
+    class_id: int,
+    term: Optional[int] = Query(None, description="학기 (1 또는 2, 미지정 시 전체)"),
+    db: Session = Depends(get_db)
+):
+    grade_join = GradeModel.student_id == StudentModel.id
+    if term is not None:
+        grade_join = and_(grade_join, GradeModel.term == term)
+
+    rows = db.execute(
+        select(
+            StudentModel.id,
+            StudentModel.student_name,
+            ClassModel.grade,
+            ClassModel.class_num,
+            SubjectModel.name,
+            GradeModel.average_score,
+            GradeModel.grade_letter,
+        )
+        .select_from(StudentModel)
+        .outerjoin(ClassModel, ClassModel.id == StudentModel.class_id)
+        .outerjoin(GradeModel, grade_join)
+        .outerjoin(SubjectModel, SubjectModel.id == GradeModel.subject_id)
+        .where(StudentModel.class_id == class_id)
+        .order_by(StudentModel.id, GradeModel.term, GradeModel.id)  # 기존 (student_id, term) 인덱스 순서와 동일
+    ).all()
+    if not rows:
         return {"success": False, "error": {"code": 404, "message": "No students found for this class"}}
 
-    result = []
-    for student in students:
-        grades = db.query(GradeModel).filter(GradeModel.student_id == student.id).all()
-        scores, total_score, subject_count = {}, 0, 0
-
-        for grade in grades:
-            subject = db.query(SubjectModel).filter(SubjectModel.id == grade.subject_id).first()
-            if subject:
-                scores[subject.name] = {
-                    "average_score": grade.average_score,
-                    "grade_letter": grade.grade_letter
-                }
-                if grade.average_score is not None:
-                    total_score += grade.average_score
-                    subject_count += 1
-
-        avg_score = round(total_score / subject_count, 1) if subject_count else 0
-        class_obj = db.query(ClassModel).filter(ClassModel.id == student.class_id).first()
-        class_name = f"{class_obj.grade}-{class_obj.class_num}" if class_obj else "Unknown"
-
-        result.append({
-            "student_id": student.id,
-            "name": student.student_name,
-            "class": class_name,
-            "scores": scores,
-            "average": avg_score
-        })
+    result, totals = [], {}
+    for student_id, name, grade, class_num, subject_name, average_score, grade_letter in rows:
+        if not result or result[-1]["student_id"] != student_id:
+            result.append({
+                "student_id": student_id,
+                "name": name,
+                "class": f"{grade}-{class_num}" if grade is not None else "Unknown",
+                "scores": {},
+                "average": 0
+            })
+            totals[student_id] = [0, 0]  # [점수 합, 과목 수]
+
+        # 성적이 없거나(LEFT JOIN) 과목이 삭제된 성적은 기존과 동일하게 제외
+        if subject_name is None:
+            continue
+        result[-1]["scores"][subject_name] = {
+            "average_score": average_score,
+            "grade_letter": grade_letter
+        }
+        if average_score is not None:
+            totals[student_id][0] += average_score
+            totals[student_id][1] += 1
+
+    for item in result:
+        total_score, subject_count = totals[item["student_id"]]
+        item["average"] = round(total_score / subject_count, 1) if subject_count else 0
 
     return {"success": True, "data": result}
 
 # ✅ [RANKING] 반 내 평균 점수 기준 등수
+# - SQL 윈도 함수(RANK / DENSE_RANK / PERCENT_RANK)로 계산 → 동점자는 같은 석차
+# - by_subject=true 이면 과목별 석차(반 × 학기 × 과목)도 함께 반환
+# - 결과는 (반, 학기) 단위로 캐시되고 성적 쓰기 시 무효화 (services/grade_rankings.py)
 @router.get("/rankings")
-def get_class_rankings(class_id: int, db: Session = Depends(get_db)):
-    students = db.query(StudentModel).filter(StudentModel.class_id == class_id).all()
-    if not students:
+def get_class_rankings(
+    class_id: int,
+    term: Optional[int] = Query(None, description="학기 (미지정 시 전 학기 합산)"),
+    by_subject: bool = Query(False, description="과목별 석차 포함 여부"),
+    db: Session = Depends(get_db)
+):
+    results = grade_rankings.get_rankings(db, class_id, term, by_subject)
+    if not results:
         return {"success": False, "error": {"code": 404, "message": "No students found for this class"}}
 
-    results = []
-    for student in students:
-        grades = db.query(GradeModel).filter(GradeModel.student_id == student.id).all()
-        avg_score = round(sum([g.average_score for g in grades if g.average_score is not None]) / len(grades), 1) if grades else 0.0
-        results.append({
-            "student_id": student.id,
-            "name": student.student_name,
-            "avg_score": avg_score,
-            "grade_letters": [g.grade_letter for g in grades if g.grade_letter]
-        })
-
-    sorted_results = sorted(results, key=lambda x: x["avg_score"], reverse=True)
-    for idx, item in enumerate(sorted_results, start=1):
-        item["rank"] = idx
-
-    return {"success": True, "data": sorted_results}
+    return {"success": True, "data": results}
 
 # ✅ [SUMMARY] 반 전체 평균 점수
+# - 반 × 학기 × 과목 집계 행의 합계/개수로 계산 (원본 성적 행을 읽지 않음)
 @router.get("/summary")
 def get_class_average_score(class_id: int, db: Session = Depends(get_db)):
-    student_ids = db.query(StudentModel.id).filter(StudentModel.class_id == class_id).all()
-    student_ids = [s[0] for s in student_ids]
-
-    if not student_ids:
+    if not db.query(StudentModel.id).filter(StudentModel.class_id == class_id).first():
         return {"success": False, "error": {"code": 404, "message": "No students found for this class"}}
 
-    avg_result = (
-        db.query(func.avg(GradeModel.average_score))
-        .filter(GradeModel.student_id.in_(student_ids))
-        .scalar()
+    score_sum, score_count = (
+        db.query(func.sum(GradeSubjectStat.score_sum), func.sum(GradeSubjectStat.score_count))
+        .filter(GradeSubjectStat.class_id == class_id)
+        .one()
     )
-    avg_score = round(avg_result, 1) if avg_result else 0.0
+    avg_score = round(score_sum / score_count, 1) if score_count else 0.0
 
     return {"success": True, "data": {"class_id": class_id, "average_score": avg_score}}
 
 # ✅ [DISTRIBUTION] 점수 구간별 학생 수 분포
+# - 학생별 평균(GROUP BY) → CASE 구간 번호 → 구간별 COUNT 를 한 번의 쿼리로 계산
+# - 평균은 점수가 있는 성적만으로 계산, 점수가 없는 학생은 어느 구간에도 포함하지 않음
 @router.get("/distribution")
-def get_score_distribution(class_id: int, db: Session = Depends(get_db)):
-    students = db.query(StudentModel).filter(StudentModel.class_id == class_id).all()
-    if not students:
+def get_score_distribution(
+    class_id: int,
+    edges: List[int] = Query(list(score_buckets.DEFAULT_EDGES), description="구간 경계 (예: edges=60&edges=70&edges=80&edges=90)"),
+    db: Session = Depends(get_db)
+):
+    try:
+        edges = score_buckets.validate_edges(edges)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    averages = grade_rollup.student_averages(class_id).subquery()
+    bucket = score_buckets.bucket_case(averages.c.average, edges).label("bucket")
+    rows = db.execute(select(bucket, func.count()).group_by(bucket)).all()
+    if not rows:
         return {"success": False, "error": {"code": 404, "message": "No students found for this class"}}
 
-    distribution = {"0~59": 0, "60~69": 0, "70~79": 0, "80~89": 0, "90~100": 0}
-
-    for student in students:
-        grades = db.query(GradeModel).filter(GradeModel.student_id == student.id).all()
-        if not grades:
-            continue
-        avg_score = sum([g.average_score for g in grades if g.average_score is not None]) / len(grades)
-        if avg_score < 60: distribution["0~59"] += 1
-        elif avg_score < 70: distribution["60~69"] += 1
-        elif avg_score < 80: distribution["70~79"] += 1
-        elif avg_score < 90: distribution["80~89"] += 1
-        else: distribution["90~100"] += 1
+    labels = score_buckets.bucket_labels(edges)
+    distribution = dict.fromkeys(labels, 0)
+    for index, count in rows:
+        if index is not None:
+            distribution[labels[index]] = count
 
     return {"success": True, "data": {"class_id": class_id, "distribution": distribution}}
 
 # ✅ [LOW PERFORMERS] 기준 미달 학생 목록
+# - 학생별 평균 GROUP BY ... HAVING average < threshold 로 기준 미달 학생만 조회
 @router.get("/low-performers")
 def get_low_performers(class_id: int, threshold: float = 65.0, db: Session = Depends(get_db)):
-    students = db.query(StudentModel).filter(StudentModel.class_id == class_id).all()
-    if not students:
+    stmt = grade_rollup.student_averages(class_id)
+    low = db.execute(
+        stmt.having(stmt.selected_columns.average < threshold).order_by(StudentModel.id)
+    ).all()
+    if not low and not db.query(StudentModel.id).filter(StudentModel.class_id == class_id).first():
         return {"success": False, "error": {"code": 404, "message": "No students found for this class"}}
 
-    low_performers = []
-    for student in students:
-        grades = db.query(GradeModel).filter(GradeModel.student_id == student.id).all()
-        if not grades:
-            continue
-        avg_score = sum([g.average_score for g in grades if g.average_score is not None]) / len(grades)
-        if avg_score < threshold:
-            low_performers.append({
-                "student_id": student.id,
-                "name": student.student_name,
-                "average": round(avg_score, 1),
-                "grade_letters": [g.grade_letter for g in grades if g.grade_letter]
-            })
+    # 등급 목록은 기준 미달 학생분만 조회
+    letters = grade_rankings.grade_letters(db, [row.student_id for row in low])
+    low_performers = [
+        {
+            "student_id": row.student_id,
+            "name": row.name,
+            "average": round(row.average, 1),
+            "grade_letters": letters.get(row.student_id, [])
+        }
+        for row in low
+    ]
 
     return {
         "success": True,
         "data": {"class_id": class_id, "threshold": threshold, "count": len(low_performers), "students": low_performers}
     }
 
+# ✅ [TRENDS] 반 전체 학생 × 과목 성적 추이
+# - 학기 성적 + 시험 점수(시험 날짜순)를 과목별 시계열로 병합, 이동평균/기울기/추세 계산
+# - 반 단위 2쿼리 (시험은 tests(class_id, test_date) 인덱스), 계산은 services/grade_trends.py
+@router.get("/trends")
+def get_class_trends(
+    class_id: int,
+    year: Optional[int] = Query(None, description="학기 성적을 배치할 학년도 (미지정 시 최근 시험 기준)"),
+    window: int = Query(grade_trends.DEFAULT_WINDOW, ge=1, le=20, description="이동평균 구간 (시점 수)"),
+    threshold: float = Query(grade_trends.TREND_THRESHOLD, ge=0, description="상승/하락 판정 기울기 (점/30일)"),
+    db: Session = Depends(get_read_db)
+):
+    roster, frame, year = grade_trends.load_points(db, class_id=class_id, year=year)
+    if not roster:
+        return {"success": False, "error": {"code": 404, "message": "No students found for this class"}}
+
+    trends = grade_trends.build_trends(db, roster, frame, window, threshold)
+    return {
+        "success": True,
+        "data": {"class_id": class_id, "year": year, "window": window, "threshold": threshold, **trends}
+    }
+
+# ==========================================================
+# [1단계] 등급 기준(정책) 라우터 (정적 경로)
+# ==========================================================
+
+# ✅ [POLICY] 등급 기준 조회
+# - term/subject_id 지정 시 그 범위와 공통(NULL) 범위 기준만
+@router.get("/policies")
+def get_grading_policies(
+    term: Optional[int] = Query(None, ge=1, le=2),
+    subject_id: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
+    return {
+        "success": True,
+        "data": {
+            "default": settings.GRADE_LETTER_CUTOFFS,
+            "policies": grading_policy.list_policies(db, term, subject_id),
+        }
+    }
+
+# ✅ [POLICY] 범위(과목 × 학기) 등급 기준 교체
+# - 기존 성적 등급은 바뀌지 않음 → POST /grades/recompute-letters 로 재계산
+@router.put("/policies")
+def put_grading_policy(payload: GradingPolicyUpdate, db: Session = Depends(get_db)):
+    try:
+        grading_policy.replace_policy(db, payload.subject_id, payload.term, payload.cutoffs)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    db.commit()
+    return {
+        "success": True,
+        "data": {"subject_id": payload.subject_id, "term": payload.term, "cutoffs": payload.cutoffs},
+        "message": "등급 기준이 저장되었습니다."
+    }
+
+# ✅ [POLICY] 범위 등급 기준 삭제 (상위 범위 또는 기본값으로 복귀)
+@router.delete("/policies")
+def delete_grading_policy(
+    subject_id: Optional[int] = None,
+    term: Optional[int] = Query(None, ge=1, le=2),
+    db: Session = Depends(get_db)
+):
+    deleted = grading_policy.delete_policy(db, subject_id, term)
+    if not deleted:
+        return {"success": False, "error": {"code": 404, "message": "Grading policy not found"}}
+    db.commit()
+    return {"success": True, "data": {"subject_id": subject_id, "term": term, "deleted": deleted}}
+
+# ✅ [RECOMPUTE] 학기 전체 성적 등급 재계산
+# - 현재 등급 정책으로 UPDATE grades SET grade_letter = CASE ... 한 문장 (등급이 바뀌는 행만)
+@router.post("/recompute-letters")
+def recompute_grade_letters(payload: RecomputeLettersRequest, db: Session = Depends(get_db)):
+    try:
+        updated = grading_policy.recompute_letters(db, payload.term, payload.subject_ids)
+    except ValueError as e:  # 저장된 기준이 잘못된 경우
+        raise HTTPException(status_code=400, detail=str(e))
+    db.commit()
+    return {
+        "success": True,
+        "data": {"term": payload.term, "subject_ids": payload.subject_ids, "updated": updated},
+        "message": f"{payload.term}학기 성적 등급 {updated}건 재계산"
+    }
+
 # ==========================================================
 # [2단계] 부분 동적 라우터 (학생 단위 조회)
 # ==========================================================
 
 # ✅ [READ] 특정 학생의 성적 피벗
+# - 학생 1 + 성적 1쿼리, 과목명/반 이름은 참조 데이터 캐시에서 (과목이 없는 성적은 제외)
 @router.get("/student/{student_id}")
 def get_student_grades(student_id: int, db: Session = Depends(get_db)):
-    student = db.query(StudentModel).filter(StudentModel.id == student_id).first()
+    student = db.get(StudentModel, student_id)
     if not student:
         return {"success": False, "error": {"code": 404, "message": "Student not found"}}
 
-    results = (
-        db.query(
-            SubjectModel.name.label("subject_name"),
-            GradeModel.average_score,
-            GradeModel.grade_letter
+    refs = get_reference_data(db)
+    results = [
+        (refs.subjects[subject_id], average_score, grade_letter)
+        for subject_id, average_score, grade_letter in db.execute(
+            select(GradeModel.subject_id, GradeModel.average_score, GradeModel.grade_letter)
+            .where(GradeModel.student_id == student_id)
+            .order_by(GradeModel.id)
         )
-        .join(SubjectModel, SubjectModel.id == GradeModel.subject_id)
-        .filter(GradeModel.student_id == student_id)
-        .all()
-    )
+        if subject_id in refs.subjects
+    ]
     if not results:
         return {"success": False, "error": {"code": 404, "message": "No grades found for student"}}
 
-    scores = {r.subject_name: {"average_score": r.average_score, "grade_letter": r.grade_letter} for r in results}
-    avg_score = round(sum([r.average_score for r in results if r.average_score is not None]) / len(results), 1)
-
-    class_info = db.query(ClassModel).filter(ClassModel.id == student.class_id).first()
-    class_name = f"{class_info.grade}-{class_info.class_num}" if class_info else "Unknown"
+    scores = {name: {"average_score": score, "grade_letter": letter} for name, score, letter in results}
+    avg_score = round(sum(score for _, score, _ in results if score is not None) / len(results), 1)
 
     return {
         "success": True,
         "data": {
             "student_id": student.id,
             "name": student.student_name,
-            "class": class_name,
+            "class": refs.class_name(student.class_id),
             "scores": scores,
             "average": avg_score
         }
@@ -203,8 +313,12 @@ def get_student_grades(student_id: int, db: Session = Depends(get_db)):
 # ✅ [CREATE] 성적 추가
 @router.post("/")
 def create_grade(grade: GradeSchema, db: Session = Depends(get_db)):
-    db_grade = GradeModel(**grade.model_dump())
+    values = grade.model_dump()
+    grading_policy.fill_missing_letters(db, [values])  # ✅ 등급 미지정 시 등급 정책으로 계산
+    db_grade = GradeModel(**values)
     db.add(db_grade)
+    db.flush()
+    grade_rollup.apply_grade_change(db, None, GradeValues.of(db_grade))  # ✅ 집계 테이블 증분 갱신
     db.commit()
     db.refresh(db_grade)
     return {
@@ -219,24 +333,97 @@ def create_grade(grade: GradeSchema, db: Session = Depends(get_db)):
         }
     }
 
-# ✅ [READ] 전체 성적 조회
-@router.get("/")
-def read_grades(db: Session = Depends(get_db)):
-    records = db.query(GradeModel).all()
+# ✅ [BULK] 성적 일괄 저장 (시험 한 번 분량)
+# - 행별 검증 → 오류 행만 errors 로 반환하고 나머지는 저장 (배치 전체를 거부하지 않음)
+# - grade_letter 미지정 행은 요청 등급 기준(cutoffs) 또는 과목 × 학기 등급 정책으로 한 번에 계산
+# - (student_id, term, subject_id) 기준 INSERT ... ON DUPLICATE KEY UPDATE 한 문장 + 집계 재구축을 한 트랜잭션으로
+@router.post("/bulk")
+def bulk_upsert_grades(payload: GradeBulkRequest, db: Session = Depends(get_db)):
+    if len(payload.rows) > settings.BULK_MAX_ROWS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {settings.BULK_MAX_ROWS}행까지 저장할 수 있습니다.")
+    try:
+        cutoffs = grade_letters.resolve_cutoffs(payload.cutoffs) if payload.cutoffs is not None else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    valid, errors = bulk_upsert.validate_rows(GradeBulkItem, payload.rows)
+    valid, duplicates = bulk_upsert.drop_duplicates(valid, key=lambda g: (g.student_id, g.term, g.subject_id))
+    errors += duplicates
+
+    # 학생/과목 존재 확인 (학생 1쿼리, 과목은 참조 데이터 캐시)
+    student_classes = dict(db.execute(
+        select(StudentModel.id, StudentModel.class_id)
+        .where(StudentModel.id.in_({g.student_id for _, g in valid}))
+    ).tuples().all())
+    subjects = get_reference_data(db).subjects
+    rows = []
+    for index, g in valid:
+        if g.student_id not in student_classes:
+            errors.append(bulk_upsert.row_error(index, "학생을 찾을 수 없습니다.", "student_id"))
+        elif g.subject_id not in subjects:
+            errors.append(bulk_upsert.row_error(index, "과목을 찾을 수 없습니다.", "subject_id"))
+        else:
+            rows.append(g.model_dump())
+
+    grading_policy.fill_missing_letters(db, rows, cutoffs)
+
+    # 기존 성적 키 (신규/갱신 건수 보고용)
+    existing = set()
+    if rows:
+        existing = set(db.execute(
+            select(GradeModel.student_id, GradeModel.term, GradeModel.subject_id)
+            .where(GradeModel.student_id.in_({row["student_id"] for row in rows}))
+        ).tuples())
+    updated = sum((row["student_id"], row["term"], row["subject_id"]) in existing for row in rows)
+
+    bulk_upsert.upsert(
+        db, GradeModel, rows,
+        key_columns=["student_id", "term", "subject_id"],
+        update_columns=["average_score", "grade_letter"],
+    )
+    # ✅ 행 단위 증분 대신 영향받은 (반, 학기) 범위만 집계 재구축
+    for class_id, term in sorted({(student_classes[row["student_id"]], row["term"]) for row in rows}):
+        grade_rollup.rebuild(db, class_id=class_id, term=term)
+    db.commit()
+
     return {
         "success": True,
-        "data": [
-            {
-                "id": r.id,
-                "student_id": r.student_id,
-                "subject_id": r.subject_id,
-                "average_score": r.average_score,
-                "grade_letter": r.grade_letter
-            }
-            for r in records
-        ]
+        "data": {
+            "received": len(payload.rows),
+            "saved": len(rows),
+            "inserted": len(rows) - updated,
+            "updated": updated,
+            "errors": sorted(errors, key=lambda e: e["index"]),
+        },
+        "message": f"성적 {len(rows)}건 저장 (오류 {len(errors)}건)"
     }
 
+# ✅ [READ] 전체 성적 조회 (커서 페이지네이션 + 필드 선택)
+LIST_FIELDS = {
+    "id": GradeModel.id,
+    "student_id": GradeModel.student_id,
+    "subject_id": GradeModel.subject_id,
+    "average_score": GradeModel.average_score,
+    "grade_letter": GradeModel.grade_letter,
+}
+
+@router.get("/")
+def read_grades(
+    page: CursorPagination = Depends(),
+    format: Optional[ExportFormat] = Query(None, description="전체 덤프 스트리밍: ndjson | csv"),
+    db: Session = Depends(get_db)
+):
+    # ✅ format 지정 시 페이지네이션 없이 전체 행을 서버사이드 커서로 스트리밍
+    if format:
+        return stream_export(LIST_FIELDS, format, "grades", fields=page.fields)
+
+    result = keyset_paginate(db, LIST_FIELDS, page)
+    return fast_response({
+        "success": True,
+        "data": result["items"],
+        "next_cursor": result["next_cursor"]
+    })
+
 # ==========================================================
 # [4단계] 완전 동적 라우터
 # ==========================================================
@@ -265,9 +452,14 @@ def update_grade(grade_id: int, updated: GradeSchema, db: Session = Depends(get_
     if grade is None:
         return {"success": False, "error": {"code": 404, "message": "Grade not found"}}
 
-    for key, value in updated.model_dump().items():
+    before = GradeValues.of(grade)
+    values = updated.model_dump()
+    grading_policy.fill_missing_letters(db, [values])  # ✅ 등급 미지정 시 등급 정책으로 계산
+    for key, value in values.items():
         setattr(grade, key, value)
 
+    db.flush()
+    grade_rollup.apply_grade_change(db, before, GradeValues.of(grade))  # ✅ 집계 테이블 증분 갱신
     db.commit()
     db.refresh(grade)
     return {
@@ -289,7 +481,10 @@ def delete_grade(grade_id: int, db: Session = Depends(get_db)):
     if grade is None:
         return {"success": False, "error": {"code": 404, "message": "Grade not found"}}
 
+    before = GradeValues.of(grade)
     db.delete(grade)
+    db.flush()
+    grade_rollup.apply_grade_change(db, before, None)  # ✅ 집계 테이블 증분 갱신
     db.commit()
     return {
         "success": True,
@@ -1,120 +1,71 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from database.db import SessionLocal
-from models.students import Student as StudentModel
-from models.grades import Grade as GradeModel
-from models.subjects import Subject as SubjectModel
+from dependencies.db import get_read_db
+from services import grade_analytics, periods
+from services.reference_cache import get_reference_data
 
 router = APIRouter(prefix="/grades", tags=["grades"])
 
-# ==========================================================
-# [공통] DB 세션 관리
-# ==========================================================
-def get_db():
-    db = SessionLocal()
+
+def _parse_term(term: str) -> int:
     try:
-        yield db
-    finally:
-        db.close()
+        return periods.parse_term(term)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 
 # ==========================================================
-# [대시보드] 반 성적 요약
+# [대시보드] 학교 전체 성적 요약
+# - /dashboard/{class_id} 보다 먼저 등록해야 "school" 이 class_id 로 해석되지 않음
 # ==========================================================
-@router.get("/dashboard/{class_id}")
-def get_grades_dashboard(
-    class_id: int,
+@router.get("/dashboard/school")
+def get_school_grades_dashboard(
     term: str = Query("2학기", description="조회할 학기 (예: 1학기, 2학기)"),
-    db: Session = Depends(get_db)
+    threshold: float = Query(grade_analytics.DEFAULT_THRESHOLD, description="개별 지도 필요 기준 점수 (미만)"),
+    top: int = Query(10, ge=1, le=100, description="상·하위 학생 수"),
+    db: Session = Depends(get_read_db)
 ):
-    # 반 학생 조회
-    students = db.query(StudentModel).filter(StudentModel.class_id == class_id).all()
-    if not students:
-        return {"success": False, "error": {"code": 404, "message": "데이터 없음"}}
-
-    student_data = []
-    all_scores = []
-    subject_scores = {}
-
-    for student in students:
-        # ✅ 학기(term) 조건 추가
-        grades = (
-            db.query(GradeModel, SubjectModel)
-            .join(SubjectModel, SubjectModel.id == GradeModel.subject_id)
-            .filter(
-                GradeModel.student_id == student.id,
-                GradeModel.term == term  # 학기 필터링
-            )
-            .all()
-        )
+    term_no = _parse_term(term)
 
-        scores, total_score, subject_count = {}, 0, 0
-        for grade, subject in grades:
-            scores[subject.name] = grade.average_score
-            if grade.average_score is not None:
-                total_score += grade.average_score
-                subject_count += 1
-                all_scores.append(grade.average_score)
-
-                # 과목별 집계
-                if subject.name not in subject_scores:
-                    subject_scores[subject.name] = []
-                subject_scores[subject.name].append(grade.average_score)
-
-        avg_score = round(total_score / subject_count, 1) if subject_count else 0
-        student_data.append({
-            "student_id": student.id,
-            "name": student.student_name,
-            "scores": scores,   # {"국어": 82, "수학": 77, ...}
-            "average": avg_score
-        })
+    # ✅ 학교 전체 학기 성적을 한 번에 적재 → 반별/과목별 통계는 pandas 벡터 연산
+    frame = grade_analytics.load_scores(db, term_no)
+    if frame.empty:
+        return {"success": False, "error": {"code": 404, "message": "데이터 없음"}}
 
-    # 반 전체 평균
-    class_avg = round(sum(all_scores) / len(all_scores), 1) if all_scores else 0.0
+    refs = get_reference_data(db)
+    class_names = {class_id: refs.class_name(class_id) for class_id in refs.classes}
 
-    # 과목별 평균
-    subject_avg = {
-        subject: round(sum(scores) / len(scores), 1)
-        for subject, scores in subject_scores.items()
+    return {
+        "success": True,
+        "data": {
+            "term": term,
+            **grade_analytics.school_dashboard(frame, class_names, threshold=threshold, top=top),
+        }
     }
 
-    # 최저/최고 학생
-    best_student = max(student_data, key=lambda x: x["average"]) if student_data else None
-    worst_student = min(student_data, key=lambda x: x["average"]) if student_data else None
 
-    # 분포 계산
-    distribution = {"0-59": 0, "60-69": 0, "70-79": 0, "80-89": 0, "90-100": 0}
-    for s in student_data:
-        avg = s["average"]
-        if avg < 60: distribution["0-59"] += 1
-        elif avg < 70: distribution["60-69"] += 1
-        elif avg < 80: distribution["70-79"] += 1
-        elif avg < 90: distribution["80-89"] += 1
-        else: distribution["90-100"] += 1
-
-    # 개별 지도 필요자 (65점 미만)
-    below_threshold = [s for s in student_data if s["average"] < 65]
+# ==========================================================
+# [대시보드] 반 성적 요약
+# ==========================================================
+@router.get("/dashboard/{class_id}")
+def get_grades_dashboard(
+    class_id: int,
+    term: str = Query("2학기", description="조회할 학기 (예: 1학기, 2학기)"),
+    threshold: float = Query(grade_analytics.DEFAULT_THRESHOLD, description="개별 지도 필요 기준 점수 (미만)"),
+    db: Session = Depends(get_read_db)
+):
+    term_no = _parse_term(term)
 
-    # ✅ rank 계산 추가
-    ranked_students = sorted(student_data, key=lambda x: x["average"], reverse=True)
-    for idx, s in enumerate(ranked_students, start=1):
-        s["rank"] = idx
+    # ✅ 반 학생 × 학기 성적을 한 번에 적재 (성적 없는 학생 포함)
+    frame = grade_analytics.load_scores(db, term_no, [class_id])
+    if frame.empty:
+        return {"success": False, "error": {"code": 404, "message": "데이터 없음"}}
 
     return {
         "success": True,
         "data": {
             "class_id": class_id,
             "term": term,  # ✅ 현재 조회한 학기 반환
-            "overview": {
-                "class_avg": class_avg,
-                "highest": best_student["average"] if best_student else None,
-                "lowest": worst_student["average"] if worst_student else None,
-                "need_guidance": len(below_threshold),
-            },
-            "subject_avg": subject_avg,
-            "distribution": distribution,   # ✅ 단순 숫자
-            "alerts": {
-                "below_threshold": below_threshold
-            },
-            "students": ranked_students      # ✅ rank 포함
+            **grade_analytics.class_dashboard(frame, threshold=threshold),  # ✅ rank / dense_rank / z_score 포함
         }
     }
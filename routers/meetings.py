@@ -1,23 +1,16 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
-from database.db import SessionLocal
+from sqlalchemy import func
+from dependencies.db import get_db
 from models.meetings import Meeting as MeetingModel
 from schemas.meetings import Meeting as MeetingSchema, MeetingCreate
+from schemas.common import CursorPagination
+from services.pagination import keyset_paginate
+from services.serializers import fast_response, fetch_dicts, instance_to_dict
+from services import periods
 
 router = APIRouter(prefix="/meetings", tags=["상담 기록"])
 
-# ==========================================================
-# [DB 종속성 주입] 세션 연결
-# ==========================================================
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ==========================================================
 # [1단계] CRUD 기본 라우터
 # ==========================================================
@@ -31,20 +24,34 @@ def create_meeting(meeting: MeetingCreate, db: Session = Depends(get_db)):
     db.refresh(db_meeting)
     return {
         "success": True,
-        "data": db_meeting.__dict__,
+        "data": instance_to_dict(db_meeting),
         "message": "상담 기록이 성공적으로 추가되었습니다"
     }
 
 
-# ✅ [READ] 전체 상담 기록 조회
+# ✅ 응답 필드 ↔ 컬럼 매핑
+# - 컬럼만 SELECT 하므로 student/teacher joined 로딩·_sa_instance_state 가 응답에 섞이지 않음
+LIST_FIELDS = {
+    "id": MeetingModel.id,
+    "title": MeetingModel.title,
+    "meeting_type": MeetingModel.meeting_type,
+    "date": MeetingModel.date,
+    "time": MeetingModel.time,
+    "location": MeetingModel.location,
+    "student_id": MeetingModel.student_id,
+    "teacher_id": MeetingModel.teacher_id,
+}
+
+# ✅ [READ] 전체 상담 기록 조회 (커서 페이지네이션 + 필드 선택)
 @router.get("/")
-def read_meetings(db: Session = Depends(get_db)):
-    records = db.query(MeetingModel).all()
-    return {
+def read_meetings(page: CursorPagination = Depends(), db: Session = Depends(get_db)):
+    result = keyset_paginate(db, LIST_FIELDS, page)
+    return fast_response({
         "success": True,
-        "data": [r.__dict__ for r in records],
+        "data": result["items"],
+        "next_cursor": result["next_cursor"],
         "message": "전체 상담 기록 조회 완료"
-    }
+    })
 
 
 # ==========================================================
@@ -66,33 +73,33 @@ def meetings_summary(db: Session = Depends(get_db)):
 # ✅ [READ] 특정 교사 상담 기록 조회
 @router.get("/teacher/{teacher_id}")
 def get_meetings_by_teacher(teacher_id: int, db: Session = Depends(get_db)):
-    meetings = db.query(MeetingModel).filter(MeetingModel.teacher_id == teacher_id).all()
+    meetings = fetch_dicts(db, LIST_FIELDS, MeetingModel.teacher_id == teacher_id)
     if not meetings:
         return {
             "success": False,
             "error": {"code": 404, "message": "해당 교사의 상담 기록이 없습니다"}
         }
-    return {
+    return fast_response({
         "success": True,
-        "data": [m.__dict__ for m in meetings],
+        "data": meetings,
         "message": f"교사 ID {teacher_id} 상담 기록 조회 성공"
-    }
+    })
 
 
 # ✅ [READ] 특정 학생 상담 기록 조회
 @router.get("/student/{student_id}")
 def get_meetings_by_student(student_id: int, db: Session = Depends(get_db)):
-    meetings = db.query(MeetingModel).filter(MeetingModel.student_id == student_id).all()
+    meetings = fetch_dicts(db, LIST_FIELDS, MeetingModel.student_id == student_id)
     if not meetings:
         return {
             "success": False,
             "error": {"code": 404, "message": "해당 학생의 상담 기록이 없습니다"}
         }
-    return {
+    return fast_response({
         "success": True,
-        "data": [m.__dict__ for m in meetings],
+        "data": meetings,
         "message": f"학생 ID {student_id} 상담 기록 조회 성공"
-    }
+    })
 
 
 # ==========================================================
@@ -102,20 +109,22 @@ def get_meetings_by_student(student_id: int, db: Session = Depends(get_db)):
 # ✅ [READ] 특정 월 상담 기록 조회
 @router.get("/monthly/{year}/{month}")
 def get_meetings_by_month(year: int, month: int, db: Session = Depends(get_db)):
-    meetings = db.query(MeetingModel).filter(
-        extract("year", MeetingModel.date) == year,
-        extract("month", MeetingModel.date) == month
-    ).all()
+    try:
+        period = periods.month(year, month)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    meetings = fetch_dicts(db, LIST_FIELDS, period.filter(MeetingModel.date), order_by=MeetingModel.date)
     if not meetings:
         return {
             "success": False,
             "error": {"code": 404, "message": "해당 월의 상담 기록이 없습니다"}
         }
-    return {
+    return fast_response({
         "success": True,
-        "data": [m.__dict__ for m in meetings],
+        "data": meetings,
         "message": f"{year}년 {month}월 상담 기록 조회 성공"
-    }
+    })
 
 
 # ✅ [STATS] 교사별 상담 건수 통계
@@ -148,15 +157,15 @@ def get_student_meeting_stats(student_id: int, db: Session = Depends(get_db)):
 # ✅ [READ] 상담 상세 조회
 @router.get("/{meeting_id}")
 def read_meeting(meeting_id: int, db: Session = Depends(get_db)):
-    meeting = db.query(MeetingModel).filter(MeetingModel.id == meeting_id).first()
-    if meeting is None:
+    meetings = fetch_dicts(db, LIST_FIELDS, MeetingModel.id == meeting_id)
+    if not meetings:
         return {
             "success": False,
             "error": {"code": 404, "message": "상담 정보를 찾을 수 없습니다"}
         }
     return {
         "success": True,
-        "data": meeting.__dict__,
+        "data": meetings[0],
         "message": "상담 기록 조회 성공"
     }
 
@@ -178,7 +187,7 @@ def update_meeting(meeting_id: int, updated: MeetingCreate, db: Session = Depend
     db.refresh(meeting)
     return {
         "success": True,
-        "data": meeting.__dict__,
+        "data": instance_to_dict(meeting),
         "message": "상담 기록이 성공적으로 수정되었습니다"
     }
 
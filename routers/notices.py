@@ -1,22 +1,13 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from database.db import SessionLocal
+from dependencies.db import get_db
 from models.notices import Notice as NoticeModel
 from schemas.notices import NoticeCreate
+from schemas.common import CursorPagination
+from services.pagination import keyset_paginate
 
 router = APIRouter(prefix="/notices", tags=["공지사항"])
 
-# ==========================================================
-# DB 세션 연결
-# ==========================================================
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ==========================================================
 # [1단계] CRUD 기본 라우터
 # ==========================================================
@@ -41,22 +32,22 @@ def create_notice(notice: NoticeCreate, db: Session = Depends(get_db)):
     }
 
 
-# ✅ [READ] 전체 공지사항 조회
+# ✅ [READ] 전체 공지사항 조회 (커서 페이지네이션 + 필드 선택)
+LIST_FIELDS = {
+    "id": NoticeModel.id,
+    "title": NoticeModel.title,
+    "content": NoticeModel.content,
+    "date": NoticeModel.date,
+    "is_important": NoticeModel.is_important,
+}
+
 @router.get("/")
-def read_notices(db: Session = Depends(get_db)):
-    records = db.query(NoticeModel).all()
+def read_notices(page: CursorPagination = Depends(), db: Session = Depends(get_db)):
+    result = keyset_paginate(db, LIST_FIELDS, page)
     return {
         "success": True,
-        "data": [
-            {
-                "id": r.id,
-                "title": r.title,
-                "content": r.content,
-                "date": str(r.date),
-                "is_important": r.is_important
-            }
-            for r in records
-        ],
+        "data": result["items"],
+        "next_cursor": result["next_cursor"],
         "message": "전체 공지사항 조회 완료"
     }
 
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends
 from fastapi.responses import Response, JSONResponse
-from sqlalchemy.orm import Session
-from database.db import SessionLocal
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from dependencies.db import get_async_db
 from models.students import Student as StudentModel
 from models.reports import Report as ReportModel
 from models.grades import Grade as GradeModel
@@ -12,20 +13,14 @@ router = APIRouter(prefix="/pdf", tags=["PDF 생성"])
 
 pdf_service = PDFService()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ✅ [PDF] 상담 보고서 생성
 @router.post("/counseling-report/{student_id}")
-async def generate_counseling_pdf(student_id: int, db: Session = Depends(get_db)):
+async def generate_counseling_pdf(student_id: int, db: AsyncSession = Depends(get_async_db)):
     try:
         # 학생 정보 조회
-        student = db.query(StudentModel).filter(StudentModel.id == student_id).first()
+        student = (await db.execute(
+            select(StudentModel).where(StudentModel.id == student_id)
+        )).scalars().first()
         if not student:
             return JSONResponse(
                 status_code=404,
@@ -36,8 +31,12 @@ async def generate_counseling_pdf(student_id: int, db: Session = Depends(get_db)
             )
 
         # 상담 기록 & 성적 조회
-        reports = db.query(ReportModel).filter(ReportModel.student_id == student_id).all()
-        grades = db.query(GradeModel).filter(GradeModel.student_id == student_id).all()
+        reports = (await db.execute(
+            select(ReportModel).where(ReportModel.student_id == student_id)
+        )).scalars().all()
+        grades = (await db.execute(
+            select(GradeModel).where(GradeModel.student_id == student_id)
+        )).scalars().all()
 
         # AI 분석 요청
         ai_analysis = await ai_client.counseling_chat(
@@ -78,10 +77,12 @@ async def generate_counseling_pdf(student_id: int, db: Session = Depends(get_db)
 
 # ✅ [PDF] 학급 요약 보고서 생성
 @router.post("/class-summary/{class_id}")
-async def generate_class_pdf(class_id: int, db: Session = Depends(get_db)):
+async def generate_class_pdf(class_id: int, db: AsyncSession = Depends(get_async_db)):
     try:
         # 학급 학생들 조회
-        students = db.query(StudentModel).filter(StudentModel.class_id == class_id).all()
+        students = (await db.execute(
+            select(StudentModel).where(StudentModel.class_id == class_id)
+        )).scalars().all()
         if not students:
             return JSONResponse(
                 status_code=404,
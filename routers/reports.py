@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from database.db import SessionLocal
+from dependencies.db import get_db
 from models.reports import Report as ReportModel
 from schemas.reports import ReportCreate
 from typing import List
@@ -8,17 +8,6 @@ import datetime
 
 router = APIRouter(prefix="/reports", tags=["리포트 관리"])
 
-# ==========================================================
-# DB 세션 연결
-# ==========================================================
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ==========================================================
 # [1단계] CRUD 기본 라우터
 # ==========================================================
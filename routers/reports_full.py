@@ -1,20 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from database.db import SessionLocal
+from dependencies.db import get_db
 
 router = APIRouter(prefix="/reports", tags=["보고서 전체 호출"])
 
-# ==========================================================
-# [공통] DB 세션 관리
-# ==========================================================
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ==========================================================
 # ✅ [OVERVIEW] 보고서 개요 (선택 전 화면)
 # ==========================================================
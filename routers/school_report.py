@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from database.db import SessionLocal
+from dependencies.db import get_db
 from models.school_report import SchoolReport as SchoolReportModel
 from models.students import Student as StudentModel   # ✅ 학생 테이블 import
 from schemas.school_report import SchoolReport as SchoolReportSchema
@@ -8,14 +8,6 @@ from typing import List
 
 router = APIRouter(prefix="/school_report", tags=["생활기록부"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ==========================================================
 # [1단계] CRUD 기본 라우터
 # ==========================================================
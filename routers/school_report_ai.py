@@ -2,8 +2,9 @@
 import os
 import json
 from fastapi import APIRouter, HTTPException, Body, Depends
-from sqlalchemy.orm import Session
-from database.db import SessionLocal
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from dependencies.db import get_async_db
 from models.school_report import SchoolReport as SchoolReportModel
 from models.students import Student as StudentModel
 from schemas.school_report import SchoolReport as SchoolReportSchema
@@ -22,13 +23,6 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/school_report_ai", tags=["생활기록부AI"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # 요청 바디 스키마 (개선된 옵션들)
 class GenerateCommentRequest(BaseModel):
     tone: str = Field(default="정중하고 공식적", description="어조 설정")
@@ -159,7 +153,7 @@ def create_comment_prompt(report_data: dict, request: GenerateCommentRequest) ->
 async def generate_school_report_comment(
     report_id: int,
     request: GenerateCommentRequest = Body(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> GenerateCommentResponse:
     """
     생활기록부 AI 코멘트 생성
@@ -175,7 +169,9 @@ async def generate_school_report_comment(
     try:
         # 1. 데이터베이스에서 생활기록 조회
         logger.info(f"생활기록부 조회 시작: report_id={report_id}")
-        report = db.query(SchoolReportModel).filter(SchoolReportModel.id == report_id).first()
+        report = (await db.execute(
+            select(SchoolReportModel).where(SchoolReportModel.id == report_id)
+        )).scalars().first()
         
         if not report:
             logger.warning(f"생활기록부를 찾을 수 없음: report_id={report_id}")
@@ -186,7 +182,9 @@ async def generate_school_report_comment(
             )
 
         # 2. 학생 정보도 함께 조회
-        student = db.query(StudentModel).filter(StudentModel.id == report.student_id).first()
+        student = (await db.execute(
+            select(StudentModel).where(StudentModel.id == report.student_id)
+        )).scalars().first()
         
         # 3. 생활기록 데이터 준비
         report_data = {
@@ -317,16 +315,20 @@ async def generate_school_report_comment(
         )
 
 @router.get("/{report_id}/generate-preview")
-async def preview_generation_options(report_id: int, db: Session = Depends(get_db)):
+async def preview_generation_options(report_id: int, db: AsyncSession = Depends(get_async_db)):
     """코멘트 생성 전 미리보기 및 옵션 확인"""
     try:
-        report = db.query(SchoolReportModel).filter(SchoolReportModel.id == report_id).first()
+        report = (await db.execute(
+            select(SchoolReportModel).where(SchoolReportModel.id == report_id)
+        )).scalars().first()
         
         if not report:
             raise HTTPException(status_code=404, detail="생활기록을 찾을 수 없습니다")
         
         # 학생 정보 조회
-        student = db.query(StudentModel).filter(StudentModel.id == report.student_id).first()
+        student = (await db.execute(
+            select(StudentModel).where(StudentModel.id == report.student_id)
+        )).scalars().first()
         
         # 사용 가능한 콘텐츠 분석
         available_content = {}
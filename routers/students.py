@@ -1,23 +1,19 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from database.db import SessionLocal
+from dependencies.db import get_db, get_read_db
 from models.students import Student as StudentModel
 from models.grades import Grade as GradeModel
 from models.attendance import Attendance as AttendanceModel
 from models.meetings import Meeting as MeetingModel
 from schemas.students import StudentCreate
+from schemas.common import CursorPagination
+from services.pagination import keyset_paginate
+from services import attendance_rollup, grade_rollup, grade_trends
 
 router = APIRouter(prefix="/students", tags=["학생 정보"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ==========================================================
 # [1단계] CRUD 기본 라우터
 # ==========================================================
@@ -43,23 +39,23 @@ def create_student(student: StudentCreate, db: Session = Depends(get_db)):
     }
 
 
-# ✅ [READ] 전체 학생 조회
+# ✅ [READ] 전체 학생 조회 (커서 페이지네이션 + 필드 선택)
+LIST_FIELDS = {
+    "id": StudentModel.id,
+    "student_name": StudentModel.student_name,
+    "class_id": StudentModel.class_id,
+    "gender": StudentModel.gender,
+    "phone": StudentModel.phone,
+    "address": StudentModel.address,
+}
+
 @router.get("/")
-def read_students(db: Session = Depends(get_db)):
-    records = db.query(StudentModel).all()
+def read_students(page: CursorPagination = Depends(), db: Session = Depends(get_db)):
+    result = keyset_paginate(db, LIST_FIELDS, page)
     return {
         "success": True,
-        "data": [
-            {
-                "id": r.id,
-                "student_name": r.student_name,
-                "class_id": r.class_id,
-                "gender": r.gender,
-                "phone": r.phone,
-                "address": r.address
-            }
-            for r in records
-        ],
+        "data": result["items"],
+        "next_cursor": result["next_cursor"],
         "message": "전체 학생 정보 조회 완료"
     }
 
@@ -164,6 +160,30 @@ def get_student_grade_summary(student_id: int, db: Session = Depends(get_db)):
     }
 
 
+
+# ✅ [TREND] 특정 학생 과목별 성적 추이
+# - 학기 성적 + 응시한 시험 점수를 과목별 시계열로 병합 (이동평균/기울기/추세)
+@router.get("/{student_id}/grade-trend")
+def get_student_grade_trend(
+    student_id: int,
+    year: Optional[int] = Query(None, description="학기 성적을 배치할 학년도 (미지정 시 최근 시험 기준)"),
+    window: int = Query(grade_trends.DEFAULT_WINDOW, ge=1, le=20),
+    threshold: float = Query(grade_trends.TREND_THRESHOLD, ge=0),
+    db: Session = Depends(get_read_db)
+):
+    roster, frame, year = grade_trends.load_points(db, student_id=student_id, year=year)
+    if not roster:
+        return {
+            "success": False,
+            "error": {"code": 404, "message": "학생 정보를 찾을 수 없습니다"}
+        }
+    trends = grade_trends.build_trends(db, roster, frame, window, threshold)
+    return {
+        "success": True,
+        "data": {"year": year, "window": window, "threshold": threshold, **trends["students"][0]},
+        "message": f"학생 ID {student_id} 성적 추이 조회 성공"
+    }
+
 # ✅ [SUMMARY] 특정 학생 출결 요약
 @router.get("/{student_id}/attendance-summary")
 def get_student_attendance_summary(student_id: int, db: Session = Depends(get_db)):
@@ -241,6 +261,7 @@ def read_student(student_id: int, db: Session = Depends(get_db)):
 
 
 # ✅ [UPDATE] 특정 학생 정보 수정
+# - class_id 가 바뀌면 이전/새 반의 성적·출결 집계 재구축
 @router.put("/{student_id}")
 def update_student(student_id: int, updated: StudentCreate, db: Session = Depends(get_db)):
     student = db.query(StudentModel).filter(StudentModel.id == student_id).first()
@@ -250,9 +271,17 @@ def update_student(student_id: int, updated: StudentCreate, db: Session = Depend
             "error": {"code": 404, "message": "학생 정보를 찾을 수 없습니다"}
         }
 
+    old_class_id = student.class_id
     for key, value in updated.model_dump().items():
         setattr(student, key, value)
 
+    # ✅ 반 이동: 성적/출결 집계는 반 단위로 저장되므로 이전 반과 새 반 범위를 같은 트랜잭션에서 재구축
+    if student.class_id != old_class_id:
+        db.flush()
+        for class_id in (old_class_id, student.class_id):
+            grade_rollup.rebuild(db, class_id=class_id)
+            attendance_rollup.rebuild(db, class_id=class_id)
+
     db.commit()
     db.refresh(student)
     return {
@@ -1,19 +1,11 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from database.db import SessionLocal
+from dependencies.db import get_db
 from models.subjects import Subject as SubjectModel
 from schemas.subjects import SubjectCreate
 
 router = APIRouter(prefix="/subjects", tags=["과목 정보"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ✅ [CREATE] 과목 정보 추가
 @router.post("/")
 def create_subject(subject: SubjectCreate, db: Session = Depends(get_db)):
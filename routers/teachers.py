@@ -1,19 +1,11 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from database.db import SessionLocal
+from dependencies.db import get_db
 from models.teachers import Teacher as TeacherModel
 from schemas.teachers import TeacherCreate
 
 router = APIRouter(prefix="/teachers", tags=["교사 정보"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ==========================================================
 # [1단계] CRUD 라우터
 # ==========================================================
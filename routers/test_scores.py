@@ -1,19 +1,20 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from database.db import SessionLocal
+from config.settings import settings
+from dependencies.db import get_db
+from models.students import Student as StudentModel
 from models.test_scores import TestScore as TestScoreModel
-from schemas.test_scores import TestScore as TestScoreSchema
+from models.tests import Test as TestModel
+from schemas.test_scores import TestScore as TestScoreSchema, TestScoreBulkItem, TestScoreBulkRequest
+from schemas.common import CursorPagination
+from services.pagination import keyset_paginate
+from services.export_stream import ExportFormat, stream_export
+from services import bulk_upsert
 
 router = APIRouter(prefix="/test_scores", tags=["시험성적"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ==========================================================
 # [1단계] CRUD 라우터
 # ==========================================================
@@ -38,22 +39,97 @@ def create_test_score(score: TestScoreSchema, db: Session = Depends(get_db)):
     }
 
 
-# ✅ [READ] 전체 성적 조회
+# ✅ [BULK] 시험 점수 일괄 저장 (시험 한 번 분량)
+# - 행별 검증 → 오류 행만 errors 로 반환하고 나머지는 저장 (배치 전체를 거부하지 않음)
+# - 시험/학생 존재 및 시험 대상 학급 여부 확인, subject_name 미지정 시 시험의 과목 이름
+# - (test_id, student_id) 기준 INSERT ... ON DUPLICATE KEY UPDATE 한 문장, 한 트랜잭션
+@router.post("/bulk")
+def bulk_upsert_test_scores(payload: TestScoreBulkRequest, db: Session = Depends(get_db)):
+    if len(payload.rows) > settings.BULK_MAX_ROWS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {settings.BULK_MAX_ROWS}행까지 저장할 수 있습니다.")
+
+    valid, errors = bulk_upsert.validate_rows(TestScoreBulkItem, payload.rows)
+    valid, duplicates = bulk_upsert.drop_duplicates(valid, key=lambda s: (s.test_id, s.student_id))
+    errors += duplicates
+
+    tests = {
+        row.id: row for row in db.execute(
+            select(TestModel.id, TestModel.class_id, TestModel.subject_name)
+            .where(TestModel.id.in_({s.test_id for _, s in valid}))
+        )
+    }
+    student_classes = dict(db.execute(
+        select(StudentModel.id, StudentModel.class_id)
+        .where(StudentModel.id.in_({s.student_id for _, s in valid}))
+    ).tuples().all())
+
+    rows = []
+    for index, s in valid:
+        test = tests.get(s.test_id)
+        if test is None:
+            errors.append(bulk_upsert.row_error(index, "시험을 찾을 수 없습니다.", "test_id"))
+        elif s.student_id not in student_classes:
+            errors.append(bulk_upsert.row_error(index, "학생을 찾을 수 없습니다.", "student_id"))
+        elif student_classes[s.student_id] != test.class_id:
+            errors.append(bulk_upsert.row_error(index, "시험 대상 학급의 학생이 아닙니다.", "student_id"))
+        else:
+            row = s.model_dump()
+            row["subject_name"] = row["subject_name"] or test.subject_name
+            rows.append(row)
+
+    # 기존 점수 키 (신규/갱신 건수 보고용)
+    existing = set()
+    if rows:
+        existing = set(db.execute(
+            select(TestScoreModel.test_id, TestScoreModel.student_id)
+            .where(TestScoreModel.test_id.in_({row["test_id"] for row in rows}))
+        ).tuples())
+    updated = sum((row["test_id"], row["student_id"]) in existing for row in rows)
+
+    bulk_upsert.upsert(
+        db, TestScoreModel, rows,
+        key_columns=["test_id", "student_id"],
+        update_columns=["score", "subject_name"],
+    )
+    db.commit()
+
+    return {
+        "success": True,
+        "data": {
+            "received": len(payload.rows),
+            "saved": len(rows),
+            "inserted": len(rows) - updated,
+            "updated": updated,
+            "errors": sorted(errors, key=lambda e: e["index"]),
+        },
+        "message": f"시험 성적 {len(rows)}건 저장 (오류 {len(errors)}건)"
+    }
+
+
+# ✅ [READ] 전체 성적 조회 (커서 페이지네이션 + 필드 선택)
+LIST_FIELDS = {
+    "id": TestScoreModel.id,
+    "test_id": TestScoreModel.test_id,
+    "student_id": TestScoreModel.student_id,
+    "score": TestScoreModel.score,
+    "subject_name": TestScoreModel.subject_name,
+}
+
 @router.get("/")
-def read_test_scores(db: Session = Depends(get_db)):
-    records = db.query(TestScoreModel).all()
+def read_test_scores(
+    page: CursorPagination = Depends(),
+    format: Optional[ExportFormat] = Query(None, description="전체 덤프 스트리밍: ndjson | csv"),
+    db: Session = Depends(get_db)
+):
+    # ✅ format 지정 시 페이지네이션 없이 전체 행을 서버사이드 커서로 스트리밍
+    if format:
+        return stream_export(LIST_FIELDS, format, "test_scores", fields=page.fields)
+
+    result = keyset_paginate(db, LIST_FIELDS, page)
     return {
         "success": True,
-        "data": [
-            {
-                "id": r.id,
-                "test_id": r.test_id,
-                "student_id": r.student_id,
-                "score": r.score,
-                "subject_name": r.subject_name
-            }
-            for r in records
-        ],
+        "data": result["items"],
+        "next_cursor": result["next_cursor"],
         "message": "전체 시험 성적 조회 완료"
     }
 
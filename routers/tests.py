@@ -1,22 +1,15 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from database.db import SessionLocal
+from dependencies.db import get_db, get_read_db
 from models.tests import Test as TestModel
 from models.test_scores import TestScore as TestScoreModel
 from models.students import Student as StudentModel
 from schemas.tests import TestCreate
+from services import test_analytics
 
 router = APIRouter(prefix="/tests", tags=["시험 관리"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ==========================================================
 # [1단계] CRUD 기본 라우터
 # ==========================================================
@@ -168,6 +161,24 @@ def get_test_summary(test_id: int, db: Session = Depends(get_db)):
     }
 
 
+# ✅ [ANALYTICS] 특정 시험 점수 분석
+# - 점수 분포/표준편차/사분위수, 같은 시험(과목·시험명·시험일)을 본 반별 비교, 학생별 직전 시험 대비 변화
+# - test_scores 1쿼리(LAG 윈도 함수) + pandas 벡터 연산, 결과는 시험 점수 버전 기준으로 캐시
+@router.get("/{test_id}/analytics")
+def get_test_analytics(test_id: int, db: Session = Depends(get_read_db)):
+    result = test_analytics.get_test_analytics(db, test_id)
+    if result is None:
+        return {
+            "success": False,
+            "error": {"code": 404, "message": "해당 시험의 점수가 없습니다"}
+        }
+    return {
+        "success": True,
+        "data": result,
+        "message": "시험 분석 조회 성공"
+    }
+
+
 # ✅ [READ] 특정 시험 응시 학생 목록
 @router.get("/{test_id}/students")
 def get_test_students(test_id: int, db: Session = Depends(get_db)):
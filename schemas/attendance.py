@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Dict, Literal, Optional
 from datetime import date
 
 class Attendance(BaseModel):
@@ -12,3 +12,19 @@ class Attendance(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# ✅ 출석부에서 입력 가능한 상태 (요약/출결 달력 services/attendance_calendar.STATUS_CODES 와 같은 목록)
+AttendanceStatus = Literal["출석", "결석", "지각", "조퇴"]
+
+
+class RollCallEntry(BaseModel):
+    status: AttendanceStatus                                # 출결 상태 (예: 결석, 지각)
+    reason: Optional[str] = Field(None, max_length=200)     # 결석/조퇴 사유
+
+
+class RollCallRequest(BaseModel):
+    """반 × 날짜 출석부 (PUT /attendance/roll-call/{class_id}/{date}) — 목록에 없는 반 학생은 출석"""
+    students: Dict[int, RollCallEntry] = Field(
+        default_factory=dict, description='학생 ID → 상태/사유 (예: {"12": {"status": "결석", "reason": "감기"}})'
+    )
@@ -6,6 +6,7 @@ schemas/common.py
 - 포함 내용:
   1) 에러 응답 표준: ErrorDetail, ErrorResponse
   2) 페이지네이션 메타: Pagination, MetaInfo, make_meta()
+     + 커서(keyset) 페이지네이션 파라미터: CursorPagination
   3) (선택) 성공 응답 래퍼: SuccessEnvelope[T]
 """
 
@@ -91,6 +92,22 @@ def make_meta(total: int, page: int, size: int, sort: Optional[str] = None) -> M
     return MetaInfo(total=total, page=page, size=size, pages=pages, sort=sort)
 
 
+class CursorPagination(BaseModel):
+    """
+    대용량 목록용 커서(keyset) 페이징 파라미터 (id 오름차순)
+    - cursor: 직전 응답의 next_cursor (첫 페이지는 생략)
+    - limit: 페이지당 항목 수
+    - fields: 응답에 포함할 필드(콤마 구분, 예: "id,student_id,status"). 생략 시 전체
+      → 지정한 컬럼만 SELECT 하므로 전송량/메모리 모두 감소
+    - OFFSET 방식과 달리 뒤 페이지로 갈수록 느려지지 않음 (WHERE id > cursor)
+    """
+    cursor: Optional[int] = Field(default=None, ge=0, description="다음 페이지 시작 커서(직전 응답의 next_cursor)")
+    limit: int = Field(100, ge=1, le=1000, description="페이지당 항목 수")
+    fields: Optional[str] = Field(default=None, description='응답 필드 선택(예: "id,date,status")')
+
+    model_config = ConfigDict(extra="ignore")
+
+
 # =========================================================
 # 3) (선택) 성공 응답 래퍼
 # =========================================================
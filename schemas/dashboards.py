@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
+import datetime as dt
+
+
+class DashboardBatchRequest(BaseModel):
+    """여러 반 대시보드 일괄 조회 요청 (class_ids 또는 grade 중 하나 필수)"""
+    class_ids: Optional[List[int]] = Field(None, description="조회할 반 ID 목록")
+    grade: Optional[int] = Field(None, description="학년 전체 조회 (예: 2 → 2학년 모든 반)")
+    term: str = Field("2학기", description="성적 학기 (예: 1학기, 2학기)")
+    date: dt.date = Field(..., description="출결 기준 날짜 (예: 2025-07-26)")
+    threshold: float = Field(65.0, description="개별 지도 필요 기준 점수 (미만)")
+
+    @model_validator(mode="after")
+    def check_target(self):
+        if (self.class_ids is None) == (self.grade is None):
+            raise ValueError("class_ids 또는 grade 중 하나만 지정해야 합니다.")
+        return self
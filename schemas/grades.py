@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
 
 class Grade(BaseModel):
     id: int                                  # 성적 고유 ID
@@ -11,3 +11,39 @@ class Grade(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# ==========================================================
+# 일괄 저장 (POST /grades/bulk)
+# ==========================================================
+
+class GradeBulkItem(BaseModel):
+    """일괄 저장 행 — (student_id, term, subject_id) 가 같으면 기존 성적을 갱신"""
+    student_id: int = Field(..., gt=0)                                   # 학생 ID
+    subject_id: int = Field(..., gt=0)                                   # 과목 ID
+    term: int = Field(..., ge=1, le=2)                                   # 학기 (1, 2)
+    average_score: Optional[float] = Field(None, ge=0, le=100)           # 평균 점수
+    grade_letter: Optional[str] = Field(None, min_length=1, max_length=10)  # 미지정 시 점수로 계산
+
+
+class GradeBulkRequest(BaseModel):
+    rows: List[Dict[str, Any]] = Field(..., description="성적 행 목록 (행별로 검증, 오류 행만 제외)")
+    cutoffs: Optional[Dict[str, float]] = Field(
+        None, description='등급 기준 (예: {"A": 90, "B": 80, "C": 70, "D": 60, "F": 0}), 미지정 시 과목 × 학기 등급 정책'
+    )
+
+
+# ==========================================================
+# 등급 기준 (PUT /grades/policies, POST /grades/recompute-letters)
+# ==========================================================
+
+class GradingPolicyUpdate(BaseModel):
+    """범위(subject_id, term)의 등급 기준 교체 — NULL 은 전 과목 / 전 학기 공통"""
+    subject_id: Optional[int] = Field(None, gt=0)                        # 과목 ID (미지정 = 전 과목 기본)
+    term: Optional[int] = Field(None, ge=1, le=2)                        # 학기 (미지정 = 전 학기 공통)
+    cutoffs: Dict[str, float] = Field(..., description='등급 기준 (예: {"A": 90, "B": 80, "C": 70, "D": 60, "F": 0})')
+
+
+class RecomputeLettersRequest(BaseModel):
+    term: int = Field(..., ge=1, le=2)                                   # 재계산할 학기
+    subject_ids: Optional[List[int]] = None                              # 미지정 시 학기 전체 과목
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
 
 class TestScore(BaseModel):
     id: int                                  # 시험 성적 고유 ID
@@ -10,3 +10,19 @@ class TestScore(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# ==========================================================
+# 일괄 저장 (POST /test_scores/bulk)
+# ==========================================================
+
+class TestScoreBulkItem(BaseModel):
+    """일괄 저장 행 — (test_id, student_id) 가 같으면 기존 점수를 갱신"""
+    test_id: int = Field(..., gt=0)                                      # 시험 ID
+    student_id: int = Field(..., gt=0)                                   # 학생 ID
+    score: float = Field(..., ge=0, le=100)                              # 점수
+    subject_name: Optional[str] = Field(None, max_length=100)            # 미지정 시 시험의 과목 이름
+
+
+class TestScoreBulkRequest(BaseModel):
+    rows: List[Dict[str, Any]] = Field(..., description="시험 점수 행 목록 (행별로 검증, 오류 행만 제외)")
@@ -0,0 +1,135 @@
+"""
+scripts/bench_attendance_stats.py
+
+- /attendance/stats/students 의 기존 구현(학생 전체 조회 후 학생마다 GROUP BY status, 1 + N 쿼리)과
+  students ⟕ attendance 조건부 집계 단일 쿼리의 지연시간/SQL 수를 비교합니다. (AsyncSession)
+- 기본 규모: 학생 2,000명 × 1년(학년도 평일 전체) 출결
+
+사용 예:
+    python -m scripts.bench_attendance_stats --url mysql+pymysql://user:pw@127.0.0.1:3307/bench_db \\
+        --async-url mysql+aiomysql://user:pw@127.0.0.1:3307/bench_db
+    python -m scripts.bench_attendance_stats --url sqlite:///bench.db --async-url sqlite+aiosqlite:///bench.db
+
+⚠️ 대상 DB의 students/attendance 테이블을 삭제 후 재생성합니다. 운영 DB URL을 지정하지 마세요.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from database.db import Base
+from database.query_stats import install_query_stats, start_query_stats
+import models  # noqa: F401  # ✅ 모델 테이블을 Base.metadata 에 등록
+from models.attendance import Attendance as AttendanceModel
+from models.students import Student as StudentModel
+from routers.attendance import get_student_attendance_stats
+from services import periods
+
+TABLES = ["students", "attendance"]
+STATUSES = ["출석"] * 90 + ["지각"] * 4 + ["결석"] * 3 + ["조퇴"] * 3
+
+
+async def legacy_student_stats(db: AsyncSession) -> list:
+    """기존 구현: 학생 전체 조회 후 학생마다 상태별 건수 조회"""
+    students = (await db.execute(select(StudentModel))).scalars().all()
+    stats_data = []
+    for student in students:
+        attendance_counts = (await db.execute(
+            select(AttendanceModel.status, func.count(AttendanceModel.id))
+            .where(AttendanceModel.student_id == student.id)
+            .group_by(AttendanceModel.status)
+        )).all()
+        status_counts = {status: count for status, count in attendance_counts}
+        stats_data.append({
+            "student_id": student.id,
+            "student_name": student.student_name,
+            "class_id": student.class_id,
+            "absent_count": status_counts.get("결석", 0),
+            "late_count": status_counts.get("지각", 0),
+            "early_count": status_counts.get("조퇴", 0),
+            "present_count": status_counts.get("출석", 0),
+        })
+    return stats_data
+
+
+async def current_student_stats(db: AsyncSession) -> list:
+    response = await get_student_attendance_stats(
+        class_id=None, start_date=None, end_date=None, cursor=None, limit=None, db=db
+    )
+    return response["data"]
+
+
+def load_data(conn, students: int, class_size: int, year: int, seed: int = 42) -> int:
+    """학생 × 학년도 평일 출결 적재 (호출 측 트랜잭션), 적재한 일수 반환"""
+    rnd = random.Random(seed)
+    days = [d for d in periods.school_year(year).days() if d.weekday() < 5]
+    t = Base.metadata.tables
+    conn.execute(t["students"].insert(), [
+        {"id": sid, "student_name": f"학생{sid}", "class_id": (sid - 1) // class_size + 1}
+        for sid in range(1, students + 1)
+    ])
+    rows = []
+    for sid in range(1, students + 1):
+        rows.extend({"student_id": sid, "date": d, "status": rnd.choice(STATUSES)} for d in days)
+        if len(rows) >= 50_000:
+            conn.execute(t["attendance"].insert(), rows)
+            rows = []
+    if rows:
+        conn.execute(t["attendance"].insert(), rows)
+    return len(days)
+
+
+async def measure(async_engine, fn, repeat: int):
+    timings, statements = [], 0
+    for _ in range(repeat):
+        async with AsyncSession(async_engine) as db:
+            stats = start_query_stats()
+            start = time.perf_counter()
+            await fn(db)
+            timings.append((time.perf_counter() - start) * 1000)
+            statements = stats.statements
+    return statistics.median(timings), statements
+
+
+async def run(async_engine, repeat: int):
+    async with AsyncSession(async_engine) as db:
+        same = await legacy_student_stats(db) == await current_student_stats(db)
+    b_ms, b_sql = await measure(async_engine, legacy_student_stats, repeat)
+    a_ms, a_sql = await measure(async_engine, current_student_stats, repeat)
+    print(f"\n■ 학생별 출결 통계 (결과 동일: {'✅' if same else '❌'})")
+    print(f"  학생별 쿼리: {b_ms:9.2f} ms | SQL {b_sql}회")
+    print(f"  단일 집계  : {a_ms:9.2f} ms | SQL {a_sql}회")
+    print(f"  → {b_ms / a_ms:,.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/attendance/stats/students 1+N vs 단일 집계 쿼리 벤치마크")
+    parser.add_argument("--url", required=True, help="데이터 적재용 동기 DB URL (운영 DB 금지)")
+    parser.add_argument("--async-url", required=True, help="같은 DB의 비동기 URL (aiomysql / aiosqlite)")
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--class-size", type=int, default=30)
+    parser.add_argument("--year", type=int, default=2025, help="출결을 채울 학년도")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    tables = [Base.metadata.tables[name] for name in TABLES]
+    Base.metadata.drop_all(engine, tables=tables)
+    Base.metadata.create_all(engine, tables=tables)
+    with engine.begin() as conn:
+        days = load_data(conn, args.students, args.class_size, args.year)
+    print(f"📦 합성 데이터: 학생 {args.students}명 × {days}일 (출결 {args.students * days:,}건)")
+
+    async_engine = create_async_engine(args.async_url)
+    install_query_stats(async_engine.sync_engine)
+    asyncio.run(run(async_engine, args.repeat))
+    print("\n✅ 벤치마크 완료")
+
+
+if __name__ == "__main__":
+    main()
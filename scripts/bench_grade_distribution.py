@@ -0,0 +1,118 @@
+"""
+scripts/bench_grade_distribution.py
+
+- /grades/distribution, /grades/low-performers 의 기존 구현(학생마다 성적 전체 조회 후 Python 에서 평균/구간 계산)과
+  SQL 집계 구현(GROUP BY 학생 + CASE 구간, HAVING 기준 미달)의 지연시간/SQL 수를 비교합니다.
+- 기존 구현은 점수 NULL 성적까지 분모에 넣었으므로, 비교 기준은 NULL 을 제외하도록 보정한 학생별 순회
+- 기본 규모: 한 반 40명 × 10과목 × 2학기
+
+사용 예:
+    python -m scripts.bench_grade_distribution --url mysql+pymysql://user:pw@127.0.0.1:3307/bench_db
+    python -m scripts.bench_grade_distribution --url sqlite:///bench.db
+
+⚠️ 대상 DB의 classes/teachers/students/subjects/grades 및 집계 테이블을 삭제 후 재생성합니다.
+   운영 DB URL을 지정하지 마세요.
+"""
+
+import argparse
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from database.db import Base
+from database.query_stats import install_query_stats
+import models  # noqa: F401  # ✅ 모델 테이블을 Base.metadata 에 등록
+from models.grades import Grade as GradeModel
+from models.students import Student as StudentModel
+from routers.grades import get_low_performers, get_score_distribution
+from scripts.bench_grades_pivot import load_data, measure
+from services import grade_rollup, score_buckets
+
+TABLES = [
+    "classes", "teachers", "students", "subjects", "grades",
+    "grade_subject_stats", "student_grade_averages",
+]
+
+
+def reference_averages(db: Session, class_id: int) -> dict:
+    """학생별 평균 (학생마다 성적 전체 조회, 점수 NULL 제외) — 점수 없는 학생은 제외"""
+    averages = {}
+    for student in db.query(StudentModel).filter(StudentModel.class_id == class_id).all():
+        scores = [
+            g.average_score
+            for g in db.query(GradeModel).filter(GradeModel.student_id == student.id).all()
+            if g.average_score is not None
+        ]
+        if scores:
+            averages[student.id] = sum(scores) / len(scores)
+    return averages
+
+
+def legacy_distribution(db: Session, class_id: int, edges=score_buckets.DEFAULT_EDGES) -> dict:
+    labels = score_buckets.bucket_labels(edges)
+    distribution = dict.fromkeys(labels, 0)
+    for avg in reference_averages(db, class_id).values():
+        distribution[labels[sum(avg >= edge for edge in edges)]] += 1
+    return distribution
+
+
+def legacy_low_performers(db: Session, class_id: int, threshold: float) -> list:
+    return [
+        (student_id, round(avg, 1))
+        for student_id, avg in sorted(reference_averages(db, class_id).items())
+        if avg < threshold
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/grades/distribution·low-performers 학생별 순회 vs SQL 집계 벤치마크")
+    parser.add_argument("--url", required=True, help="벤치마크 전용 DB URL (운영 DB 금지)")
+    parser.add_argument("--students", type=int, default=40)
+    parser.add_argument("--subjects", type=int, default=10)
+    parser.add_argument("--terms", type=int, default=2)
+    parser.add_argument("--threshold", type=float, default=65.0)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    install_query_stats(engine)
+    tables = [Base.metadata.tables[name] for name in TABLES]
+    Base.metadata.drop_all(engine, tables=tables)
+    Base.metadata.create_all(engine, tables=tables)
+    load_data(engine, args.students, args.subjects, args.terms)
+    with Session(engine) as db:
+        grade_rollup.rebuild(db)
+        db.commit()
+    print(f"📦 합성 데이터: 학생 {args.students}명 × 과목 {args.subjects}개 × {args.terms}학기")
+
+    edges = list(score_buckets.DEFAULT_EDGES)
+    cases = [
+        (
+            "distribution",
+            lambda db: legacy_distribution(db, 1),
+            lambda db: get_score_distribution(class_id=1, edges=edges, db=db)["data"]["distribution"],
+        ),
+        (
+            f"low-performers (< {args.threshold})",
+            lambda db: legacy_low_performers(db, 1, args.threshold),
+            lambda db: [
+                (s["student_id"], s["average"])
+                for s in get_low_performers(class_id=1, threshold=args.threshold, db=db)["data"]["students"]
+            ],
+        ),
+    ]
+    for label, legacy, pushed in cases:
+        with Session(engine) as db:
+            same = legacy(db) == pushed(db)
+        b_ms, b_sql = measure(engine, legacy, args.repeat)
+        a_ms, a_sql = measure(engine, pushed, args.repeat)
+        print(f"\n■ {label} (결과 동일: {'✅' if same else '❌'})")
+        print(f"  학생별 순회: {b_ms:8.2f} ms | SQL {b_sql}회")
+        print(f"  SQL 집계  : {a_ms:8.2f} ms | SQL {a_sql}회")
+        print(f"  → {b_ms / a_ms:,.1f}x")
+
+    print("\n✅ 벤치마크 완료")
+
+
+if __name__ == "__main__":
+    main()
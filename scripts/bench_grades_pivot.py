@@ -0,0 +1,148 @@
+"""
+scripts/bench_grades_pivot.py
+
+- /grades/pivot 의 기존 구현(학생·성적마다 쿼리, O(학생 × 과목) 왕복)과
+  단일 JOIN 쿼리 구현(routers/grades.get_class_grades)의 지연시간/SQL 수를 비교합니다.
+- 기본 규모: 한 반 40명 × 10과목 × 2학기
+
+사용 예:
+    python -m scripts.bench_grades_pivot --url mysql+pymysql://user:pw@127.0.0.1:3307/bench_db
+    python -m scripts.bench_grades_pivot --url sqlite:///bench.db
+
+⚠️ 대상 DB의 classes/teachers/students/subjects/grades 테이블을 삭제 후 재생성합니다.
+   운영 DB URL을 지정하지 마세요.
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from database.db import Base
+from database.query_stats import install_query_stats, start_query_stats
+import models  # noqa: F401  # ✅ 모델 테이블을 Base.metadata 에 등록
+from models.classes import Class as ClassModel
+from models.grades import Grade as GradeModel
+from models.students import Student as StudentModel
+from models.subjects import Subject as SubjectModel
+from routers.grades import get_class_grades
+
+TABLES = ["classes", "teachers", "students", "subjects", "grades"]
+LETTERS = [(90, "A"), (80, "B"), (70, "C"), (60, "D"), (0, "F")]
+
+
+def legacy_class_grades(db: Session, class_id: int, term=None) -> dict:
+    """단일 쿼리 전환 이전의 /grades/pivot 구현 (회귀 비교 기준, term 필터만 추가)"""
+    students = db.query(StudentModel).filter(StudentModel.class_id == class_id).all()
+    if not students:
+        return {"success": False, "error": {"code": 404, "message": "No students found for this class"}}
+
+    result = []
+    for student in students:
+        query = db.query(GradeModel).filter(GradeModel.student_id == student.id)
+        if term is not None:
+            query = query.filter(GradeModel.term == term)
+        grades = query.all()
+        scores, total_score, subject_count = {}, 0, 0
+
+        for grade in grades:
+            subject = db.query(SubjectModel).filter(SubjectModel.id == grade.subject_id).first()
+            if subject:
+                scores[subject.name] = {
+                    "average_score": grade.average_score,
+                    "grade_letter": grade.grade_letter
+                }
+                if grade.average_score is not None:
+                    total_score += grade.average_score
+                    subject_count += 1
+
+        avg_score = round(total_score / subject_count, 1) if subject_count else 0
+        class_obj = db.query(ClassModel).filter(ClassModel.id == student.class_id).first()
+        class_name = f"{class_obj.grade}-{class_obj.class_num}" if class_obj else "Unknown"
+
+        result.append({
+            "student_id": student.id,
+            "name": student.student_name,
+            "class": class_name,
+            "scores": scores,
+            "average": avg_score
+        })
+
+    return {"success": True, "data": result}
+
+
+def load_data(engine, students: int, subjects: int, terms: int, class_id: int = 1, seed: int = 42) -> None:
+    """한 반 분량의 학생/과목/성적 합성 데이터"""
+    rnd = random.Random(seed)
+    t = Base.metadata.tables
+    with engine.begin() as conn:
+        conn.execute(t["classes"].insert(), [{"id": class_id, "grade": 3, "class_num": class_id}])
+        conn.execute(t["subjects"].insert(), [
+            {"id": sid, "name": f"과목{sid}"} for sid in range(1, subjects + 1)
+        ])
+        conn.execute(t["students"].insert(), [
+            {"id": sid, "student_name": f"학생{sid}", "class_id": class_id} for sid in range(1, students + 1)
+        ])
+        rows, gid = [], 1
+        for sid in range(1, students + 1):
+            for subject_id in range(1, subjects + 1):
+                for term in range(1, terms + 1):
+                    score = rnd.randint(40, 100)
+                    letter = next(letter for cut, letter in LETTERS if score >= cut)
+                    rows.append({"id": gid, "student_id": sid, "subject_id": subject_id, "term": term,
+                                 "average_score": score, "grade_letter": letter})
+                    gid += 1
+        conn.execute(t["grades"].insert(), rows)
+
+
+def measure(engine, fn, repeat: int):
+    timings, statements = [], 0
+    for _ in range(repeat):
+        with Session(engine) as db:
+            stats = start_query_stats()
+            start = time.perf_counter()
+            fn(db)
+            timings.append((time.perf_counter() - start) * 1000)
+            statements = stats.statements
+    return statistics.median(timings), statements
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/grades/pivot 기존 vs 단일 쿼리 벤치마크")
+    parser.add_argument("--url", required=True, help="벤치마크 전용 DB URL (운영 DB 금지)")
+    parser.add_argument("--students", type=int, default=40)
+    parser.add_argument("--subjects", type=int, default=10)
+    parser.add_argument("--terms", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    install_query_stats(engine)
+    tables = [Base.metadata.tables[name] for name in TABLES]
+    Base.metadata.drop_all(engine, tables=tables)
+    Base.metadata.create_all(engine, tables=tables)
+    load_data(engine, args.students, args.subjects, args.terms)
+    print(f"📦 합성 데이터: 학생 {args.students}명 × 과목 {args.subjects}개 × {args.terms}학기")
+
+    cases = [
+        ("전체 학기", lambda db: legacy_class_grades(db, 1), lambda db: get_class_grades(class_id=1, term=None, db=db)),
+        ("1학기", lambda db: legacy_class_grades(db, 1, 1), lambda db: get_class_grades(class_id=1, term=1, db=db)),
+    ]
+    for label, legacy, single in cases:
+        with Session(engine) as db:
+            same = legacy(db) == single(db)
+        b_ms, b_sql = measure(engine, legacy, args.repeat)
+        a_ms, a_sql = measure(engine, single, args.repeat)
+        print(f"\n■ {label} (응답 동일: {'✅' if same else '❌'})")
+        print(f"  기존: {b_ms:8.2f} ms | SQL {b_sql}회")
+        print(f"  신규: {a_ms:8.2f} ms | SQL {a_sql}회")
+        print(f"  → {b_ms / a_ms:,.1f}x")
+
+    print("\n✅ 벤치마크 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+scripts/bench_indexes.py
+
+- 핫 쿼리 컬럼 인덱스(migrations 0001/0002/0005) 적용 전/후의 실행계획과 지연시간을 비교합니다.
+- 합성 데이터(기본 50,000명)를 생성해 인덱스 없는 상태로 측정 → 인덱스 생성 → 재측정.
+
+사용 예:
+    python -m scripts.bench_indexes --url mysql+pymysql://user:pw@127.0.0.1:3307/bench_db
+    python -m scripts.bench_indexes --url sqlite:///bench.db --students 5000
+
+⚠️ 대상 DB의 teachers/students/attendance/grades/meetings/test_scores 테이블을 삭제 후 재생성합니다.
+   운영 DB URL을 지정하지 마세요.
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import date, time as dtime, timedelta
+
+from sqlalchemy import Column, Index, Integer, MetaData, Table, UniqueConstraint, create_engine, text
+
+from database.db import Base
+import models  # noqa: F401  # ✅ 모델 테이블을 Base.metadata 에 등록
+
+# 인덱스 적용 후 상태 = migrations 0001 + 0002 + 0005 (attendance/grades/test_scores 복합 인덱스는 유니크 인덱스로 대체)
+HOT_INDEXES = [
+    ("uq_attendance_student_id_date", "attendance", ["student_id", "date"], True),
+    ("ix_attendance_date", "attendance", ["date"], False),
+    ("uq_grades_student_id_term_subject_id", "grades", ["student_id", "term", "subject_id"], True),
+    ("ix_meetings_student_id_date", "meetings", ["student_id", "date"], False),
+    ("uq_test_scores_test_id_student_id", "test_scores", ["test_id", "student_id"], True),
+    ("ix_test_scores_student_id", "test_scores", ["student_id"], False),
+    ("ix_students_class_id", "students", ["class_id"], False),
+    ("ix_tests_class_id_test_date", "tests", ["class_id", "test_date"], False),
+]
+HOT_NAMES = {name for name, _, _, _ in HOT_INDEXES}
+
+# 측정 대상 쿼리 (라우터의 핫 패스를 단순화)
+QUERIES = [
+    ("출결: 학생별 기간 조회",
+     "SELECT * FROM attendance WHERE student_id = :sid AND date BETWEEN :start AND :end"),
+    ("출결: 일별 상태 집계",
+     "SELECT status, COUNT(*) FROM attendance WHERE date = :day GROUP BY status"),
+    ("성적: 학생+학기 조회",
+     "SELECT * FROM grades WHERE student_id = :sid AND term = :term"),
+    ("학생: 반별 명단",
+     "SELECT * FROM students WHERE class_id = :cid"),
+    ("상담: 학생 최근 상담",
+     "SELECT * FROM meetings WHERE student_id = :sid ORDER BY date DESC LIMIT 1"),
+    ("시험성적: 시험별 조회",
+     "SELECT * FROM test_scores WHERE test_id = :tid"),
+    ("시험: 반별 날짜순 조회",
+     "SELECT * FROM tests WHERE class_id = :cid ORDER BY test_date"),
+]
+
+STATUSES = ["출석"] * 90 + ["지각"] * 5 + ["결석"] * 3 + ["조퇴"] * 2
+START_DATE = date(2025, 3, 3)  # 1학기 개학일 (월요일)
+
+
+def build_metadata() -> MetaData:
+    """모델 테이블을 복사하되 핫 쿼리 인덱스/유니크 제약은 제거 (인덱스 적용 전 상태)"""
+    meta = MetaData()
+    # meetings.teacher_id FK 대상만 필요하므로 teachers 는 최소 컬럼으로 생성
+    Table("teachers", meta, Column("id", Integer, primary_key=True))
+    for name in ["students", "attendance", "grades", "meetings", "tests", "test_scores"]:
+        table = Base.metadata.tables[name].to_metadata(meta)
+        for idx in list(table.indexes):
+            if idx.name in HOT_NAMES:
+                table.indexes.discard(idx)
+        for cons in list(table.constraints):
+            if isinstance(cons, UniqueConstraint) and cons.name in HOT_NAMES:
+                table.constraints.discard(cons)
+    return meta
+
+
+def school_days(count: int):
+    days, d = [], START_DATE
+    while len(days) < count:
+        if d.weekday() < 5:
+            days.append(d)
+        d += timedelta(days=1)
+    return days
+
+
+def insert_chunks(conn, table, rows, chunk=10_000):
+    for i in range(0, len(rows), chunk):
+        conn.execute(table.insert(), rows[i:i + chunk])
+
+
+def load_data(engine, meta: MetaData, args) -> dict:
+    rnd = random.Random(42)
+    days = school_days(args.days)
+    class_count = max(args.students // args.class_size, 1)
+    tests_per_class = 4
+    t = meta.tables
+
+    with engine.begin() as conn:
+        conn.execute(t["teachers"].insert(), [{"id": 1}])
+
+        insert_chunks(conn, t["students"], [
+            {"id": sid, "student_name": f"학생{sid}", "class_id": (sid - 1) % class_count + 1}
+            for sid in range(1, args.students + 1)
+        ])
+
+        rows, rid = [], 1
+        for sid in range(1, args.students + 1):
+            for d in days:
+                rows.append({"id": rid, "student_id": sid, "date": d, "status": rnd.choice(STATUSES)})
+                rid += 1
+            if len(rows) >= 50_000:
+                insert_chunks(conn, t["attendance"], rows)
+                rows = []
+        insert_chunks(conn, t["attendance"], rows)
+
+        rows, rid = [], 1
+        for sid in range(1, args.students + 1):
+            for subject_id in range(1, args.subjects + 1):
+                for term in (1, 2):
+                    rows.append({"id": rid, "student_id": sid, "subject_id": subject_id,
+                                 "term": term, "average_score": rnd.randint(40, 100)})
+                    rid += 1
+            if len(rows) >= 50_000:
+                insert_chunks(conn, t["grades"], rows)
+                rows = []
+        insert_chunks(conn, t["grades"], rows)
+
+        insert_chunks(conn, t["meetings"], [
+            {"id": mid, "title": "정기 상담", "meeting_type": "학업", "date": rnd.choice(days),
+             "time": dtime(15, 0), "student_id": rnd.randint(1, args.students), "teacher_id": 1}
+            for mid in range(1, args.students // 5 + 1)
+        ])
+
+        insert_chunks(conn, t["tests"], [
+            {"id": (cid - 1) * tests_per_class + k + 1, "subject_id": k % args.subjects + 1,
+             "test_name": f"시험{k + 1}", "test_date": days[(k + 1) * len(days) // (tests_per_class + 1)],
+             "class_id": cid}
+            for cid in range(1, class_count + 1)
+            for k in range(tests_per_class)
+        ])
+
+        rows, rid = [], 1
+        for sid in range(1, args.students + 1):
+            cid = (sid - 1) % class_count + 1
+            for k in range(tests_per_class):
+                rows.append({"id": rid, "test_id": (cid - 1) * tests_per_class + k + 1,
+                             "student_id": sid, "score": rnd.randint(30, 100)})
+                rid += 1
+            if len(rows) >= 50_000:
+                insert_chunks(conn, t["test_scores"], rows)
+                rows = []
+        insert_chunks(conn, t["test_scores"], rows)
+
+    return {
+        "sid": args.students // 2,
+        "start": days[0],
+        "end": days[-1],
+        "day": days[len(days) // 2],
+        "term": 2,
+        "cid": class_count // 2 + 1,
+        "tid": 1,
+    }
+
+
+def explain(conn, sql: str, params: dict) -> str:
+    if conn.dialect.name == "sqlite":
+        rows = conn.execute(text("EXPLAIN QUERY PLAN " + sql), params).all()
+        return " / ".join(str(r[-1]) for r in rows)
+    rows = conn.execute(text("EXPLAIN " + sql), params).mappings().all()
+    return " / ".join(
+        f"type={r.get('type')} key={r.get('key')} rows={r.get('rows')}" for r in rows
+    )
+
+
+def measure(engine, params: dict, repeat: int) -> dict:
+    results = {}
+    with engine.connect() as conn:
+        for label, sql in QUERIES:
+            bound = {k: v for k, v in params.items() if f":{k}" in sql}
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                conn.execute(text(sql), bound).all()
+                timings.append((time.perf_counter() - start) * 1000)
+            results[label] = {"plan": explain(conn, sql, bound), "median_ms": statistics.median(timings)}
+    return results
+
+
+def create_hot_indexes(engine, meta: MetaData):
+    with engine.begin() as conn:
+        for name, table, columns, unique in HOT_INDEXES:
+            tbl = meta.tables[table]
+            Index(name, *[tbl.c[c] for c in columns], unique=unique).create(conn)
+        if conn.dialect.name == "sqlite":
+            conn.execute(text("ANALYZE"))
+        else:
+            conn.execute(text("ANALYZE TABLE students, attendance, grades, meetings, test_scores"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="핫 쿼리 인덱스 전/후 벤치마크")
+    parser.add_argument("--url", required=True, help="벤치마크 전용 DB URL (운영 DB 금지)")
+    parser.add_argument("--students", type=int, default=50_000)
+    parser.add_argument("--class-size", type=int, default=30)
+    parser.add_argument("--days", type=int, default=20, help="학생당 출결 일수 (수업일)")
+    parser.add_argument("--subjects", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    meta = build_metadata()
+    meta.drop_all(engine)
+    meta.create_all(engine)
+
+    print(f"📦 합성 데이터 생성: 학생 {args.students:,}명, 출결 {args.students * args.days:,}건, "
+          f"성적 {args.students * args.subjects * 2:,}건")
+    params = load_data(engine, meta, args)
+
+    print("⏱️  인덱스 적용 전 측정...")
+    before = measure(engine, params, args.repeat)
+    create_hot_indexes(engine, meta)
+    print("⏱️  인덱스 적용 후 측정...")
+    after = measure(engine, params, args.repeat)
+
+    for label, _ in QUERIES:
+        b, a = before[label], after[label]
+        speedup = b["median_ms"] / a["median_ms"] if a["median_ms"] else float("inf")
+        print(f"\n■ {label}")
+        print(f"  전: {b['median_ms']:9.2f} ms | {b['plan']}")
+        print(f"  후: {a['median_ms']:9.2f} ms | {a['plan']}")
+        print(f"  → {speedup:,.1f}x")
+
+    print("\n✅ 벤치마크 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+scripts/bench_serialization.py
+
+- /grades/, /meetings/ 응답 생성 비용을 기존 방식과 컬럼 튜플 + orjson 방식으로 비교합니다.
+  * 기존: ORM 인스턴스 조회 → dict 수작업 생성 (meetings 는 r.__dict__) → jsonable_encoder → json.dumps
+  * 신규: select(컬럼) 튜플 → dict (services/serializers.py) → orjson.dumps (ORJSONResponse)
+- HTTP 계층을 제외한 "쿼리 + 직렬화" 구간만 측정합니다.
+
+사용 예:
+    python -m scripts.bench_serialization --url mysql+pymysql://user:pw@127.0.0.1:3307/bench_db
+    python -m scripts.bench_serialization --url sqlite:///bench.db --rows 20000
+
+⚠️ 대상 DB의 classes/teachers/students/grades/meetings 테이블을 삭제 후 재생성합니다.
+   운영 DB URL을 지정하지 마세요.
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from datetime import date, time as dtime, timedelta
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from database.db import Base
+import models  # noqa: F401  # ✅ 모델 테이블을 Base.metadata 에 등록
+from models.grades import Grade as GradeModel
+from models.meetings import Meeting as MeetingModel
+from routers.grades import LIST_FIELDS as GRADE_FIELDS
+from routers.meetings import LIST_FIELDS as MEETING_FIELDS
+from services.serializers import fetch_dicts
+
+TABLES = ["classes", "teachers", "students", "grades", "meetings"]
+
+
+def starlette_json(content) -> bytes:
+    """기존 JSONResponse.render 와 동일한 인코딩"""
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+# ==========================================================
+# 측정 대상
+# ==========================================================
+
+def legacy_grades(db: Session) -> bytes:
+    records = db.query(GradeModel).all()
+    content = {
+        "success": True,
+        "data": [
+            {
+                "id": r.id,
+                "student_id": r.student_id,
+                "subject_id": r.subject_id,
+                "average_score": r.average_score,
+                "grade_letter": r.grade_letter
+            }
+            for r in records
+        ]
+    }
+    return starlette_json(jsonable_encoder(content))
+
+
+def legacy_meetings(db: Session) -> bytes:
+    records = db.query(MeetingModel).all()
+    content = {"success": True, "data": [r.__dict__ for r in records]}
+    return starlette_json(jsonable_encoder(content))
+
+
+def fast_grades(db: Session) -> bytes:
+    return orjson.dumps({"success": True, "data": fetch_dicts(db, GRADE_FIELDS)})
+
+
+def fast_meetings(db: Session) -> bytes:
+    return orjson.dumps({"success": True, "data": fetch_dicts(db, MEETING_FIELDS)})
+
+
+CASES = [
+    ("/grades/", legacy_grades, fast_grades),
+    ("/meetings/", legacy_meetings, fast_meetings),
+]
+
+
+# ==========================================================
+# 데이터 / 측정
+# ==========================================================
+
+def load_data(engine, rows: int):
+    rnd = random.Random(42)
+    students = max(rows // 20, 1)
+    with Session(engine) as db, db.begin():
+        db.execute(Base.metadata.tables["classes"].insert(), [{"id": 1, "grade": 3, "class_num": 1}])
+        db.execute(Base.metadata.tables["teachers"].insert(), [{"id": 1, "name": "교사1", "class_id": 1}])
+        db.execute(Base.metadata.tables["students"].insert(), [
+            {"id": sid, "student_name": f"학생{sid}", "class_id": 1} for sid in range(1, students + 1)
+        ])
+        db.execute(Base.metadata.tables["grades"].insert(), [
+            {"id": i, "student_id": rnd.randint(1, students), "subject_id": i % 10 + 1, "term": i % 2 + 1,
+             "average_score": rnd.randint(40, 100), "grade_letter": rnd.choice("ABCDF")}
+            for i in range(1, rows + 1)
+        ])
+        db.execute(Base.metadata.tables["meetings"].insert(), [
+            {"id": i, "title": "정기 상담", "meeting_type": "학업",
+             "date": date(2025, 3, 3) + timedelta(days=i % 180), "time": dtime(15, 0),
+             "location": "교실", "student_id": rnd.randint(1, students), "teacher_id": 1}
+            for i in range(1, rows + 1)
+        ])
+
+
+def measure(engine, fn, repeat: int):
+    timings, size = [], 0
+    for _ in range(repeat):
+        with Session(engine) as db:  # 매번 새 세션 → identity map 재사용 없음
+            start = time.perf_counter()
+            body = fn(db)
+            timings.append((time.perf_counter() - start) * 1000)
+            size = len(body)
+    return statistics.median(timings), size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 직렬화 방식 벤치마크")
+    parser.add_argument("--url", required=True, help="벤치마크 전용 DB URL (운영 DB 금지)")
+    parser.add_argument("--rows", type=int, default=50_000, help="grades/meetings 각각의 행 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    tables = [Base.metadata.tables[name] for name in TABLES]
+    Base.metadata.drop_all(engine, tables=tables)
+    Base.metadata.create_all(engine, tables=tables)
+    print(f"📦 합성 데이터 생성: grades/meetings 각 {args.rows:,}건")
+    load_data(engine, args.rows)
+
+    for label, legacy, fast in CASES:
+        print(f"\n■ {label}")
+        try:
+            b_ms, b_size = measure(engine, legacy, args.repeat)
+            print(f"  기존: {b_ms:9.2f} ms | {b_size / 1024:,.0f} KB")
+        except Exception as e:  # meetings 의 __dict__ 는 _sa_instance_state 때문에 직렬화 실패할 수 있음
+            b_ms = None
+            print(f"  기존: 실패 ({type(e).__name__}: {e})")
+        a_ms, a_size = measure(engine, fast, args.repeat)
+        print(f"  신규: {a_ms:9.2f} ms | {a_size / 1024:,.0f} KB")
+        if b_ms:
+            print(f"  → {b_ms / a_ms:,.1f}x")
+
+    print("\n✅ 벤치마크 완료")
+
+
+if __name__ == "__main__":
+    main()
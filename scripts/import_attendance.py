@@ -2,6 +2,7 @@ import csv
 from sqlalchemy.orm import Session
 from database.db import SessionLocal
 from models.attendance import Attendance as AttendanceModel  # ✅ 모델 import
+from services import attendance_rollup
 
 CSV_PATH = "data/attendance.csv"  # ✅ 파일 경로
 
@@ -21,6 +22,8 @@ def migrate_attendance():
             )
             db.add(attendance)
 
+    db.flush()
+    attendance_rollup.rebuild(db)  # ✅ 일별 출결 집계도 같은 트랜잭션에서 재구축
     db.commit()
     db.close()
     print("✅ 출결 CSV → DB 마이그레이션 완료")
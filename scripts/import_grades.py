@@ -2,6 +2,7 @@ import csv
 from sqlalchemy.orm import Session
 from database.db import SessionLocal
 from models.grades import Grade as GradeModel  # ✅ 모델 import
+from services import grade_rollup
 
 CSV_PATH = "data/grades.csv"  # ✅ 파일 경로
 
@@ -22,6 +23,10 @@ def migrate_grades():
             db.add(grade)
 
     db.commit()
+
+    # ✅ 일괄 import 는 증분 갱신을 거치지 않으므로 집계 테이블 재구축
+    grade_rollup.rebuild(db)
+    db.commit()
     db.close()
     print("✅ 성적 CSV → DB 마이그레이션 완료")
 
@@ -0,0 +1,54 @@
+"""
+scripts/rebuild_attendance_rollup.py
+
+- 출결 일별 집계 테이블(attendance_daily_rollup)을 원본 attendance 에서 다시 계산합니다.
+- 사용 시점: 최초 백필, CSV 일괄 import 후, 학생 반 편성 변경 후, 정합성 의심 시
+
+사용 예:
+    python -m scripts.rebuild_attendance_rollup                          # 전체
+    python -m scripts.rebuild_attendance_rollup --class-id 3             # 3반만
+    python -m scripts.rebuild_attendance_rollup --month 2025-07          # 2025년 7월만
+    python -m scripts.rebuild_attendance_rollup --year 2025 --term 2     # 2025학년도 2학기만
+"""
+
+import argparse
+
+from database.db import SessionLocal
+from services import attendance_rollup, periods
+
+
+def main():
+    parser = argparse.ArgumentParser(description="출결 일별 집계 테이블 재구축")
+    parser.add_argument("--class-id", type=int, default=None, help="지정한 반만 재구축 (0 = students 에 없는 학생)")
+    parser.add_argument("--month", default=None, help="지정한 월(YYYY-MM)만 재구축")
+    parser.add_argument("--year", type=int, default=None, help="지정한 학년도만 재구축 (--term 과 함께 쓰면 학기)")
+    parser.add_argument("--term", type=int, choices=[1, 2], default=None, help="--year 학년도의 학기")
+    args = parser.parse_args()
+
+    if args.month and args.year:
+        parser.error("--month 와 --year 는 함께 쓸 수 없습니다")
+    if args.term and not args.year:
+        parser.error("--term 은 --year 와 함께 지정해야 합니다")
+    if args.month:
+        period = periods.parse_month(args.month)
+    elif args.year:
+        period = periods.semester(args.year, args.term) if args.term else periods.school_year(args.year)
+    else:
+        period = None
+
+    db = SessionLocal()
+    try:
+        rows = attendance_rollup.rebuild(db, period=period, class_id=args.class_id)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    scope = f"{period.start} ~ {period.last_day}" if period else "전체 기간"
+    print(f"✅ 출결 집계 재구축 완료 ({scope}): 반×날짜×상태 {rows}행")
+
+
+if __name__ == "__main__":
+    main()
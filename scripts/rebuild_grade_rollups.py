@@ -0,0 +1,40 @@
+"""
+scripts/rebuild_grade_rollups.py
+
+- 성적 집계 테이블(grade_subject_stats, student_grade_averages)을 원본 grades 에서 다시 계산합니다.
+- 사용 시점: 최초 백필, CSV 일괄 import 후, 학생 반 편성 변경 후, 정합성 의심 시
+
+사용 예:
+    python -m scripts.rebuild_grade_rollups                 # 전체
+    python -m scripts.rebuild_grade_rollups --class-id 3    # 3반만
+    python -m scripts.rebuild_grade_rollups --term 2        # 2학기만
+"""
+
+import argparse
+
+from database.db import SessionLocal
+from services import grade_rollup
+
+
+def main():
+    parser = argparse.ArgumentParser(description="성적 집계 테이블 재구축")
+    parser.add_argument("--class-id", type=int, default=None, help="지정한 반만 재구축")
+    parser.add_argument("--term", type=int, default=None, help="지정한 학기만 재구축")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        counts = grade_rollup.rebuild(db, class_id=args.class_id, term=args.term)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    print(f"✅ 성적 집계 재구축 완료: 반×학기×과목 {counts['grade_subject_stats']}행, "
+          f"학생×학기 {counts['student_grade_averages']}행")
+
+
+if __name__ == "__main__":
+    main()
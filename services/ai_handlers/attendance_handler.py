@@ -1,10 +1,13 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.students import Student
 from models.attendance import Attendance
+from services import attendance_rollup
+from services.attendance_rollup import AttendanceValues
 from datetime import datetime, date
 import re
 
-async def handle_attendance_query(message: str, db: Session):
+async def handle_attendance_query(message: str, db: AsyncSession):
     """출석처리 관련 쿼리 처리"""
     user_message = message.lower()
 
@@ -23,26 +26,27 @@ async def handle_attendance_query(message: str, db: Session):
     return "출석처리 관련 명령어를 인식하지 못했습니다. '모든 학생 출석처리해줘' 또는 '김민수 결석처리해줘'와 같이 입력해주세요."
 
 
-async def handle_bulk_attendance(message: str, db: Session):
+async def handle_bulk_attendance(message: str, db: AsyncSession):
     """모든 학생 출석처리"""
     try:
         # 모든 학생 조회
-        students = db.query(Student).all()
+        students = (await db.execute(select(Student))).scalars().all()
         if not students:
             return "등록된 학생이 없습니다."
         
         today = date.today()
         processed_count = 0
         already_processed = 0
+        rollup_changes = []  # 일별 출결 집계 반영용 (변경 전, 변경 후)
+        
+        # ✅ 오늘 이미 출결이 있는 학생을 한 번에 조회 (학생별 SELECT 제거)
+        recorded = set((await db.execute(
+            select(Attendance.student_id).where(Attendance.date == today)
+        )).scalars().all())
         
         for student in students:
             # 이미 오늘 출석처리가 되어있는지 확인
-            existing_attendance = db.query(Attendance).filter(
-                Attendance.student_id == student.id,
-                Attendance.date == today
-            ).first()
-            
-            if existing_attendance:
+            if student.id in recorded:
                 already_processed += 1
                 continue
             
@@ -53,9 +57,13 @@ async def handle_bulk_attendance(message: str, db: Session):
                 status="출석"
             )
             db.add(new_attendance)
+            rollup_changes.append((None, AttendanceValues.of(new_attendance)))
             processed_count += 1
         
-        db.commit()
+        # ✅ 일별 출결 집계를 같은 트랜잭션에서 한 번에 갱신
+        await db.flush()
+        await db.run_sync(attendance_rollup.apply_changes, rollup_changes)
+        await db.commit()
         
         if processed_count > 0:
             return f"모든 학생이 출석처리되었습니다. (총 {len(students)}명)"
@@ -63,11 +71,11 @@ async def handle_bulk_attendance(message: str, db: Session):
             return f"모든 학생이 이미 출석처리되어 있습니다. (총 {len(students)}명)"
             
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return f"출석처리 중 오류가 발생했습니다: {str(e)}"
 
 
-async def handle_individual_attendance(message: str, db: Session):
+async def handle_individual_attendance(message: str, db: AsyncSession):
     """특정 학생 출석/결석 처리 (나머지 학생은 출석처리)"""
     try:
         # 학생별 상태와 사유 추출
@@ -81,7 +89,9 @@ async def handle_individual_attendance(message: str, db: Session):
         not_found_students = []
         
         for student_name, status, reason in student_info_list:
-            student = db.query(Student).filter(Student.student_name == student_name).first()
+            student = (await db.execute(
+                select(Student).where(Student.student_name == student_name)
+            )).scalars().first()
             if student:
                 target_students.append((student, status, reason))
             else:
@@ -94,23 +104,28 @@ async def handle_individual_attendance(message: str, db: Session):
         processed_count = 0
         already_processed = 0
         target_student_ids = [s.id for s, _, _ in target_students]
+        rollup_changes = []  # 일별 출결 집계 반영용 (변경 전, 변경 후)
         
         # 모든 학생 조회
-        all_students = db.query(Student).all()
+        all_students = (await db.execute(select(Student))).scalars().all()
         
         for student in all_students:
             # 이미 오늘 출석처리가 되어있는지 확인
-            existing_attendance = db.query(Attendance).filter(
-                Attendance.student_id == student.id,
-                Attendance.date == today
-            ).first()
+            existing_attendance = (await db.execute(
+                select(Attendance).where(
+                    Attendance.student_id == student.id,
+                    Attendance.date == today
+                )
+            )).scalars().first()
             
             if existing_attendance:
                 # 기존 출석 상태가 있으면
                 if student.id in target_student_ids:
                     # 대상 학생은 요청된 상태로 변경
                     target_info = next((s, status, reason) for s, status, reason in target_students if s.id == student.id)
+                    before = AttendanceValues.of(existing_attendance)
                     existing_attendance.status = target_info[1]
+                    rollup_changes.append((before, AttendanceValues.of(existing_attendance)))
                     if target_info[2]:  # 사유가 있으면
                         existing_attendance.reason = target_info[2]
                     already_processed += 1
@@ -134,9 +149,13 @@ async def handle_individual_attendance(message: str, db: Session):
                     reason=reason
                 )
                 db.add(new_attendance)
+                rollup_changes.append((None, AttendanceValues.of(new_attendance)))
                 processed_count += 1
         
-        db.commit()
+        # ✅ 일별 출결 집계를 같은 트랜잭션에서 한 번에 갱신
+        await db.flush()
+        await db.run_sync(attendance_rollup.apply_changes, rollup_changes)
+        await db.commit()
         
         # 결과 메시지 생성 (사용자 입력 순서 보존)
         result_messages = []
@@ -152,17 +171,19 @@ async def handle_individual_attendance(message: str, db: Session):
         return f"{', '.join(result_messages)} 처리되었습니다."
             
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return f"출석처리 중 오류가 발생했습니다: {str(e)}"
 
 
-async def handle_attendance_inquiry(message: str, db: Session):
+async def handle_attendance_inquiry(message: str, db: AsyncSession):
     """출석 조회"""
     try:
         today = date.today()
         
         # 오늘 출석 현황 조회
-        attendance_records = db.query(Attendance).filter(Attendance.date == today).all()
+        attendance_records = (await db.execute(
+            select(Attendance).where(Attendance.date == today)
+        )).scalars().all()
         
         if not attendance_records:
             return f"오늘({today.strftime('%Y년 %m월 %d일')}) 출석 기록이 없습니다."
@@ -175,7 +196,9 @@ async def handle_attendance_inquiry(message: str, db: Session):
             status = record.status
             
             # 학생명 조회
-            student = db.query(Student).filter(Student.id == record.student_id).first()
+            student = (await db.execute(
+                select(Student).where(Student.id == record.student_id)
+            )).scalars().first()
             student_name = student.student_name if student else "알 수 없음"
             
             # 카운트
@@ -1,8 +1,9 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.events import Event as EventModel
 from langchain_google_genai import ChatGoogleGenerativeAI
-from sqlalchemy import func
+from sqlalchemy import select
 from config.settings import settings
+from services import periods
 from datetime import datetime, timedelta, time
 import re
 
@@ -14,7 +15,7 @@ model = ChatGoogleGenerativeAI(
 )
 
 
-async def handle_event_query(message: str, db: Session):
+async def handle_event_query(message: str, db: AsyncSession):
     """이벤트/일정 조회 및 추가/삭제 처리"""
     user_message = message.lower()
     
@@ -55,7 +56,7 @@ async def handle_event_query(message: str, db: Session):
     return await handle_event_list(message, db)
 
 
-async def handle_event_add(message: str, db: Session):
+async def handle_event_add(message: str, db: AsyncSession):
     """일정 추가 처리"""
     # 여러 이벤트 파싱 시도 (우선순위 1)
     multiple_events = await parse_multiple_events(message)
@@ -100,7 +101,7 @@ async def handle_event_add(message: str, db: Session):
     
     try:
         db.add(new_event)
-        db.commit()
+        await db.commit()
         
         # 시간 정보가 있는 경우 응답에 포함
         if start_time and end_time:
@@ -126,45 +127,42 @@ async def handle_event_add(message: str, db: Session):
             else:
                 return f"'{event_title}' 일정이 {start_date}부터 {end_date}까지 성공적으로 추가되었습니다!"
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return f"일정 추가 중 오류가 발생했습니다: {str(e)}"
 
 
-async def handle_event_list(message: str, db: Session):
+async def handle_event_list(message: str, db: AsyncSession):
     """전체 이벤트 목록 조회"""
-    events = db.query(EventModel).all()
+    events = (await db.execute(select(EventModel))).scalars().all()
     return await build_ai_response(events, message)
 
 
-async def handle_event_weekly(start, end, message, db: Session):
+async def handle_event_weekly(start, end, message, db: AsyncSession):
     """주간 이벤트 조회"""
-    events = (
-        db.query(EventModel)
-        .filter(EventModel.start_date.between(start, end))
-        .all()
-    )
+    events = (await db.execute(
+        select(EventModel)
+        .where(EventModel.start_date.between(start, end))
+    )).scalars().all()
     return await build_ai_response(events, message)
 
 
-async def handle_event_daily(date, message: str, db: Session):
+async def handle_event_daily(date, message: str, db: AsyncSession):
     """일일 이벤트 조회"""
     current_date = datetime.now().strftime('%Y년 %m월 %d일')
     
-    events = (
-        db.query(EventModel)
-        .filter(EventModel.start_date == date)
-        .all()
-    )
+    events = (await db.execute(
+        select(EventModel)
+        .where(EventModel.start_date == date)
+    )).scalars().all()
     
     if not events:
         # 가까운 일정도 함께 조회
-        future_events = (
-            db.query(EventModel)
-            .filter(EventModel.start_date > date)
+        future_events = (await db.execute(
+            select(EventModel)
+            .where(EventModel.start_date > date)
             .order_by(EventModel.start_date)
             .limit(3)
-            .all()
-        )
+        )).scalars().all()
         
         if future_events:
             future_info = "\n".join([f"- {event.event_name} ({event.start_date})" for event in future_events])
@@ -175,14 +173,12 @@ async def handle_event_daily(date, message: str, db: Session):
     return await build_ai_response(events, message)
 
 
-async def handle_event_monthly(year: int, month: int, message: str, db: Session):
+async def handle_event_monthly(year: int, month: int, message: str, db: AsyncSession):
     """월간 이벤트 조회"""
-    events = (
-        db.query(EventModel)
-        .filter(func.year(EventModel.start_date) == year)
-        .filter(func.month(EventModel.start_date) == month)
-        .all()
-    )
+    events = (await db.execute(
+        select(EventModel)
+        .where(periods.month(year, month).filter(EventModel.start_date))
+    )).scalars().all()
     return await build_ai_response(events, message)
 
 
@@ -401,7 +397,7 @@ async def classify_event_type_by_keywords(event_title: str) -> str:
 
 
 
-async def handle_event_delete(message: str, db: Session):
+async def handle_event_delete(message: str, db: AsyncSession):
     """일정 삭제 처리"""
     # 메시지에서 삭제할 일정 정보 추출
     event_title = await extract_event_title_for_delete(message)
@@ -411,7 +407,7 @@ async def handle_event_delete(message: str, db: Session):
         return "어떤 일정을 삭제하시겠어요? (예: '체육대회 삭제해줘' 또는 '내일 일정 삭제')"
     
     # 삭제할 일정 찾기
-    query = db.query(EventModel)
+    query = select(EventModel)
     
     if event_title:
         # 제목과 Description에서 모두 검색 (더 유연한 검색)
@@ -431,21 +427,21 @@ async def handle_event_delete(message: str, db: Session):
             
             # 제목 조건 OR 시간 조건 (더 유연한 검색)
             if time_conditions:
-                query = query.filter(
+                query = query.where(
                     title_condition | 
                     (time_conditions[0] if len(time_conditions) == 1 else 
                      time_conditions[0] | time_conditions[1] if len(time_conditions) == 2 else
                      time_conditions[0] | time_conditions[1] | time_conditions[2])
                 )
             else:
-                query = query.filter(title_condition)
+                query = query.where(title_condition)
         else:
-            query = query.filter(title_condition)
+            query = query.where(title_condition)
     
     if event_date:
-        query = query.filter(EventModel.start_date == event_date)
+        query = query.where(EventModel.start_date == event_date)
     
-    events_to_delete = query.all()
+    events_to_delete = (await db.execute(query)).scalars().all()
     
     if not events_to_delete:
         if event_title and event_date:
@@ -462,14 +458,14 @@ async def handle_event_delete(message: str, db: Session):
     for event in events_to_delete:
         try:
             deleted_events.append(f"{event.event_name} ({event.start_date})")
-            db.delete(event)
+            await db.delete(event)
             deleted_count += 1
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             return f"일정 삭제 중 오류가 발생했습니다: {str(e)}"
     
     try:
-        db.commit()
+        await db.commit()
         
         if deleted_count == 1:
             return f"'{deleted_events[0]}' 일정이 성공적으로 삭제되었습니다!"
@@ -478,7 +474,7 @@ async def handle_event_delete(message: str, db: Session):
             return f"{deleted_count}개의 일정이 삭제되었습니다:\n{deleted_list}"
             
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return f"일정 삭제 중 오류가 발생했습니다: {str(e)}"
 
 
@@ -709,7 +705,7 @@ async def parse_multiple_events(message: str):
         return None
 
 
-async def add_multiple_events(events_data, db: Session):
+async def add_multiple_events(events_data, db: AsyncSession):
     """여러 이벤트를 데이터베이스에 추가 (개별 이벤트만)"""
     added_events = []
     failed_events = []
@@ -757,7 +753,7 @@ async def add_multiple_events(events_data, db: Session):
             failed_events.append(f"{event_data.get('title', '알 수 없음')}: {str(e)}")
     
     try:
-        db.commit()
+        await db.commit()
         
         if failed_events:
             return f"일부 일정 추가에 실패했습니다.\n성공: {', '.join(added_events)}\n실패: {', '.join(failed_events)}"
@@ -765,7 +761,7 @@ async def add_multiple_events(events_data, db: Session):
             return "\n".join(added_events)
             
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return f"일정 추가 중 오류가 발생했습니다: {str(e)}"
 
 
@@ -931,7 +927,7 @@ async def parse_date_from_text(date_text: str):
     return None
 
 
-async def handle_event_move(message: str, db: Session):
+async def handle_event_move(message: str, db: AsyncSession):
     """일정 이동 처리"""
     try:
         # 일정 이동 정보 파싱
@@ -958,9 +954,9 @@ async def handle_event_move(message: str, db: Session):
         
         # 일정 검색 (띄어쓰기 제거 후 비교)
         normalized_event_name = normalize_text(event_name)
-        events = db.query(EventModel).filter(
-            EventModel.start_date == old_date
-        ).all()
+        events = (await db.execute(
+            select(EventModel).where(EventModel.start_date == old_date)
+        )).scalars().all()
         
         target_event = None
         for event in events:
@@ -987,8 +983,8 @@ async def handle_event_move(message: str, db: Session):
         target_event.start_date = new_start_date
         target_event.end_date = new_end_date
         
-        db.commit()
-        db.refresh(target_event)
+        await db.commit()
+        await db.refresh(target_event)
         
         # 성공 메시지 생성
         if new_start_date == new_end_date:
@@ -997,5 +993,5 @@ async def handle_event_move(message: str, db: Session):
             return f"'{event_name}' 일정이 {new_date}부터 {new_end_date}까지로 성공적으로 이동되었습니다!"
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return f"일정 이동 중 오류가 발생했습니다: {str(e)}"
\ No newline at end of file
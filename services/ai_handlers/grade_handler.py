@@ -1,8 +1,9 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.students import Student as StudentModel
 from models.grades import Grade as GradeModel
 from models.test_scores import TestScore as TestScoreModel
-from models.subjects import Subject as SubjectModel
+from services.reference_cache import aget_reference_data
 from langchain_google_genai import ChatGoogleGenerativeAI
 from config.settings import settings
 
@@ -13,7 +14,7 @@ model = ChatGoogleGenerativeAI(
     temperature=0.7
 )
 
-async def handle_grade_query(message: str, db: Session):
+async def handle_grade_query(message: str, db: AsyncSession):
     """성적 조회 처리"""
     # 학생 이름 추출 (간단한 방식)
     student_name = None
@@ -26,22 +27,26 @@ async def handle_grade_query(message: str, db: Session):
         return "어떤 학생의 성적을 알고 싶으신가요? (예: 이예은의 성적을 알려줘)"
     
     # 학생 정보 조회
-    student = db.query(StudentModel).filter(StudentModel.student_name == student_name).first()
+    student = (await db.execute(
+        select(StudentModel).where(StudentModel.student_name == student_name)
+    )).scalars().first()
     if not student:
         return f"'{student_name}' 학생을 찾을 수 없습니다."
     
     # 성적 정보 조회 (grades 테이블만 - 중간고사, 기말고사)
-    grades = db.query(GradeModel).filter(GradeModel.student_id == student.id).all()
+    grades = (await db.execute(
+        select(GradeModel).where(GradeModel.student_id == student.id)
+    )).scalars().all()
     
     if not grades:
         return f"'{student_name}' 학생의 성적 정보가 없습니다."
     
     # 성적 정보를 텍스트로 변환 (중간고사, 기말고사만)
+    refs = await aget_reference_data(db)
     grade_info = []
     for grade in grades:
-        # 과목명 조회
-        subject = db.query(SubjectModel).filter(SubjectModel.id == grade.subject_id).first()
-        subject_name = subject.name if subject else f"과목ID {grade.subject_id}"
+        # 과목명 조회 (참조 캐시)
+        subject_name = refs.subject_name(grade.subject_id, f"과목ID {grade.subject_id}")
         
         # term에 따른 시험 구분 (1: 1학기, 2: 2학기)
         term_name = "1학기" if grade.term == 1 else "2학기" if grade.term == 2 else f"{grade.term}학기"
@@ -1,7 +1,7 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.lessons import Lesson as LessonModel
 from langchain_google_genai import ChatGoogleGenerativeAI
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, select
 from config.settings import settings
 from datetime import datetime, timedelta
 import re
@@ -14,7 +14,7 @@ model = ChatGoogleGenerativeAI(
 )
 
 
-async def handle_lesson_query(message: str, db: Session):
+async def handle_lesson_query(message: str, db: AsyncSession):
     """수업 정보 조회 및 관리 처리"""
     user_message = message.lower()
     
@@ -37,34 +37,32 @@ async def handle_lesson_query(message: str, db: Session):
     return await handle_next_lesson(message, db)
 
 
-async def handle_next_lesson(message: str, db: Session):
+async def handle_next_lesson(message: str, db: AsyncSession):
     """다음 수업 조회"""
     current_time = datetime.now()
     current_date = current_time.date()
     current_time_str = current_time.strftime('%H:%M')
     
     # 오늘 날짜의 다음 수업 찾기
-    next_lesson = (
-        db.query(LessonModel)
-        .filter(
+    next_lesson = (await db.execute(
+        select(LessonModel)
+        .where(
             and_(
                 LessonModel.date == current_date,
                 LessonModel.start_time > current_time_str
             )
         )
         .order_by(LessonModel.start_time)
-        .first()
-    )
+    )).scalars().first()
     
     if not next_lesson:
         # 오늘 남은 수업이 없으면 내일 첫 수업 찾기
         tomorrow = current_date + timedelta(days=1)
-        next_lesson = (
-            db.query(LessonModel)
-            .filter(LessonModel.date == tomorrow)
+        next_lesson = (await db.execute(
+            select(LessonModel)
+            .where(LessonModel.date == tomorrow)
             .order_by(LessonModel.start_time)
-            .first()
-        )
+        )).scalars().first()
         
         if not next_lesson:
             return "다음 수업 일정이 등록되어 있지 않습니다."
@@ -74,14 +72,13 @@ async def handle_next_lesson(message: str, db: Session):
     return await build_next_lesson_response(next_lesson, message, is_tomorrow=False)
 
 
-async def handle_today_lessons(date, message: str, db: Session):
+async def handle_today_lessons(date, message: str, db: AsyncSession):
     """오늘 수업 조회"""
-    lessons = (
-        db.query(LessonModel)
-        .filter(LessonModel.date == date)
+    lessons = (await db.execute(
+        select(LessonModel)
+        .where(LessonModel.date == date)
         .order_by(LessonModel.start_time)
-        .all()
-    )
+    )).scalars().all()
     
     if not lessons:
         return f"오늘({date.strftime('%m월 %d일')}) 등록된 수업이 없습니다."
@@ -89,21 +86,20 @@ async def handle_today_lessons(date, message: str, db: Session):
     return await build_today_lessons_response(lessons, message, date)
 
 
-async def handle_subject_lesson(subject: str, message: str, db: Session):
+async def handle_subject_lesson(subject: str, message: str, db: AsyncSession):
     """특정 과목 수업 조회"""
     current_date = datetime.now().date()
     
-    lesson = (
-        db.query(LessonModel)
-        .filter(
+    lesson = (await db.execute(
+        select(LessonModel)
+        .where(
             and_(
                 LessonModel.subject_name == subject,
                 LessonModel.date >= current_date
             )
         )
         .order_by(LessonModel.date, LessonModel.start_time)
-        .first()
-    )
+    )).scalars().first()
     
     if not lesson:
         return f"{subject} 수업 일정이 등록되어 있지 않습니다."
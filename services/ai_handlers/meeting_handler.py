@@ -1,4 +1,5 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from langchain_google_genai import ChatGoogleGenerativeAI
 from config.settings import settings
 from models.meetings import Meeting as MeetingModel
@@ -11,7 +12,7 @@ model = ChatGoogleGenerativeAI(
 )
 
 
-def handle_meeting_query(message: str, db: Session):
+async def handle_meeting_query(message: str, db: AsyncSession):
     """
     회의록 관련 질의 처리
     - 요약 요청: "회의 요약해줘", "지난 회의 간단히 정리"
@@ -20,27 +21,27 @@ def handle_meeting_query(message: str, db: Session):
     user_message = message.lower()
 
     # 회의록 조회
-    meeting = (
-        db.query(MeetingModel)
+    meeting = (await db.execute(
+        select(MeetingModel)
         .order_by(MeetingModel.created_at.desc())
-        .first()
-    )
+        .limit(1)
+    )).scalars().first()
     if not meeting:
         return "❌ 저장된 회의록이 없습니다."
 
     # 요약 요청
     if "요약" in user_message or "정리" in user_message or "간단히" in user_message:
-        return summarize_meeting(meeting.content)
+        return await summarize_meeting(meeting.content)
 
     # 액션 아이템 요청
     if "할 일" in user_message or "해야" in user_message or "액션" in user_message:
-        return extract_actions(meeting.content)
+        return await extract_actions(meeting.content)
 
     # 기본: 회의록 내용 그대로 반환
     return f"📋 최근 회의록 원문:\n\n{meeting.content}"
 
 
-def summarize_meeting(content: str) -> str:
+async def summarize_meeting(content: str) -> str:
     """회의록 요약"""
     prompt = f"""
     다음은 회의록 전문입니다:
@@ -49,11 +50,11 @@ def summarize_meeting(content: str) -> str:
     ---
     위 내용을 한국어로 5줄 이내로 간결하게 요약해 주세요.
     """
-    response = model.invoke(prompt)
+    response = await model.ainvoke(prompt)
     return f"📝 회의 요약:\n{response.content}"
 
 
-def extract_actions(content: str) -> str:
+async def extract_actions(content: str) -> str:
     """회의록 액션 아이템 추출"""
     prompt = f"""
     다음은 회의록 전문입니다:
@@ -62,5 +63,5 @@ def extract_actions(content: str) -> str:
     ---
     이 회의에서 나온 '실행해야 할 액션 아이템(To-Do)'만 항목별로 추출해서 목록 형태로 정리해 주세요.
     """
-    response = model.invoke(prompt)
+    response = await model.ainvoke(prompt)
     return f"✅ 액션 아이템:\n{response.content}"
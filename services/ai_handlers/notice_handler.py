@@ -1,7 +1,7 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.notices import Notice as NoticeModel
 from langchain_google_genai import ChatGoogleGenerativeAI
-from sqlalchemy import func
+from sqlalchemy import func, select
 from config.settings import settings
 from datetime import datetime, timedelta
 import re
@@ -15,7 +15,7 @@ model = ChatGoogleGenerativeAI(
 
 
 
-async def handle_notice_query(message: str, db: Session):
+async def handle_notice_query(message: str, db: AsyncSession):
 
     """공지사항 조회 및 관리 처리"""
     user_message = message.lower()
@@ -56,26 +56,24 @@ async def handle_notice_query(message: str, db: Session):
     return await handle_recent_notices(message, db)
 
 
-async def handle_notice_daily(date, message: str, db: Session):
+async def handle_notice_daily(date, message: str, db: AsyncSession):
 
     """일일 공지사항 조회"""
     current_date = datetime.now().strftime('%Y년 %m월 %d일')
     
-    notices = (
-        db.query(NoticeModel)
-        .filter(func.date(NoticeModel.date) == date)
+    notices = (await db.execute(
+        select(NoticeModel)
+        .where(func.date(NoticeModel.date) == date)
         .order_by(NoticeModel.date.desc())
-        .all()
-    )
+    )).scalars().all()
     
     if not notices:
         # 최근 공지사항도 함께 조회
-        recent_notices = (
-            db.query(NoticeModel)
+        recent_notices = (await db.execute(
+            select(NoticeModel)
             .order_by(NoticeModel.date.desc())
             .limit(3)
-            .all()
-        )
+        )).scalars().all()
         
         if recent_notices:
             recent_info = "\n".join([f"- {notice.title} ({notice.date})" for notice in recent_notices])
@@ -87,48 +85,45 @@ async def handle_notice_daily(date, message: str, db: Session):
     return await build_notice_response(notices, message)
 
 
-async def handle_important_notices(message: str, db: Session):
+async def handle_important_notices(message: str, db: AsyncSession):
 
 
     """중요 공지사항 조회 (기능 제거됨)"""
     return "죄송합니다. 현재 중요 공지사항 구분 기능은 지원하지 않습니다. 전체 공지사항을 조회해드릴까요?"
 
 
-async def handle_notice_list(message: str, db: Session):
+async def handle_notice_list(message: str, db: AsyncSession):
 
     """전체 공지사항 조회"""
-    notices = (
-        db.query(NoticeModel)
+    notices = (await db.execute(
+        select(NoticeModel)
         .order_by(NoticeModel.date.desc())
         .limit(10)
-        .all()
-    )
+    )).scalars().all()
     
     return await build_notice_response(notices, message)
 
 
-async def handle_notice_weekly(start, end, message: str, db: Session):
+async def handle_notice_weekly(start, end, message: str, db: AsyncSession):
 
     """주간 공지사항 조회"""
-    notices = (
-        db.query(NoticeModel)
-        .filter(NoticeModel.date.between(start, end))
+    notices = (await db.execute(
+        select(NoticeModel)
+        .where(NoticeModel.date.between(start, end))
         .order_by(NoticeModel.date.desc())
-        .all()
-    )
+    )).scalars().all()
     
     return await build_notice_response_with_summary(notices, message, start, end)
 
 
-async def handle_recent_notices(message: str, db: Session):
+async def handle_recent_notices(message: str, db: AsyncSession):
 
     """최근 공지사항 조회"""
-    notices = (
-        db.query(NoticeModel)
+    notices = (await db.execute(
+        select(NoticeModel)
         .order_by(NoticeModel.date.desc())
         .limit(5)
-        .all()
-    )
+    )).scalars().all()
     
 
     return await build_notice_response(notices, message)
@@ -1,9 +1,17 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from datetime import datetime
 import re
 from langchain_google_genai import ChatGoogleGenerativeAI
 from config.settings import settings
+from models.grades import Grade as GradeModel
+from models.attendance import Attendance as AttendanceModel
+from models.notices import Notice as NoticeModel
+from models.events import Event as EventModel
+from models.meetings import Meeting as MeetingModel
+from models.students import Student as StudentModel
+from models.subjects import Subject as SubjectModel
+from services import periods
 
 # LangChain Gemini API 설정
 model = ChatGoogleGenerativeAI(
@@ -13,7 +21,7 @@ model = ChatGoogleGenerativeAI(
 )
 
 
-def handle_report_query(message: str, db: Session):
+async def handle_report_query(message: str, db: AsyncSession):
     """
     학급/학생/학교 단위 통합 리포트 생성
     예: "이번 달 3반 리포트 만들어줘", "철수 학생 리포트", "학교 전체 리포트"
@@ -35,112 +43,115 @@ def handle_report_query(message: str, db: Session):
     class_match = re.search(r'(\d+)반', message)
     if class_match:
         class_id = int(class_match.group(1))
-        return build_class_report(db, year, month, class_id, message)
+        return await build_class_report(db, year, month, class_id, message)
 
     # 학생 리포트
     student_match = re.search(r'(\w+)\s*학생', message)
     if student_match:
         student_name = student_match.group(1)
-        return build_student_report(db, year, month, student_name, message)
+        return await build_student_report(db, year, month, student_name, message)
 
     # 기본: 학교 전체 리포트
-    return build_school_report(db, year, month, message)
+    return await build_school_report(db, year, month, message)
 
 
 # ---------------------------------------------------------------
-# Class Report
+# 공통 조회 (기간 조건은 모두 [start, end) 범위 → 날짜 인덱스 사용)
 # ---------------------------------------------------------------
-def build_class_report(db: Session, year: int, month: int, class_id: int, message: str):
-    grades = (
-        db.query(GradeModel)
-        .filter(GradeModel.class_id == class_id)
-        .filter(func.extract("month", GradeModel.created_at) == month)
-        .all()
-    )
-    attendance = (
-        db.query(AttendanceModel)
-        .filter(AttendanceModel.class_id == class_id)
-        .filter(func.extract("month", AttendanceModel.date) == month)
-        .all()
+def _grade_rows(*filters):
+    # 성적 테이블에는 날짜 컬럼이 없으므로 기간 대신 학생 조건만 적용
+    return (
+        select(StudentModel.student_name, SubjectModel.name, GradeModel.term, GradeModel.average_score)
+        .join(StudentModel, GradeModel.student_id == StudentModel.id)
+        .join(SubjectModel, GradeModel.subject_id == SubjectModel.id)
+        .where(*filters)
+        .order_by(StudentModel.id, SubjectModel.id, GradeModel.term)
     )
-    notices = (
-        db.query(NoticeModel)
-        .filter(func.extract("month", NoticeModel.created_at) == month)
-        .all()
+
+
+def _attendance_rows(period: periods.Period, *filters):
+    return (
+        select(AttendanceModel.date, StudentModel.student_name, AttendanceModel.status)
+        .join(StudentModel, AttendanceModel.student_id == StudentModel.id)
+        .where(period.filter(AttendanceModel.date), *filters)
+        .order_by(AttendanceModel.date, StudentModel.id)
     )
-    events = (
-        db.query(EventModel)
-        .filter(func.extract("month", EventModel.date) == month)
-        .all()
+
+
+async def _fetch_all(db: AsyncSession, stmt):
+    return (await db.execute(stmt)).all()
+
+
+async def _fetch_scalars(db: AsyncSession, stmt):
+    return (await db.execute(stmt)).scalars().all()
+
+
+# ---------------------------------------------------------------
+# Class Report
+# ---------------------------------------------------------------
+async def build_class_report(db: AsyncSession, year: int, month: int, class_id: int, message: str):
+    period = periods.month(year, month)
+    grades = await _fetch_all(db, _grade_rows(StudentModel.class_id == class_id))
+    attendance = await _fetch_all(db, _attendance_rows(period, StudentModel.class_id == class_id))
+    notices = await _fetch_scalars(db,
+        select(NoticeModel)
+        .where(NoticeModel.target_class_id == class_id)
+        .where(period.filter(NoticeModel.date))
     )
+    events = await _fetch_scalars(db, select(EventModel).where(period.filter(EventModel.start_date)))
 
-    return build_ai_report("📘 학급 리포트", grades, attendance, notices, events, message)
+    return await build_ai_report("📘 학급 리포트", grades, attendance, notices, events, message)
 
 
 # ---------------------------------------------------------------
 # Student Report
 # ---------------------------------------------------------------
-def build_student_report(db: Session, year: int, month: int, student_name: str, message: str):
-    grades = (
-        db.query(GradeModel)
-        .filter(GradeModel.student_name == student_name)
-        .filter(func.extract("month", GradeModel.created_at) == month)
-        .all()
+async def build_student_report(db: AsyncSession, year: int, month: int, student_name: str, message: str):
+    period = periods.month(year, month)
+    grades = await _fetch_all(db, _grade_rows(StudentModel.student_name == student_name))
+    attendance = await _fetch_all(db, _attendance_rows(period, StudentModel.student_name == student_name))
+    meetings = await _fetch_scalars(db,
+        select(MeetingModel)
+        .join(StudentModel, MeetingModel.student_id == StudentModel.id)
+        .where(StudentModel.student_name == student_name)
+        .where(period.filter(MeetingModel.date))
     )
-    attendance = (
-        db.query(AttendanceModel)
-        .filter(AttendanceModel.student_name == student_name)
-        .filter(func.extract("month", AttendanceModel.date) == month)
-        .all()
-    )
-    # TODO: 상담 기록 모델 연결 필요시 여기에 추가
-    return build_ai_report("👩‍🎓 학생 리포트", grades, attendance, [], [], message)
+    return await build_ai_report("👩‍🎓 학생 리포트", grades, attendance, [], [], message, meetings)
 
 
 # ---------------------------------------------------------------
 # School Report
 # ---------------------------------------------------------------
-def build_school_report(db: Session, year: int, month: int, message: str):
-    notices = (
-        db.query(NoticeModel)
-        .filter(func.extract("month", NoticeModel.created_at) == month)
-        .all()
-    )
-    events = (
-        db.query(EventModel)
-        .filter(func.extract("month", EventModel.date) == month)
-        .all()
-    )
-    meetings = (
-        db.query(MeetingModel)
-        .filter(func.extract("month", MeetingModel.created_at) == month)
-        .all()
-    )
-    return build_ai_report("🏫 학교 전체 리포트", [], [], notices, events, message, meetings)
+async def build_school_report(db: AsyncSession, year: int, month: int, message: str):
+    period = periods.month(year, month)
+    notices = await _fetch_scalars(db, select(NoticeModel).where(period.filter(NoticeModel.date)))
+    events = await _fetch_scalars(db, select(EventModel).where(period.filter(EventModel.start_date)))
+    meetings = await _fetch_scalars(db, select(MeetingModel).where(period.filter(MeetingModel.date)))
+    return await build_ai_report("🏫 학교 전체 리포트", [], [], notices, events, message, meetings)
 
 
 # ---------------------------------------------------------------
 # AI Report Generator
 # ---------------------------------------------------------------
-def build_ai_report(title: str, grades, attendance, notices, events, message: str, meetings=None):
+async def build_ai_report(title: str, grades, attendance, notices, events, message: str, meetings=None):
     grade_info = (
-        "\n".join([f"{g.student_name} - {g.subject}: {g.score}" for g in grades])
+        "\n".join([f"{name} - {subject}({term}학기): {score}" for name, subject, term, score in grades])
         if grades else "데이터 없음"
     )
     attendance_info = (
-        "\n".join([f"{a.date} {a.student_name}: {a.status}" for a in attendance])
+        "\n".join([f"{d} {name}: {status}" for d, name, status in attendance])
         if attendance else "데이터 없음"
     )
     notice_info = (
-        "\n".join([f"{n.title} ({n.created_at.strftime('%Y-%m-%d')})" for n in notices])
+        "\n".join([f"{n.title} ({n.date})" for n in notices])
         if notices else "데이터 없음"
     )
     event_info = (
-        "\n".join([f"{e.event_name} ({e.date})" for e in events])
+        "\n".join([f"{e.event_name} ({e.start_date})" for e in events])
         if events else "데이터 없음"
     )
     meeting_info = (
-        "\n".join([f"{m.title} ({m.created_at.strftime('%Y-%m-%d')})" for m in meetings])
+        "\n".join([f"{m.title} ({m.date})" for m in meetings])
         if meetings else "데이터 없음"
     )
 
@@ -169,5 +180,5 @@ def build_ai_report(title: str, grades, attendance, notices, events, message: st
     {meeting_info}
     """
 
-    response = model.invoke(prompt)
+    response = await model.ainvoke(prompt)
     return response.content
@@ -1,4 +1,5 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.students import Student as StudentModel
 from langchain_google_genai import ChatGoogleGenerativeAI
 from config.settings import settings
@@ -10,10 +11,10 @@ model = ChatGoogleGenerativeAI(
     temperature=0.7
 )
 
-async def handle_student_query(message: str, db: Session):
+async def handle_student_query(message: str, db: AsyncSession):
     """학생 명단 조회 처리"""
     # 학생 데이터 조회
-    students = db.query(StudentModel).all()
+    students = (await db.execute(select(StudentModel))).scalars().all()
     
     if not students:
         return "현재 등록된 학생이 없습니다."
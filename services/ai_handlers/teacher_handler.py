@@ -1,4 +1,5 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.teachers import Teacher as TeacherModel
 from langchain_google_genai import ChatGoogleGenerativeAI
 from config.settings import settings
@@ -10,10 +11,10 @@ model = ChatGoogleGenerativeAI(
     temperature=0.7
 )
 
-async def handle_teacher_query(message: str, db: Session):
+async def handle_teacher_query(message: str, db: AsyncSession):
     """교사 명단 조회 처리"""
     # 교사 데이터 조회
-    teachers = db.query(TeacherModel).all()
+    teachers = (await db.execute(select(TeacherModel))).scalars().all()
     
     if not teachers:
         return "현재 등록된 선생님이 없습니다."
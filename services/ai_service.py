@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from services.ai_handlers.teacher_handler import handle_teacher_query
 from services.ai_handlers.student_handler import handle_student_query
 from services.ai_handlers.grade_handler import handle_grade_query
@@ -7,7 +7,7 @@ from services.ai_handlers.notice_handler import handle_notice_query
 from services.ai_handlers.lesson_handler import handle_lesson_query
 from services.ai_handlers.attendance_handler import handle_attendance_query
 
-async def process_ai_query(message: str, db: Session):
+async def process_ai_query(message: str, db: AsyncSession):
     """AI 쿼리 처리 메인 함수"""
     user_message = message.lower()
     
@@ -0,0 +1,121 @@
+"""
+services/attendance_aggregation.py
+
+- 출결 집계 SQL 모음 (원본 출결 행을 Python 으로 가져와 세지 않고 DB 에서 집계)
+  1) status_count(): COUNT(CASE WHEN status = ? THEN 1 END) 조건부 집계 식
+  2) student_stats_stmt(): students ⟕ attendance 학생별 상태 건수 (출결 없는 학생도 0건으로 포함)
+     → Select 만 만들고 실행은 호출 측 (동기 Session / AsyncSession 모두 사용)
+  3) count_by_status(): 조건(기간/학생/반)별 COUNT ... GROUP BY status
+  4) absence_reasons(): 결석 사유별 건수 (GROUP BY reason) — 최다 결석 사유
+- 날짜별 출결 건수(일별 출석률)는 일별 집계 테이블에서 읽음 (attendance_rollup.daily_counts)
+- 요약 라우터(/attendance/*-summary)는 집계 결과 행만 받고 개별 출결 행은 가져오지 않음
+"""
+
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Select, and_, case, func, select
+from sqlalchemy.orm import Session
+
+from models.attendance import Attendance as AttendanceModel
+from models.students import Student as StudentModel
+
+# 학생별 통계 응답 키 ← DB 상태값
+STUDENT_STAT_KEYS = {
+    "absent_count": "결석",
+    "late_count": "지각",
+    "early_count": "조퇴",
+    "present_count": "출석",
+}
+
+
+def status_count(status: str, column=AttendanceModel.status):
+    """status 인 행 수 (LEFT JOIN 으로 NULL 인 행은 세지 않음)"""
+    return func.count(case((column == status, 1)))
+
+
+def date_range(start: Optional[date] = None, end: Optional[date] = None) -> list:
+    """[start, end] (양끝 포함) 날짜 조건 목록 — 컬럼을 함수로 감싸지 않아 인덱스 사용"""
+    conditions = []
+    if start is not None:
+        conditions.append(AttendanceModel.date >= start)
+    if end is not None:
+        conditions.append(AttendanceModel.date < end + timedelta(days=1))
+    return conditions
+
+
+# ==========================================================
+# 학생별 상태 건수
+# ==========================================================
+
+def student_stats_stmt(
+    class_id: Optional[int] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    cursor: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> Select:
+    """
+    학생별 결석/지각/조퇴/출석 건수 (학생 id 순, 1쿼리)
+    - 날짜 조건은 JOIN 조건에 걸어 기간 내 출결이 없는 학생도 0건으로 유지
+    - cursor: 이 학생 id 다음부터 (keyset), limit: 최대 학생 수
+    """
+    stmt = (
+        select(
+            StudentModel.id.label("student_id"),
+            StudentModel.student_name,
+            StudentModel.class_id,
+            *[status_count(status).label(key) for key, status in STUDENT_STAT_KEYS.items()],
+        )
+        .select_from(StudentModel)
+        .outerjoin(
+            AttendanceModel,
+            and_(AttendanceModel.student_id == StudentModel.id, *date_range(start, end)),
+        )
+        .group_by(StudentModel.id, StudentModel.student_name, StudentModel.class_id)
+        .order_by(StudentModel.id)
+    )
+    if class_id is not None:
+        stmt = stmt.where(StudentModel.class_id == class_id)
+    if cursor is not None:
+        stmt = stmt.where(StudentModel.id > cursor)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+# ==========================================================
+# 상태별 / 사유별 집계 (동기 Session)
+# ==========================================================
+
+def _scoped(stmt: Select, class_id: Optional[int], filters) -> Select:
+    if class_id is not None:
+        stmt = stmt.join(StudentModel, AttendanceModel.student_id == StudentModel.id).where(
+            StudentModel.class_id == class_id
+        )
+    if filters:
+        stmt = stmt.where(*filters)
+    return stmt
+
+
+def count_by_status(db: Session, *filters, class_id: Optional[int] = None) -> Dict[str, int]:
+    """{상태: 건수} — filters: 추가 WHERE 조건 (예: date_range(...), 학생 조건), class_id: 현재 반 학생만"""
+    stmt = select(AttendanceModel.status, func.count()).group_by(AttendanceModel.status)
+    return dict(db.execute(_scoped(stmt, class_id, filters)).tuples().all())
+
+
+def absence_reasons(db: Session, *filters, class_id: Optional[int] = None) -> List[Tuple[str, int]]:
+    """[(결석 사유, 건수)] 건수 내림차순(동률은 사유 이름순) — 사유가 비어 있는 결석은 제외"""
+    count = func.count()
+    stmt = (
+        select(AttendanceModel.reason, count)
+        .where(AttendanceModel.status == "결석", AttendanceModel.reason.isnot(None), AttendanceModel.reason != "")
+        .group_by(AttendanceModel.reason)
+        .order_by(count.desc(), AttendanceModel.reason)
+    )
+    return db.execute(_scoped(stmt, class_id, filters)).tuples().all()
+
+
+def attendance_rate(present: int, total: int) -> float:
+    """출석률 % (소수 첫째 자리, 기록 없으면 0)"""
+    return round((present / total) * 100, 1) if total else 0
@@ -0,0 +1,315 @@
+"""
+services/attendance_calendar.py
+
+- 학생 × 학년도 출결 달력: 날짜별 상태를 1바이트 코드(uint8)로 압축 (학생 1명 1년 = 365~366바이트)
+  1) load_calendars(): 여러 반의 학년도 출결을 1쿼리로 읽어 반마다 (학생 × 일) 코드 행렬 생성
+  2) get_calendars(): 반 × 학년도 단위 프로세스 캐시 → 출결/학생 쓰기 시 비우고 다음 조회에서 DB 로 재구축
+  3) detect(): 반 전체 행렬을 한 번에 계산 (학생별 반복/쿼리 없음)
+     * 연속 결석: 기준일까지 이어지는 결석 일수 / 학년도 최장 연속 결석 (기록 없는 날 = 주말·휴일은 건너뜀)
+     * 요일 패턴: 최근 PATTERN_WEEKS 주 동안 같은 요일에 반복된 지각/결석/조퇴 (예: 월요일 지각)
+     * 최근 RECENT_DAYS 일 결석률
+  4) need_attention(): detect() 결과 → 주의 학생 목록 (출결 대시보드 alerts.calendar)
+- 무효화: grade_rankings 와 같은 방식 (flush / bulk 실행 / commit 시 전체 캐시 삭제)
+- 다른 워커 프로세스의 쓰기는 settings.ATTENDANCE_CALENDAR_CACHE_TTL 초 후 반영
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple, get_args
+
+import numpy as np
+from sqlalchemy import and_, event, select
+from sqlalchemy.orm import Session
+
+from config.settings import settings
+from models.attendance import Attendance as AttendanceModel
+from models.students import Student as StudentModel
+from schemas.attendance import AttendanceStatus
+from services import periods
+
+# ✅ 상태 코드 (0 = 기록 없음, 목록에 없는 상태는 OTHER)
+NO_RECORD = 0
+STATUS_CODES = {status: code for code, status in enumerate(get_args(AttendanceStatus), start=1)}  # 출석 1 … 조퇴 4
+OTHER = 5
+LEGEND = {str(NO_RECORD): None, **{str(code): status for status, code in STATUS_CODES.items()}, str(OTHER): "기타"}
+ABSENT = STATUS_CODES["결석"]
+
+ABSENT_STREAK = 3          # 연속 결석 위험 기준 (기록된 날 기준 3일)
+PATTERN_WEEKS = 8          # 요일 패턴 확인 기간 (기준일 포함 최근 8주)
+PATTERN_MIN_COUNT = 3      # 같은 요일 같은 상태가 이 횟수 이상이고
+PATTERN_MIN_RATIO = 0.5    # 그 요일 기록의 절반 이상이면 패턴
+PATTERN_STATUSES = ["지각", "결석", "조퇴"]
+RECENT_DAYS = 28           # 최근 결석률 계산 기간 (기준일 포함)
+RECENT_MIN_RECORDS = 5     # 최근 기록이 이보다 적으면 결석률 판단 안 함
+RECENT_ABSENCE_RATE = 0.2  # 최근 결석률 주의 기준
+WEEKDAYS = ["월", "화", "수", "목", "금", "토", "일"]
+
+_CALENDAR_MODELS = (AttendanceModel, StudentModel)
+_DIRTY_KEY = "attendance_calendar_dirty"
+
+_lock = threading.Lock()
+_cache: Dict[Tuple[int, int], Tuple[float, "ClassCalendar"]] = {}
+_version = 0
+
+
+def encode_status(status: Optional[str]) -> int:
+    if status is None:
+        return NO_RECORD
+    return STATUS_CODES.get(status, OTHER)
+
+
+@dataclass(frozen=True)
+class ClassCalendar:
+    """한 반의 학년도 출결 달력 (캐시와 공유되므로 codes 는 읽기 전용)"""
+    class_id: int
+    year: int
+    student_ids: np.ndarray   # (학생 수,) 학생 id 오름차순
+    names: List[str]
+    codes: np.ndarray         # (학생 수, 학년도 일수) uint8 — 열 j = 학년도 시작일 + j 일
+
+    @property
+    def period(self) -> periods.Period:
+        return periods.school_year(self.year)
+
+    def day_index(self, d: date) -> int:
+        return (d - self.period.start).days
+
+    def row(self, student_id: int) -> Optional[np.ndarray]:
+        pos = int(np.searchsorted(self.student_ids, student_id))
+        if pos < len(self.student_ids) and self.student_ids[pos] == student_id:
+            return self.codes[pos]
+        return None
+
+    @staticmethod
+    def encode(row: np.ndarray) -> str:
+        """코드 배열 → 숫자 문자열 (하루 1글자, LEGEND 로 해석)"""
+        return (row + ord("0")).astype(np.uint8).tobytes().decode("ascii")
+
+
+# ==========================================================
+# 무효화
+# ==========================================================
+
+def invalidate() -> None:
+    """출결/학생 변경 시 호출 → 모든 반의 달력 캐시 삭제"""
+    global _version
+    with _lock:
+        _version += 1
+        _cache.clear()
+
+
+def _mark_dirty(session) -> None:
+    session.info[_DIRTY_KEY] = True
+    invalidate()
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_on_flush(session, flush_context):
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, _CALENDAR_MODELS):
+            _mark_dirty(session)
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_on_bulk(orm_execute_state):
+    # ✅ ORM 객체를 거치지 않는 insert()/update()/delete() 실행 (일괄 출결 저장 등)
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and issubclass(mapper.class_, _CALENDAR_MODELS):
+        _mark_dirty(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    if session.info.pop(_DIRTY_KEY, False):
+        invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _invalidate_on_rollback(session):
+    if session.info.pop(_DIRTY_KEY, False):
+        invalidate()
+
+
+# ==========================================================
+# 적재
+# ==========================================================
+
+def load_calendars(db: Session, class_ids: Iterable[int], year: int) -> Dict[int, ClassCalendar]:
+    """반 ID → 학년도 달력 (1쿼리, 학생이 없는 반은 빈 달력)"""
+    class_ids = list(class_ids)
+    period = periods.school_year(year)
+    n_days = (period.end - period.start).days
+    stmt = (
+        select(
+            StudentModel.class_id,
+            StudentModel.id,
+            StudentModel.student_name,
+            AttendanceModel.date,
+            AttendanceModel.status,
+        )
+        .select_from(StudentModel)
+        .outerjoin(
+            AttendanceModel,
+            and_(AttendanceModel.student_id == StudentModel.id, period.filter(AttendanceModel.date)),
+        )
+        .where(StudentModel.class_id.in_(class_ids))
+        .order_by(StudentModel.class_id, StudentModel.id)
+    )
+
+    students: Dict[int, Dict[int, str]] = {class_id: {} for class_id in class_ids}
+    cells: Dict[int, List[tuple]] = {class_id: [] for class_id in class_ids}
+    for class_id, student_id, name, day, status in db.execute(stmt):
+        students[class_id].setdefault(student_id, name)
+        if day is not None:
+            cells[class_id].append((student_id, (day - period.start).days, encode_status(status)))
+
+    calendars = {}
+    for class_id in class_ids:
+        student_ids = np.fromiter(students[class_id], dtype=np.int64, count=len(students[class_id]))
+        codes = np.zeros((len(student_ids), n_days), dtype=np.uint8)
+        if cells[class_id]:
+            sids, days, values = np.array(cells[class_id], dtype=np.int64).T
+            codes[np.searchsorted(student_ids, sids), days] = values
+        codes.setflags(write=False)
+        calendars[class_id] = ClassCalendar(
+            class_id=class_id,
+            year=year,
+            student_ids=student_ids,
+            names=list(students[class_id].values()),
+            codes=codes,
+        )
+    return calendars
+
+
+def get_calendars(db: Session, class_ids: Iterable[int], year: int) -> Dict[int, ClassCalendar]:
+    """캐시 우선 반별 달력 — 캐시에 없는 반만 모아 1쿼리로 적재"""
+    class_ids = list(dict.fromkeys(class_ids))
+    ttl = settings.ATTENDANCE_CALENDAR_CACHE_TTL
+    result: Dict[int, ClassCalendar] = {}
+    if ttl > 0:
+        now = time.monotonic()
+        with _lock:
+            for class_id in class_ids:
+                cached = _cache.get((class_id, year))
+                if cached is not None and now - cached[0] < ttl:
+                    result[class_id] = cached[1]
+            version = _version
+
+    missing = [class_id for class_id in class_ids if class_id not in result]
+    if missing:
+        loaded = load_calendars(db, missing, year)
+        result.update(loaded)
+        if ttl > 0:
+            with _lock:
+                # 적재 중에 출결이 바뀌었다면 오래된 달력이므로 저장하지 않음
+                if version == _version:
+                    now = time.monotonic()
+                    _cache.update({(class_id, year): (now, calendar) for class_id, calendar in loaded.items()})
+    return {class_id: result[class_id] for class_id in class_ids}
+
+
+def get_calendar(db: Session, class_id: int, year: int) -> ClassCalendar:
+    return get_calendars(db, [class_id], year)[class_id]
+
+
+# ==========================================================
+# 탐지 (반 전체 벡터 연산)
+# ==========================================================
+
+def detect(calendar: ClassCalendar, target_date: date) -> Dict[str, np.ndarray]:
+    """
+    학생별 지표 배열 (학년도 시작 ~ target_date 까지만 사용)
+    - absent_streak / longest_absent_streak: (학생 수,)
+    - recent_records / recent_absent: (학생 수,) 최근 RECENT_DAYS 일 기록 수 / 결석 수
+    - weekday_records: (학생 수, 7) 최근 PATTERN_WEEKS 주 요일별 기록 수
+    - weekday_counts: (len(PATTERN_STATUSES), 학생 수, 7) 상태별 요일별 건수
+    """
+    n_students, n_days = calendar.codes.shape
+    end = min(max(calendar.day_index(target_date) + 1, 0), n_days)
+    codes = calendar.codes[:, :end]
+    recorded = codes != NO_RECORD
+    absent = codes == ABSENT
+
+    # 연속 결석: 각 날짜까지의 결석 누적 - 마지막 '결석 아닌 기록' 시점까지의 결석 누적
+    cum = np.zeros((n_students, end + 1), dtype=np.int32)
+    np.cumsum(absent, axis=1, out=cum[:, 1:])
+    last_break = np.where(recorded & ~absent, np.arange(1, end + 1), 0)
+    np.maximum.accumulate(last_break, axis=1, out=last_break)
+    runs = cum[:, 1:] - np.take_along_axis(cum, last_break, axis=1)
+    empty = np.zeros(n_students, dtype=np.int32)
+
+    # 요일 패턴: (상태별 일치 여부) @ (날짜 × 요일 one-hot)
+    start = max(end - PATTERN_WEEKS * 7, 0)
+    weekday = (calendar.period.start.weekday() + np.arange(start, end)) % 7
+    one_hot = (weekday[:, None] == np.arange(7)).astype(np.int32)
+    window = codes[:, start:end]
+    status_codes = np.array([STATUS_CODES[s] for s in PATTERN_STATUSES], dtype=np.uint8)
+    matches = (window[None, :, :] == status_codes[:, None, None]).astype(np.int32)
+
+    recent = slice(max(end - RECENT_DAYS, 0), end)
+    return {
+        "absent_streak": runs[:, -1] if end else empty,
+        "longest_absent_streak": runs.max(axis=1) if end else empty,
+        "recent_records": recorded[:, recent].sum(axis=1),
+        "recent_absent": absent[:, recent].sum(axis=1),
+        "weekday_records": (window != NO_RECORD).astype(np.int32) @ one_hot,
+        "weekday_counts": matches @ one_hot,
+    }
+
+
+def need_attention(calendar: ClassCalendar, target_date: date, stats: Optional[dict] = None) -> List[dict]:
+    """
+    주의 학생 목록 (학생 id 순, 학생마다 해당 항목 순서대로)
+    - {"student_id", "name", "issue", "detail"}
+    """
+    if stats is None:
+        stats = detect(calendar, target_date)
+    counts = stats["weekday_counts"]
+    records = stats["weekday_records"]
+    ratio = counts / np.maximum(records, 1)
+    pattern = (counts >= PATTERN_MIN_COUNT) & (ratio >= PATTERN_MIN_RATIO)
+    streak = stats["absent_streak"] >= ABSENT_STREAK
+    recent_rate = stats["recent_absent"] / np.maximum(stats["recent_records"], 1)
+    frequent = (stats["recent_records"] >= RECENT_MIN_RECORDS) & (recent_rate >= RECENT_ABSENCE_RATE)
+
+    flagged = np.flatnonzero(streak | pattern.any(axis=(0, 2)) | frequent)
+    alerts = []
+    for pos in flagged:
+        base = {"student_id": int(calendar.student_ids[pos]), "name": calendar.names[pos]}
+        if streak[pos]:
+            alerts.append({**base, "issue": "연속 결석", "detail": f"{int(stats['absent_streak'][pos])}일째"})
+        for s, wd in zip(*np.nonzero(pattern[:, pos, :])):
+            alerts.append({
+                **base,
+                "issue": f"{WEEKDAYS[wd]}요일 반복 {PATTERN_STATUSES[s]}",
+                "detail": f"최근 {PATTERN_WEEKS}주 {int(counts[s, pos, wd])}/{int(records[pos, wd])}회",
+            })
+        if frequent[pos]:
+            alerts.append({
+                **base,
+                "issue": "결석 잦음",
+                "detail": f"최근 {RECENT_DAYS}일 결석률 {round(float(recent_rate[pos]) * 100, 1)}%",
+            })
+    return alerts
+
+
+def student_summaries(calendar: ClassCalendar, target_date: date, stats: Optional[dict] = None) -> List[dict]:
+    """학생별 압축 달력 문자열 + 연속 결석 지표 (학생 id 순)"""
+    if stats is None:
+        stats = detect(calendar, target_date)
+    return [
+        {
+            "student_id": int(student_id),
+            "name": name,
+            "codes": ClassCalendar.encode(calendar.codes[pos]),
+            "absent_streak": int(stats["absent_streak"][pos]),
+            "longest_absent_streak": int(stats["longest_absent_streak"][pos]),
+        }
+        for pos, (student_id, name) in enumerate(zip(calendar.student_ids, calendar.names))
+    ]
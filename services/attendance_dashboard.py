@@ -0,0 +1,170 @@
+"""
+services/attendance_dashboard.py
+
+- 반별 출결 대시보드 계산 모듈
+  1) load_rows(): 여러 반의 [기준일-4, 기준일] 출결을 한 번의 쿼리로 조회
+  2) build_dashboard(): 한 반의 행만으로 당일 현황/주의 학생/처리 현황/상세/주간 요약 계산
+- 연속 결석 확인도 같은 5일치 행에서 계산하므로 결석 학생마다 추가 쿼리가 없음
+- 학년도 출결 달력(services/attendance_calendar.py)을 넘기면 alerts.calendar 에
+  연속 결석 / 요일 반복 패턴 / 잦은 결석 학생을 추가 (반 전체 벡터 연산, 캐시 사용)
+- /attendance/dashboard/{class_id} 와 /dashboards/batch 가 함께 사용
+"""
+
+from collections import Counter, namedtuple
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models.attendance import Attendance as AttendanceModel
+from models.students import Student as StudentModel
+from services.attendance_calendar import ClassCalendar, need_attention as calendar_alerts
+
+WEEK_DAYS = 5         # 주간 요약 기간 (기준일 포함 최근 5일)
+ABSENT_STREAK = 3     # 연속 결석 위험 기준 (최근 3일)
+
+# ✅ 상태 매핑 (한글 → 영문)
+STATUS_MAP = {
+    "출석": "present",
+    "결석": "absent",
+    "지각": "late",
+    "조퇴": "early_leave"
+}
+
+AttendanceRow = namedtuple("AttendanceRow", "class_id student_id student_name date status reason")
+
+
+def convert_status(status: str) -> str:
+    return STATUS_MAP.get(status, status)
+
+
+# ==========================================================
+# 조회
+# ==========================================================
+
+def load_rows(db: Session, class_ids: Iterable[int], target_date: date) -> Dict[int, List[AttendanceRow]]:
+    """반 ID → 최근 WEEK_DAYS 일 출결 행 (날짜, id 순) — 1쿼리"""
+    start = target_date - timedelta(days=WEEK_DAYS - 1)
+    stmt = (
+        select(
+            StudentModel.class_id,
+            AttendanceModel.student_id,
+            StudentModel.student_name,
+            AttendanceModel.date,
+            AttendanceModel.status,
+            AttendanceModel.reason,
+        )
+        .join(StudentModel, AttendanceModel.student_id == StudentModel.id)
+        .where(
+            StudentModel.class_id.in_(list(class_ids)),
+            AttendanceModel.date.between(start, target_date),
+        )
+        .order_by(AttendanceModel.date, AttendanceModel.id)
+    )
+    rows: Dict[int, List[AttendanceRow]] = {}
+    for row in db.execute(stmt):
+        rows.setdefault(row.class_id, []).append(AttendanceRow(*row))
+    return rows
+
+
+# ==========================================================
+# 계산
+# ==========================================================
+
+def build_dashboard(
+    class_id: int,
+    target_date: date,
+    week_rows: List[AttendanceRow],
+    calendar: Optional[ClassCalendar] = None,
+) -> dict:
+    """
+    한 반의 대시보드 data (week_rows: load_rows() 결과 중 해당 반)
+    - calendar: 해당 반의 학년도 출결 달력 (attendance_calendar.get_calendars) → alerts.calendar
+    """
+    records = [r for r in week_rows if r.date == target_date]
+
+    total_students = len(records)
+    status_counter = Counter(r.status for r in records)
+
+    present = status_counter.get("출석", 0)
+    absent = status_counter.get("결석", 0)
+    late = status_counter.get("지각", 0)
+    early_leave = status_counter.get("조퇴", 0)
+    rate = round((present / total_students) * 100, 1) if total_students else 0
+
+    # 학생별 최근 ABSENT_STREAK+1 일([기준일-3, 기준일]) 출결 상태
+    streak_start = target_date - timedelta(days=ABSENT_STREAK)
+    recent: Dict[int, List[str]] = {}
+    for r in week_rows:
+        if r.date >= streak_start:
+            recent.setdefault(r.student_id, []).append(r.status)
+
+    # 2) 주의 필요 학생 (연속 결석 or 특정 사유 다수)
+    need_attention = []
+    at_risk = set()
+    for r in records:
+        if r.status == "결석":
+            statuses = recent.get(r.student_id, [])
+            if len(statuses) == ABSENT_STREAK and all(s == "결석" for s in statuses):
+                need_attention.append({"name": r.student_name, "issue": "연속 결석 위험"})
+                at_risk.add(r.student_name)
+        if r.reason and r.reason.count(",") >= 2:
+            need_attention.append({"name": r.student_name, "issue": "특별 사유 다수"})
+
+    # 3) 처리 현황 (예: 결석계 제출, 무단결석)
+    processed_absent = sum(1 for r in records if r.status == "결석" and "병결" in (r.reason or ""))
+    unreported_absent = sum(1 for r in records if r.status == "결석" and "무단" in (r.reason or ""))
+
+    # 4) 당일 상세 현황
+    details = [
+        {
+            "student_name": r.student_name,
+            "status": convert_status(r.status),
+            "reason": r.reason,
+            "note": "연속결석 위험" if r.student_name in at_risk else ""
+        }
+        for r in records
+    ]
+
+    # 5) 주간 요약 (최근 5일치 출석률 + 결석 사유 분석)
+    start_week = target_date - timedelta(days=WEEK_DAYS - 1)
+    daily = {}
+    for r in week_rows:
+        totals = daily.setdefault(r.date, [0, 0])
+        totals[0] += 1
+        totals[1] += r.status == "출석"
+    avg_rate = round(sum(p / t * 100 for t, p in daily.values()) / len(daily), 1) if daily else 0
+
+    # 결석 사유 분석
+    reasons = [r.reason for r in week_rows if r.status == "결석" and r.reason]
+    reason_counter = Counter(reasons)
+    top_reason = reason_counter.most_common(1)[0] if reason_counter else ("None", 0)
+
+    return {
+        "class_id": class_id,
+        "date": str(target_date),
+        "overview": {
+            "total": total_students,
+            "present": present,
+            "absent": absent,
+            "late": late,
+            "early_leave": early_leave,
+            "attendance_rate": f"{rate}%"
+        },
+        "alerts": {
+            "need_attention": need_attention,
+            "calendar": calendar_alerts(calendar, target_date) if calendar is not None else [],
+        },
+        "processing": {
+            "absence_report_submitted": processed_absent,
+            "unreported_absent": unreported_absent
+        },
+        "details": details,
+        "weekly_summary": {
+            "period": f"{start_week} ~ {target_date}",
+            "avg_attendance_rate": f"{avg_rate}%",
+            "top_absent_reason": top_reason[0],
+            "top_absent_rate": f"{round((top_reason[1] / len(reasons)) * 100, 1)}%" if reasons else "0%"
+        }
+    }
@@ -0,0 +1,92 @@
+"""
+services/attendance_roll_call.py
+
+- 반 × 날짜 출석부 일괄 저장 (PUT /attendance/roll-call/{class_id}/{date})
+  1) 반 학생 명단을 SELECT ... FOR UPDATE 로 읽어 같은 반 출석부 저장을 직렬화
+     → 동시에 두 번 제출돼도 나중 요청은 먼저 commit 된 값과 비교하므로 중복 반영 없음
+  2) 같은 날짜의 기존 출결(변경 전 값)과 요청 값을 비교해 바뀐 학생만
+     (student_id, date) 유니크 키 기준 INSERT ... ON DUPLICATE KEY UPDATE 한 문장으로 저장
+  3) 변경 전/후 값으로 일별 출결 집계(attendance_rollup) 증분 반영
+- 같은 요청을 다시 보내면 저장/집계 변경 없이 빈 diff 반환 (멱등)
+- 쿼리 수는 반 인원과 무관: 명단 1 + 기존 출결 1 + upsert 1 (+ 집계 반영)
+"""
+
+from datetime import date
+from typing import Mapping, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models.attendance import Attendance as AttendanceModel
+from models.students import Student as StudentModel
+from services import attendance_rollup, bulk_upsert
+from services.attendance_rollup import AttendanceValues
+
+DEFAULT_STATUS = "출석"  # 요청에 없는 반 학생의 상태
+
+Entry = Tuple[str, Optional[str]]  # (상태, 사유)
+
+
+def roll_call(db: Session, class_id: int, day: date, entries: Mapping[int, Entry]) -> Optional[dict]:
+    """
+    반 출석부 저장 후 적용한 diff 반환 (commit 은 호출 측에서)
+    - entries: 학생 ID → (상태, 사유), 없는 학생은 (DEFAULT_STATUS, None)
+    - 반에 학생이 없으면 None, 반 학생이 아닌 ID 가 있으면 ValueError
+    - diff: total / created[] / updated[] (before, after) / unchanged (건수)
+    """
+    roster = db.scalars(
+        select(StudentModel.id)
+        .where(StudentModel.class_id == class_id)
+        .order_by(StudentModel.id)
+        .with_for_update()
+    ).all()
+    if not roster:
+        return None
+    unknown = sorted(set(entries) - set(roster))
+    if unknown:
+        raise ValueError(f"{class_id}반 학생이 아닙니다: {unknown}")
+
+    existing = {
+        row.student_id: row
+        for row in db.execute(
+            select(AttendanceModel.student_id, AttendanceModel.status, AttendanceModel.reason)
+            .where(AttendanceModel.student_id.in_(roster), AttendanceModel.date == day)
+            .with_for_update()
+        )
+    }
+
+    created, updated, rows, changes = [], [], [], []
+    for student_id in roster:
+        status, reason = entries.get(student_id, (DEFAULT_STATUS, None))
+        old = existing.get(student_id)
+        if old is not None and (old.status, old.reason) == (status, reason):
+            continue
+        after = {"status": status, "reason": reason}
+        if old is None:
+            created.append({"student_id": student_id, **after})
+        else:
+            updated.append({
+                "student_id": student_id,
+                "before": {"status": old.status, "reason": old.reason},
+                "after": after,
+            })
+        rows.append({"student_id": student_id, "date": day, **after})
+        changes.append((
+            AttendanceValues(student_id, day, old.status) if old is not None else None,
+            AttendanceValues(student_id, day, status),
+        ))
+
+    # ✅ 바뀐 학생만 한 문장으로 저장 (special_note 등 다른 컬럼은 유지)
+    bulk_upsert.upsert(
+        db, AttendanceModel, rows,
+        key_columns=["student_id", "date"],
+        update_columns=["status", "reason"],
+    )
+    attendance_rollup.apply_changes(db, changes)
+
+    return {
+        "total": len(roster),
+        "created": created,
+        "updated": updated,
+        "unchanged": len(roster) - len(rows),
+    }
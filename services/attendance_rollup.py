@@ -0,0 +1,176 @@
+"""
+services/attendance_rollup.py
+
+- 출결 일별 집계 테이블(models/attendance_stats.py) 유지 관리 + 조회
+  1) apply_changes(): 출결 생성/수정/삭제(여러 건 가능)를 같은 트랜잭션에서 증분 반영
+     * (반, 날짜, 상태)별 증감을 모아 다중 행 INSERT ... ON DUPLICATE KEY UPDATE count = count + ? 한 문장
+     * 0건이 된 집계 행은 삭제
+  2) rebuild(): 원본 attendance 에서 GROUP BY 로 전체(또는 기간/반 단위) 재구축 — 백필/대량 import 후 사용
+  3) count_by_status() / daily_counts(): 주간/월간/학기 요약용 조회 (재학생 수와 무관하게 반 × 날짜 × 상태 행만 읽음)
+- 호출 순서: 원본 변경 → db.flush() → apply_changes() → db.commit()
+  (AsyncSession 은 await db.run_sync(attendance_rollup.apply_changes, changes))
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, delete, func, insert, select, tuple_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from models.attendance import Attendance as AttendanceModel
+from models.attendance_stats import AttendanceDailyRollup
+from models.students import Student as StudentModel
+from services.periods import Period
+
+NO_CLASS = 0  # students 에 없는(삭제된) 학생의 출결
+
+
+@dataclass(frozen=True)
+class AttendanceValues:
+    """집계에 영향을 주는 출결 값 (변경 전/후 스냅샷)"""
+    student_id: int
+    date: date
+    status: str
+
+    @classmethod
+    def of(cls, attendance: AttendanceModel) -> "AttendanceValues":
+        return cls(attendance.student_id, attendance.date, attendance.status)
+
+
+Change = Tuple[Optional[AttendanceValues], Optional[AttendanceValues]]
+
+
+# ==========================================================
+# 증분 갱신
+# ==========================================================
+
+def _classes_of(db: Session, student_ids) -> Dict[int, int]:
+    return dict(db.execute(
+        select(StudentModel.id, StudentModel.class_id).where(StudentModel.id.in_(list(student_ids)))
+    ).tuples().all())
+
+
+def apply_changes(db: Session, changes: Iterable[Change]) -> None:
+    """
+    출결 변경 목록을 집계 테이블에 반영 (commit 은 호출 측에서)
+    - 변경 1건 = (old, new): 생성은 old=None, 삭제는 new=None
+    - 학생 반 조회 1쿼리 + upsert 1문장 (+ 0건 행 정리 1문장)
+    """
+    changes = [(old, new) for old, new in changes if old != new]
+    if not changes:
+        return
+    classes = _classes_of(db, {v.student_id for change in changes for v in change if v is not None})
+
+    deltas: Counter = Counter()
+    for old, new in changes:
+        for values, sign in ((old, -1), (new, +1)):
+            if values is not None:
+                deltas[(classes.get(values.student_id, NO_CLASS), values.date, values.status)] += sign
+    rows = [
+        {"class_id": class_id, "date": day, "status": status, "count": delta}
+        for (class_id, day, status), delta in sorted(deltas.items()) if delta
+    ]
+    if not rows:
+        return
+
+    table = AttendanceDailyRollup.__table__
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        stmt = mysql_insert(table).values(rows)
+        stmt = stmt.on_duplicate_key_update(count=table.c.count + stmt.inserted.count)
+    elif dialect == "sqlite":
+        stmt = sqlite_insert(table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["class_id", "date", "status"],
+            set_={"count": table.c.count + stmt.excluded.count},
+        )
+    else:
+        raise RuntimeError(f"지원하지 않는 DB dialect: {dialect}")
+    db.execute(stmt)
+
+    if any(row["count"] < 0 for row in rows):
+        keys = [(row["class_id"], row["date"], row["status"]) for row in rows if row["count"] < 0]
+        db.execute(
+            delete(table).where(
+                tuple_(table.c.class_id, table.c.date, table.c.status).in_(keys),
+                table.c.count <= 0,
+            )
+        )
+
+
+def apply_change(db: Session, old: Optional[AttendanceValues], new: Optional[AttendanceValues]) -> None:
+    """출결 1건 변경 반영 (생성: old=None / 삭제: new=None / 수정: 둘 다 지정)"""
+    apply_changes(db, [(old, new)])
+
+
+# ==========================================================
+# 재구축
+# ==========================================================
+
+def rebuild(db: Session, period: Optional[Period] = None, class_id: Optional[int] = None) -> int:
+    """
+    원본 attendance 에서 집계 테이블을 다시 계산 (commit 은 호출 측에서)
+    - period / class_id 지정 시 해당 범위만 교체 (class_id=0 은 students 에 없는 학생)
+    - 반환: 재구축된 행 수
+    """
+    class_of = func.coalesce(StudentModel.class_id, NO_CLASS)
+
+    rollup_del = delete(AttendanceDailyRollup)
+    filters = []
+    if period is not None:
+        rollup_del = rollup_del.where(period.filter(AttendanceDailyRollup.date))
+        filters.append(period.filter(AttendanceModel.date))
+    if class_id is not None:
+        rollup_del = rollup_del.where(AttendanceDailyRollup.class_id == class_id)
+        filters.append(class_of == class_id)
+    db.execute(rollup_del)
+
+    result = db.execute(insert(AttendanceDailyRollup).from_select(
+        ["class_id", "date", "status", "count"],
+        select(class_of, AttendanceModel.date, AttendanceModel.status, func.count())
+        .select_from(AttendanceModel)
+        .outerjoin(StudentModel, StudentModel.id == AttendanceModel.student_id)
+        .where(*filters)
+        .group_by(class_of, AttendanceModel.date, AttendanceModel.status),
+    ))
+    return result.rowcount
+
+
+# ==========================================================
+# 조회 (주간/월간/학기 요약용)
+# ==========================================================
+
+def _scoped(stmt, period: Period, class_id: Optional[int]):
+    stmt = stmt.where(period.filter(AttendanceDailyRollup.date))
+    if class_id is not None:
+        stmt = stmt.where(AttendanceDailyRollup.class_id == class_id)
+    return stmt
+
+
+def count_by_status(db: Session, period: Period, class_id: Optional[int] = None) -> Dict[str, int]:
+    """{상태: 건수} — attendance_aggregation.count_by_status 의 집계 테이블 버전"""
+    stmt = (
+        select(AttendanceDailyRollup.status, func.sum(AttendanceDailyRollup.count))
+        .group_by(AttendanceDailyRollup.status)
+    )
+    return {status: int(count) for status, count in db.execute(_scoped(stmt, period, class_id)).tuples()}
+
+
+def daily_counts(db: Session, period: Period, class_id: Optional[int] = None) -> List[Tuple[date, int, int]]:
+    """[(날짜, 전체 건수, 출석 건수)] 날짜순 — 기록이 있는 날짜만"""
+    count = AttendanceDailyRollup.count
+    stmt = (
+        select(
+            AttendanceDailyRollup.date,
+            func.sum(count),
+            func.sum(case((AttendanceDailyRollup.status == "출석", count), else_=0)),
+        )
+        .group_by(AttendanceDailyRollup.date)
+        .having(func.sum(count) > 0)
+        .order_by(AttendanceDailyRollup.date)
+    )
+    return [(day, int(total), int(present)) for day, total, present in db.execute(_scoped(stmt, period, class_id))]
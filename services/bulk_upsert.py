@@ -0,0 +1,75 @@
+"""
+services/bulk_upsert.py
+
+- 일괄 저장 API(POST /grades/bulk, /test_scores/bulk) 공용 도우미
+  1) validate_rows(): 요청 행을 한 번씩 스키마 검증 → 유효 행 / 행별 오류 분리 (한 행 오류로 전체 거부 X)
+  2) drop_duplicates(): 같은 요청 안의 중복 키 행은 첫 행만 사용, 이후 행은 오류로 보고
+  3) upsert(): 여러 행을 INSERT ... ON DUPLICATE KEY UPDATE (SQLite: ON CONFLICT DO UPDATE) 한 문장으로 저장
+- 트랜잭션(commit/rollback)은 호출 측에서 관리
+"""
+
+from typing import Callable, Dict, Hashable, Iterable, List, Sequence, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+RowError = Dict[str, object]
+
+
+def row_error(index: int, message: str, field: str = None) -> RowError:
+    return {"index": index, "errors": [{"field": field, "message": message}]}
+
+
+def validate_rows(schema: Type[BaseModel], rows: Sequence[dict]) -> Tuple[List[Tuple[int, BaseModel]], List[RowError]]:
+    """행별 스키마 검증 → ([(행 번호, 검증된 항목)], [행별 오류])"""
+    valid, errors = [], []
+    for index, row in enumerate(rows):
+        try:
+            valid.append((index, schema.model_validate(row)))
+        except ValidationError as e:
+            errors.append({
+                "index": index,
+                "errors": [
+                    {"field": ".".join(str(loc) for loc in err["loc"]) or None, "message": err["msg"]}
+                    for err in e.errors()
+                ],
+            })
+    return valid, errors
+
+
+def drop_duplicates(valid: Iterable[Tuple[int, BaseModel]], key: Callable[[BaseModel], Hashable]):
+    """같은 키가 여러 번 나오면 첫 행만 유지"""
+    seen: Dict[Hashable, int] = {}
+    kept, errors = [], []
+    for index, item in valid:
+        k = key(item)
+        if k in seen:
+            errors.append(row_error(index, f"같은 요청의 {seen[k]}번 행과 키가 중복됩니다."))
+            continue
+        seen[k] = index
+        kept.append((index, item))
+    return kept, errors
+
+
+def upsert(db: Session, model, rows: List[dict], key_columns: Sequence[str], update_columns: Sequence[str]) -> None:
+    """
+    다중 행 upsert 한 문장 (key_columns 는 유니크 제약 컬럼)
+    - 이미 있는 키는 update_columns 만 갱신, 없는 키는 삽입
+    """
+    if not rows:
+        return
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        stmt = mysql_insert(model).values(rows)
+        stmt = stmt.on_duplicate_key_update({col: stmt.inserted[col] for col in update_columns})
+    elif dialect == "sqlite":
+        stmt = sqlite_insert(model).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_={col: stmt.excluded[col] for col in update_columns},
+        )
+    else:
+        raise RuntimeError(f"지원하지 않는 DB dialect: {dialect}")
+    db.execute(stmt)
@@ -0,0 +1,257 @@
+"""
+services/grade_analytics.py
+
+- 성적 대시보드용 벡터화 분석 엔진 (NumPy / pandas)
+  1) load_scores(): 반(들) 또는 학교 전체의 학기 성적을 한 번의 쿼리로 long 프레임에 적재
+     (students ⟕ (grades ⋈ subjects) — 성적 없는 학생도 한 행으로 포함)
+  2) class_dashboard(): 한 반의 학생 × 과목 행렬, 평균/과목 통계/분포/분위수/순위/z-score
+  3) school_dashboard(): 여러 반을 한 프레임으로 묶어 반별·과목별·학생 분포 요약
+- 모든 통계는 groupby / pivot / rank / cut 등 벡터 연산으로 계산하고,
+  Python 반복은 응답 JSON 을 만드는 단계(학생·반 수만큼)에서만 사용
+"""
+
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_, join, select
+from sqlalchemy.orm import Session
+
+from models.grades import Grade as GradeModel
+from models.students import Student as StudentModel
+from models.subjects import Subject as SubjectModel
+
+# 학생 평균 분포 구간 [하한, 상한) — 기존 대시보드 라벨 유지
+DISTRIBUTION_BINS = [-np.inf, 60, 70, 80, 90, np.inf]
+DISTRIBUTION_LABELS = ["0-59", "60-69", "70-79", "80-89", "90-100"]
+QUANTILES = [0.1, 0.25, 0.5, 0.75, 0.9]
+DEFAULT_THRESHOLD = 65.0  # 개별 지도 필요 기준 (평균 미만)
+
+COLUMNS = ["student_id", "name", "class_id", "grade_id", "subject", "score"]
+
+
+# ==========================================================
+# 적재
+# ==========================================================
+
+def load_scores(db: Session, term: int, class_ids: Optional[Iterable[int]] = None) -> pd.DataFrame:
+    """
+    학기 성적을 long 프레임으로 적재 (1쿼리)
+    - 과목이 없는 성적은 기존 대시보드(INNER JOIN subjects)와 같이 제외
+    - class_ids=None 이면 학교 전체
+    """
+    graded = join(GradeModel, SubjectModel, SubjectModel.id == GradeModel.subject_id)
+    stmt = (
+        select(
+            StudentModel.id,
+            StudentModel.student_name,
+            StudentModel.class_id,
+            GradeModel.id,
+            SubjectModel.name,
+            GradeModel.average_score,
+        )
+        .select_from(StudentModel)
+        .outerjoin(graded, and_(GradeModel.student_id == StudentModel.id, GradeModel.term == term))
+        .order_by(StudentModel.id, GradeModel.id)
+    )
+    if class_ids is not None:
+        stmt = stmt.where(StudentModel.class_id.in_(list(class_ids)))
+
+    frame = pd.DataFrame.from_records(db.execute(stmt).all(), columns=COLUMNS)
+    frame["score"] = pd.to_numeric(frame["score"], errors="coerce")
+    return frame
+
+
+# ==========================================================
+# 공통 계산
+# ==========================================================
+
+def _round(value, digits: Optional[int] = 1):
+    """NaN → None, numpy 스칼라 → Python float (JSON 직렬화용, digits=None 이면 반올림 없음)"""
+    if value is None or pd.isna(value):
+        return None
+    return float(value) if digits is None else round(float(value), digits)
+
+
+def student_averages(frame: pd.DataFrame) -> pd.Series:
+    """학생별 평균 (점수 있는 성적 기준, 성적 없으면 0) — 학생 id 순"""
+    students = frame["student_id"].drop_duplicates()
+    means = frame.groupby("student_id")["score"].mean()
+    return means.reindex(students).fillna(0.0).round(1)
+
+
+def subject_stats(frame: pd.DataFrame) -> pd.DataFrame:
+    """과목별 count/mean/std/min/max/중앙값"""
+    scored = frame.dropna(subset=["score"])
+    stats = scored.groupby("subject", sort=True)["score"].agg(["count", "mean", "std", "min", "max", "median"])
+    return stats
+
+
+def distribution(averages: pd.Series) -> dict:
+    counts = pd.cut(averages, bins=DISTRIBUTION_BINS, labels=DISTRIBUTION_LABELS, right=False).value_counts()
+    return {label: int(counts.get(label, 0)) for label in DISTRIBUTION_LABELS}
+
+
+def quantiles(averages: pd.Series) -> dict:
+    if averages.empty:
+        return {f"p{int(q * 100)}": None for q in QUANTILES}
+    values = averages.quantile(QUANTILES)
+    return {f"p{int(q * 100)}": _round(values[q]) for q in QUANTILES}
+
+
+def z_scores(averages: pd.Series) -> pd.Series:
+    std = averages.std(ddof=0)
+    if not std or pd.isna(std):
+        return pd.Series(0.0, index=averages.index)
+    return ((averages - averages.mean()) / std).round(2)
+
+
+def _subject_stats_json(stats: pd.DataFrame) -> dict:
+    return {
+        subject: {
+            "count": int(row["count"]),
+            "mean": _round(row["mean"]),
+            "std": _round(row["std"], 2),
+            "min": _round(row["min"]),
+            "max": _round(row["max"]),
+            "median": _round(row["median"]),
+        }
+        for subject, row in stats.iterrows()
+    }
+
+
+# ==========================================================
+# 반 대시보드
+# ==========================================================
+
+def class_dashboard(frame: pd.DataFrame, threshold: float = DEFAULT_THRESHOLD) -> dict:
+    """
+    한 반(또는 임의 학생 집합)의 대시보드 본문
+    - 기존 응답 키(overview/subject_avg/distribution/alerts/students) 유지
+    - 추가: subject_stats, quantiles, 학생별 dense_rank / z_score
+    """
+    averages = student_averages(frame)
+    names = frame.drop_duplicates("student_id").set_index("student_id")["name"]
+
+    # 학생 × 과목 점수 행렬 (같은 과목 성적이 여러 건이면 마지막 성적)
+    graded = frame.dropna(subset=["grade_id"]).drop_duplicates(["student_id", "subject"], keep="last")
+    matrix = graded.pivot(index="student_id", columns="subject", values="score")
+    present = graded.pivot(index="student_id", columns="subject", values="grade_id").notna()
+
+    # 순위: 기존과 같이 동점은 학생 id 순 (ordinal), 추가로 dense rank
+    rank = averages.rank(method="first", ascending=False).astype(int)
+    dense = averages.rank(method="dense", ascending=False).astype(int)
+    z = z_scores(averages)
+
+    stats = subject_stats(frame)
+    scored = frame["score"].dropna()
+
+    students = {}
+    for student_id in averages.index:
+        if student_id in matrix.index:
+            row, has = matrix.loc[student_id], present.loc[student_id]
+            scores = {subject: _round(row[subject], None) for subject in row.index[has.to_numpy()]}
+        else:
+            scores = {}
+        students[student_id] = {
+            "student_id": int(student_id),
+            "name": names[student_id],
+            "scores": scores,
+            "average": float(averages[student_id]),
+            "rank": int(rank[student_id]),
+            "dense_rank": int(dense[student_id]),
+            "z_score": float(z[student_id]),
+        }
+
+    ranked = [students[sid] for sid in rank.sort_values(kind="stable").index]
+    below = [students[sid] for sid in averages.index[(averages < threshold).to_numpy()]]
+
+    return {
+        "overview": {
+            "class_avg": _round(scored.mean()) if not scored.empty else 0.0,
+            "highest": float(averages.max()) if not averages.empty else None,
+            "lowest": float(averages.min()) if not averages.empty else None,
+            "need_guidance": len(below),
+        },
+        "subject_avg": {subject: _round(mean) for subject, mean in stats["mean"].items()},
+        "subject_stats": _subject_stats_json(stats),
+        "distribution": distribution(averages),
+        "quantiles": quantiles(averages),
+        "alerts": {
+            "below_threshold": below
+        },
+        "students": ranked,
+    }
+
+
+# ==========================================================
+# 학교 전체 대시보드
+# ==========================================================
+
+def school_dashboard(frame: pd.DataFrame, class_names: dict, threshold: float = DEFAULT_THRESHOLD, top: int = 10) -> dict:
+    """
+    여러 반(학교/교육청 단위) 요약
+    - classes: 반별 학생 수/평균/최고/최저/지도 필요 수/반 순위(dense)
+    - subject_stats, distribution, quantiles: 전체 학생 기준
+    - top_students / bottom_students: 평균 상·하위 top 명
+    """
+    averages = student_averages(frame)
+    students = frame.drop_duplicates("student_id").set_index("student_id")[["name", "class_id"]]
+    students["average"] = averages
+    students["z_score"] = z_scores(averages)
+    students["below"] = students["average"] < threshold
+
+    scored = frame.dropna(subset=["score"])
+    by_class = students.groupby("class_id").agg(
+        student_count=("average", "size"),
+        student_avg=("average", "mean"),
+        highest=("average", "max"),
+        lowest=("average", "min"),
+        need_guidance=("below", "sum"),
+    )
+    by_class["class_avg"] = scored.groupby("class_id")["score"].mean()
+    by_class["rank"] = by_class["class_avg"].rank(method="dense", ascending=False)
+
+    classes = [
+        {
+            "class_id": int(class_id),
+            "class_name": class_names.get(int(class_id), "Unknown"),
+            "student_count": int(row["student_count"]),
+            "class_avg": _round(row["class_avg"]) if not pd.isna(row["class_avg"]) else 0.0,
+            "student_avg": _round(row["student_avg"]),
+            "highest": _round(row["highest"]),
+            "lowest": _round(row["lowest"]),
+            "need_guidance": int(row["need_guidance"]),
+            "rank": int(row["rank"]) if not pd.isna(row["rank"]) else None,
+        }
+        for class_id, row in by_class.sort_values(["rank", "class_avg"], na_position="last").iterrows()
+    ]
+
+    def _student_list(selected: pd.DataFrame) -> list:
+        return [
+            {
+                "student_id": int(student_id),
+                "name": row["name"],
+                "class_id": int(row["class_id"]),
+                "average": float(row["average"]),
+                "z_score": float(row["z_score"]),
+            }
+            for student_id, row in selected.iterrows()
+        ]
+
+    stats = subject_stats(frame)
+    return {
+        "overview": {
+            "school_avg": _round(scored["score"].mean()) if not scored.empty else 0.0,
+            "class_count": len(by_class),
+            "student_count": len(students),
+            "need_guidance": int(students["below"].sum()),
+        },
+        "classes": classes,
+        "subject_avg": {subject: _round(mean) for subject, mean in stats["mean"].items()},
+        "subject_stats": _subject_stats_json(stats),
+        "distribution": distribution(averages),
+        "quantiles": quantiles(averages),
+        "top_students": _student_list(students.nlargest(top, "average")),
+        "bottom_students": _student_list(students.nsmallest(top, "average")),
+    }
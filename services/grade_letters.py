@@ -0,0 +1,62 @@
+"""
+services/grade_letters.py
+
+- 점수 → 성적 등급(grade_letter) 변환
+  1) resolve_cutoffs(): 등급 기준 검증 (요청 값 또는 settings.GRADE_LETTER_CUTOFFS)
+  2) assign_letters(): 점수 배열을 NumPy searchsorted 로 한 번에 등급 변환 (NULL 점수 → None)
+  3) letter_case(): 같은 기준의 SQL CASE 식 (bulk UPDATE 용)
+- 과목 × 학기별 기준(grading_policies) 해석은 services/grading_policy.py
+- 기준 형식: {"A": 90, "B": 80, "C": 70, "D": 60, "F": 0} — 점수가 하한 이상이면 해당 등급
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from sqlalchemy import case
+
+from config.settings import settings
+
+Cutoffs = Tuple[np.ndarray, np.ndarray]  # (오름차순 하한 점수, 대응 등급)
+
+
+def resolve_cutoffs(cutoffs: Optional[Dict[str, float]] = None) -> Cutoffs:
+    """등급 기준 검증 후 searchsorted 용 배열로 변환 (잘못된 경우 ValueError)"""
+    cutoffs = cutoffs if cutoffs is not None else settings.GRADE_LETTER_CUTOFFS
+    if not cutoffs:
+        raise ValueError("등급 기준이 비어 있습니다.")
+    if any(not letter or len(letter) > 10 for letter in cutoffs):
+        raise ValueError("등급 이름은 1~10자여야 합니다.")
+    bounds = sorted((float(low), letter) for letter, low in cutoffs.items())
+    lows = [low for low, _ in bounds]
+    if len(set(lows)) != len(lows):
+        raise ValueError(f"등급 하한 점수가 중복됩니다: {cutoffs}")
+    return np.array(lows), np.array([letter for _, letter in bounds], dtype=object)
+
+
+def letter_array(values: np.ndarray, cutoffs: Cutoffs) -> np.ndarray:
+    """float 점수 배열(NULL = NaN) → 등급 object 배열 (가장 낮은 하한 미만, NaN 은 None)"""
+    lows, letters = cutoffs
+    index = np.searchsorted(lows, values, side="right") - 1
+    valid = ~np.isnan(values) & (index >= 0)
+    result = np.full(len(values), None, dtype=object)
+    result[valid] = letters[index[valid]]
+    return result
+
+
+def assign_letters(scores: Sequence[Optional[float]], cutoffs: Cutoffs) -> List[Optional[str]]:
+    """
+    점수 목록 → 등급 목록
+    - 가장 낮은 하한보다 낮은 점수, NULL 점수는 None
+    """
+    values = np.array([np.nan if s is None else s for s in scores], dtype=float)
+    return letter_array(values, cutoffs).tolist()
+
+
+def letter_case(score, cutoffs: Cutoffs):
+    """assign_letters 와 같은 규칙의 SQL 식: CASE WHEN score >= 90 THEN 'A' WHEN ... END (그 외 NULL)"""
+    lows, letters = cutoffs
+    return case(
+        *[(score >= float(low), str(letter)) for low, letter in zip(lows[::-1], letters[::-1])],
+        else_=None,
+    )
@@ -0,0 +1,234 @@
+"""
+services/grade_rankings.py
+
+- 반 × 학기 석차를 SQL 윈도 함수로 계산하고 프로세스 안에서 캐시
+  1) 학생 석차: student_grade_averages 로 학생 평균 → RANK / DENSE_RANK / PERCENT_RANK
+     (PARTITION BY 반 — 학기는 조회 조건으로 고정) → 동점자는 같은 석차
+  2) 과목 석차(선택): grades 에서 PARTITION BY 반, 학기, 과목 (점수 NULL 성적 제외)
+- 캐시 키: (class_id, term, by_subject) — 같은 반 대시보드 새로고침은 DB 조회 없이 반환
+- 무효화: 성적/학생/성적 집계 테이블 쓰기가 flush(ORM) 또는 실행(bulk INSERT/UPDATE/DELETE)될 때와
+  해당 트랜잭션 commit 시점에 전체 캐시를 비움 → 다른 요청이 commit 전 데이터로 다시 채운 캐시도 제거
+- 다른 워커 프로세스의 쓰기는 settings.RANKING_CACHE_TTL 초 후 반영
+"""
+
+import threading
+import time
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, case, event, func, select
+from sqlalchemy.orm import Session
+
+from config.settings import settings
+from models.grade_stats import GradeSubjectStat, StudentGradeAverage
+from models.grades import Grade as GradeModel
+from models.students import Student as StudentModel
+from services.reference_cache import get_reference_data
+
+_GRADE_MODELS = (GradeModel, StudentModel, GradeSubjectStat, StudentGradeAverage)
+_DIRTY_KEY = "grade_rankings_dirty"
+
+_lock = threading.Lock()
+_cache: Dict[Tuple[int, Optional[int], bool], Tuple[float, list]] = {}
+_version = 0
+
+
+# ==========================================================
+# 무효화
+# ==========================================================
+
+def invalidate() -> None:
+    """성적 변경 시 호출 → 모든 반의 석차 캐시 삭제"""
+    global _version
+    with _lock:
+        _version += 1
+        _cache.clear()
+
+
+def _mark_dirty(session) -> None:
+    session.info[_DIRTY_KEY] = True
+    invalidate()
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_on_flush(session, flush_context):
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, _GRADE_MODELS):
+            _mark_dirty(session)
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_on_bulk(orm_execute_state):
+    # ✅ ORM 객체를 거치지 않는 insert()/update()/delete() 실행 (집계 재구축, 일괄 저장 등)
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and issubclass(mapper.class_, _GRADE_MODELS):
+        _mark_dirty(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    if session.info.pop(_DIRTY_KEY, False):
+        invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _invalidate_on_rollback(session):
+    # 같은 세션에서 commit 전 데이터로 채워졌을 수 있는 캐시도 제거
+    if session.info.pop(_DIRTY_KEY, False):
+        invalidate()
+
+
+# ==========================================================
+# 계산 (SQL 윈도 함수)
+# ==========================================================
+
+def _student_rankings(db: Session, class_id: int, term: Optional[int]) -> list:
+    grade_count = func.sum(StudentGradeAverage.grade_count)
+    on = and_(
+        StudentGradeAverage.student_id == StudentModel.id,
+        StudentGradeAverage.class_id == StudentModel.class_id,
+    )
+    if term is not None:
+        on = and_(on, StudentGradeAverage.term == term)
+
+    # 개인 평균: 기존 /grades/rankings 와 같이 점수 합계 / 성적 수, 성적 없으면 0
+    averages = (
+        select(
+            StudentModel.id.label("student_id"),
+            StudentModel.student_name.label("name"),
+            StudentModel.class_id,
+            func.round(
+                case((grade_count > 0, func.sum(StudentGradeAverage.score_sum) / grade_count), else_=0.0), 1
+            ).label("avg_score"),
+        )
+        .select_from(StudentModel)
+        .outerjoin(StudentGradeAverage, on)
+        .where(StudentModel.class_id == class_id)
+        .group_by(StudentModel.id, StudentModel.student_name, StudentModel.class_id)
+        .subquery()
+    )
+    window = {"partition_by": averages.c.class_id, "order_by": averages.c.avg_score.desc()}
+    stmt = (
+        select(
+            averages.c.student_id,
+            averages.c.name,
+            averages.c.avg_score,
+            func.rank().over(**window).label("rank"),
+            func.dense_rank().over(**window).label("dense_rank"),
+            func.percent_rank().over(**window).label("percent_rank"),
+        )
+        .order_by(averages.c.avg_score.desc(), averages.c.student_id)
+    )
+    return db.execute(stmt).all()
+
+
+def _subject_rankings(db: Session, class_id: int, term: Optional[int]) -> Dict[int, list]:
+    window = {
+        "partition_by": [StudentModel.class_id, GradeModel.term, GradeModel.subject_id],
+        "order_by": GradeModel.average_score.desc(),
+    }
+    stmt = (
+        select(
+            GradeModel.student_id,
+            GradeModel.term,
+            GradeModel.subject_id,
+            GradeModel.average_score,
+            func.rank().over(**window).label("rank"),
+            func.dense_rank().over(**window).label("dense_rank"),
+            func.percent_rank().over(**window).label("percent_rank"),
+        )
+        .join(StudentModel, StudentModel.id == GradeModel.student_id)
+        .where(StudentModel.class_id == class_id, GradeModel.average_score.isnot(None))
+        .order_by(GradeModel.student_id, GradeModel.term, GradeModel.id)
+    )
+    if term is not None:
+        stmt = stmt.where(GradeModel.term == term)
+
+    refs = get_reference_data(db)
+    ranks: Dict[int, list] = {}
+    for row in db.execute(stmt):
+        subject = refs.subject_name(row.subject_id)
+        if subject is None:  # 삭제된 과목
+            continue
+        ranks.setdefault(row.student_id, []).append({
+            "term": row.term,
+            "subject": subject,
+            "score": row.average_score,
+            "rank": row.rank,
+            "dense_rank": row.dense_rank,
+            "percent_rank": round(float(row.percent_rank), 4),
+        })
+    return ranks
+
+
+def grade_letters(db: Session, student_ids, term: Optional[int] = None) -> dict:
+    """학생별 성적 등급 목록 (학기, 성적 id 순, 1쿼리)"""
+    letters = {}
+    if not student_ids:
+        return letters
+    stmt = (
+        select(GradeModel.student_id, GradeModel.grade_letter)
+        .where(GradeModel.student_id.in_(student_ids), GradeModel.grade_letter.isnot(None))
+        .order_by(GradeModel.student_id, GradeModel.term, GradeModel.id)
+    )
+    if term is not None:
+        stmt = stmt.where(GradeModel.term == term)
+    for student_id, letter in db.execute(stmt):
+        if letter:
+            letters.setdefault(student_id, []).append(letter)
+    return letters
+
+
+def _compute(db: Session, class_id: int, term: Optional[int], by_subject: bool) -> list:
+    rows = _student_rankings(db, class_id, term)
+    if not rows:
+        return []
+    letters = grade_letters(db, [row.student_id for row in rows], term)
+    subject_ranks = _subject_rankings(db, class_id, term) if by_subject else None
+
+    results = []
+    for row in rows:
+        item = {
+            "student_id": row.student_id,
+            "name": row.name,
+            "avg_score": float(row.avg_score),
+            "grade_letters": letters.get(row.student_id, []),
+            "rank": row.rank,                       # 동점자 같은 석차, 다음 석차는 건너뜀 (1, 1, 3)
+            "dense_rank": row.dense_rank,           # 동점자 같은 석차, 건너뛰지 않음 (1, 1, 2)
+            "percent_rank": round(float(row.percent_rank), 4),  # 0(최상위) ~ 1(최하위)
+        }
+        if subject_ranks is not None:
+            item["subject_ranks"] = subject_ranks.get(row.student_id, [])
+        results.append(item)
+    return results
+
+
+# ==========================================================
+# 조회 API
+# ==========================================================
+
+def get_rankings(db: Session, class_id: int, term: Optional[int] = None, by_subject: bool = False) -> List[dict]:
+    """
+    반 석차 목록 (평균 내림차순, 동점은 학생 id 순) — 학생이 없으면 []
+    - 반환 목록은 캐시와 공유되므로 수정하지 말 것
+    """
+    key = (class_id, term, by_subject)
+    ttl = settings.RANKING_CACHE_TTL
+    if ttl > 0:
+        with _lock:
+            cached = _cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+            version = _version
+
+    results = _compute(db, class_id, term, by_subject)
+
+    if ttl > 0 and results:
+        with _lock:
+            # 계산 중에 성적이 바뀌었다면 오래된 결과이므로 저장하지 않음
+            if version == _version:
+                _cache[key] = (time.monotonic(), results)
+    return results
@@ -0,0 +1,364 @@
+"""
+services/grade_rollup.py
+
+- 성적 집계 테이블(models/grade_stats.py) 유지 관리
+  1) apply_grade_change(): 성적 생성/수정/삭제 시 같은 트랜잭션에서 증분 갱신
+     * 추가: INSERT ... ON DUPLICATE KEY UPDATE (SQLite: ON CONFLICT) 로 원자적 누적
+     * 제거: UPDATE 로 차감, 최저/최고 점수가 빠지면 해당 (반, 학기, 과목) 그룹만 다시 계산
+  2) rebuild(): 원본 grades 에서 GROUP BY 로 전체(또는 반/학기 단위) 재구축 — 백필/대량 쓰기 후 사용
+- 호출 순서: 원본 변경 → db.flush() → apply_grade_change() → db.commit()
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from sqlalchemy import and_, case, delete, func, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from models.grade_stats import GradeSubjectStat, StudentGradeAverage
+from models.grades import Grade as GradeModel
+from models.students import Student as StudentModel
+
+# (응답 라벨, 컬럼명, 하한 포함, 상한 미포함) — 하한/상한 None 은 제한 없음
+BUCKETS = [
+    ("0-59", "bucket_0_59", None, 60),
+    ("60-69", "bucket_60_69", 60, 70),
+    ("70-79", "bucket_70_79", 70, 80),
+    ("80-89", "bucket_80_89", 80, 90),
+    ("90-100", "bucket_90_100", 90, None),
+]
+
+
+@dataclass(frozen=True)
+class GradeValues:
+    """집계에 영향을 주는 성적 값 (변경 전/후 스냅샷)"""
+    student_id: int
+    term: int
+    subject_id: int
+    score: Optional[float]
+
+    @classmethod
+    def of(cls, grade: GradeModel) -> "GradeValues":
+        return cls(grade.student_id, grade.term, grade.subject_id, grade.average_score)
+
+
+def bucket_column(score: Optional[float]) -> Optional[str]:
+    if score is None:
+        return None
+    for _, column, low, high in BUCKETS:
+        if (low is None or score >= low) and (high is None or score < high):
+            return column
+    return None
+
+
+# ==========================================================
+# 증분 갱신
+# ==========================================================
+
+def _deltas(values: GradeValues, sign: int) -> Dict[str, float]:
+    has_score = values.score is not None
+    return {
+        "grade_count": sign,
+        "score_count": sign if has_score else 0,
+        "score_sum": sign * values.score if has_score else 0,
+    }
+
+
+def _upsert_add(db: Session, model, keys: dict, deltas: dict, score: Optional[float] = None, with_range: bool = False):
+    """집계 행이 없으면 생성, 있으면 누적 (동시 쓰기에도 원자적)"""
+    table = model.__table__
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        stmt = mysql_insert(table)
+    elif dialect == "sqlite":
+        stmt = sqlite_insert(table)
+    else:
+        raise RuntimeError(f"지원하지 않는 DB dialect: {dialect}")
+
+    row = {**keys, **deltas}
+    if with_range:
+        row.update(score_min=score, score_max=score)
+    stmt = stmt.values(**row)
+
+    incoming = stmt.inserted if dialect == "mysql" else stmt.excluded
+    set_ = {col: table.c[col] + incoming[col] for col in deltas}
+    if with_range:
+        # 다중 인자 최솟값/최댓값: MySQL LEAST/GREATEST, SQLite min/max
+        least, greatest = (func.least, func.greatest) if dialect == "mysql" else (func.min, func.max)
+        # NULL 점수 추가 시 기존 값 유지, 기존 값이 NULL 이면 새 점수로 초기화
+        for col, pick in (("score_min", least), ("score_max", greatest)):
+            set_[col] = pick(
+                func.coalesce(table.c[col], incoming[col]),
+                func.coalesce(incoming[col], table.c[col]),
+            )
+
+    if dialect == "mysql":
+        stmt = stmt.on_duplicate_key_update(**set_)
+    else:
+        stmt = stmt.on_conflict_do_update(index_elements=list(keys), set_=set_)
+    db.execute(stmt)
+
+
+def _subtract(db: Session, model, keys: dict, deltas: dict):
+    table = model.__table__
+    db.execute(
+        update(table)
+        .where(*[table.c[k] == v for k, v in keys.items()])
+        .values({col: table.c[col] + delta for col, delta in deltas.items()})
+    )
+
+
+def _recompute_range(db: Session, class_id: int, term: int, subject_id: int):
+    """제거된 점수가 최저/최고였을 때 그룹의 min/max 를 원본에서 다시 계산"""
+    score_min, score_max = db.execute(
+        select(func.min(GradeModel.average_score), func.max(GradeModel.average_score))
+        .join(StudentModel, StudentModel.id == GradeModel.student_id)
+        .where(
+            StudentModel.class_id == class_id,
+            GradeModel.term == term,
+            GradeModel.subject_id == subject_id,
+        )
+    ).one()
+    db.execute(
+        update(GradeSubjectStat)
+        .where(
+            GradeSubjectStat.class_id == class_id,
+            GradeSubjectStat.term == term,
+            GradeSubjectStat.subject_id == subject_id,
+        )
+        .values(score_min=score_min, score_max=score_max)
+    )
+
+
+def _class_of(db: Session, student_id: int, cache: dict) -> Optional[int]:
+    if student_id not in cache:
+        cache[student_id] = db.execute(
+            select(StudentModel.class_id).where(StudentModel.id == student_id)
+        ).scalar()
+    return cache[student_id]
+
+
+def _remove(db: Session, values: GradeValues, classes: dict):
+    class_id = _class_of(db, values.student_id, classes)
+    deltas = _deltas(values, -1)
+
+    _subtract(db, StudentGradeAverage, {"student_id": values.student_id, "term": values.term}, deltas)
+    if class_id is None:
+        return
+
+    keys = {"class_id": class_id, "term": values.term, "subject_id": values.subject_id}
+    bucket = bucket_column(values.score)
+    _subtract(db, GradeSubjectStat, keys, {**deltas, **({bucket: -1} if bucket else {})})
+
+    if values.score is not None:
+        stat = db.execute(
+            select(GradeSubjectStat.score_min, GradeSubjectStat.score_max)
+            .where(*[getattr(GradeSubjectStat, k) == v for k, v in keys.items()])
+        ).first()
+        if stat is None or stat.score_min is None \
+                or values.score <= stat.score_min or values.score >= stat.score_max:
+            _recompute_range(db, **keys)
+
+
+def _add(db: Session, values: GradeValues, classes: dict):
+    class_id = _class_of(db, values.student_id, classes)
+    deltas = _deltas(values, +1)
+
+    _upsert_add(
+        db, StudentGradeAverage,
+        {"student_id": values.student_id, "term": values.term},
+        deltas,
+    )
+    # class_id 는 누적값이 아니므로 별도 갱신 (반 정보가 없으면 NULL 유지)
+    db.execute(
+        update(StudentGradeAverage)
+        .where(StudentGradeAverage.student_id == values.student_id, StudentGradeAverage.term == values.term)
+        .values(class_id=class_id)
+    )
+    if class_id is None:
+        return
+
+    bucket = bucket_column(values.score)
+    zero_buckets = {column: 0 for _, column, _, _ in BUCKETS}
+    _upsert_add(
+        db, GradeSubjectStat,
+        {"class_id": class_id, "term": values.term, "subject_id": values.subject_id},
+        {**deltas, **zero_buckets, **({bucket: 1} if bucket else {})},
+        score=values.score, with_range=True,
+    )
+
+
+def apply_grade_change(db: Session, old: Optional[GradeValues], new: Optional[GradeValues]) -> None:
+    """
+    성적 1건 변경을 집계 테이블에 반영 (commit 은 호출 측에서)
+    - 생성: old=None / 삭제: new=None / 수정: 둘 다 지정
+    - 원본 변경이 flush 된 뒤 호출해야 min/max 재계산이 최신 상태를 봄
+    """
+    if old == new:
+        return
+    classes: dict = {}
+    if old is not None:
+        _remove(db, old, classes)
+    if new is not None:
+        _add(db, new, classes)
+
+
+# ==========================================================
+# 재구축
+# ==========================================================
+
+def _score_bucket_sums(score):
+    sums = []
+    for _, column, low, high in BUCKETS:
+        conds = []
+        if low is not None:
+            conds.append(score >= low)
+        if high is not None:
+            conds.append(score < high)
+        sums.append(func.sum(case((and_(*conds), 1), else_=0)).label(column))
+    return sums
+
+
+def rebuild(db: Session, class_id: Optional[int] = None, term: Optional[int] = None) -> dict:
+    """
+    원본 grades 에서 집계 테이블을 다시 계산 (commit 은 호출 측에서)
+    - class_id / term 지정 시 해당 범위만 교체 (대량 쓰기 후 부분 재구축)
+    - 반환: 재구축된 행 수
+    """
+    score = GradeModel.average_score
+
+    # ---- 반 × 학기 × 과목 ----
+    stat_del = delete(GradeSubjectStat)
+    filters = []
+    if class_id is not None:
+        stat_del = stat_del.where(GradeSubjectStat.class_id == class_id)
+        filters.append(StudentModel.class_id == class_id)
+    if term is not None:
+        stat_del = stat_del.where(GradeSubjectStat.term == term)
+        filters.append(GradeModel.term == term)
+    db.execute(stat_del)
+
+    stat_select = (
+        select(
+            StudentModel.class_id,
+            GradeModel.term,
+            GradeModel.subject_id,
+            func.count(),
+            func.count(score),
+            func.coalesce(func.sum(score), 0),
+            func.min(score),
+            func.max(score),
+            *_score_bucket_sums(score),
+        )
+        .join(StudentModel, StudentModel.id == GradeModel.student_id)
+        .where(*filters)
+        .group_by(StudentModel.class_id, GradeModel.term, GradeModel.subject_id)
+    )
+    stat_result = db.execute(insert(GradeSubjectStat).from_select(
+        ["class_id", "term", "subject_id", "grade_count", "score_count", "score_sum",
+         "score_min", "score_max", *[column for _, column, _, _ in BUCKETS]],
+        stat_select,
+    ))
+
+    # ---- 학생 × 학기 ----
+    avg_del = delete(StudentGradeAverage)
+    avg_filters = []
+    if class_id is not None:
+        in_class = select(StudentModel.id).where(StudentModel.class_id == class_id)
+        avg_del = avg_del.where(StudentGradeAverage.student_id.in_(in_class))
+        avg_filters.append(GradeModel.student_id.in_(in_class))
+    if term is not None:
+        avg_del = avg_del.where(StudentGradeAverage.term == term)
+        avg_filters.append(GradeModel.term == term)
+    db.execute(avg_del)
+
+    avg_select = (
+        select(
+            GradeModel.student_id,
+            GradeModel.term,
+            func.max(StudentModel.class_id),
+            func.count(),
+            func.count(score),
+            func.coalesce(func.sum(score), 0),
+        )
+        .outerjoin(StudentModel, StudentModel.id == GradeModel.student_id)
+        .where(*avg_filters)
+        .group_by(GradeModel.student_id, GradeModel.term)
+    )
+    avg_result = db.execute(insert(StudentGradeAverage).from_select(
+        ["student_id", "term", "class_id", "grade_count", "score_count", "score_sum"],
+        avg_select,
+    ))
+
+    return {"grade_subject_stats": stat_result.rowcount, "student_grade_averages": avg_result.rowcount}
+
+
+# ==========================================================
+# 조회 (대시보드/요약 엔드포인트용)
+# ==========================================================
+
+def student_totals(db: Session, class_id: int, term: Optional[int] = None) -> Dict[int, tuple]:
+    """
+    반 학생별 성적 합계 {student_id: (grade_count, score_count, score_sum)}
+    - term 미지정 시 전 학기 합산 → 학생당 학기 수만큼의 행만 읽음
+    """
+    stmt = (
+        select(
+            StudentGradeAverage.student_id,
+            func.sum(StudentGradeAverage.grade_count),
+            func.sum(StudentGradeAverage.score_count),
+            func.sum(StudentGradeAverage.score_sum),
+        )
+        .where(StudentGradeAverage.class_id == class_id)
+        .group_by(StudentGradeAverage.student_id)
+    )
+    if term is not None:
+        stmt = stmt.where(StudentGradeAverage.term == term)
+    return {sid: (grade_count, score_count, score_sum) for sid, grade_count, score_count, score_sum in db.execute(stmt)}
+
+
+def student_averages(class_id: int, term: Optional[int] = None):
+    """
+    반 학생별 평균 SELECT (student_id, name, average) — 학생 id 로 GROUP BY
+    - average = 점수 합계 / 점수가 있는 성적 수 (점수 NULL 성적은 분모에서 제외)
+    - 성적이 없거나 점수가 모두 NULL 인 학생은 average NULL
+    - 호출 측에서 .having() / 서브쿼리로 구간 집계 등을 덧붙여 사용
+    """
+    average = (
+        func.sum(StudentGradeAverage.score_sum)
+        / func.nullif(func.sum(StudentGradeAverage.score_count), 0)
+    ).label("average")
+    on = and_(
+        StudentGradeAverage.student_id == StudentModel.id,
+        StudentGradeAverage.class_id == StudentModel.class_id,
+    )
+    if term is not None:
+        on = and_(on, StudentGradeAverage.term == term)
+    return (
+        select(StudentModel.id.label("student_id"), StudentModel.student_name.label("name"), average)
+        .select_from(StudentModel)
+        .outerjoin(StudentGradeAverage, on)
+        .where(StudentModel.class_id == class_id)
+        .group_by(StudentModel.id, StudentModel.student_name)
+    )
+
+
+def subject_stats(db: Session, class_id: int, term: Optional[int] = None):
+    """반(×학기)의 과목별 통계 행 (과목 수만큼)"""
+    stmt = (
+        select(
+            GradeSubjectStat.subject_id,
+            func.sum(GradeSubjectStat.score_count).label("score_count"),
+            func.sum(GradeSubjectStat.score_sum).label("score_sum"),
+            func.min(GradeSubjectStat.score_min).label("score_min"),
+            func.max(GradeSubjectStat.score_max).label("score_max"),
+        )
+        .where(GradeSubjectStat.class_id == class_id)
+        .group_by(GradeSubjectStat.subject_id)
+        .order_by(GradeSubjectStat.subject_id)
+    )
+    if term is not None:
+        stmt = stmt.where(GradeSubjectStat.term == term)
+    return db.execute(stmt).all()
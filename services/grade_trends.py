@@ -0,0 +1,237 @@
+"""
+services/grade_trends.py
+
+- 학생 × 과목 성적 추이(시계열) 분석 (pandas 벡터 연산)
+  1) load_points(): 학기 성적(grades)과 시험 점수(test_scores ⋈ tests.test_date)를
+     한 반(또는 한 학생) 단위로 2쿼리에 적재해 하나의 long 프레임으로 병합
+     * 학기 성적은 날짜가 없으므로 해당 학기의 마지막 날을 시점으로 사용
+  2) build_trends(): 학생 × 과목 시계열마다 이동평균 / 기울기(점/30일) / 추세 라벨
+     * 기울기는 groupby 합계(Σx, Σy, Σxy, Σx²)로 반 전체 시계열을 한 번에 최소제곱 계산
+- 반 단위 시험 조회는 tests(class_id, test_date) 인덱스 사용 (migrations 0006)
+"""
+
+from datetime import date
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models.grades import Grade as GradeModel
+from models.students import Student as StudentModel
+from models.test_scores import TestScore as TestScoreModel
+from models.tests import Test as TestModel
+from services import periods
+from services.reference_cache import get_reference_data
+
+DEFAULT_WINDOW = 3        # 이동평균 구간 (시점 수)
+TREND_THRESHOLD = 1.0     # |기울기| 가 이 값(점/30일) 이상이면 상승/하락
+SLOPE_DAYS = 30           # 기울기 단위 (30일당 점수 변화)
+
+TRENDS = ["improving", "declining", "stable", "insufficient"]
+SOURCE_ORDER = {"test": 0, "grade": 1}  # 같은 날짜면 시험 → 학기 성적 순
+KEYS = ["student_id", "subject_id"]
+POINT_COLUMNS = ["student_id", "subject_id", "date", "source", "label", "score"]
+
+
+# ==========================================================
+# 적재
+# ==========================================================
+
+def _grade_label(term: int) -> str:
+    return f"{term}학기 성적"
+
+
+def load_points(
+    db: Session,
+    class_id: Optional[int] = None,
+    student_id: Optional[int] = None,
+    year: Optional[int] = None,
+):
+    """
+    (학생 명단, 시점 프레임, 학년도) 반환 — 2쿼리
+    - class_id: 반 학생 전체 + 그 반 대상 시험 (tests(class_id, test_date) 인덱스)
+    - student_id: 한 학생 + 그 학생이 본 모든 시험
+    - year=None 이면 가장 최근 시험 날짜의 학년도 (시험이 없으면 오늘 기준)
+    """
+    if (class_id is None) == (student_id is None):
+        raise ValueError("class_id 또는 student_id 중 하나만 지정해야 합니다")
+
+    # 1) 학생 명단 ⟕ 학기 성적 (성적 없는 학생도 명단에 포함)
+    grades_stmt = (
+        select(
+            StudentModel.id,
+            StudentModel.student_name,
+            GradeModel.subject_id,
+            GradeModel.term,
+            GradeModel.average_score,
+        )
+        .select_from(StudentModel)
+        .outerjoin(GradeModel, GradeModel.student_id == StudentModel.id)
+        .order_by(StudentModel.id, GradeModel.id)
+    )
+    # 2) 시험 점수 ⋈ 시험 날짜
+    tests_stmt = (
+        select(
+            TestScoreModel.student_id,
+            TestModel.subject_id,
+            TestModel.test_date,
+            TestModel.test_name,
+            TestScoreModel.score,
+        )
+        .join(TestModel, TestModel.id == TestScoreModel.test_id)
+        .order_by(TestModel.test_date, TestModel.id)
+    )
+    if class_id is not None:
+        grades_stmt = grades_stmt.where(StudentModel.class_id == class_id)
+        tests_stmt = (
+            tests_stmt.join(StudentModel, StudentModel.id == TestScoreModel.student_id)
+            .where(TestModel.class_id == class_id, StudentModel.class_id == class_id)
+        )
+    else:
+        grades_stmt = grades_stmt.where(StudentModel.id == student_id)
+        tests_stmt = tests_stmt.where(TestScoreModel.student_id == student_id)
+
+    grade_rows = db.execute(grades_stmt).all()
+    test_rows = db.execute(tests_stmt).all()
+
+    roster = {}
+    for sid, name, *_ in grade_rows:
+        roster.setdefault(sid, name)
+
+    if year is None:
+        latest = max((row.test_date for row in test_rows), default=date.today())
+        year = periods.school_year_of(latest)
+
+    # 학기 성적 → 학기 마지막 날 시점 (점수 NULL, 1·2학기 외 성적 제외)
+    grade_points = [
+        (sid, subject_id, periods.semester(year, term).last_day, "grade", _grade_label(term), score)
+        for sid, _, subject_id, term, score in grade_rows
+        if score is not None and term in (1, 2)
+    ]
+    test_points = [
+        (sid, subject_id, test_date, "test", test_name, score)
+        for sid, subject_id, test_date, test_name, score in test_rows
+    ]
+    frame = pd.DataFrame.from_records(grade_points + test_points, columns=POINT_COLUMNS)
+    frame["date"] = pd.to_datetime(frame["date"])
+    frame["score"] = pd.to_numeric(frame["score"], errors="coerce")
+    return roster, frame, year
+
+
+# ==========================================================
+# 추이 계산
+# ==========================================================
+
+def _round(value, digits: int = 1):
+    if value is None or pd.isna(value):
+        return None
+    return round(float(value), digits)
+
+
+def series_stats(frame: pd.DataFrame, window: int = DEFAULT_WINDOW, threshold: float = TREND_THRESHOLD):
+    """
+    (시점 프레임 + rolling_avg, 시계열 통계) 반환
+    - 시점 프레임: 학생 × 과목 × 날짜 순 정렬, 시계열별 이동평균 열 추가
+    - 시계열 통계(index=(student_id, subject_id)): count/mean/first/last/change/slope/trend
+    """
+    frame = frame.assign(order=frame["source"].map(SOURCE_ORDER))
+    frame = frame.sort_values(KEYS + ["date", "order"], kind="stable").reset_index(drop=True)
+
+    grouped = frame.groupby(KEYS, sort=True)
+    frame["rolling_avg"] = (
+        grouped["score"].rolling(window, min_periods=1).mean().reset_index(level=KEYS, drop=True)
+    )
+
+    # 최소제곱 기울기: x = 첫 시점부터 경과 일수 / SLOPE_DAYS
+    x = (frame["date"] - grouped["date"].transform("min")).dt.days / SLOPE_DAYS
+    frame["x"], frame["xy"], frame["xx"] = x, x * frame["score"], x * x
+
+    stats = frame.groupby(KEYS, sort=True).agg(
+        count=("score", "size"),
+        mean=("score", "mean"),
+        first=("score", "first"),
+        last=("score", "last"),
+        sx=("x", "sum"),
+        sy=("score", "sum"),
+        sxy=("xy", "sum"),
+        sxx=("xx", "sum"),
+    )
+    n = stats["count"]
+    denom = n * stats["sxx"] - stats["sx"] ** 2
+    stats["slope"] = ((n * stats["sxy"] - stats["sx"] * stats["sy"]) / denom).where(denom > 0)
+    stats["change"] = stats["last"] - stats["first"]
+    stats["trend"] = np.select(
+        [stats["slope"].isna(), stats["slope"] >= threshold, stats["slope"] <= -threshold],
+        ["insufficient", "improving", "declining"],
+        default="stable",
+    )
+    frame = frame.drop(columns=["order", "x", "xy", "xx"])
+    return frame, stats.drop(columns=["sx", "sy", "sxy", "sxx"])
+
+
+def _trend_counts(trends: pd.Series) -> dict:
+    counts = trends.value_counts()
+    return {trend: int(counts.get(trend, 0)) for trend in TRENDS}
+
+
+def build_trends(
+    db: Session,
+    roster: dict,
+    frame: pd.DataFrame,
+    window: int = DEFAULT_WINDOW,
+    threshold: float = TREND_THRESHOLD,
+) -> dict:
+    """
+    학생별 과목 추이 + 과목별 요약
+    - students: 명단 순(학생 id), 시점이 없는 학생은 subjects=[]
+    - subjects: 과목별 시계열 수 / 평균 기울기 / 추세별 학생 수
+    """
+    refs = get_reference_data(db)
+    points, stats = series_stats(frame, window, threshold)
+
+    by_series = {}
+    for row in points.itertuples(index=False):
+        by_series.setdefault((row.student_id, row.subject_id), []).append({
+            "date": row.date.date().isoformat(),
+            "source": row.source,
+            "label": row.label,
+            "score": float(row.score),
+            "rolling_avg": _round(row.rolling_avg),
+        })
+
+    students = {
+        sid: {"student_id": int(sid), "name": name, "subjects": []} for sid, name in roster.items()
+    }
+    for (sid, subject_id), row in stats.iterrows():
+        if sid not in students:
+            continue
+        students[sid]["subjects"].append({
+            "subject_id": int(subject_id),
+            "subject": refs.subject_name(subject_id, f"과목ID {subject_id}"),
+            "count": int(row["count"]),
+            "mean": _round(row["mean"]),
+            "first": _round(row["first"]),
+            "last": _round(row["last"]),
+            "change": _round(row["change"]),
+            "slope": _round(row["slope"], 2),
+            "trend": row["trend"],
+            "points": by_series[(sid, subject_id)],
+        })
+    for student in students.values():
+        student["summary"] = _trend_counts(pd.Series([s["trend"] for s in student["subjects"]], dtype=object))
+
+    subject_rows = stats.reset_index()
+    subject_rows = subject_rows[subject_rows["student_id"].isin(list(roster))]
+    subjects = []
+    for subject_id, group in subject_rows.groupby("subject_id", sort=True):
+        subjects.append({
+            "subject_id": int(subject_id),
+            "subject": refs.subject_name(subject_id, f"과목ID {subject_id}"),
+            "students": int(len(group)),
+            "mean_slope": _round(group["slope"].mean(), 2),
+            "trends": _trend_counts(group["trend"]),
+        })
+
+    return {"subjects": subjects, "students": list(students.values())}
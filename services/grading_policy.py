@@ -0,0 +1,165 @@
+"""
+services/grading_policy.py
+
+- 과목 × 학기별 성적 등급 기준(grading_policies) 해석과 등급 계산 엔진
+  1) load_policy(): 한 학기에 적용되는 기준을 1쿼리로 읽어 Policy 로 해석
+     우선순위: (과목, 학기) > (과목, 전 학기) > (전 과목, 학기) > (전 과목, 전 학기) > settings 기본값
+  2) Policy.assign(): 과목이 섞인 점수 배치를 과목별 마스크 + searchsorted 로 한 번에 등급 변환
+  3) Policy.case(): 같은 규칙의 SQL CASE 식 → recompute_letters() 가 학기 전체를 UPDATE 한 문장으로 재계산
+- 기준 변경은 범위(subject_id, term) 단위로 통째로 교체 (replace_policy)
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import case, delete, select, update
+from sqlalchemy.orm import Session
+
+from models.grades import Grade as GradeModel
+from models.grading_policies import GradingPolicy
+from services.grade_letters import Cutoffs, letter_array, letter_case, resolve_cutoffs
+
+
+@dataclass
+class Policy:
+    """한 학기에 적용되는 등급 기준 (과목별 기준이 없으면 default)"""
+    default: Cutoffs
+    subjects: Dict[int, Cutoffs] = field(default_factory=dict)
+
+    def cutoffs_for(self, subject_id: int) -> Cutoffs:
+        return self.subjects.get(subject_id, self.default)
+
+    def assign(self, subject_ids: Sequence[int], scores: Sequence[Optional[float]]) -> List[Optional[str]]:
+        """(과목, 점수) 배치 → 등급 목록 (NULL 점수, 최저 하한 미만은 None)"""
+        subject_ids = np.asarray(subject_ids)
+        values = np.array([np.nan if s is None else s for s in scores], dtype=float)
+        result = np.full(len(values), None, dtype=object)
+        specific = np.zeros(len(values), dtype=bool)
+        for subject_id, cutoffs in self.subjects.items():
+            mask = subject_ids == subject_id
+            if mask.any():
+                result[mask] = letter_array(values[mask], cutoffs)
+                specific |= mask
+        result[~specific] = letter_array(values[~specific], self.default)
+        return result.tolist()
+
+    def case(self, score, subject_id):
+        """Policy.assign 과 같은 규칙의 SQL 식 (과목별 기준은 CASE subject_id WHEN ... 로 분기)"""
+        default = letter_case(score, self.default)
+        if not self.subjects:
+            return default
+        return case(
+            {sid: letter_case(score, cutoffs) for sid, cutoffs in sorted(self.subjects.items())},
+            value=subject_id,
+            else_=default,
+        )
+
+
+# ==========================================================
+# 조회 / 해석
+# ==========================================================
+
+def _group(rows) -> Dict[tuple, Dict[str, float]]:
+    """(subject_id, term, letter, min_score) 행 → {(subject_id, term): {letter: min_score}}"""
+    scopes: Dict[tuple, Dict[str, float]] = {}
+    for subject_id, term, letter, min_score in rows:
+        scopes.setdefault((subject_id, term), {})[letter] = min_score
+    return scopes
+
+
+def list_policies(db: Session, term: Optional[int] = None, subject_id: Optional[int] = None) -> List[dict]:
+    """저장된 범위별 기준 (term/subject_id 지정 시 해당 값 또는 NULL(공통) 범위만)"""
+    stmt = select(GradingPolicy.subject_id, GradingPolicy.term, GradingPolicy.letter, GradingPolicy.min_score)
+    if term is not None:
+        stmt = stmt.where((GradingPolicy.term == term) | GradingPolicy.term.is_(None))
+    if subject_id is not None:
+        stmt = stmt.where((GradingPolicy.subject_id == subject_id) | GradingPolicy.subject_id.is_(None))
+    scopes = _group(db.execute(stmt).all())
+    return [
+        {
+            "subject_id": sid,
+            "term": t,
+            "cutoffs": dict(sorted(cutoffs.items(), key=lambda item: -item[1])),
+        }
+        for (sid, t), cutoffs in sorted(scopes.items(), key=lambda item: (item[0][0] or 0, item[0][1] or 0))
+    ]
+
+
+def load_policy(db: Session, term: int) -> Policy:
+    """term 학기에 적용할 기준 (1쿼리)"""
+    rows = db.execute(
+        select(GradingPolicy.subject_id, GradingPolicy.term, GradingPolicy.letter, GradingPolicy.min_score)
+        .where((GradingPolicy.term == term) | GradingPolicy.term.is_(None))
+    ).all()
+    scopes = _group(rows)
+
+    def pick(subject_id):
+        return scopes.get((subject_id, term)) or scopes.get((subject_id, None))
+
+    default = pick(None)
+    subjects = {sid for sid, _ in scopes if sid is not None}
+    return Policy(
+        default=resolve_cutoffs(default),
+        subjects={sid: resolve_cutoffs(pick(sid)) for sid in subjects},
+    )
+
+
+def fill_missing_letters(db: Session, rows: List[dict], cutoffs: Optional[Cutoffs] = None) -> None:
+    """
+    grade_letter 가 없는 성적 행(dict)에 등급을 채움 (제자리 수정)
+    - cutoffs 지정 시 모든 행에 그 기준, 아니면 행의 학기별 정책 (학기당 1쿼리)
+    """
+    missing = [row for row in rows if row.get("grade_letter") is None]
+    for term in sorted({row["term"] for row in missing}):
+        group = [row for row in missing if row["term"] == term]
+        policy = Policy(default=cutoffs) if cutoffs is not None else load_policy(db, term)
+        letters = policy.assign([row["subject_id"] for row in group], [row["average_score"] for row in group])
+        for row, letter in zip(group, letters):
+            row["grade_letter"] = letter
+
+
+# ==========================================================
+# 변경
+# ==========================================================
+
+def replace_policy(db: Session, subject_id: Optional[int], term: Optional[int], cutoffs: Dict[str, float]) -> None:
+    """범위(subject_id, term)의 기준을 통째로 교체 (검증 실패 시 ValueError, 커밋은 호출 측)"""
+    resolve_cutoffs(cutoffs)
+    delete_policy(db, subject_id, term)
+    db.add_all([
+        GradingPolicy(subject_id=subject_id, term=term, letter=letter, min_score=float(low))
+        for letter, low in cutoffs.items()
+    ])
+    db.flush()
+
+
+def delete_policy(db: Session, subject_id: Optional[int], term: Optional[int]) -> int:
+    """범위(subject_id, term)의 기준 삭제 → 상위 범위(또는 기본값)로 돌아감"""
+    result = db.execute(
+        delete(GradingPolicy)
+        .where(
+            GradingPolicy.subject_id.is_(None) if subject_id is None else GradingPolicy.subject_id == subject_id,
+            GradingPolicy.term.is_(None) if term is None else GradingPolicy.term == term,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def recompute_letters(db: Session, term: int, subject_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    term 학기 성적의 grade_letter 를 현재 기준으로 재계산 — UPDATE ... SET grade_letter = CASE ... 한 문장
+    - 등급이 실제로 바뀌는 행만 갱신, 갱신 행 수 반환 (커밋은 호출 측)
+    - 점수/집계(rollup) 값은 바뀌지 않으므로 집계 재구축 불필요
+    """
+    letter = load_policy(db, term).case(GradeModel.average_score, GradeModel.subject_id)
+    stmt = (
+        update(GradeModel)
+        .where(GradeModel.term == term, GradeModel.grade_letter.is_distinct_from(letter))
+        .values(grade_letter=letter)
+        .execution_options(synchronize_session=False)
+    )
+    if subject_ids is not None:
+        stmt = stmt.where(GradeModel.subject_id.in_(list(subject_ids)))
+    return db.execute(stmt).rowcount
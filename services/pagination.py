@@ -0,0 +1,63 @@
+"""
+services/pagination.py
+
+- 목록 API 공용 커서(keyset) 페이지네이션 + 필드 선택(projection) 헬퍼
+- ORM 객체를 만들지 않고 요청된 컬럼만 SELECT → dict 로 변환
+"""
+
+from typing import Dict, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from schemas.common import CursorPagination
+from services.serializers import rows_to_dicts
+
+
+def select_columns(columns: Dict[str, object], fields: Optional[str]) -> Dict[str, object]:
+    """
+    fields("a,b,c") → {응답키: 컬럼} 부분 집합
+    - 커서 계산에 필요한 id 는 항상 포함
+    - 허용되지 않은 필드명이 있으면 400
+    """
+    if not fields:
+        return dict(columns)
+
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in columns]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"알 수 없는 필드: {', '.join(unknown)} (허용: {', '.join(columns)})",
+        )
+
+    selected = {"id": columns["id"]}
+    for f in requested:
+        selected[f] = columns[f]
+    return selected
+
+
+def keyset_paginate(db: Session, columns: Dict[str, object], params: CursorPagination, *filters) -> dict:
+    """
+    id 기준 keyset 페이지 조회
+    - columns: {응답키: 컬럼} (반드시 "id" 포함)
+    - filters: 추가 WHERE 조건
+    - 반환: {"items": [...], "next_cursor": int | None}
+    """
+    selected = select_columns(columns, params.fields)
+    id_col = columns["id"]
+
+    stmt = select(*selected.values()).order_by(id_col).limit(params.limit + 1)
+    if filters:
+        stmt = stmt.where(*filters)
+    if params.cursor is not None:
+        stmt = stmt.where(id_col > params.cursor)
+
+    rows = db.execute(stmt).all()
+    has_more = len(rows) > params.limit
+    rows = rows[:params.limit]
+
+    items = rows_to_dicts(list(selected), rows)
+    next_cursor = items[-1]["id"] if has_more else None
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,132 @@
+"""
+services/periods.py
+
+- 일/ISO 주/월/학기/학년도 기간을 반개구간 [start, end) 으로 계산하는 공용 모듈
+- func.year(col) == y / extract("month", col) == m 처럼 컬럼을 함수로 감싸면
+  인덱스를 못 타고 풀스캔이 발생 → 항상 `col >= start AND col < end` 로 필터링
+- 학기 기준 (국내 학사력):
+  * 1학기: 3/1 ~ 8/31
+  * 2학기: 9/1 ~ 다음 해 2월 말
+  * 학년도 Y: Y-03-01 ~ (Y+1)-03-01 (미포함)
+
+사용 예:
+    period = month(2025, 7)
+    db.query(AttendanceModel).filter(period.filter(AttendanceModel.date))
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from sqlalchemy import and_
+
+SCHOOL_YEAR_START_MONTH = 3   # 학년도 시작 월 (3월)
+SECOND_SEMESTER_START_MONTH = 9  # 2학기 시작 월 (9월)
+
+
+@dataclass(frozen=True)
+class Period:
+    """반개구간 [start, end) 기간"""
+    start: date
+    end: date
+
+    def filter(self, column):
+        """인덱스를 탈 수 있는 범위 조건 (col >= start AND col < end)"""
+        return and_(column >= self.start, column < self.end)
+
+    def __contains__(self, d: date) -> bool:
+        return self.start <= d < self.end
+
+    @property
+    def last_day(self) -> date:
+        """기간의 마지막 날 (포함) — 화면 표시용"""
+        return self.end - timedelta(days=1)
+
+    def days(self):
+        """기간에 포함된 날짜를 순서대로 반환"""
+        d = self.start
+        while d < self.end:
+            yield d
+            d += timedelta(days=1)
+
+
+# ==========================================================
+# 기간 생성
+# ==========================================================
+
+def day(d: date) -> Period:
+    return Period(d, d + timedelta(days=1))
+
+
+def iso_week(year: int, week: int) -> Period:
+    """ISO 주차 (월요일 시작)"""
+    start = date.fromisocalendar(year, week, 1)
+    return Period(start, start + timedelta(days=7))
+
+
+def week_of(d: date) -> Period:
+    """d 가 속한 ISO 주 (월~일)"""
+    start = d - timedelta(days=d.weekday())
+    return Period(start, start + timedelta(days=7))
+
+
+def month(year: int, mon: int) -> Period:
+    if not 1 <= mon <= 12:
+        raise ValueError(f"월은 1~12 사이여야 합니다: {mon}")
+    start = date(year, mon, 1)
+    end = date(year + 1, 1, 1) if mon == 12 else date(year, mon + 1, 1)
+    return Period(start, end)
+
+
+def parse_month(value: str) -> Period:
+    """'YYYY-MM' 문자열 → 해당 월 기간"""
+    try:
+        year, mon = map(int, value.split("-"))
+    except ValueError:
+        raise ValueError(f"YYYY-MM 형식이 아닙니다: {value}")
+    return month(year, mon)
+
+
+def school_year(year: int) -> Period:
+    """학년도 (year-03-01 ~ year+1-03-01)"""
+    return Period(
+        date(year, SCHOOL_YEAR_START_MONTH, 1),
+        date(year + 1, SCHOOL_YEAR_START_MONTH, 1),
+    )
+
+
+def semester(year: int, term: int) -> Period:
+    """학년도 year 의 term 학기 (1 또는 2)"""
+    if term == 1:
+        return Period(
+            date(year, SCHOOL_YEAR_START_MONTH, 1),
+            date(year, SECOND_SEMESTER_START_MONTH, 1),
+        )
+    if term == 2:
+        return Period(
+            date(year, SECOND_SEMESTER_START_MONTH, 1),
+            date(year + 1, SCHOOL_YEAR_START_MONTH, 1),
+        )
+    raise ValueError(f"학기는 1 또는 2여야 합니다: {term}")
+
+
+# ==========================================================
+# 날짜 → 학년도/학기
+# ==========================================================
+
+def parse_term(value) -> int:
+    """'2학기' / '2' / 2 → 2 (grades.term 은 정수 1/2 로 저장됨)"""
+    digits = "".join(ch for ch in str(value) if ch.isdigit())
+    if digits not in ("1", "2"):
+        raise ValueError(f"학기는 1 또는 2여야 합니다: {value}")
+    return int(digits)
+
+
+def school_year_of(d: date) -> int:
+    """1~2월은 전년도 학년도에 속함"""
+    return d.year if d.month >= SCHOOL_YEAR_START_MONTH else d.year - 1
+
+
+def semester_of(d: date) -> Period:
+    year = school_year_of(d)
+    term = 1 if SCHOOL_YEAR_START_MONTH <= d.month < SECOND_SEMESTER_START_MONTH else 2
+    return semester(year, term)
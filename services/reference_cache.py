@@ -0,0 +1,158 @@
+"""
+services/reference_cache.py
+
+- 과목/학급/교사처럼 작고 자주 참조되는 테이블을 한 번에 읽어 id → 이름 으로 조회하는 캐시
+- 행마다 SubjectModel/ClassModel 을 조회하던 N+1 을 테이블당 1쿼리로 대체
+- 캐시 범위:
+  1) 요청 범위: Session.info 에 저장 → 같은 요청(세션) 안에서는 재조회 없음
+  2) 프로세스 전역(선택): settings.REFERENCE_CACHE_TTL 초 동안 워커 내에서 공유
+- 무효화: 참조 모델이 flush 되면 버전이 올라가 요청/전역 캐시 모두 다음 조회 때 다시 로드
+
+사용 예:
+    refs = get_reference_data(db)              # 동기 Session
+    refs = await aget_reference_data(db)       # AsyncSession
+    refs.subject_name(grade.subject_id)
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from itertools import chain
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from config.settings import settings
+from models.classes import Class as ClassModel
+from models.subjects import Subject as SubjectModel
+from models.teachers import Teacher as TeacherModel
+
+_INFO_KEY = "reference_data"
+_REFERENCE_MODELS = (SubjectModel, ClassModel, TeacherModel)
+
+_SUBJECTS = select(SubjectModel.id, SubjectModel.name)
+_CLASSES = select(ClassModel.id, ClassModel.grade, ClassModel.class_num)
+_TEACHERS = select(TeacherModel.id, TeacherModel.name)
+
+
+@dataclass(frozen=True)
+class ReferenceData:
+    """참조 테이블 스냅샷 (읽기 전용)"""
+    subjects: Dict[int, str]
+    classes: Dict[int, Tuple[int, int]]  # class_id → (학년, 반)
+    teachers: Dict[int, str]
+    version: int
+
+    def subject_name(self, subject_id: int, default: Optional[str] = None) -> Optional[str]:
+        return self.subjects.get(subject_id, default)
+
+    def class_name(self, class_id: int, default: str = "Unknown") -> str:
+        """'학년-반' 형식 (예: 3-2)"""
+        cls = self.classes.get(class_id)
+        return f"{cls[0]}-{cls[1]}" if cls else default
+
+    def teacher_name(self, teacher_id: int, default: Optional[str] = None) -> Optional[str]:
+        return self.teachers.get(teacher_id, default)
+
+
+# ==========================================================
+# 버전 / 프로세스 전역 캐시
+# ==========================================================
+
+_lock = threading.Lock()
+_version = 0
+_shared: Optional[ReferenceData] = None
+_shared_loaded_at = 0.0
+
+
+def invalidate() -> None:
+    """참조 데이터 변경 시 호출 → 모든 캐시가 다음 조회 때 재로딩"""
+    global _version, _shared
+    with _lock:
+        _version += 1
+        _shared = None
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_on_write(session, flush_context):
+    # ✅ 과목/학급/교사 행이 추가·수정·삭제되면 자동 무효화 (AsyncSession 도 내부 Session 으로 발생)
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, _REFERENCE_MODELS):
+            invalidate()
+            return
+
+
+def _get_shared() -> Optional[ReferenceData]:
+    ttl = settings.REFERENCE_CACHE_TTL
+    if ttl <= 0:
+        return None
+    with _lock:
+        if _shared is not None and _shared.version == _version \
+                and time.monotonic() - _shared_loaded_at < ttl:
+            return _shared
+    return None
+
+
+def _store_shared(data: ReferenceData) -> None:
+    global _shared, _shared_loaded_at
+    if settings.REFERENCE_CACHE_TTL <= 0:
+        return
+    with _lock:
+        # 로딩 중에 무효화됐다면 오래된 스냅샷이므로 저장하지 않음
+        if data.version == _version:
+            _shared = data
+            _shared_loaded_at = time.monotonic()
+
+
+def _build(subject_rows, class_rows, teacher_rows, version: int) -> ReferenceData:
+    return ReferenceData(
+        subjects={r.id: r.name for r in subject_rows},
+        classes={r.id: (r.grade, r.class_num) for r in class_rows},
+        teachers={r.id: r.name for r in teacher_rows},
+        version=version,
+    )
+
+
+def _from_request(info: dict) -> Optional[ReferenceData]:
+    cached = info.get(_INFO_KEY)
+    if cached is not None and cached.version == _version:
+        return cached
+    return _get_shared()
+
+
+# ==========================================================
+# 조회 API
+# ==========================================================
+
+def get_reference_data(db: Session) -> ReferenceData:
+    """동기 Session 용 (요청 범위 → 전역 → DB 순서로 조회)"""
+    data = _from_request(db.info)
+    if data is None:
+        version = _version
+        data = _build(
+            db.execute(_SUBJECTS).all(),
+            db.execute(_CLASSES).all(),
+            db.execute(_TEACHERS).all(),
+            version,
+        )
+        _store_shared(data)
+    db.info[_INFO_KEY] = data
+    return data
+
+
+async def aget_reference_data(db: AsyncSession) -> ReferenceData:
+    """AsyncSession 용 (AI 핸들러 등)"""
+    data = _from_request(db.info)
+    if data is None:
+        version = _version
+        data = _build(
+            (await db.execute(_SUBJECTS)).all(),
+            (await db.execute(_CLASSES)).all(),
+            (await db.execute(_TEACHERS)).all(),
+            version,
+        )
+        _store_shared(data)
+    db.info[_INFO_KEY] = data
+    return data
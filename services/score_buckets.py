@@ -0,0 +1,46 @@
+"""
+services/score_buckets.py
+
+- 학생 평균 점수 구간(bucket) 정의와 SQL CASE 식 생성
+  1) validate_edges(): 구간 경계 검증 (0 < e1 < e2 < ... <= 100, 정수)
+  2) bucket_labels(): 경계 → 응답 라벨 ("0~59", "60~69", ..., "90~100")
+  3) bucket_case(): 평균 식 → 구간 번호 CASE 식 (평균 NULL 이면 NULL)
+- 기본 경계 60/70/80/90 은 기존 /grades/distribution 응답 라벨과 동일
+"""
+
+from typing import List, Sequence
+
+from sqlalchemy import case
+
+DEFAULT_EDGES = (60, 70, 80, 90)
+MAX_SCORE = 100
+
+
+def validate_edges(edges: Sequence[int]) -> tuple:
+    """구간 경계 검증 (잘못된 경우 ValueError)"""
+    edges = tuple(edges)
+    if not edges:
+        raise ValueError("구간 경계를 하나 이상 지정해야 합니다.")
+    if any(e <= 0 or e > MAX_SCORE for e in edges):
+        raise ValueError(f"구간 경계는 0 초과 {MAX_SCORE} 이하여야 합니다: {list(edges)}")
+    if any(a >= b for a, b in zip(edges, edges[1:])):
+        raise ValueError(f"구간 경계는 오름차순이어야 합니다: {list(edges)}")
+    return edges
+
+
+def bucket_labels(edges: Sequence[int]) -> List[str]:
+    """[0, e1), [e1, e2), ..., [en, 100] 구간 라벨"""
+    bounds = [0, *edges]
+    labels = [f"{low}~{high - 1}" for low, high in zip(bounds, edges)]
+    labels.append(f"{edges[-1]}~{MAX_SCORE}")
+    return labels
+
+
+def bucket_case(average, edges: Sequence[int]):
+    """
+    평균 식 → 구간 번호 (0 ~ len(edges))
+    - ELSE 없이 마지막 구간도 조건으로 지정 → 평균이 NULL(점수 없음)이면 어느 구간에도 속하지 않음
+    """
+    whens = [(average < edge, index) for index, edge in enumerate(edges)]
+    whens.append((average >= edges[-1], len(edges)))
+    return case(*whens)
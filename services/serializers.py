@@ -0,0 +1,61 @@
+"""
+services/serializers.py
+
+- ORM 인스턴스를 만들지 않고 컬럼 튜플을 바로 dict 로 바꾸는 공용 직렬화 헬퍼
+  * session.execute(select(*cols)) → Row 튜플 → dict (identity map / relationship 로딩 없음)
+  * r.__dict__ 처럼 _sa_instance_state, joined relationship 이 섞여 나가는 문제 방지
+- fast_response(): ORJSONResponse 를 직접 반환해 FastAPI 의 jsonable_encoder 재귀 변환을 건너뜀
+  (payload 는 이미 JSON 호환 값이어야 함 — fetch_dicts/instance_to_dict 결과는 그대로 사용 가능)
+"""
+
+from datetime import date, datetime, time
+from typing import Dict, Iterable, List, Sequence
+
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+
+def to_jsonable(value):
+    """날짜/시간 값은 기존 응답과 동일하게 문자열로 변환 (None 은 그대로)"""
+    if isinstance(value, (date, datetime, time)):
+        return str(value)
+    return value
+
+
+def model_columns(model, exclude: Sequence[str] = ()) -> Dict[str, object]:
+    """모델의 테이블 컬럼 전체 → {응답키: 컬럼} (relationship 제외)"""
+    return {
+        c.key: getattr(model, c.key)
+        for c in model.__table__.columns
+        if c.key not in exclude
+    }
+
+
+def rows_to_dicts(keys: Sequence[str], rows: Iterable[tuple]) -> List[dict]:
+    return [{k: to_jsonable(v) for k, v in zip(keys, row)} for row in rows]
+
+
+def fetch_dicts(db: Session, columns: Dict[str, object], *filters, order_by=None) -> List[dict]:
+    """
+    columns({응답키: 컬럼}) 만 SELECT 해서 dict 리스트로 반환
+    - filters: WHERE 조건, order_by: 정렬 컬럼 (기본: 첫 번째 컬럼)
+    """
+    stmt = select(*columns.values())
+    if filters:
+        stmt = stmt.where(*filters)
+    stmt = stmt.order_by(order_by if order_by is not None else next(iter(columns.values())))
+    return rows_to_dicts(list(columns), db.execute(stmt).all())
+
+
+def instance_to_dict(obj, columns: Sequence[str] = None) -> dict:
+    """
+    이미 로드된 ORM 인스턴스(생성/수정 직후 등) → 컬럼 값만 담은 dict
+    - columns 미지정 시 테이블 컬럼 전체
+    """
+    keys = columns or [c.key for c in obj.__table__.columns]
+    return {k: to_jsonable(getattr(obj, k)) for k in keys}
+
+
+def fast_response(content: dict, status_code: int = 200) -> ORJSONResponse:
+    return ORJSONResponse(content, status_code=status_code)
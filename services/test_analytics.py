@@ -0,0 +1,302 @@
+"""
+services/test_analytics.py
+
+- 시험 한 건의 점수 분석 (/tests/{test_id}/analytics)
+  1) 점수 분포(10점 구간), 평균/표준편차/최저/최고/사분위수
+  2) 반별 비교: 같은 과목·시험명·시험일의 다른 반 시험과 평균/표준편차/중앙값 비교
+  3) 직전 시험 대비 변화: 같은 과목에서 학생별 바로 이전 시험 점수와의 차이
+- test_scores 는 LAG 윈도 함수로 직전 시험 점수까지 한 번의 쿼리로 읽고,
+  통계는 pandas / NumPy 벡터 연산으로 계산
+- 캐시: 시험별 결과를 프로세스 안에 저장, 계산에 사용한 시험들의 버전이 하나라도 바뀌면 재계산
+  * 시험 점수 쓰기(ORM flush) → 해당 시험 버전 증가
+  * 시험 정보 쓰기 / 시험 점수 bulk 실행 → 전체 버전(epoch) 증가
+  * 해당 트랜잭션 commit / rollback 시 한 번 더 증가 (commit 전 데이터로 채워진 캐시 제거)
+  * 다른 워커의 쓰기는 settings.TEST_ANALYTICS_CACHE_TTL 초 후 반영
+"""
+
+import threading
+import time
+from itertools import chain
+from typing import Dict, Optional, Set
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import get_history
+
+from config.settings import settings
+from models.students import Student as StudentModel
+from models.test_scores import TestScore as TestScoreModel
+from models.tests import Test as TestModel
+from services.reference_cache import get_reference_data
+
+DISTRIBUTION_EDGES = np.arange(0, 101, 10)  # [0, 10), ..., [90, 100] (마지막 구간은 100 포함)
+DISTRIBUTION_LABELS = [f"{low}~{low + 9}" for low in range(0, 90, 10)] + ["90~100"]
+
+_TOUCHED_KEY = "test_analytics_touched"
+
+_lock = threading.Lock()
+_epoch = 0
+_versions: Dict[int, int] = {}
+_cache: Dict[int, tuple] = {}  # test_id → (epoch, {의존 시험 id: 버전}, 저장 시각, 결과)
+
+
+# ==========================================================
+# 버전 / 무효화
+# ==========================================================
+
+def bump(test_ids=None) -> None:
+    """시험 점수 변경 시 호출 (test_ids=None 이면 전체 무효화)"""
+    global _epoch
+    with _lock:
+        if test_ids is None:
+            _epoch += 1
+            _cache.clear()
+            return
+        for test_id in test_ids:
+            _versions[test_id] = _versions.get(test_id, 0) + 1
+
+
+def _touch(session, test_ids) -> None:
+    touched: Set = session.info.setdefault(_TOUCHED_KEY, set())
+    touched.update(test_ids)
+    bump(None if None in touched else test_ids)
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_on_flush(session, flush_context):
+    test_ids = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, TestModel):
+            test_ids.add(None)
+        elif isinstance(obj, TestScoreModel):
+            history = get_history(obj, "test_id")
+            test_ids.update(t for t in chain(history.added, history.unchanged, history.deleted) if t is not None)
+    if test_ids:
+        _touch(session, test_ids)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_on_bulk(orm_execute_state):
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and issubclass(mapper.class_, (TestModel, TestScoreModel)):
+        _touch(orm_execute_state.session, {None})
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _bump_on_end(session):
+    touched = session.info.pop(_TOUCHED_KEY, None)
+    if touched:
+        bump(None if None in touched else touched)
+
+
+def _lookup(test_id: int) -> Optional[dict]:
+    ttl = settings.TEST_ANALYTICS_CACHE_TTL
+    if ttl <= 0:
+        return None
+    with _lock:
+        entry = _cache.get(test_id)
+        if entry is None:
+            return None
+        epoch, deps, stored_at, result = entry
+        if epoch == _epoch and time.monotonic() - stored_at < ttl \
+                and all(_versions.get(t, 0) == v for t, v in deps.items()):
+            return result
+    return None
+
+
+def _snapshot(test_ids) -> tuple:
+    with _lock:
+        return _epoch, {t: _versions.get(t, 0) for t in test_ids}
+
+
+def _store(test_id: int, snapshot: tuple, result: dict) -> None:
+    if settings.TEST_ANALYTICS_CACHE_TTL <= 0:
+        return
+    epoch, deps = snapshot
+    with _lock:
+        # 계산 중에 관련 시험 점수가 바뀌었다면 저장하지 않음
+        if epoch == _epoch and all(_versions.get(t, 0) == v for t, v in deps.items()):
+            _cache[test_id] = (epoch, deps, time.monotonic(), result)
+
+
+# ==========================================================
+# 조회
+# ==========================================================
+
+def _load_scores(db: Session, test: TestModel, sibling_ids, history_ids) -> pd.DataFrame:
+    """
+    반별 비교 대상 시험들의 점수 + 학생별 직전 시험 점수 (1쿼리)
+    - 같은 과목·시험일 이전 시험을 LAG(…) OVER (PARTITION BY 학생 ORDER BY 시험일, 시험 id)
+    """
+    takers = select(TestScoreModel.student_id).where(TestScoreModel.test_id.in_(sibling_ids))
+    window = {
+        "partition_by": TestScoreModel.student_id,
+        "order_by": (TestModel.test_date, TestModel.id),
+    }
+    history = (
+        select(
+            TestScoreModel.test_id,
+            TestModel.class_id,
+            TestScoreModel.student_id,
+            TestScoreModel.score,
+            func.lag(TestScoreModel.score).over(**window).label("prev_score"),
+            func.lag(TestModel.id).over(**window).label("prev_test_id"),
+        )
+        .join(TestModel, TestModel.id == TestScoreModel.test_id)
+        .where(TestScoreModel.test_id.in_(history_ids), TestScoreModel.student_id.in_(takers))
+        .subquery()
+    )
+    stmt = (
+        select(history, StudentModel.student_name)
+        .outerjoin(StudentModel, StudentModel.id == history.c.student_id)
+        .where(history.c.test_id.in_(sibling_ids))
+        .order_by(history.c.test_id, history.c.student_id)
+    )
+    return pd.DataFrame.from_records(
+        db.execute(stmt).all(),
+        columns=["test_id", "class_id", "student_id", "score", "prev_score", "prev_test_id", "name"],
+    )
+
+
+# ==========================================================
+# 계산
+# ==========================================================
+
+def _num(value, digits: int = 2):
+    if value is None or pd.isna(value):
+        return None
+    return round(float(value), digits)
+
+
+def _describe(scores: pd.Series) -> dict:
+    q1, median, q3 = scores.quantile([0.25, 0.5, 0.75])
+    return {
+        "count": int(scores.count()),
+        "mean": _num(scores.mean()),
+        "std": _num(scores.std(ddof=0)),  # 응시자 전체 기준 (모표준편차)
+        "min": _num(scores.min()),
+        "max": _num(scores.max()),
+        "q1": _num(q1),
+        "median": _num(median),
+        "q3": _num(q3),
+        "iqr": _num(q3 - q1),
+    }
+
+
+def _distribution(scores: pd.Series) -> dict:
+    counts, _ = np.histogram(scores.clip(0, 100), bins=DISTRIBUTION_EDGES)
+    return dict(zip(DISTRIBUTION_LABELS, counts.tolist()))
+
+
+def _class_comparison(frame: pd.DataFrame, test_id: int, class_name) -> list:
+    overall = frame["score"].mean()
+    grouped = frame.groupby(["test_id", "class_id"])["score"]
+    stats = grouped.agg(["count", "mean", "median", "min", "max"])
+    stats["std"] = grouped.std(ddof=0)
+    stats = stats.sort_values("mean", ascending=False)
+    stats["rank"] = stats["mean"].rank(method="min", ascending=False)
+    return [
+        {
+            "test_id": int(tid),
+            "class_id": int(class_id),
+            "class_name": class_name(int(class_id)),
+            "is_target": int(tid) == test_id,
+            "count": int(row["count"]),
+            "mean": _num(row["mean"]),
+            "std": _num(row["std"]),
+            "median": _num(row["median"]),
+            "min": _num(row["min"]),
+            "max": _num(row["max"]),
+            "diff_from_overall": _num(row["mean"] - overall),
+            "rank": int(row["rank"]),
+        }
+        for (tid, class_id), row in stats.iterrows()
+    ]
+
+
+def _changes(target: pd.DataFrame) -> dict:
+    delta = target["delta"].dropna()
+    return {
+        "compared": int(delta.count()),
+        "no_previous": int(target["delta"].isna().sum()),
+        "improved": int((delta > 0).sum()),
+        "declined": int((delta < 0).sum()),
+        "unchanged": int((delta == 0).sum()),
+        "mean_delta": _num(delta.mean()),
+    }
+
+
+def _compute(db: Session, test: TestModel, sibling_ids, history_ids) -> Optional[dict]:
+    frame = _load_scores(db, test, sibling_ids, history_ids)
+    target = frame[frame["test_id"] == test.id].copy()
+    if target.empty:
+        return None
+
+    target["delta"] = target["score"] - target["prev_score"]
+    target["rank"] = target["score"].rank(method="min", ascending=False).astype(int)
+    target["percentile"] = (target["score"].rank(method="max", pct=True) * 100).round(1)
+    target = target.sort_values(["rank", "student_id"])
+
+    refs = get_reference_data(db)
+    students = [
+        {
+            "student_id": int(row.student_id),
+            "name": row.name,
+            "score": float(row.score),
+            "rank": int(row.rank),
+            "percentile": float(row.percentile),
+            "prev_test_id": None if pd.isna(row.prev_test_id) else int(row.prev_test_id),
+            "prev_score": _num(row.prev_score),
+            "delta": _num(row.delta),
+        }
+        for row in target.itertuples(index=False)
+    ]
+
+    return {
+        "test": {
+            "id": test.id,
+            "test_name": test.test_name,
+            "test_date": str(test.test_date),
+            "subject_id": test.subject_id,
+            "subject_name": test.subject_name,
+            "class_id": test.class_id,
+        },
+        "summary": _describe(target["score"]),
+        "distribution": _distribution(target["score"]),
+        "class_comparison": {
+            "overall": _describe(frame["score"]),
+            "classes": _class_comparison(frame, test.id, refs.class_name),
+        },
+        "changes": _changes(target),
+        "students": students,
+    }
+
+
+def get_test_analytics(db: Session, test_id: int) -> Optional[dict]:
+    """시험 분석 결과 (시험이 없거나 점수가 없으면 None) — 반환 dict 는 캐시와 공유되므로 수정하지 말 것"""
+    cached = _lookup(test_id)
+    if cached is not None:
+        return cached
+
+    test = db.get(TestModel, test_id)
+    if test is None:
+        return None
+
+    # 같은 과목의 시험일 이전(당일 포함) 시험 목록: 반별 비교 대상 + 직전 시험 후보
+    related = db.execute(
+        select(TestModel.id, TestModel.test_name, TestModel.test_date)
+        .where(TestModel.subject_id == test.subject_id, TestModel.test_date <= test.test_date)
+    ).all()
+    history_ids = [r.id for r in related]
+    sibling_ids = [r.id for r in related if r.test_name == test.test_name and r.test_date == test.test_date]
+
+    snapshot = _snapshot(history_ids)
+    result = _compute(db, test, sibling_ids, history_ids)
+    if result is not None:
+        _store(test_id, snapshot, result)
+    return result
@@ -0,0 +1,105 @@
+"""
+tests/conftest.py
+
+- 공용 SQLite 테스트 DB 픽스처
+  - engine: 인메모리 SQLite (StaticPool 로 모든 세션이 같은 DB 공유) + 전체 테이블 생성 + 쿼리 수 집계
+  - db: engine 위의 Session
+  - file_db: 파일 SQLite (동기 engine + AsyncSession 실행용 aiosqlite URL) — AsyncSession 핸들러 테스트
+  - client: 지정한 라우터만 올린 FastAPI TestClient (get_db / get_read_db → engine 세션)
+- 테스트 모듈에 seed(engine) 함수가 있으면 테이블 생성 직후 호출해 초기 데이터 적재
+- 프로세스 전역 캐시(참조 테이블/석차/출결 달력/시험 분석)는 DB 마다 새로 만들므로 적재 후 비움
+"""
+
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from database.db import Base
+from database.query_stats import install_query_stats
+from dependencies.db import get_db, get_read_db
+import models  # noqa: F401  # ✅ 모델 테이블을 Base.metadata 에 등록
+from services import attendance_calendar, grade_rankings, reference_cache, test_analytics
+
+
+def _prepare(engine: Engine, request) -> Engine:
+    """테이블 생성 + 쿼리 수 집계 + 모듈 seed(engine) + 캐시 초기화"""
+    Base.metadata.create_all(engine)
+    install_query_stats(engine)
+    seed = getattr(request.module, "seed", None)
+    if seed is not None:
+        seed(engine)
+    reference_cache.invalidate()
+    grade_rankings.invalidate()
+    attendance_calendar.invalidate()
+    test_analytics.bump()
+    return engine
+
+
+@pytest.fixture()
+def engine(request):
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    yield _prepare(engine, request)
+    engine.dispose()
+
+
+@pytest.fixture()
+def db(engine):
+    with Session(engine) as session:
+        yield session
+
+
+@dataclass
+class FileDB:
+    """파일 SQLite — 동기 engine 으로 검증하고 AsyncSession 시나리오는 run_async 로 실행"""
+    engine: Engine
+    async_url: str
+
+    def run_async(self, scenario, **session_options):
+        """새 이벤트 루프에서 aiosqlite AsyncSession 을 열어 await scenario(db) 결과 반환"""
+        async def main():
+            async_engine = create_async_engine(self.async_url)
+            install_query_stats(async_engine.sync_engine)
+            try:
+                async with AsyncSession(async_engine, **session_options) as db:
+                    return await scenario(db)
+            finally:
+                await async_engine.dispose()
+        return asyncio.run(main())
+
+
+@pytest.fixture()
+def file_db(request, tmp_path):
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    engine = create_engine(url)
+    yield FileDB(_prepare(engine, request), url.replace("sqlite://", "sqlite+aiosqlite://"))
+    engine.dispose()
+
+
+@pytest.fixture()
+def client(engine):
+    """client(*routers, middleware=[...]) → TestClient (DB 의존성은 engine 세션으로 교체)"""
+    def override_db():
+        with Session(engine) as session:
+            yield session
+
+    def make(*routers, middleware=()):
+        app = FastAPI()
+        for router in routers:
+            app.include_router(router)
+        for cls in middleware:
+            app.add_middleware(cls)
+        app.dependency_overrides[get_db] = override_db
+        app.dependency_overrides[get_read_db] = override_db
+        return TestClient(app)
+
+    return make
@@ -0,0 +1,128 @@
+"""
+출결 달력(services/attendance_calendar.py) 검증
+
+- 압축 달력의 연속 결석 지표가 학생별 Python 계산(기록 없는 날 건너뜀)과 같은지
+- 요일 반복 패턴 / 연속 결석 / 잦은 결석 탐지, 대시보드 alerts.calendar
+- 캐시: 두 번째 조회는 쿼리 없음, ORM 출결 쓰기 후에는 DB 로 재구축
+"""
+
+import random
+from datetime import date, timedelta
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from database.db import Base
+from database.query_stats import start_query_stats
+from models.attendance import Attendance as AttendanceModel
+from routers.attendance import get_class_attendance_calendar, get_student_attendance_calendar
+from routers.attendance_dashboard import get_attendance_dashboard
+from services import attendance_calendar, periods
+
+TARGET = date(2025, 7, 7)  # 월요일
+WEEKS = 6
+
+
+def _school_days(weeks: int):
+    start = TARGET - timedelta(weeks=weeks)
+    return [d for d in periods.Period(start, TARGET + timedelta(days=1)).days() if d.weekday() < 5]
+
+
+def _records():
+    rows = []
+    for d in _school_days(WEEKS):
+        # 학생 1: 월요일마다 지각
+        rows.append({"student_id": 1, "date": d, "status": "지각" if d.weekday() == 0 else "출석"})
+        # 학생 2: 목, 금, (주말), 월 연속 결석
+        rows.append({"student_id": 2, "date": d, "status": "결석" if d >= TARGET - timedelta(days=4) else "출석"})
+        # 학생 3: 모두 출석
+        rows.append({"student_id": 3, "date": d, "status": "출석"})
+    # 학생 4: 무작위 (기록 없는 날 포함)
+    rnd = random.Random(5)
+    for d in periods.Period(periods.school_year(2025).start, TARGET + timedelta(days=1)).days():
+        if rnd.random() < 0.8:
+            rows.append({"student_id": 4, "date": d, "status": rnd.choice(["출석", "결석", "결석", "지각", "조회"])})
+    return rows
+
+
+def seed(engine):
+    t = Base.metadata.tables
+    with engine.begin() as conn:
+        conn.execute(t["students"].insert(), [
+            {"id": sid, "student_name": f"학생{sid}", "class_id": 1} for sid in (1, 2, 3, 4)
+        ])
+        conn.execute(t["attendance"].insert(), _records())
+
+
+def _naive_streaks(statuses):
+    """기록된 날만 순서대로 보고 (현재 연속 결석, 최장 연속 결석)"""
+    current = longest = 0
+    for status in statuses:
+        if status is None:
+            continue
+        current = current + 1 if status == "결석" else 0
+        longest = max(longest, current)
+    return current, longest
+
+
+def test_streaks_match_naive(engine):
+    records = _records()
+    with Session(engine) as db:
+        calendar = attendance_calendar.load_calendars(db, [1], 2025)[1]
+    stats = attendance_calendar.detect(calendar, TARGET)
+
+    start = calendar.period.start
+    for pos, sid in enumerate(calendar.student_ids):
+        by_day = {r["date"]: r["status"] for r in records if r["student_id"] == sid}
+        statuses = [by_day.get(start + timedelta(days=i)) for i in range((TARGET - start).days + 1)]
+        assert (stats["absent_streak"][pos], stats["longest_absent_streak"][pos]) == _naive_streaks(statuses)
+
+    assert calendar.codes.dtype == np.uint8
+    assert calendar.codes.shape == (4, 365)  # 학년도 2025-03-01 ~ 2026-02-28
+
+
+def test_need_attention(engine):
+    with Session(engine) as db:
+        response = get_class_attendance_calendar(class_id=1, date=str(TARGET), db=db)
+    data = response["data"]
+    issues = {(a["student_id"], a["issue"]) for a in data["need_attention"]}
+
+    assert (1, "월요일 반복 지각") in issues
+    assert (2, "연속 결석") in issues
+    assert not any(sid == 3 for sid, _ in issues)
+
+    students = {s["student_id"]: s for s in data["students"]}
+    assert students[2]["absent_streak"] == 3
+    # 하루 1글자: 학생 1의 기준일(월요일)은 지각(3), 학생 2는 결석(2)
+    offset = (TARGET - date(2025, 3, 1)).days
+    assert students[1]["codes"][offset] == "3" and students[2]["codes"][offset] == "2"
+    assert len(students[3]["codes"]) == 365 and data["legend"]["3"] == "지각"
+
+    with Session(engine) as db:
+        single = get_student_attendance_calendar(student_id=1, date=str(TARGET), db=db)["data"]
+        missing = get_student_attendance_calendar(student_id=99, date=str(TARGET), db=db)
+    assert single["codes"] == students[1]["codes"]
+    assert [a["issue"] for a in single["need_attention"]] == ["월요일 반복 지각"]
+    assert missing["success"] is False
+
+
+def test_dashboard_calendar_alerts(engine):
+    with Session(engine) as db:
+        data = get_attendance_dashboard(class_id=1, date=str(TARGET), db=db)["data"]
+    assert {a["name"] for a in data["alerts"]["calendar"]} >= {"학생1", "학생2"}
+
+
+def test_cache_and_invalidation(engine):
+    with Session(engine) as db:
+        attendance_calendar.get_calendar(db, 1, 2025)
+        stats = start_query_stats()
+        attendance_calendar.get_calendar(db, 1, 2025)
+        assert stats.statements == 0
+
+        # 학생 3 기준일 다음 날(화) 결석 추가 → commit 시 캐시 삭제 → 다음 조회에서 재구축
+        next_day = TARGET + timedelta(days=1)
+        db.add(AttendanceModel(student_id=3, date=next_day, status="결석"))
+        db.commit()
+        calendar = attendance_calendar.get_calendar(db, 1, 2025)
+    assert calendar.row(3)[calendar.day_index(next_day)] == attendance_calendar.ABSENT
+    assert not calendar.codes.flags.writeable
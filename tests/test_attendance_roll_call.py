@@ -0,0 +1,126 @@
+"""
+PUT /attendance/roll-call/{class_id}/{date} 검증
+
+- 요청에 없는 반 학생은 출석, 기존 출결은 상태/사유만 갱신 (special_note 유지), 적용한 diff 반환
+- 같은 요청 재전송은 쓰기 없이 빈 diff (명단 + 기존 출결 2쿼리)
+- 일별 출결 집계 증분 결과 == 전체 재구축 결과
+- 허용되지 않은 상태값은 422 (저장 안 함)
+"""
+
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from database.db import Base
+from database.query_stats import start_query_stats
+from models.attendance import Attendance as AttendanceModel
+from models.attendance_stats import AttendanceDailyRollup
+from routers import attendance as attendance_routes
+from routers.attendance import put_roll_call
+from schemas.attendance import RollCallRequest
+from services import attendance_rollup
+
+DAY = date(2025, 7, 7)
+
+
+def seed(engine):
+    t = Base.metadata.tables
+    with engine.begin() as conn:
+        conn.execute(t["students"].insert(), [
+            {"id": sid, "student_name": f"학생{sid}", "class_id": 1 if sid <= 5 else 2} for sid in range(1, 7)
+        ])
+        conn.execute(t["attendance"].insert(), [
+            {"student_id": 2, "date": DAY, "status": "결석", "reason": None, "special_note": "보건실"},
+            {"student_id": 6, "date": DAY, "status": "지각", "reason": "늦잠", "special_note": None},
+        ])
+    with Session(engine) as db:
+        attendance_rollup.rebuild(db)
+        db.commit()
+
+
+def _snapshot(db: Session):
+    return db.execute(
+        select(AttendanceDailyRollup.__table__).order_by(
+            AttendanceDailyRollup.class_id, AttendanceDailyRollup.date, AttendanceDailyRollup.status
+        )
+    ).all()
+
+
+def _payload():
+    return RollCallRequest(students={
+        2: {"status": "지각", "reason": "버스 지연"},
+        3: {"status": "결석", "reason": "감기"},
+    })
+
+
+def test_roll_call_applies_diff(engine):
+    with Session(engine) as db:
+        data = put_roll_call(class_id=1, date=str(DAY), payload=_payload(), db=db)["data"]
+
+        assert data["total"] == 5 and data["unchanged"] == 0
+        assert data["created"] == [
+            {"student_id": 1, "status": "출석", "reason": None},
+            {"student_id": 3, "status": "결석", "reason": "감기"},
+            {"student_id": 4, "status": "출석", "reason": None},
+            {"student_id": 5, "status": "출석", "reason": None},
+        ]
+        assert data["updated"] == [{
+            "student_id": 2,
+            "before": {"status": "결석", "reason": None},
+            "after": {"status": "지각", "reason": "버스 지연"},
+        }]
+
+        rows = {
+            row.student_id: (row.status, row.reason, row.special_note)
+            for row in db.scalars(select(AttendanceModel).where(AttendanceModel.date == DAY))
+        }
+        assert rows[2] == ("지각", "버스 지연", "보건실")
+        assert rows[6] == ("지각", "늦잠", None)  # 다른 반은 그대로
+        assert len(rows) == 6
+
+        incremental = _snapshot(db)
+        attendance_rollup.rebuild(db)
+        db.commit()
+        assert incremental == _snapshot(db)
+
+
+def test_roll_call_is_idempotent(engine):
+    with Session(engine) as db:
+        put_roll_call(class_id=1, date=str(DAY), payload=_payload(), db=db)
+        before = _snapshot(db)
+
+        stats = start_query_stats()
+        data = put_roll_call(class_id=1, date=str(DAY), payload=_payload(), db=db)["data"]
+        assert stats.statements == 2  # 명단 + 기존 출결 (쓰기 없음)
+        assert (data["created"], data["updated"], data["unchanged"]) == ([], [], 5)
+        assert _snapshot(db) == before
+
+        # 빠진 학생은 다시 출석으로
+        payload = RollCallRequest(students={2: {"status": "지각", "reason": "버스 지연"}})
+        data = put_roll_call(class_id=1, date=str(DAY), payload=payload, db=db)["data"]
+        assert data["updated"] == [{
+            "student_id": 3,
+            "before": {"status": "결석", "reason": "감기"},
+            "after": {"status": "출석", "reason": None},
+        }]
+
+
+def test_roll_call_rejects_other_students(engine):
+    with Session(engine) as db:
+        with pytest.raises(HTTPException) as e:
+            put_roll_call(class_id=1, date=str(DAY), payload=RollCallRequest(students={6: {"status": "결석"}}), db=db)
+        assert e.value.status_code == 400
+        assert put_roll_call(class_id=99, date=str(DAY), payload=RollCallRequest(), db=db)["success"] is False
+        assert db.scalar(select(AttendanceModel.status).where(AttendanceModel.student_id == 6)) == "지각"
+
+
+def test_roll_call_rejects_unknown_status(engine, client):
+    response = client(attendance_routes.router).put(
+        f"/attendance/roll-call/1/{DAY}", json={"students": {"2": {"status": "조회"}}}
+    )
+    assert response.status_code == 422
+    with Session(engine) as db:
+        assert db.scalar(select(AttendanceModel.status).where(AttendanceModel.student_id == 2)) == "결석"
@@ -0,0 +1,87 @@
+"""
+출결 일별 집계 테이블 증분 갱신 결과가 전체 재구축 결과와 같은지 확인
+
+- create/update/delete_attendance 무작위 반복 ((학생, 날짜) 유니크 키 유지)
+- AI 일괄 출석처리(AsyncSession) 경로, students 에 없는 학생의 출결(class_id 0)
+"""
+
+import random
+from datetime import date, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from database.db import Base
+from models.attendance import Attendance as AttendanceModel
+from models.attendance_stats import AttendanceDailyRollup
+from routers.attendance import create_attendance, delete_attendance, update_attendance
+from schemas.attendance import Attendance as AttendanceSchema
+from services import attendance_rollup
+from services.ai_handlers.attendance_handler import handle_bulk_attendance, handle_individual_attendance
+
+STATUSES = ["출석", "결석", "지각", "조퇴"]
+DAYS = [date(2025, 7, 1) + timedelta(days=d) for d in range(20)]
+
+
+def _snapshot(db: Session):
+    return db.execute(
+        select(AttendanceDailyRollup.__table__).order_by(
+            AttendanceDailyRollup.class_id, AttendanceDailyRollup.date, AttendanceDailyRollup.status
+        )
+    ).all()
+
+
+def seed(engine):
+    with engine.begin() as conn:
+        conn.execute(Base.metadata.tables["students"].insert(), [
+            {"id": sid, "student_name": name, "class_id": cid}
+            for sid, name, cid in [(1, "김민수", 1), (2, "이서연", 1), (3, "박지훈", 2), (4, "최유나", 3)]
+        ])
+
+
+def test_crud_matches_rebuild(engine):
+    rnd = random.Random(11)
+    with Session(engine) as db:
+        for _ in range(150):
+            used = set(db.execute(select(AttendanceModel.student_id, AttendanceModel.date)).tuples())
+            free = [(sid, d) for sid in (1, 2, 3, 4, 99) for d in DAYS if (sid, d) not in used]
+            ids = [i for i, in db.execute(select(AttendanceModel.id))]
+            action = rnd.random()
+            if action < 0.5 or not ids:
+                sid, d = rnd.choice(free)
+                create_attendance(AttendanceSchema(student_id=sid, date=d, status=rnd.choice(STATUSES)), db=db)
+            elif action < 0.8:
+                current = db.get(AttendanceModel, rnd.choice(ids))
+                sid, d = (current.student_id, current.date) if rnd.random() < 0.6 else rnd.choice(free)
+                update_attendance(
+                    current.id,
+                    AttendanceSchema(id=current.id, student_id=sid, date=d, status=rnd.choice(STATUSES)),
+                    db=db,
+                )
+            else:
+                delete_attendance(rnd.choice(ids), db=db)
+
+        incremental = _snapshot(db)
+        assert all(row.count > 0 for row in incremental)
+        assert {row.class_id for row in incremental} >= {0, 1, 2}
+        attendance_rollup.rebuild(db)
+        db.commit()
+        assert incremental == _snapshot(db)
+
+
+def test_ai_bulk_writes_update_rollup(file_db):
+    async def scenario(db):
+        await handle_individual_attendance("김민수 결석처리해줘", db)
+        await handle_individual_attendance("박지훈 지각처리해줘", db)
+        await handle_bulk_attendance("모든 학생 출석처리해줘", db)
+
+    file_db.run_async(scenario, expire_on_commit=False)
+    with Session(file_db.engine) as db:
+        incremental = _snapshot(db)
+        today = date.today()
+        assert {(row.class_id, row.status): row.count for row in incremental if row.date == today} == {
+            (1, "결석"): 1, (1, "출석"): 1, (2, "지각"): 1, (3, "출석"): 1,
+        }
+        attendance_rollup.rebuild(db)
+        db.commit()
+        assert incremental == _snapshot(db)
@@ -0,0 +1,67 @@
+"""
+/attendance/stats/students 검증 (AsyncSession + aiosqlite)
+
+- 단일 집계 쿼리 결과가 기존(학생별 1 + N 쿼리) 구현과 같은지
+- class_id / 기간 / 커서 페이지네이션
+"""
+
+from datetime import date
+
+from database.db import Base
+from database.query_stats import start_query_stats
+from routers.attendance import get_student_attendance_stats
+from scripts.bench_attendance_stats import legacy_student_stats, load_data
+
+
+def seed(engine):
+    with engine.begin() as conn:
+        load_data(conn, students=25, class_size=10, year=2025)
+        conn.execute(Base.metadata.tables["students"].insert(), [
+            {"id": 26, "student_name": "출결없음", "class_id": 2},
+        ])
+
+
+async def _stats(db, **params):
+    params = {"class_id": None, "start_date": None, "end_date": None, "cursor": None, "limit": None, **params}
+    return await get_student_attendance_stats(db=db, **params)
+
+
+def test_matches_legacy_in_one_query(file_db):
+    async def scenario(db):
+        expected = await legacy_student_stats(db)
+        stats = start_query_stats()
+        response = await _stats(db)
+        return expected, response, stats.statements
+
+    expected, response, statements = file_db.run_async(scenario)
+    assert response["success"] is True
+    assert response["data"] == expected
+    assert response["next_cursor"] is None
+    assert statements == 1
+    assert response["data"][-1] == {
+        "student_id": 26, "student_name": "출결없음", "class_id": 2,
+        "absent_count": 0, "late_count": 0, "early_count": 0, "present_count": 0,
+    }
+
+
+def test_filters_and_pagination(file_db):
+    async def scenario(db):
+        full = (await _stats(db))["data"]
+        march = (await _stats(db, class_id=2, start_date=date(2025, 3, 1), end_date=date(2025, 3, 31)))["data"]
+        pages, cursor = [], None
+        while True:
+            page = await _stats(db, cursor=cursor, limit=10)
+            pages.append(page["data"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return full, march, pages
+
+    full, march, pages = file_db.run_async(scenario)
+    assert [s["student_id"] for s in march] == list(range(11, 21)) + [26]
+    march_days = sum(1 for d in range(1, 32) if date(2025, 3, d).weekday() < 5)
+    assert all(
+        sum(s[k] for k in ("absent_count", "late_count", "early_count", "present_count")) == march_days
+        for s in march[:-1]
+    )
+    assert [len(p) for p in pages] == [10, 10, 6]
+    assert [s for p in pages for s in p] == full
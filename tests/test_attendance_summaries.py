@@ -0,0 +1,123 @@
+"""
+/attendance/*-summary 집계 쿼리 검증
+
+- 일/주/월/학기/학생/반 요약이 원본 행을 Python 으로 센 결과(기존 구현)와 같은지
+- 각 요약은 GROUP BY 쿼리만 실행 (주간 요약 2회, 나머지 1회)
+"""
+
+import random
+from collections import Counter
+from datetime import date, timedelta
+
+from sqlalchemy.orm import Session
+
+from database.db import Base
+from database.query_stats import start_query_stats
+from routers import attendance as attendance_routes
+from services import attendance_rollup
+
+START = date(2025, 6, 23)
+STATUSES = ["출석"] * 6 + ["결석", "지각", "조퇴", "조회"]
+REASONS = [None, "", "감기", "감기", "가족행사", "병원"]
+STUDENT_CLASS = {sid: 1 if sid <= 6 else 2 for sid in range(1, 11)}
+
+
+def _records():
+    rnd = random.Random(3)
+    return [
+        {"student_id": sid, "date": START + timedelta(days=d), "status": status,
+         "reason": rnd.choice(REASONS) if status == "결석" else None}
+        for sid in STUDENT_CLASS
+        for d in range(0, 45)
+        if (START + timedelta(days=d)).weekday() < 5 and rnd.random() < 0.9
+        for status in [rnd.choice(STATUSES)]
+    ]
+
+
+RECORDS = _records()
+
+
+def seed(engine):
+    t = Base.metadata.tables
+    with engine.begin() as conn:
+        conn.execute(t["students"].insert(), [
+            {"id": sid, "student_name": f"학생{sid}", "class_id": cid} for sid, cid in STUDENT_CLASS.items()
+        ])
+        conn.execute(t["attendance"].insert(), RECORDS)
+    with Session(engine) as db:
+        attendance_rollup.rebuild(db)  # 주간/월간 요약은 일별 집계 테이블을 읽음
+        db.commit()
+
+
+def _summary(records):
+    counts = Counter(r["status"] for r in records)
+    rate = round(counts["출석"] / len(records) * 100, 1) if records else 0
+    return {"total": len(records), "present": counts["출석"], "absent": counts["결석"],
+            "late": counts["지각"], "attendance_rate": f"{rate}%"}
+
+
+def _call(engine, fn, **params):
+    with Session(engine) as db:
+        stats = start_query_stats()
+        response = fn(db=db, **params)
+    return response, stats.statements
+
+
+def test_daily_monthly_student_class(engine):
+    day = START + timedelta(days=8)
+    daily, n = _call(engine, attendance_routes.get_daily_attendance_summary, date=day.isoformat())
+    records = [r for r in RECORDS if r["date"] == day]
+    assert n == 1
+    assert {k: daily["data"][k] for k in ("total", "present", "absent", "late", "attendance_rate")} == _summary(records)
+    assert daily["data"]["checkin"] == sum(r["status"] == "조회" for r in records)
+
+    monthly, n = _call(engine, attendance_routes.get_monthly_attendance_summary, class_id=2, month="2025-07")
+    records = [r for r in RECORDS if STUDENT_CLASS[r["student_id"]] == 2 and r["date"].month == 7]
+    assert n == 1
+    assert {k: monthly["data"][k] for k in ("total", "present", "absent", "late", "attendance_rate")} == _summary(records)
+
+    semester, n = _call(engine, attendance_routes.get_semester_attendance_summary, year=2025, term=1, class_id=None)
+    records = [r for r in RECORDS if r["date"] < date(2025, 9, 1)]
+    assert n == 1
+    assert {k: semester["data"][k] for k in ("total", "present", "absent", "late", "attendance_rate")} == _summary(records)
+
+    student, n = _call(engine, attendance_routes.get_student_attendance_summary, student_id=3)
+    assert n == 1
+    assert {k: v for k, v in student["data"].items() if k != "student_id"} == _summary(
+        [r for r in RECORDS if r["student_id"] == 3]
+    )
+
+    klass, n = _call(engine, attendance_routes.get_class_attendance_summary, class_id=1)
+    assert {k: v for k, v in klass["data"].items() if k != "class_id"} == _summary(
+        [r for r in RECORDS if STUDENT_CLASS[r["student_id"]] == 1]
+    )
+    missing, _ = _call(engine, attendance_routes.get_student_attendance_summary, student_id=999)
+    assert missing["error"]["code"] == 404
+
+
+def test_weekly_summary(engine):
+    start, end = START + timedelta(days=7), START + timedelta(days=20)
+    weekly, n = _call(engine, attendance_routes.get_weekly_attendance_summary,
+                      start_date=start.isoformat(), end_date=end.isoformat())
+    data = weekly["data"]
+    assert n == 2
+
+    records = [r for r in RECORDS if start <= r["date"] <= end]
+    by_day = {}
+    for r in records:
+        by_day.setdefault(r["date"], []).append(r)
+    rates = [sum(r["status"] == "출석" for r in rows) / len(rows) * 100 for rows in by_day.values()]
+    reasons = Counter(r["reason"] for r in records if r["status"] == "결석" and r["reason"])
+    top = max(reasons.values())
+
+    assert data["total_records"] == len(records)
+    assert data["average_attendance_rate"] == f"{round(sum(rates) / len(rates), 1)}%"
+    assert data["total_absent"] == sum(reasons.values())
+    assert data["top_absent_reason"] == min(reason for reason, c in reasons.items() if c == top)
+    assert data["top_absent_rate"] == f"{round(top / sum(reasons.values()) * 100, 1)}%"
+    assert [d["date"] for d in data["daily"]] == sorted(str(d) for d in by_day)
+
+    empty, _ = _call(engine, attendance_routes.get_weekly_attendance_summary,
+                     start_date="2024-01-01", end_date="2024-01-07")
+    assert empty["data"]["average_attendance_rate"] == "0%"
+    assert (empty["data"]["top_absent_reason"], empty["data"]["top_absent_rate"]) == ("None", "0%")
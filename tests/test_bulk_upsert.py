@@ -0,0 +1,128 @@
+"""
+POST /grades/bulk, /test_scores/bulk 검증
+
+- 오류 행(스키마/참조 무결성/중복)은 errors 로 보고하고 나머지는 저장
+- 기존 키는 갱신, 새 키는 삽입 — 다중 행 INSERT 한 문장
+- grade_letter 미지정 행은 등급 기준으로 계산, 성적 집계 테이블은 전체 재구축 결과와 일치
+"""
+
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from database.db import Base
+from models.grades import Grade as GradeModel
+from models import test_scores as test_score_models
+from routers.grades import bulk_upsert_grades
+from routers.test_scores import bulk_upsert_test_scores
+from schemas.grades import GradeBulkRequest
+from schemas import test_scores as test_score_schemas
+from services import grade_letters, grade_rollup
+from tests.test_grade_rollup import _snapshot
+
+
+def seed(engine):
+    t = Base.metadata.tables
+    with engine.begin() as conn:
+        conn.execute(t["classes"].insert(), [{"id": 1, "grade": 1, "class_num": 1}, {"id": 2, "grade": 1, "class_num": 2}])
+        conn.execute(t["subjects"].insert(), [{"id": 1, "name": "국어"}, {"id": 2, "name": "수학"}])
+        conn.execute(t["students"].insert(), [
+            {"id": sid, "student_name": f"학생{sid}", "class_id": 1 if sid <= 3 else 2} for sid in range(1, 6)
+        ])
+        conn.execute(t["grades"].insert(), [
+            {"id": 1, "student_id": 1, "subject_id": 1, "term": 1, "average_score": 50, "grade_letter": "F"},
+        ])
+        conn.execute(t["tests"].insert(), [
+            {"id": 1, "subject_id": 2, "test_name": "중간고사", "test_date": date(2025, 4, 20), "class_id": 1,
+             "subject_name": "수학"},
+        ])
+        conn.execute(t["test_scores"].insert(), [
+            {"id": 1, "test_id": 1, "student_id": 1, "score": 40, "subject_name": "수학"},
+        ])
+    with Session(engine) as db:
+        grade_rollup.rebuild(db)
+        db.commit()
+
+
+def _count_inserts(engine, table):
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith(f"INSERT INTO {table}"):
+            statements.append(statement)
+
+    return statements
+
+
+def test_bulk_grades(engine):
+    inserts = _count_inserts(engine, "grades")
+    rows = [
+        {"student_id": 1, "subject_id": 1, "term": 1, "average_score": 95},          # 0 갱신 → A
+        {"student_id": 1, "subject_id": 2, "term": 1, "average_score": 84.5},        # 1 신규 → B
+        {"student_id": 4, "subject_id": 1, "term": 2, "average_score": None},        # 2 점수 없음 → 등급 없음
+        {"student_id": 2, "subject_id": 1, "term": 1, "average_score": 30, "grade_letter": "P"},  # 3 등급 지정
+        {"student_id": 2, "subject_id": 1, "term": 1, "average_score": 99},          # 4 중복 키
+        {"student_id": 99, "subject_id": 1, "term": 1, "average_score": 70},         # 5 없는 학생
+        {"student_id": 3, "subject_id": 9, "term": 1, "average_score": 70},          # 6 없는 과목
+        {"student_id": 3, "subject_id": 1, "term": 3, "average_score": 170},         # 7 스키마 오류 2건
+        {"student_id": "abc"},                                                        # 8 스키마 오류
+    ]
+    with Session(engine) as db:
+        response = bulk_upsert_grades(GradeBulkRequest(rows=rows, cutoffs={"A": 90, "B": 80, "F": 0}), db=db)
+
+    data = response["data"]
+    assert (data["received"], data["saved"], data["inserted"], data["updated"]) == (9, 4, 3, 1)
+    assert [e["index"] for e in data["errors"]] == [4, 5, 6, 7, 8]
+    assert {e["field"] for e in data["errors"][3]["errors"]} == {"term", "average_score"}
+    assert len(inserts) == 1
+
+    with Session(engine) as db:
+        saved = {
+            (g.student_id, g.subject_id, g.term): (g.average_score, g.grade_letter)
+            for g in db.scalars(select(GradeModel))
+        }
+        assert saved == {
+            (1, 1, 1): (95, "A"),
+            (1, 2, 1): (84.5, "B"),
+            (4, 1, 2): (None, None),
+            (2, 1, 1): (30, "P"),
+        }
+        incremental = _snapshot(db)
+        grade_rollup.rebuild(db)
+        db.commit()
+        assert incremental == _snapshot(db)
+
+
+def test_bulk_grades_rejects_invalid_cutoffs(engine):
+    with Session(engine) as db, pytest.raises(HTTPException):
+        bulk_upsert_grades(GradeBulkRequest(rows=[], cutoffs={"A": 90, "B": 90}), db=db)
+
+
+def test_bulk_test_scores(engine):
+    inserts = _count_inserts(engine, "test_scores")
+    rows = [
+        {"test_id": 1, "student_id": 1, "score": 88},   # 0 갱신
+        {"test_id": 1, "student_id": 2, "score": 72},   # 1 신규 (과목 이름은 시험에서)
+        {"test_id": 1, "student_id": 4, "score": 60},   # 2 다른 반 학생
+        {"test_id": 2, "student_id": 3, "score": 60},   # 3 없는 시험
+        {"test_id": 1, "student_id": 3, "score": -1},   # 4 스키마 오류
+    ]
+    with Session(engine) as db:
+        response = bulk_upsert_test_scores(test_score_schemas.TestScoreBulkRequest(rows=rows), db=db)
+
+    data = response["data"]
+    assert (data["saved"], data["inserted"], data["updated"]) == (2, 1, 1)
+    assert [e["index"] for e in data["errors"]] == [2, 3, 4]
+    assert len(inserts) == 1
+    with Session(engine) as db:
+        saved = {(s.test_id, s.student_id): (s.score, s.subject_name) for s in db.scalars(select(test_score_models.TestScore))}
+    assert saved == {(1, 1): (88, "수학"), (1, 2): (72, "수학")}
+
+
+def test_assign_letters():
+    cutoffs = grade_letters.resolve_cutoffs({"A": 90, "B": 80, "C": 70, "D": 60, "F": 0})
+    assert grade_letters.assign_letters([100, 90, 89.9, 60, 0, None, -5], cutoffs) == ["A", "A", "B", "D", "F", None, None]
@@ -0,0 +1,83 @@
+"""
+POST /dashboards/batch 검증
+
+- 일괄 응답의 반별 grades / attendance 가 단건 대시보드 API 와 같은지
+- 반 수가 늘어도 실행 쿼리 수가 고정인지 (N+1 방지)
+"""
+
+import random
+from datetime import date, timedelta
+
+from sqlalchemy.orm import Session
+
+from database.db import Base
+from database.query_stats import start_query_stats
+from routers.attendance_dashboard import get_attendance_dashboard
+from routers.dashboards import get_dashboards_batch
+from routers.grades_dashboard import get_grades_dashboard
+from schemas.dashboards import DashboardBatchRequest
+from services import attendance_calendar, reference_cache
+
+TARGET = date(2025, 7, 25)
+STATUSES = ["출석"] * 6 + ["결석", "지각", "조퇴"]
+REASONS = [None, "병결", "무단", "가사,병결,기타"]
+
+
+def seed(engine):
+    rnd = random.Random(7)
+    t = Base.metadata.tables
+    classes = [{"id": cid, "grade": 2, "class_num": cid} for cid in range(1, 7)]
+    students = [{"id": sid, "student_name": f"학생{sid}", "class_id": (sid - 1) // 10 + 1} for sid in range(1, 61)]
+    grades, attendance = [], []
+    for s in students:
+        for subject_id in (1, 2, 3):
+            grades.append({"student_id": s["id"], "subject_id": subject_id, "term": 1,
+                           "average_score": rnd.randint(40, 100), "grade_letter": "B"})
+        for offset in range(7):
+            # 학생 10, 20, ... : 최근 4일 중 3일 결석 기록 (하루는 기록 없음) → 연속 결석 위험
+            if s["id"] % 10 == 0 and offset == 3:
+                continue
+            status = "결석" if s["id"] % 10 == 0 else rnd.choice(STATUSES)
+            attendance.append({"student_id": s["id"], "date": TARGET - timedelta(days=offset),
+                               "status": status, "reason": rnd.choice(REASONS) if status != "출석" else None})
+    with engine.begin() as conn:
+        conn.execute(t["classes"].insert(), classes)
+        conn.execute(t["subjects"].insert(), [{"id": i, "name": f"과목{i}"} for i in (1, 2, 3)])
+        conn.execute(t["students"].insert(), students)
+        conn.execute(t["grades"].insert(), grades)
+        conn.execute(t["attendance"].insert(), attendance)
+
+
+def test_batch_matches_single_dashboards(engine):
+    payload = DashboardBatchRequest(class_ids=[2, 1, 99], term="1학기", date=TARGET)
+    with Session(engine) as db:
+        response = get_dashboards_batch(payload=payload, db=db)
+
+    sections = response["data"]["classes"]
+    assert [s["class_id"] for s in sections] == [2, 1, 99]
+    with Session(engine) as db:
+        for section in sections[:2]:
+            class_id = section["class_id"]
+            assert section["grades"] == get_grades_dashboard(class_id=class_id, term="1학기", threshold=65.0, db=db)["data"]
+            assert section["attendance"] == get_attendance_dashboard(class_id=class_id, date=str(TARGET), db=db)["data"]
+    assert sections[2]["grades"] is None
+    assert sections[2]["attendance"]["overview"]["total"] == 0
+    assert any(a["issue"] == "연속 결석 위험" for a in sections[0]["attendance"]["alerts"]["need_attention"])
+
+
+def test_batch_query_count_is_constant(engine):
+    counts = []
+    for class_ids in ([1], [1, 2, 3, 4, 5, 6]):
+        reference_cache.invalidate()
+        attendance_calendar.invalidate()
+        with Session(engine) as db:
+            stats = start_query_stats()
+            get_dashboards_batch(payload=DashboardBatchRequest(class_ids=class_ids, term="1학기", date=TARGET), db=db)
+        counts.append(stats.statements)
+    assert counts[0] == counts[1]
+
+    with Session(engine) as db:
+        stats = start_query_stats()
+        response = get_dashboards_batch(payload=DashboardBatchRequest(grade=2, term="1학기", date=TARGET), db=db)
+    assert len(response["data"]["classes"]) == 6
+    assert stats.statements <= counts[0] + 1  # 학년 → 반 목록 1쿼리 추가
@@ -0,0 +1,65 @@
+"""
+전체 덤프 스트리밍(services/export_stream.py) 검증 — GET /attendance/?format=csv|ndjson
+
+- CSV: UTF-8 BOM + 헤더 행, 필드 선택(fields) 반영
+- NDJSON: 한 줄에 한 행, 목록 응답(data)과 같은 값 (날짜 문자열, 한글 그대로)
+- 배치(batch_size) 경계와 상관없이 전체 행을 id 순으로 전송
+"""
+
+import csv
+import io
+import json
+from datetime import date, timedelta
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from database.db import Base
+from routers import attendance as attendance_routes
+from routers.attendance import LIST_FIELDS
+from services import export_stream
+
+ROWS = 7
+
+
+def seed(engine):
+    with engine.begin() as conn:
+        conn.execute(Base.metadata.tables["attendance"].insert(), [
+            {"student_id": 1, "date": date(2025, 7, 1) + timedelta(days=i),
+             "status": "결석" if i % 3 == 0 else "출석", "reason": "병결, 기타" if i % 3 == 0 else None}
+            for i in range(ROWS)
+        ])
+
+
+def test_csv_export(engine, client, monkeypatch):
+    monkeypatch.setattr(export_stream, "engine", engine)
+    response = client(attendance_routes.router).get("/attendance/", params={"format": "csv", "fields": "date,reason"})
+
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    assert response.headers["content-disposition"] == 'attachment; filename="attendance.csv"'
+    assert response.content.startswith(b"\xef\xbb\xbf")  # UTF-8 BOM
+    rows = list(csv.reader(io.StringIO(response.content.decode("utf-8-sig"))))
+    assert rows[0] == ["id", "date", "reason"]
+    assert rows[1] == ["1", "2025-07-01", "병결, 기타"]
+    assert rows[2] == ["2", "2025-07-02", ""]
+    assert len(rows) == ROWS + 1
+
+
+def test_ndjson_export_matches_list(engine, client, monkeypatch):
+    monkeypatch.setattr(export_stream, "engine", engine)
+    api = client(attendance_routes.router)
+    response = api.get("/attendance/", params={"format": "ndjson"})
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.content.decode().splitlines()
+    assert "병결" in lines[0]  # 한글은 \u 이스케이프 없이 UTF-8 그대로
+    assert [json.loads(line) for line in lines] == api.get("/attendance/").json()["data"]
+
+
+def test_batches_cover_all_rows(engine, monkeypatch):
+    monkeypatch.setattr(export_stream, "engine", engine)
+    app = FastAPI()
+    app.get("/dump")(lambda: export_stream.stream_export(LIST_FIELDS, "ndjson", "attendance", batch_size=3))
+
+    lines = TestClient(app).get("/dump").content.splitlines()
+    assert [json.loads(line)["id"] for line in lines] == list(range(1, ROWS + 1))
@@ -0,0 +1,58 @@
+"""
+services/grade_analytics 벡터화 계산 검증
+
+- 작은 long 프레임을 직접 만들어 평균/순위/분포/반별 요약이 손 계산과 같은지 확인
+"""
+
+import pandas as pd
+
+from services import grade_analytics
+
+
+def _frame(rows):
+    return pd.DataFrame(rows, columns=grade_analytics.COLUMNS)
+
+
+FRAME = _frame([
+    # student_id, name, class_id, grade_id, subject, score
+    (1, "가", 1, 1, "국어", 90.0),
+    (1, "가", 1, 2, "수학", 80.0),
+    (2, "나", 1, 3, "국어", 88.0),
+    (2, "나", 1, 4, "수학", None),   # 점수 NULL → 평균에서 제외
+    (3, "다", 1, None, None, None),  # 성적 없음 → 평균 0
+    (4, "라", 2, 5, "국어", 60.0),
+    (4, "라", 2, 6, "수학", 70.0),
+])
+
+
+def test_class_dashboard():
+    dash = grade_analytics.class_dashboard(FRAME[FRAME["class_id"] == 1])
+
+    assert [s["student_id"] for s in dash["students"]] == [2, 1, 3]
+    assert [s["rank"] for s in dash["students"]] == [1, 2, 3]
+    assert dash["students"][0]["scores"] == {"국어": 88.0, "수학": None}
+    assert dash["students"][2]["scores"] == {}
+    assert dash["overview"] == {"class_avg": 86.0, "highest": 88.0, "lowest": 0.0, "need_guidance": 1}
+    assert dash["subject_avg"] == {"국어": 89.0, "수학": 80.0}
+    assert dash["distribution"] == {"0-59": 1, "60-69": 0, "70-79": 0, "80-89": 2, "90-100": 0}
+    assert [s["student_id"] for s in dash["alerts"]["below_threshold"]] == [3]
+
+
+def test_dense_rank_ties():
+    frame = _frame([
+        (1, "가", 1, 1, "국어", 70.0),
+        (2, "나", 1, 2, "국어", 90.0),
+        (3, "다", 1, 3, "국어", 90.0),
+    ])
+    students = grade_analytics.class_dashboard(frame)["students"]
+    assert [(s["student_id"], s["rank"], s["dense_rank"]) for s in students] == [(2, 1, 1), (3, 2, 1), (1, 3, 2)]
+
+
+def test_school_dashboard():
+    dash = grade_analytics.school_dashboard(FRAME, {1: "1-1", 2: "1-2"}, top=1)
+
+    assert dash["overview"] == {"school_avg": 77.6, "class_count": 2, "student_count": 4, "need_guidance": 1}
+    assert [(c["class_id"], c["class_name"], c["rank"]) for c in dash["classes"]] == [(1, "1-1", 1), (2, "1-2", 2)]
+    assert dash["classes"][1]["class_avg"] == 65.0
+    assert [s["student_id"] for s in dash["top_students"]] == [2]
+    assert [s["student_id"] for s in dash["bottom_students"]] == [3]
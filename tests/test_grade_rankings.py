@@ -0,0 +1,84 @@
+"""
+/grades/rankings 윈도 함수 석차 + 캐시 검증
+
+- 동점자 RANK / DENSE_RANK / PERCENT_RANK, 과목별 석차
+- 두 번째 조회는 쿼리 없이 캐시에서 반환, 성적 쓰기(ORM / 집계 재구축) 후에는 다시 계산
+"""
+
+from sqlalchemy.orm import Session
+
+from database.db import Base
+from database.query_stats import start_query_stats
+from routers.grades import create_grade, get_class_rankings
+from schemas.grades import Grade as GradeSchema
+from services import grade_rollup
+
+# 학생별 (1학기 국어, 1학기 수학) 점수 — 1·2번 동점, 4번 성적 없음
+SCORES = {1: (90, 80), 2: (80, 90), 3: (70, 70)}
+
+
+def seed(engine):
+    t = Base.metadata.tables
+    with engine.begin() as conn:
+        conn.execute(t["classes"].insert(), [{"id": 1, "grade": 1, "class_num": 1}])
+        conn.execute(t["subjects"].insert(), [{"id": 1, "name": "국어"}, {"id": 2, "name": "수학"}])
+        conn.execute(t["students"].insert(), [
+            {"id": sid, "student_name": f"학생{sid}", "class_id": 1} for sid in (1, 2, 3, 4)
+        ])
+        conn.execute(t["grades"].insert(), [
+            {"student_id": sid, "subject_id": subject_id, "term": 1, "average_score": score, "grade_letter": "B"}
+            for sid, scores in SCORES.items()
+            for subject_id, score in zip((1, 2), scores)
+        ])
+    with Session(engine) as db:
+        grade_rollup.rebuild(db)
+        db.commit()
+
+
+def _ranks(response):
+    return [(s["student_id"], s["avg_score"], s["rank"], s["dense_rank"], s["percent_rank"]) for s in response["data"]]
+
+
+def test_ties_share_rank(engine):
+    with Session(engine) as db:
+        response = get_class_rankings(class_id=1, term=1, by_subject=False, db=db)
+    assert _ranks(response) == [
+        (1, 85.0, 1, 1, 0.0),
+        (2, 85.0, 1, 1, 0.0),
+        (3, 70.0, 3, 2, 0.6667),
+        (4, 0.0, 4, 3, 1.0),
+    ]
+    assert get_class_rankings(class_id=99, term=None, by_subject=False, db=Session(engine))["success"] is False
+
+
+def test_subject_ranks(engine):
+    with Session(engine) as db:
+        response = get_class_rankings(class_id=1, term=1, by_subject=True, db=db)
+    by_id = {s["student_id"]: s["subject_ranks"] for s in response["data"]}
+    assert [(r["subject"], r["rank"]) for r in by_id[1]] == [("국어", 1), ("수학", 2)]
+    assert [(r["subject"], r["rank"], r["dense_rank"]) for r in by_id[3]] == [("국어", 3, 3), ("수학", 3, 3)]
+    assert by_id[4] == []
+
+
+def test_cache_hit_and_invalidation(engine):
+    with Session(engine) as db:
+        get_class_rankings(class_id=1, term=1, by_subject=False, db=db)
+        stats = start_query_stats()
+        get_class_rankings(class_id=1, term=1, by_subject=False, db=db)
+    assert stats.statements == 0
+
+    # ORM 쓰기 → commit 후 다시 계산
+    with Session(engine) as db:
+        create_grade(GradeSchema(id=100, student_id=4, subject_id=1, term=1, average_score=100, grade_letter="A"), db=db)
+    with Session(engine) as db:
+        response = get_class_rankings(class_id=1, term=1, by_subject=False, db=db)
+    assert response["data"][0]["student_id"] == 4
+
+    # 집계 테이블 bulk 재구축 → 다시 계산
+    with Session(engine) as db:
+        db.execute(Base.metadata.tables["grades"].delete().where(Base.metadata.tables["grades"].c.student_id == 4))
+        grade_rollup.rebuild(db)
+        db.commit()
+    with Session(engine) as db:
+        response = get_class_rankings(class_id=1, term=1, by_subject=False, db=db)
+    assert response["data"][-1]["student_id"] == 4
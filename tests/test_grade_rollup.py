@@ -0,0 +1,133 @@
+"""
+성적 집계 테이블 증분 갱신(create/update/delete_grade) 결과가 전체 재구축 결과와 같은지 확인
+- 학생 반 이동(PUT /students/{id}) 후 성적/출결 집계 == 전체 재구축
+
+- 인메모리 SQLite, 2개 반 × 10명 × 3과목 × 2학기 + 무작위 생성/수정/삭제 ((학생, 과목, 학기) 유니크 키 유지)
+"""
+
+import random
+from datetime import date
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from database.db import Base
+from models.attendance_stats import AttendanceDailyRollup
+from models.grade_stats import GradeSubjectStat, StudentGradeAverage
+from models.grades import Grade as GradeModel
+from routers.attendance import create_attendance
+from routers.grades import create_grade, delete_grade, update_grade
+from routers.students import update_student
+from schemas.attendance import Attendance as AttendanceSchema
+from schemas.grades import Grade as GradeSchema
+from schemas.students import StudentCreate
+from services import attendance_rollup, grade_rollup
+
+STATUSES = ["출석", "결석", "지각", "조퇴"]
+
+
+def _snapshot(db: Session):
+    stats = db.execute(
+        select(GradeSubjectStat.__table__).order_by(
+            GradeSubjectStat.class_id, GradeSubjectStat.term, GradeSubjectStat.subject_id
+        )
+    ).all()
+    averages = db.execute(
+        select(StudentGradeAverage.__table__).order_by(StudentGradeAverage.student_id, StudentGradeAverage.term)
+    ).all()
+    # 0건이 된 집계 행은 재구축 결과에는 없으므로 비교에서 제외, 합계는 부동소수 오차 허용
+    stats = [
+        tuple(round(v, 6) if isinstance(v, float) else v for v in row)
+        for row in stats if row.grade_count
+    ]
+    averages = [
+        tuple(round(v, 6) if isinstance(v, float) else v for v in row)
+        for row in averages if row.grade_count
+    ]
+    return stats, averages
+
+
+def _attendance_snapshot(db: Session):
+    return db.execute(
+        select(AttendanceDailyRollup.__table__).order_by(
+            AttendanceDailyRollup.class_id, AttendanceDailyRollup.date, AttendanceDailyRollup.status
+        )
+    ).all()
+
+
+def seed(engine):
+    t = Base.metadata.tables
+    with engine.begin() as conn:
+        conn.execute(t["students"].insert(), [
+            {"id": sid, "student_name": f"학생{sid}", "class_id": 1 if sid <= 10 else 2} for sid in range(1, 21)
+        ])
+
+
+def test_incremental_matches_rebuild(db):
+    rnd = random.Random(7)
+    next_id = 1
+    all_keys = [(sid, subject_id, term) for sid in range(1, 21) for subject_id in (1, 2, 3) for term in (1, 2)]
+
+    def free_key():
+        # (학생, 과목, 학기) 유니크 키 중 아직 성적이 없는 키
+        used = set(db.execute(select(GradeModel.student_id, GradeModel.subject_id, GradeModel.term)).tuples())
+        return rnd.choice([key for key in all_keys if key not in used])
+
+    def payload(grade_id, key):
+        student_id, subject_id, term = key
+        return GradeSchema(
+            id=grade_id,
+            student_id=student_id,
+            subject_id=subject_id,
+            term=term,
+            average_score=rnd.choice([None, *range(30, 101)]),
+            grade_letter=None,
+        )
+
+    for _ in range(60):
+        create_grade(payload(next_id, free_key()), db=db)
+        next_id += 1
+
+    for _ in range(200):
+        ids = [g for g, in db.execute(select(GradeModel.id))]
+        action = rnd.random()
+        if action < 0.3:
+            create_grade(payload(next_id, free_key()), db=db)
+            next_id += 1
+        elif action < 0.7:
+            grade_id = rnd.choice(ids)
+            # 절반은 점수만 변경, 절반은 다른 학생/과목/학기로 이동
+            current = db.get(GradeModel, grade_id)
+            key = (current.student_id, current.subject_id, current.term) if rnd.random() < 0.5 else free_key()
+            update_grade(grade_id, payload(grade_id, key), db=db)
+        else:
+            delete_grade(rnd.choice(ids), db=db)
+
+    incremental = _snapshot(db)
+    grade_rollup.rebuild(db)
+    db.commit()
+    assert incremental == _snapshot(db)
+
+
+def test_class_move_matches_rebuild(db):
+    rnd = random.Random(3)
+    next_id = 1
+    for sid in range(1, 21):
+        for subject_id in (1, 2, 3):
+            create_grade(GradeSchema(
+                id=next_id, student_id=sid, subject_id=subject_id, term=1 + next_id % 2,
+                average_score=rnd.choice([None, *range(30, 101)]), grade_letter=None,
+            ), db=db)
+            next_id += 1
+        create_attendance(AttendanceSchema(student_id=sid, date=date(2025, 7, 1), status=rnd.choice(STATUSES)), db=db)
+
+    # 1반 → 2반, 2반 → 새 3반
+    update_student(3, StudentCreate(student_name="학생3", class_id=2), db=db)
+    update_student(15, StudentCreate(student_name="학생15", class_id=3), db=db)
+
+    incremental = _snapshot(db), _attendance_snapshot(db)
+    assert {row[0] for row in incremental[0][0]} == {1, 2, 3}  # grade_subject_stats.class_id
+    grade_rollup.rebuild(db)
+    attendance_rollup.rebuild(db)
+    db.commit()
+    assert incremental == (_snapshot(db), _attendance_snapshot(db))
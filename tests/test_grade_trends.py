@@ -0,0 +1,122 @@
+"""
+/grades/trends, /students/{id}/grade-trend 검증
+
+- 학기 성적 + 시험 점수가 과목별 날짜순 시계열로 병합되는지
+- 기울기가 np.polyfit(30일 단위)과 같은지, 이동평균/추세 라벨
+- 반 전체 조회가 2쿼리인지
+"""
+
+from datetime import date
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from database.db import Base
+from database.query_stats import start_query_stats
+from routers.grades import get_class_trends
+from routers.students import get_student_grade_trend
+from services import reference_cache
+
+# 과목 1 시험 (1반), 과목 2 시험 (1반), 2반 시험
+TESTS = [
+    (1, 1, "쪽지1", date(2025, 3, 20), 1),
+    (2, 1, "중간", date(2025, 4, 25), 1),
+    (3, 1, "쪽지2", date(2025, 6, 1), 1),
+    (4, 2, "중간", date(2025, 4, 25), 1),
+    (5, 1, "중간", date(2025, 4, 25), 2),
+]
+SCORES = {  # 시험 → {학생: 점수}
+    1: {1: 60, 2: 80, 3: 70},
+    2: {1: 70, 2: 75},
+    3: {1: 80, 2: 70},
+    4: {1: 90},
+    5: {5: 100, 1: 50},  # 2반 시험 → 1반 추이에서 제외
+}
+GRADES = [  # (student_id, subject_id, term, score) — 1학기 성적 시점 = 2025-08-31
+    (1, 1, 1, 90),
+    (2, 1, 1, 60),
+    (2, 1, 3, 99),  # 1·2학기 외 → 제외
+]
+
+
+def seed(engine):
+    t = Base.metadata.tables
+    with engine.begin() as conn:
+        conn.execute(t["subjects"].insert(), [{"id": 1, "name": "국어"}, {"id": 2, "name": "수학"}])
+        conn.execute(t["students"].insert(), [
+            {"id": 1, "student_name": "상승", "class_id": 1},
+            {"id": 2, "student_name": "하락", "class_id": 1},
+            {"id": 3, "student_name": "기타", "class_id": 1},
+            {"id": 4, "student_name": "성적없음", "class_id": 1},
+            {"id": 5, "student_name": "다른반", "class_id": 2},
+        ])
+        conn.execute(t["tests"].insert(), [
+            {"id": tid, "subject_id": sub, "test_name": name, "test_date": d, "class_id": cid}
+            for tid, sub, name, d, cid in TESTS
+        ])
+        conn.execute(t["test_scores"].insert(), [
+            {"test_id": tid, "student_id": sid, "score": score}
+            for tid, scores in SCORES.items() for sid, score in scores.items()
+        ])
+        conn.execute(t["grades"].insert(), [
+            {"student_id": sid, "subject_id": sub, "term": term, "average_score": score}
+            for sid, sub, term, score in GRADES
+        ])
+
+
+def _slope(points):
+    days = np.array([(date.fromisoformat(p["date"]) - date.fromisoformat(points[0]["date"])).days for p in points])
+    return round(float(np.polyfit(days / 30, [p["score"] for p in points], 1)[0]), 2)
+
+
+def test_class_trends(engine):
+    with Session(engine) as db:
+        data = get_class_trends(class_id=1, year=None, window=2, threshold=1.0, db=db)["data"]
+
+    assert data["year"] == 2025
+    students = {s["student_id"]: s for s in data["students"]}
+    assert list(students) == [1, 2, 3, 4]
+    assert students[4]["subjects"] == []
+
+    korean = students[1]["subjects"][0]
+    assert korean["subject"] == "국어"
+    assert [p["label"] for p in korean["points"]] == ["쪽지1", "중간", "쪽지2", "1학기 성적"]
+    assert [p["date"] for p in korean["points"]][-1] == "2025-08-31"
+    assert [p["rolling_avg"] for p in korean["points"]] == [60.0, 65.0, 75.0, 85.0]
+    assert korean["slope"] == _slope(korean["points"])
+    assert korean["trend"] == "improving"
+    assert korean["change"] == 30.0
+
+    declining = students[2]["subjects"][0]
+    assert len(declining["points"]) == 4  # 3학기 성적 제외
+    assert declining["slope"] == _slope(declining["points"])
+    assert declining["trend"] == "declining"
+
+    # 한 시점뿐인 시계열 → 기울기 없음, 2반 시험은 포함하지 않음
+    math = students[1]["subjects"][1]
+    assert (math["subject"], math["slope"], math["trend"]) == ("수학", None, "insufficient")
+    assert [s["subject_id"] for s in students[3]["subjects"]] == [1]
+
+    summary = {s["subject_id"]: s for s in data["subjects"]}
+    assert summary[1]["students"] == 3
+    assert summary[1]["trends"]["improving"] == 1 and summary[1]["trends"]["declining"] == 1
+
+
+def test_class_trends_query_count(engine):
+    with Session(engine) as db:
+        reference_cache.get_reference_data(db)
+        stats = start_query_stats()
+        get_class_trends(class_id=1, year=2025, window=3, threshold=1.0, db=db)
+    assert stats.statements == 2
+
+
+def test_student_trend_and_not_found(engine):
+    with Session(engine) as db:
+        data = get_student_grade_trend(student_id=5, year=2025, window=3, threshold=1.0, db=db)["data"]
+        missing = get_student_grade_trend(student_id=999, year=None, window=3, threshold=1.0, db=db)
+        empty_class = get_class_trends(class_id=99, year=None, window=3, threshold=1.0, db=db)
+
+    assert data["name"] == "다른반"
+    assert [p["score"] for p in data["subjects"][0]["points"]] == [100.0]
+    assert missing["error"]["code"] == 404
+    assert empty_class["error"]["code"] == 404
@@ -0,0 +1,60 @@
+"""
+/grades/pivot 단일 쿼리 구현이 기존(N+1) 구현과 같은 응답을 내는지 확인하는 회귀 테스트
+
+- 인메모리 SQLite 에 40명 × 10과목 × 2학기 + 경계 데이터(성적 없는 학생, 점수 NULL, 삭제된 과목)를 적재
+"""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from database.db import Base
+from database.query_stats import start_query_stats
+from routers.grades import get_class_grades, get_student_grades
+from scripts.bench_grades_pivot import legacy_class_grades, load_data
+from services import reference_cache
+
+
+def seed(engine):
+    load_data(engine, students=40, subjects=10, terms=2)
+
+    t = Base.metadata.tables
+    with engine.begin() as conn:
+        conn.execute(t["students"].insert(), [
+            {"id": 41, "student_name": "성적없음", "class_id": 1},
+            {"id": 42, "student_name": "반없음", "class_id": 99},  # classes 행이 없는 반
+        ])
+        conn.execute(t["grades"].insert(), [
+            {"id": 10_001, "student_id": 1, "subject_id": 999, "term": 1, "average_score": 10},  # 삭제된 과목
+            {"id": 10_002, "student_id": 2, "subject_id": 1, "term": 3, "average_score": None},  # 점수 NULL
+            {"id": 10_003, "student_id": 42, "subject_id": 2, "term": 1, "average_score": 77},
+        ])
+
+
+@pytest.mark.parametrize("class_id", [1, 99, 12345])
+@pytest.mark.parametrize("term", [None, 1, 2, 3])
+def test_pivot_matches_legacy(engine, class_id, term):
+    with Session(engine) as db:
+        expected = legacy_class_grades(db, class_id, term)
+    with Session(engine) as db:
+        assert get_class_grades(class_id=class_id, term=term, db=db) == expected
+
+
+def test_pivot_is_single_query(engine):
+    with Session(engine) as db:
+        stats = start_query_stats()
+        response = get_class_grades(class_id=1, term=None, db=db)
+    assert stats.statements == 1
+    assert len(response["data"]) == 41
+
+
+def test_student_grades(engine):
+    reference_cache.invalidate()
+    with Session(engine) as db:
+        response = get_student_grades(student_id=1, db=db)
+        missing = get_student_grades(student_id=12345, db=db)
+        no_grades = get_student_grades(student_id=41, db=db)
+
+    data = response["data"]
+    assert data["student_id"] == 1 and data["class"] != "Unknown"
+    assert len(data["scores"]) == 10  # 삭제된 과목(999) 성적 제외
+    assert missing["error"]["code"] == 404 and no_grades["error"]["code"] == 404
@@ -0,0 +1,77 @@
+"""
+등급 정책(grading_policies) + POST /grades/recompute-letters 검증
+
+- 범위 우선순위: (과목, 학기) > (과목, 전 학기) > (전 과목, 학기) > 기본값
+- SQL CASE 재계산 결과가 Policy.assign(NumPy) 결과와 같은지, UPDATE 한 문장인지
+"""
+
+import random
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from database.db import Base
+from database.query_stats import start_query_stats
+from models.grades import Grade as GradeModel
+from routers.grades import put_grading_policy, recompute_grade_letters
+from schemas.grades import GradingPolicyUpdate, RecomputeLettersRequest
+from services import grading_policy
+
+
+def seed(engine):
+    rnd = random.Random(7)
+    t = Base.metadata.tables
+    with engine.begin() as conn:
+        conn.execute(t["grades"].insert(), [
+            {"student_id": sid, "subject_id": sub, "term": term,
+             "average_score": None if (sid + sub) % 13 == 0 else rnd.choice([rnd.randint(0, 100), 50, 59.5, 95]),
+             "grade_letter": "?"}
+            for sid in range(1, 41) for sub in (1, 2, 3) for term in (1, 2)
+        ])
+
+
+def _put(db, cutoffs, subject_id=None, term=None):
+    put_grading_policy(GradingPolicyUpdate(subject_id=subject_id, term=term, cutoffs=cutoffs), db=db)
+
+
+def test_policy_precedence(engine):
+    with Session(engine) as db:
+        _put(db, {"P": 50, "F": 0})                          # 전 과목 기본
+        _put(db, {"A": 95, "B": 0}, subject_id=2)            # 수학 전 학기
+        _put(db, {"S": 90, "U": 0}, subject_id=2, term=2)    # 수학 2학기
+        _put(db, {"H": 60}, term=2)                          # 2학기 공통 (60 미만 등급 없음)
+
+        first, second = grading_policy.load_policy(db, 1), grading_policy.load_policy(db, 2)
+        assert first.assign([1, 2, 3], [70, 70, None]) == ["P", "B", None]
+        assert second.assign([1, 2, 2, 3], [70, 95, 10, 59.5]) == ["H", "S", "U", None]
+
+        policies = grading_policy.list_policies(db, term=1)
+        assert [(p["subject_id"], p["term"]) for p in policies] == [(None, None), (2, None)]
+
+
+def test_recompute_matches_engine(engine):
+    with Session(engine) as db:
+        _put(db, {"A": 85, "B": 70, "C": 55}, subject_id=1, term=2)
+        _put(db, {"P": 60}, subject_id=3)
+
+        stats = start_query_stats()
+        result = recompute_grade_letters(RecomputeLettersRequest(term=2), db=db)
+        assert stats.statements == 2  # 정책 조회 + UPDATE 한 문장
+
+        rows = db.execute(
+            select(GradeModel.term, GradeModel.subject_id, GradeModel.average_score, GradeModel.grade_letter)
+            .order_by(GradeModel.id)
+        ).all()
+        second = [row for row in rows if row.term == 2]
+        expected = grading_policy.load_policy(db, 2).assign(
+            [row.subject_id for row in second], [row.average_score for row in second]
+        )
+        assert [row.grade_letter for row in second] == expected
+        assert result["data"]["updated"] == len(second)
+        assert all(row.grade_letter == "?" for row in rows if row.term == 1)
+
+        # 바뀌는 등급이 없으면 갱신 0건, 과목 한정 재계산
+        again = recompute_grade_letters(RecomputeLettersRequest(term=2), db=db)
+        assert again["data"]["updated"] == 0
+        only_math = recompute_grade_letters(RecomputeLettersRequest(term=1, subject_ids=[2]), db=db)
+        assert only_math["data"]["updated"] == 40
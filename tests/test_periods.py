@@ -0,0 +1,102 @@
+"""
+services/periods.py 기간 계산 + 범위 조건의 인덱스 사용 여부(EXPLAIN) 테스트
+
+- 인덱스 확인은 인메모리 SQLite 에 모델 테이블/인덱스를 그대로 생성해 EXPLAIN QUERY PLAN 으로 검사
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, func, select
+
+from database.db import Base
+import models  # noqa: F401  # ✅ 모델 테이블을 Base.metadata 에 등록
+from models.attendance import Attendance as AttendanceModel
+from models.events import Event as EventModel
+from models.meetings import Meeting as MeetingModel
+from models.notices import Notice as NoticeModel
+from services import periods
+
+
+# ==========================================================
+# 기간 계산
+# ==========================================================
+
+def test_month_is_half_open():
+    p = periods.month(2025, 2)
+    assert (p.start, p.end) == (date(2025, 2, 1), date(2025, 3, 1))
+    assert date(2025, 2, 28) in p
+    assert date(2025, 3, 1) not in p
+    assert p.last_day == date(2025, 2, 28)
+
+
+def test_december_rolls_over_year():
+    p = periods.month(2025, 12)
+    assert (p.start, p.end) == (date(2025, 12, 1), date(2026, 1, 1))
+
+
+def test_parse_month_rejects_bad_input():
+    assert periods.parse_month("2025-07") == periods.month(2025, 7)
+    with pytest.raises(ValueError):
+        periods.parse_month("2025/07")
+    with pytest.raises(ValueError):
+        periods.parse_month("2025-13")
+
+
+def test_iso_week_and_week_of():
+    p = periods.iso_week(2025, 1)
+    assert (p.start, p.end) == (date(2024, 12, 30), date(2025, 1, 6))
+    assert periods.week_of(date(2025, 1, 1)) == p
+
+
+def test_semester_and_school_year():
+    assert periods.semester(2025, 1) == periods.Period(date(2025, 3, 1), date(2025, 9, 1))
+    assert periods.semester(2025, 2) == periods.Period(date(2025, 9, 1), date(2026, 3, 1))
+    assert periods.school_year(2025) == periods.Period(date(2025, 3, 1), date(2026, 3, 1))
+
+    # 1~2월은 전년도 학년도 2학기
+    assert periods.school_year_of(date(2026, 2, 10)) == 2025
+    assert periods.semester_of(date(2026, 2, 10)) == periods.semester(2025, 2)
+    assert periods.semester_of(date(2025, 8, 31)) == periods.semester(2025, 1)
+
+
+def test_day_contains_only_that_day():
+    p = periods.day(date(2025, 7, 1))
+    assert list(p.days()) == [date(2025, 7, 1)]
+
+
+# ==========================================================
+# EXPLAIN: 범위 조건이 날짜 인덱스를 사용하는지
+# ==========================================================
+
+@pytest.fixture(scope="module")
+def conn():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.connect() as c:
+        yield c
+
+
+def _plan(conn, stmt) -> str:
+    compiled = stmt.compile(conn, compile_kwargs={"literal_binds": True})
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").all()
+    return " / ".join(str(r[-1]) for r in rows)
+
+
+@pytest.mark.parametrize("model, column, index_name", [
+    (AttendanceModel, AttendanceModel.date, "ix_attendance_date"),
+    (EventModel, EventModel.start_date, "ix_events_start_date"),
+    (MeetingModel, MeetingModel.date, "ix_meetings_date"),
+    (NoticeModel, NoticeModel.date, "ix_notices_date"),
+])
+def test_month_filter_uses_date_index(conn, model, column, index_name):
+    stmt = select(model.id).where(periods.month(2025, 7).filter(column))
+    plan = _plan(conn, stmt)
+    assert f"USING INDEX {index_name}" in plan or f"USING COVERING INDEX {index_name}" in plan, plan
+
+
+def test_function_wrapped_column_scans(conn):
+    # 대조군: 컬럼을 함수로 감싸면 인덱스를 쓰지 못하고 전체 스캔
+    stmt = select(AttendanceModel.id).where(func.strftime("%Y-%m", AttendanceModel.date) == "2025-07")
+    plan = _plan(conn, stmt)
+    assert "ix_attendance_date" not in plan or "SCAN" in plan, plan
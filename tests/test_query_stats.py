@@ -0,0 +1,60 @@
+"""
+요청별 DB 계측(database/query_stats.py, middlewares/query_stats.py) 검증
+
+- X-DB-Queries / X-DB-Rows / X-DB-Time-Ms 응답 헤더, DB_N_PLUS_ONE_THRESHOLD 초과 시 N+1 의심 경고
+- X-DB-Rows 는 버퍼드 SELECT 의 rowcount 만 합산 (DML 영향 행 수, 스트리밍/알 수 없는 행 수 제외)
+"""
+
+import logging
+from types import SimpleNamespace
+
+from config.settings import settings
+from database.db import Base
+from database.query_stats import _after_cursor_execute, start_query_stats
+from middlewares.query_stats import QueryStatsMiddleware
+from routers import students as student_routes
+
+
+def seed(engine):
+    with engine.begin() as conn:
+        conn.execute(Base.metadata.tables["students"].insert(), [
+            {"id": sid, "student_name": f"학생{sid}", "class_id": 1} for sid in (1, 2, 3)
+        ])
+
+
+def _execute(rowcount, description=(("id",),), stream_results=False):
+    """SELECT/DML 한 문장 실행 후 after_cursor_execute 호출과 같은 인자"""
+    conn = SimpleNamespace(info={})
+    cursor = SimpleNamespace(rowcount=rowcount, description=description)
+    context = SimpleNamespace(execution_options={"stream_results": True} if stream_results else {})
+    _after_cursor_execute(conn, cursor, "SELECT 1", None, context, False)
+
+
+def test_headers_and_n_plus_one_warning(engine, client, monkeypatch, caplog):
+    api = client(student_routes.router, middleware=[QueryStatsMiddleware])
+
+    with caplog.at_level(logging.WARNING, logger="db.query_stats"):
+        response = api.get("/students/1")
+    assert response.json()["data"]["student_name"] == "학생1"
+    assert response.headers["X-DB-Queries"] == "1"
+    assert response.headers["X-DB-Rows"] == "0"  # SQLite SELECT rowcount 는 -1 (행 수 모름)
+    assert int(response.headers["X-DB-Time-Ms"]) >= 0
+    assert not caplog.records
+
+    monkeypatch.setattr(settings, "DB_N_PLUS_ONE_THRESHOLD", 0)
+    with caplog.at_level(logging.WARNING, logger="db.query_stats"):
+        response = api.get("/students/2")
+    assert response.headers["X-DB-Queries"] == "1"
+    [record] = caplog.records
+    assert record.getMessage().startswith("N+1 의심: GET /students/2 statements=1 ")
+
+
+def test_rows_count_buffered_selects_only():
+    stats = start_query_stats()
+    _execute(5)                          # 버퍼드 SELECT
+    _execute(0)
+    _execute(-1)                         # 드라이버가 행 수를 모름
+    _execute(2 ** 64 - 1)                # PyMySQL SSCursor
+    _execute(7, stream_results=True)     # 스트리밍 내보내기
+    _execute(3, description=None)        # UPDATE/DELETE 영향 행 수
+    assert (stats.statements, stats.rows) == (6, 5)
@@ -0,0 +1,95 @@
+"""
+/grades/distribution, /grades/low-performers SQL 집계 검증
+
+- 점수 NULL 성적은 평균의 분모에서 제외되는지 (기존: len(grades) 로 나눠 평균이 낮아짐)
+- 점수가 없는 학생 / 성적이 없는 학생은 구간·기준 미달 목록에서 제외되는지
+- 결과가 원본 grades 를 학생별로 순회한 계산과 같은지, 구간 경계 변경/검증
+"""
+
+import random
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from database.db import Base
+from database.query_stats import start_query_stats
+from routers.grades import get_low_performers, get_score_distribution
+from scripts.bench_grade_distribution import reference_averages
+from scripts.bench_grades_pivot import load_data
+from services import grade_rollup, score_buckets
+
+
+def seed(engine):
+    load_data(engine, students=30, subjects=5, terms=2)
+
+    t = Base.metadata.tables
+    rnd = random.Random(3)
+    with engine.begin() as conn:
+        conn.execute(t["students"].insert(), [
+            {"id": 31, "student_name": "점수NULL섞임", "class_id": 1},
+            {"id": 32, "student_name": "점수모두NULL", "class_id": 1},
+            {"id": 33, "student_name": "성적없음", "class_id": 1},
+        ])
+        conn.execute(t["grades"].insert(), [
+            {"student_id": 31, "subject_id": 1, "term": 1, "average_score": 82, "grade_letter": "B"},
+            {"student_id": 31, "subject_id": 2, "term": 1, "average_score": None, "grade_letter": None},
+            {"student_id": 32, "subject_id": 1, "term": 1, "average_score": None, "grade_letter": "F"},
+        ])
+        # 임의 학생들의 성적 일부를 점수 NULL 로 변경
+        null_ids = rnd.sample(range(1, 301), 10)
+        conn.execute(t["grades"].update().where(t["grades"].c.id.in_(null_ids)).values(average_score=None))
+    with Session(engine) as db:
+        grade_rollup.rebuild(db)
+        db.commit()
+
+
+def test_null_scores_are_excluded_from_average(engine):
+    with Session(engine) as db:
+        distribution = get_score_distribution(class_id=1, edges=[60, 70, 80, 90], db=db)["data"]["distribution"]
+        low = get_low_performers(class_id=1, threshold=100.0, db=db)["data"]["students"]
+
+    by_id = {s["student_id"]: s for s in low}
+    assert by_id[31]["average"] == 82.0  # (82 + NULL) / 1, 기존 구현은 41.0
+    assert 32 not in by_id and 33 not in by_id
+    assert sum(distribution.values()) == 31  # 점수 있는 학생만
+
+
+@pytest.mark.parametrize("edges", [[60, 70, 80, 90], [50, 75], [100]])
+def test_distribution_matches_reference(engine, edges):
+    with Session(engine) as db:
+        averages = reference_averages(db, 1)
+        stats = start_query_stats()
+        response = get_score_distribution(class_id=1, edges=edges, db=db)
+    assert stats.statements == 1
+
+    labels = score_buckets.bucket_labels(edges)
+    expected = dict.fromkeys(labels, 0)
+    for avg in averages.values():
+        expected[labels[sum(avg >= edge for edge in edges)]] += 1
+    assert response["data"]["distribution"] == expected
+
+
+@pytest.mark.parametrize("threshold", [0.0, 65.0, 72.5, 100.0])
+def test_low_performers_match_reference(engine, threshold):
+    with Session(engine) as db:
+        averages = reference_averages(db, 1)
+        response = get_low_performers(class_id=1, threshold=threshold, db=db)
+
+    expected = [(sid, round(avg, 1)) for sid, avg in sorted(averages.items()) if avg < threshold]
+    assert [(s["student_id"], s["average"]) for s in response["data"]["students"]] == expected
+    assert response["data"]["count"] == len(expected)
+
+
+def test_unknown_class_and_invalid_edges(engine):
+    with Session(engine) as db:
+        assert get_score_distribution(class_id=999, edges=[60], db=db)["success"] is False
+        assert get_low_performers(class_id=999, threshold=65.0, db=db)["success"] is False
+        for edges in ([], [70, 60], [0, 50], [60, 120]):
+            with pytest.raises(HTTPException):
+                get_score_distribution(class_id=1, edges=edges, db=db)
+
+
+def test_bucket_labels():
+    assert score_buckets.bucket_labels(score_buckets.DEFAULT_EDGES) == ["0~59", "60~69", "70~79", "80~89", "90~100"]
+    assert score_buckets.bucket_labels([50]) == ["0~49", "50~100"]
@@ -0,0 +1,115 @@
+"""
+/tests/{test_id}/analytics 검증
+
+- 요약 통계/분포가 NumPy 계산과 같은지, 반별 비교·직전 시험 대비 변화
+- 두 번째 조회는 캐시(쿼리 0회), 관련 시험 점수 변경 후에는 다시 계산
+"""
+
+from datetime import date
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from database.db import Base
+from database.query_stats import start_query_stats
+from models import test_scores as test_score_models
+from routers import test_scores as test_score_routes
+from routers.tests import get_test_analytics
+from schemas import test_scores as test_score_schemas
+
+# 시험: 1·2 = 같은 중간고사(1반/2반), 3 = 1반 이전 쪽지시험, 4 = 다른 과목
+TESTS = [
+    (1, 1, "중간고사", date(2025, 4, 20), 1),
+    (2, 1, "중간고사", date(2025, 4, 20), 2),
+    (3, 1, "쪽지시험", date(2025, 3, 30), 1),
+    (4, 2, "중간고사", date(2025, 4, 10), 1),
+]
+MIDTERM_1 = {1: 95, 2: 80, 3: 80, 4: 55, 5: 100}
+MIDTERM_2 = {6: 70, 7: 60, 8: 90}
+QUIZ = {1: 90, 2: 85, 3: 80}           # 4, 5번은 직전 시험 없음
+OTHER = {1: 10, 4: 99}                 # 다른 과목 → 직전 시험으로 보지 않음
+
+
+def seed(engine):
+    t = Base.metadata.tables
+    with engine.begin() as conn:
+        conn.execute(t["classes"].insert(), [{"id": 1, "grade": 2, "class_num": 1}, {"id": 2, "grade": 2, "class_num": 2}])
+        conn.execute(t["students"].insert(), [
+            {"id": sid, "student_name": f"학생{sid}", "class_id": 1 if sid <= 5 else 2} for sid in range(1, 9)
+        ])
+        conn.execute(t["tests"].insert(), [
+            {"id": tid, "subject_id": sub, "test_name": name, "test_date": d, "class_id": cid}
+            for tid, sub, name, d, cid in TESTS
+        ])
+        conn.execute(t["test_scores"].insert(), [
+            {"test_id": tid, "student_id": sid, "score": score}
+            for tid, scores in ((1, MIDTERM_1), (2, MIDTERM_2), (3, QUIZ), (4, OTHER))
+            for sid, score in scores.items()
+        ])
+
+
+def test_summary_and_distribution(engine):
+    with Session(engine) as db:
+        data = get_test_analytics(test_id=1, db=db)["data"]
+
+    scores = np.array(list(MIDTERM_1.values()), dtype=float)
+    summary = data["summary"]
+    assert summary["count"] == 5
+    assert summary["mean"] == round(scores.mean(), 2)
+    assert summary["std"] == round(scores.std(), 2)
+    assert (summary["q1"], summary["median"], summary["q3"]) == tuple(np.percentile(scores, [25, 50, 75]))
+    assert data["distribution"]["50~59"] == 1 and data["distribution"]["90~100"] == 2
+    assert sum(data["distribution"].values()) == 5
+
+    students = {s["student_id"]: s for s in data["students"]}
+    assert [s["student_id"] for s in data["students"]] == [5, 1, 2, 3, 4]
+    assert (students[2]["rank"], students[3]["rank"]) == (3, 3)
+
+
+def test_class_comparison_and_changes(engine):
+    with Session(engine) as db:
+        data = get_test_analytics(test_id=1, db=db)["data"]
+
+    classes = data["class_comparison"]["classes"]
+    assert [(c["class_id"], c["is_target"], c["count"], c["rank"]) for c in classes] == [(1, True, 5, 1), (2, False, 3, 2)]
+    assert classes[1]["mean"] == round(np.mean(list(MIDTERM_2.values())), 2)
+    assert data["class_comparison"]["overall"]["count"] == 8
+
+    students = {s["student_id"]: s for s in data["students"]}
+    assert (students[1]["prev_test_id"], students[1]["delta"]) == (3, 5.0)
+    assert students[2]["delta"] == -5.0 and students[3]["delta"] == 0.0
+    assert students[4]["prev_score"] is None and students[5]["delta"] is None
+    assert data["changes"] == {
+        "compared": 3, "no_previous": 2, "improved": 1, "declined": 1, "unchanged": 1, "mean_delta": 0.0,
+    }
+
+
+def test_cache_and_invalidation(engine):
+    with Session(engine) as db:
+        get_test_analytics(test_id=1, db=db)
+        stats = start_query_stats()
+        get_test_analytics(test_id=1, db=db)
+    assert stats.statements == 0
+
+    # 직전 시험(쪽지시험) 점수 수정 → 중간고사 분석의 변화량도 다시 계산
+    with Session(engine) as db:
+        score_id = db.query(test_score_models.TestScore.id).filter_by(test_id=3, student_id=1).scalar()
+        test_score_routes.update_test_score(
+            score_id, test_score_schemas.TestScore(id=score_id, test_id=3, student_id=1, score=50), db=db
+        )
+    with Session(engine) as db:
+        students = {s["student_id"]: s for s in get_test_analytics(test_id=1, db=db)["data"]["students"]}
+    assert students[1]["delta"] == 45.0
+
+    # bulk 저장 → 다시 계산
+    with Session(engine) as db:
+        test_score_routes.bulk_upsert_test_scores(
+            test_score_schemas.TestScoreBulkRequest(rows=[{"test_id": 1, "student_id": 4, "score": 65}]), db=db
+        )
+    with Session(engine) as db:
+        assert get_test_analytics(test_id=1, db=db)["data"]["distribution"]["50~59"] == 0
+
+
+def test_missing_test(engine):
+    with Session(engine) as db:
+        assert get_test_analytics(test_id=999, db=db)["success"] is False